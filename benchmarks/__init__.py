@@ -0,0 +1 @@
+"""Performance benchmarks for the Home Assistant MCP server."""
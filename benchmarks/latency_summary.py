@@ -0,0 +1,43 @@
+"""Summary statistics of latency samples."""
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Get a percentile with the nearest-rank method.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        q: Percentile between 0 and 100
+
+    Returns:
+        Percentile value (0.0 without samples)
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize_latencies(samples: Sequence[float]) -> dict[str, Any]:
+    """Summarize latencies given in seconds.
+
+    Args:
+        samples: Latency of every call in seconds
+
+    Returns:
+        Dictionary with count and mean/min/p50/p95/p99/max in milliseconds
+    """
+    ordered = sorted(samples)
+    to_ms = 1000.0
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * to_ms, 3) if ordered else 0.0,
+        "min_ms": round(ordered[0] * to_ms, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * to_ms, 3),
+        "p95_ms": round(percentile(ordered, 95) * to_ms, 3),
+        "p99_ms": round(percentile(ordered, 99) * to_ms, 3),
+        "max_ms": round(ordered[-1] * to_ms, 3) if ordered else 0.0,
+    }
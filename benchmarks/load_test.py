@@ -0,0 +1,246 @@
+"""Load test the MCP server end to end over the stdio transport.
+
+Spawns ``home-assistant-mcp`` against a simulated Home Assistant and sends
+concurrent ``tools/call`` requests with a weighted tool mix, e.g.::
+
+    python -m benchmarks.load_test --concurrency 32 --requests 5000 \
+        --mix ha_get_entity_state=10,ha_list_entities=1,ha_turn_on=3
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from home_assistant_mcp.simulator import BehaviorSpec, FakeHomeAssistant, InstallSpec, SyntheticInstall
+
+from .latency_summary import summarize_latencies
+from .tool_benchmark import tool_arguments
+
+DEFAULT_MIX = {
+    "ha_get_entity_state": 10,
+    "ha_list_entities": 1,
+    "ha_turn_on": 3,
+    "ha_turn_off": 3,
+    "ha_get_history": 2,
+    "ha_get_config": 1,
+    "ha_get_area_entities": 1,
+    "ha_list_dashboards": 1,
+}
+
+# The server reports failures as text results starting with one of these
+ERROR_PREFIXES = (
+    "Unknown tool:",
+    "Missing required argument:",
+    "Invalid argument type:",
+    "Request timed out",
+    "Home Assistant error:",
+    "Internal error:",
+)
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """Parse a tool mix such as ``ha_get_entity_state=10,ha_turn_on=2``.
+
+    Args:
+        text: Comma-separated ``tool=weight`` pairs (weight defaults to 1)
+
+    Returns:
+        Mapping of tool name to weight
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name:
+            mix[name] = int(weight) if weight else 1
+    return mix
+
+
+def server_parameters(ha_url: str, ha_token: str, command: list[str] | None = None) -> StdioServerParameters:
+    """Build the parameters spawning the MCP server.
+
+    Args:
+        ha_url: Home Assistant URL passed as ``HA_URL``
+        ha_token: Access token passed as ``HA_TOKEN``
+        command: Server command line (``python -m home_assistant_mcp.server``
+            by default, i.e. the ``server:main`` entry point)
+
+    Returns:
+        Stdio server parameters
+    """
+    command = command or [sys.executable, "-m", "home_assistant_mcp.server"]
+    env = {**os.environ, "HA_URL": ha_url, "HA_TOKEN": ha_token}
+    return StdioServerParameters(command=command[0], args=command[1:], env=env)
+
+
+async def run_load_test(
+    spec: InstallSpec,
+    mix: dict[str, int] | None = None,
+    concurrency: int = 16,
+    requests: int = 1000,
+    behavior: BehaviorSpec | None = None,
+    command: list[str] | None = None,
+    seed: int = 42,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Drive a spawned MCP server with concurrent tool calls.
+
+    Args:
+        spec: Size of the simulated install
+        mix: Tool weights (:data:`DEFAULT_MIX` if None)
+        concurrency: Number of requests kept in flight
+        requests: Total number of tool calls
+        behavior: Simulated Home Assistant latency and failures
+        command: Server command line override
+        seed: Random seed of the tool sequence
+        verbose: Forward the server's log output to stderr
+
+    Returns:
+        JSON-serializable report with overall and per-tool latency and errors
+    """
+    mix = mix or DEFAULT_MIX
+    install = SyntheticInstall(spec)
+    arguments = tool_arguments(install)
+    unknown = [name for name in mix if name not in arguments]
+    if unknown:
+        raise ValueError(f"No load test arguments for: {', '.join(unknown)}")
+
+    rnd = random.Random(seed)
+    sequence = rnd.choices(list(mix), weights=list(mix.values()), k=requests)
+    iterations: Counter[str] = Counter()
+    latencies: dict[str, list[float]] = {name: [] for name in mix}
+    errors: Counter[str] = Counter()
+    first_errors: dict[str, str] = {}
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for name in sequence:
+        queue.put_nowait(name)
+
+    async def worker(session: ClientSession) -> None:
+        while not queue.empty():
+            name = queue.get_nowait()
+            call_arguments = arguments[name](iterations[name])
+            iterations[name] += 1
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(name, call_arguments)
+                text = result.content[0].text if result.content else ""
+                error = text if result.isError or text.startswith(ERROR_PREFIXES) else None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            latencies[name].append(time.perf_counter() - start)
+            if error is not None:
+                errors[name] += 1
+                first_errors.setdefault(name, error[:200])
+
+    behavior = behavior or BehaviorSpec()
+    async with contextlib.AsyncExitStack() as stack:
+        errlog = sys.stderr
+        if not verbose:
+            # Opened in a worker thread to keep file I/O off the event loop
+            errlog = stack.enter_context(await asyncio.to_thread(open, os.devnull, "w"))
+        simulator = await stack.enter_async_context(FakeHomeAssistant(install, behavior=behavior))
+        parameters = server_parameters(simulator.url, simulator.token, command)
+        read_stream, write_stream = await stack.enter_async_context(stdio_client(parameters, errlog=errlog))
+        session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+        await session.initialize()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for samples in latencies.values() for latency in samples]
+    total_errors = sum(errors.values())
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "spec": spec.model_dump(),
+        "behavior": behavior.model_dump(),
+        "concurrency": concurrency,
+        "mix": mix,
+        "duration_s": round(elapsed, 3),
+        "throughput_per_s": round(len(all_latencies) / elapsed, 2) if elapsed else 0.0,
+        "overall": {
+            **summarize_latencies(all_latencies),
+            "errors": total_errors,
+            "error_rate": round(total_errors / len(all_latencies), 4) if all_latencies else 0.0,
+        },
+        "tools": {
+            name: {
+                **summarize_latencies(samples),
+                "errors": errors[name],
+                "error_rate": round(errors[name] / len(samples), 4) if samples else 0.0,
+                "first_error": first_errors.get(name),
+            }
+            for name, samples in latencies.items()
+        },
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a load test report as a text table."""
+    header = f"{'tool':<24}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'err %':>8}"
+    lines = [header, "-" * len(header)]
+    rows = [*report["tools"].items(), ("TOTAL", report["overall"])]
+    for name, result in rows:
+        lines.append(
+            f"{name:<24}{result['count']:>8}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['errors']:>8}{result['error_rate'] * 100:>7.2f}%"
+        )
+    lines.append(
+        f"\n{report['overall']['count']} calls in {report['duration_s']:.2f}s "
+        f"({report['throughput_per_s']:.1f}/s) at concurrency {report['concurrency']}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--mix", help="Weighted tool mix, e.g. ha_get_entity_state=10,ha_turn_on=2")
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--areas", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated Home Assistant latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--command", help="Server command line (default: python -m home_assistant_mcp.server)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the server's log output")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_load_test(
+            InstallSpec(entities=args.entities, areas=args.areas, seed=args.seed),
+            mix=parse_mix(args.mix) if args.mix else None,
+            concurrency=args.concurrency,
+            requests=args.requests,
+            behavior=BehaviorSpec(
+                latency_ms=args.latency_ms,
+                jitter_ms=args.jitter_ms,
+                error_rate=args.error_rate,
+                seed=args.seed,
+            ),
+            command=args.command.split() if args.command else None,
+            seed=args.seed,
+            verbose=args.verbose,
+        )
+    )
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
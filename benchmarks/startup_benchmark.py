@@ -0,0 +1,161 @@
+"""Measure the cold import time of the MCP server and enforce a budget.
+
+Runs ``python -X importtime -c "import home_assistant_mcp.server"`` in fresh
+interpreters and fails when the startup regresses, e.g.::
+
+    python -m benchmarks.startup_benchmark --runs 5 --package-budget-ms 60
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+TARGET = "home_assistant_mcp.server"
+PACKAGE = "home_assistant_mcp"
+
+# Modules that must only be loaded by the first tool call, not by startup
+DEFERRED_MODULES = (
+    "websockets",
+    "home_assistant_mcp.client",
+    "home_assistant_mcp.models",
+    "cProfile",
+    "pstats",
+)
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        output: Standard error of an interpreter run with ``-X importtime``
+
+    Returns:
+        Mapping of module name to (self, cumulative) time in microseconds
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def measure_import(module: str = TARGET) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and collect its import times.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Mapping of module name to (self, cumulative) time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def run_startup_benchmark(runs: int = 5, top: int = 15) -> dict[str, Any]:
+    """Measure the cold start of the server over several runs.
+
+    Args:
+        runs: Number of fresh interpreters (the median run is reported)
+        top: Number of slowest modules listed
+
+    Returns:
+        JSON-serializable report with the total and package import time in
+        milliseconds, the slowest modules and the deferred modules that were
+        imported anyway
+    """
+    samples = [measure_import() for _ in range(runs)]
+    totals = [sample[TARGET][1] for sample in samples]
+    median = samples[totals.index(sorted(totals)[len(totals) // 2])]
+
+    package_self = [
+        sum(self_time for name, (self_time, _) in sample.items() if name.split(".")[0] == PACKAGE)
+        for sample in samples
+    ]
+    slowest = sorted(median.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "runs": runs,
+        "total_ms": round(statistics.median(totals) / 1000, 2),
+        "package_ms": round(statistics.median(package_self) / 1000, 2),
+        "slowest": [
+            {"module": name, "self_ms": round(self_time / 1000, 2), "cumulative_ms": round(cumulative / 1000, 2)}
+            for name, (self_time, cumulative) in slowest
+        ],
+        "deferred_imported": [name for name in DEFERRED_MODULES if name in median],
+    }
+
+
+def check_budget(report: dict[str, Any], budget_ms: float | None, package_budget_ms: float | None) -> list[str]:
+    """Compare a report with the startup budget.
+
+    Args:
+        report: Report of :func:`run_startup_benchmark`
+        budget_ms: Maximum total import time, or None
+        package_budget_ms: Maximum self time of the package's own modules, or None
+
+    Returns:
+        Budget violations (empty when the budget holds)
+    """
+    violations = []
+    if budget_ms is not None and report["total_ms"] > budget_ms:
+        violations.append(f"import of {TARGET} took {report['total_ms']:.1f} ms (budget {budget_ms:.1f} ms)")
+    if package_budget_ms is not None and report["package_ms"] > package_budget_ms:
+        violations.append(
+            f"{PACKAGE} modules took {report['package_ms']:.1f} ms (budget {package_budget_ms:.1f} ms)"
+        )
+    for name in report["deferred_imported"]:
+        violations.append(f"{name} is imported at startup but should load on first use")
+    return violations
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a startup report as text."""
+    header = f"{'module':<48}{'self ms':>10}{'cumul ms':>10}"
+    lines = [header, "-" * len(header)]
+    for entry in report["slowest"]:
+        lines.append(f"{entry['module']:<48}{entry['self_ms']:>10.2f}{entry['cumulative_ms']:>10.2f}")
+    lines.append(
+        f"\nimport {TARGET}: {report['total_ms']:.1f} ms total, "
+        f"{report['package_ms']:.1f} ms in {PACKAGE} (median of {report['runs']} runs)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules listed")
+    parser.add_argument("--budget-ms", type=float, help="Fail when the total import time exceeds this")
+    parser.add_argument("--package-budget-ms", type=float, help=f"Fail when {PACKAGE}'s own modules exceed this")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_startup_benchmark(args.runs, args.top)
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}", file=sys.stderr)
+
+    violations = check_budget(report, args.budget_ms, args.package_budget_ms)
+    for violation in violations:
+        print(f"FAIL: {violation}", file=sys.stderr)
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
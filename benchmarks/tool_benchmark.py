@@ -0,0 +1,281 @@
+"""Benchmark every MCP tool against a local simulated Home Assistant.
+
+Run with ``python -m benchmarks.tool_benchmark --entities 12000 --output run.json``
+and compare two runs with ``--baseline previous.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from home_assistant_mcp.client import HomeAssistantClient
+from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.simulator import BehaviorSpec, FakeHomeAssistant, InstallSpec, SyntheticInstall
+from home_assistant_mcp.tools import TOOLS_MAP
+
+from .latency_summary import summarize_latencies
+
+ArgumentFactory = Callable[[int], dict[str, Any]]
+
+
+def tool_arguments(install: SyntheticInstall) -> dict[str, ArgumentFactory]:
+    """Build realistic arguments for every tool, varying with the iteration.
+
+    Dashboards created by ``ha_create_dashboard`` in iteration ``i`` are
+    updated and deleted by the matching iterations of the later tools, so the
+    benchmark leaves the install as it found it.
+
+    Args:
+        install: Installation the arguments refer to
+
+    Returns:
+        Mapping of tool name to a factory taking the iteration number
+    """
+    entity_ids = list(install.states)
+    lights = [entity_id for entity_id in entity_ids if entity_id.startswith("light.")] or entity_ids
+    area_ids = list(install.areas)
+    url_paths = [dashboard["url_path"] for dashboard in install.dashboards.values()]
+
+    def pick(items: list[str], i: int) -> str:
+        return items[i % len(items)]
+
+    return {
+        "ha_health_check": lambda i: {},
+        "ha_get_config": lambda i: {},
+        "ha_list_entities": lambda i: {},
+        "ha_search_entities": lambda i: {"query": install.states[pick(entity_ids, i)]["attributes"]["friendly_name"]},
+        "ha_query_entities": lambda i: {"domain": "light", "state": "on"},
+        "ha_get_changes": lambda i: {},
+        "ha_get_entity_state": lambda i: {"entity_id": pick(entity_ids, i)},
+        "ha_wait_for_state": lambda i: {"entity_id": pick(entity_ids, i), "op": "!=", "value": "-", "timeout": 1},
+        "ha_list_services": lambda i: {},
+        "ha_call_service": lambda i: {
+            "domain": "light",
+            "service": "turn_on",
+            "entity_id": pick(lights, i),
+            "data": {"brightness": 128},
+        },
+        "ha_turn_on": lambda i: {"entity_id": pick(lights, i)},
+        "ha_turn_off": lambda i: {"entity_id": pick(lights, i)},
+        "ha_toggle": lambda i: {"entity_id": pick(lights, i)},
+        "ha_get_history": lambda i: {"entity_id": pick(entity_ids, i), "hours_ago": 24},
+        "ha_fire_event": lambda i: {"event_type": "benchmark_event", "event_data": {"i": i}},
+        "ha_fire_events": lambda i: {
+            "events": [{"event_type": "benchmark_event", "event_data": {"i": i, "n": n}} for n in range(100)]
+        },
+        "ha_subscribe_events": lambda i: {"event_types": ["benchmark_event"], "subscription_id": "bench"},
+        "ha_read_events": lambda i: {"subscription_id": "bench", "cursor": i},
+        "ha_unsubscribe_events": lambda i: {"subscription_id": "bench"},
+        "ha_list_areas": lambda i: {},
+        "ha_get_area_entities": lambda i: {"area": pick(area_ids, i)},
+        "ha_get_area_devices": lambda i: {"area": pick(area_ids, i)},
+        "ha_get_entity_area": lambda i: {"entity_id": pick(entity_ids, i)},
+        "ha_render_template": lambda i: {"template": "{{ areas() | count }}"},
+        "ha_list_dashboards": lambda i: {},
+        "ha_get_dashboard": lambda i: {"url_path": pick(url_paths, i) if url_paths else None},
+        "ha_create_dashboard": lambda i: {"url_path": f"bench-{i}", "title": f"Bench {i}"},
+        "ha_update_dashboard": lambda i: {"dashboard_id": f"bench_{i}", "title": f"Bench {i} updated"},
+        "ha_delete_dashboard": lambda i: {"dashboard_id": f"bench_{i}"},
+        "ha_patch_dashboard": lambda i: {
+            "url_path": pick(url_paths, i) if url_paths else None,
+            "operations": [{"op": "replace", "path": "/title", "value": f"Bench {i}"}],
+        },
+        "ha_generate_dashboards": lambda i: {"url_path": "bench-areas", "title": f"Areas {i}"},
+        "ha_metrics": lambda i: {},
+    }
+
+
+async def benchmark_tool(
+    client: HomeAssistantClient,
+    name: str,
+    arguments: ArgumentFactory,
+    iterations: int,
+    warmup: int,
+) -> dict[str, Any]:
+    """Measure one tool.
+
+    Latencies are measured without tracing memory; peak memory is measured
+    on one extra call with tracemalloc, which would otherwise distort timing.
+
+    Args:
+        client: Client connected to the simulator
+        name: Tool name
+        arguments: Factory of per-iteration arguments
+        iterations: Measured calls
+        warmup: Unmeasured calls made first
+
+    Returns:
+        Latency summary, throughput, peak memory, response size and errors
+    """
+    execute = TOOLS_MAP[name]
+    errors: list[str] = []
+    latencies: list[float] = []
+    response_bytes = 0
+
+    async def call(i: int) -> None:
+        nonlocal response_bytes
+        start = time.perf_counter()
+        try:
+            result = await execute(client, arguments(i))
+            response_bytes = sum(len(item.text.encode()) for item in result)
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+        latencies.append(time.perf_counter() - start)
+
+    for i in range(warmup):
+        await call(iterations + 1 + i)
+    latencies.clear()
+    errors.clear()
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        await call(i)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        await call(iterations + warmup + 1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    latencies.pop()
+
+    return {
+        **summarize_latencies(latencies),
+        "throughput_per_s": round(iterations / elapsed, 2) if elapsed else 0.0,
+        "peak_memory_kib": round(peak / 1024, 1),
+        "response_bytes": response_bytes,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+    }
+
+
+async def run_benchmark(
+    spec: InstallSpec,
+    iterations: int = 20,
+    warmup: int = 2,
+    tools: list[str] | None = None,
+    behavior: BehaviorSpec | None = None,
+) -> dict[str, Any]:
+    """Benchmark tools against a freshly generated simulated install.
+
+    Args:
+        spec: Size of the synthetic install
+        iterations: Measured calls per tool
+        warmup: Unmeasured calls per tool
+        tools: Tool names to run (all tools in TOOLS_MAP if None)
+        behavior: Simulated network latency and failures (none by default)
+
+    Returns:
+        JSON-serializable benchmark report
+    """
+    install = SyntheticInstall(spec)
+    arguments = tool_arguments(install)
+    names = [name for name in TOOLS_MAP if tools is None or name in tools]
+
+    results: dict[str, Any] = {}
+    behavior = behavior or BehaviorSpec()
+    async with FakeHomeAssistant(install, behavior=behavior) as simulator:
+        config = HomeAssistantConfig(url=simulator.url, token=simulator.token)
+        async with HomeAssistantClient(config) as client:
+            for name in names:
+                if name not in arguments:
+                    results[name] = {"skipped": "no benchmark arguments"}
+                    continue
+                results[name] = await benchmark_tool(client, name, arguments[name], iterations, warmup)
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": spec.model_dump(),
+        "behavior": behavior.model_dump(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "tools": results,
+    }
+
+
+def format_report(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> str:
+    """Render a report as a text table.
+
+    Args:
+        report: Report from :func:`run_benchmark`
+        baseline: Earlier report; adds the p50 change per tool
+
+    Returns:
+        Table text
+    """
+    header = f"{'tool':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'peak KiB':>11}{'errors':>8}"
+    if baseline:
+        header += f"{'p50 Δ':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in report["tools"].items():
+        if "skipped" in result:
+            lines.append(f"{name:<24}skipped: {result['skipped']}")
+            continue
+        line = (
+            f"{name:<24}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['throughput_per_s']:>10.1f}{result['peak_memory_kib']:>11.1f}{result['errors']:>8}"
+        )
+        previous = (baseline or {}).get("tools", {}).get(name, {})
+        if previous.get("p50_ms"):
+            line += f"{(result['p50_ms'] / previous['p50_ms'] - 1) * 100:>+8.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--areas", type=int, default=20)
+    parser.add_argument("--devices-per-area", type=int, default=5)
+    parser.add_argument("--history-points", type=int, default=24, help="State changes per entity and day")
+    parser.add_argument("--dashboards", type=int, default=3)
+    parser.add_argument("--dashboard-views", type=int, default=3)
+    parser.add_argument("--cards-per-view", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--tools", help="Comma-separated tool names (default: all)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare with")
+    args = parser.parse_args(argv)
+
+    spec = InstallSpec(
+        entities=args.entities,
+        areas=args.areas,
+        devices_per_area=args.devices_per_area,
+        history_points=args.history_points,
+        dashboards=args.dashboards,
+        dashboard_views=args.dashboard_views,
+        cards_per_view=args.cards_per_view,
+        seed=args.seed,
+    )
+    tools = [name.strip() for name in args.tools.split(",")] if args.tools else None
+    behavior = BehaviorSpec(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed
+    )
+    report = asyncio.run(run_benchmark(spec, args.iterations, args.warmup, tools, behavior))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print(format_report(report, baseline))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
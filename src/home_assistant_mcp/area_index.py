@@ -0,0 +1,104 @@
+"""In-memory join of the area, device and entity registries."""
+
+from typing import Any
+
+
+class AreaIndex:
+    """Areas with their devices and entities, built from the registries.
+
+    Answers the questions the ``area_*`` template functions answer, without a
+    round trip. An entity without an area of its own is in its device's
+    area, as in Home Assistant.
+
+    Attributes:
+        names: Area names by area ID, in registry order
+    """
+
+    def __init__(
+        self,
+        areas: list[dict[str, Any]],
+        devices: list[dict[str, Any]],
+        entities: list[dict[str, Any]],
+    ):
+        """Join the registries.
+
+        Args:
+            areas: Result of ``config/area_registry/list``
+            devices: Result of ``config/device_registry/list``
+            entities: Result of ``config/entity_registry/list``
+        """
+        self.names: dict[str, str] = {area["area_id"]: area.get("name") or area["area_id"] for area in areas}
+        self._ids_by_name = {name.casefold(): area_id for area_id, name in self.names.items()}
+        self._devices: dict[str, list[str]] = {area_id: [] for area_id in self.names}
+        self._entities: dict[str, list[str]] = {area_id: [] for area_id in self.names}
+        self._entity_areas: dict[str, str] = {}
+
+        device_areas = {}
+        for device in devices:
+            area_id = device.get("area_id")
+            device_areas[device["id"]] = area_id
+            if area_id in self._devices:
+                self._devices[area_id].append(device["id"])
+        for entity in entities:
+            area_id = entity.get("area_id") or device_areas.get(entity.get("device_id"))
+            if area_id in self._entities:
+                self._entities[area_id].append(entity["entity_id"])
+                self._entity_areas[entity["entity_id"]] = area_id
+
+    def resolve(self, area: str) -> str | None:
+        """Get the ID of an area given by ID or name.
+
+        Args:
+            area: Area ID or name (case-insensitive)
+
+        Returns:
+            Area ID, or None if unknown
+        """
+        if area in self.names:
+            return area
+        return self._ids_by_name.get(area.casefold())
+
+    def area_entities(self, area: str, domain: str | None = None) -> list[str]:
+        """Get the entities in an area.
+
+        Args:
+            area: Area ID or name
+            domain: Optional domain to filter (e.g., 'light')
+
+        Returns:
+            Entity IDs (empty for an unknown area)
+        """
+        entity_ids = self._entities.get(self.resolve(area) or "", [])
+        if domain:
+            return [entity_id for entity_id in entity_ids if entity_id.startswith(f"{domain}.")]
+        return list(entity_ids)
+
+    def area_devices(self, area: str) -> list[str]:
+        """Get the devices in an area.
+
+        Args:
+            area: Area ID or name
+
+        Returns:
+            Device IDs (empty for an unknown area)
+        """
+        return list(self._devices.get(self.resolve(area) or "", []))
+
+    def entity_area(self, entity_id: str) -> str | None:
+        """Get the area ID of an entity.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Area ID, or None if not assigned
+        """
+        return self._entity_areas.get(entity_id)
+
+    def entity_areas(self) -> dict[str, str]:
+        """Get the area ID of every entity assigned to one.
+
+        Returns:
+            Area IDs by entity ID
+        """
+        return dict(self._entity_areas)
@@ -0,0 +1,130 @@
+"""Bounded log of entity state changes addressed by opaque cursors."""
+
+import base64
+import json
+import uuid
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any
+
+
+class ChangeLog:
+    """Latest change of each entity, ordered by a sequence number.
+
+    Only the most recent change of an entity is kept, so polling clients get
+    one row per changed entity however often it changed. The log holds at
+    most ``max_entries`` entities; cursors older than the evicted changes, or
+    issued before a gap in the event stream, can no longer be answered and
+    callers fall back to comparing ``last_updated`` times.
+
+    Attributes:
+        max_entries: Maximum number of entities kept
+        epoch: Identifier of this log, embedded in its cursors
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize an empty log.
+
+        Args:
+            max_entries: Maximum number of entities kept before evicting the
+                least recently changed one
+        """
+        self.max_entries = max_entries
+        self.epoch = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._floor = 0
+        self._entries: OrderedDict[str, tuple[int, dict[str, Any] | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of entities with a logged change."""
+        return len(self._entries)
+
+    def record(self, entity_id: str, new_state: dict[str, Any] | None) -> None:
+        """Log a state change.
+
+        Args:
+            entity_id: Entity ID
+            new_state: New state, or None if the entity was removed
+        """
+        self._seq += 1
+        self._entries[entity_id] = (self._seq, new_state)
+        self._entries.move_to_end(entity_id)
+        if len(self._entries) > self.max_entries:
+            _, (seq, _) = self._entries.popitem(last=False)
+            self._floor = seq
+
+    def mark_gap(self) -> None:
+        """Expire every cursor issued so far, e.g. after events were missed."""
+        self._seq += 1
+        self._floor = self._seq
+
+    def cursor(self, timestamp: datetime | None = None) -> str:
+        """Build a cursor for the current position.
+
+        Args:
+            timestamp: Time of the position, used when the cursor is answered
+                by ``last_updated`` comparison (defaults to now)
+
+        Returns:
+            Opaque cursor string
+        """
+        return encode_cursor(self.epoch, self._seq, timestamp or datetime.now(UTC))
+
+    def since(self, cursor: str) -> list[tuple[str, dict[str, Any] | None]] | None:
+        """Get the changes logged after a cursor.
+
+        Args:
+            cursor: Cursor returned by :meth:`cursor`
+
+        Returns:
+            ``(entity_id, new_state)`` pairs in change order, or None if the
+            cursor is from another log or older than the retained changes
+        """
+        position = decode_cursor(cursor)
+        if position is None or position.get("epoch") != self.epoch:
+            return None
+        seq = position.get("seq")
+        if not isinstance(seq, int) or seq < self._floor or seq > self._seq:
+            return None
+        changes = []
+        for entity_id, (entry_seq, state) in reversed(self._entries.items()):
+            if entry_seq <= seq:
+                break
+            changes.append((entity_id, state))
+        changes.reverse()
+        return changes
+
+
+def encode_cursor(epoch: str | None, seq: int, timestamp: datetime) -> str:
+    """Build an opaque cursor.
+
+    Args:
+        epoch: Change log the sequence number belongs to (None if no log)
+        seq: Sequence number of the last change seen
+        timestamp: Time of the position
+
+    Returns:
+        Cursor string
+    """
+    position = {"epoch": epoch, "seq": seq, "time": timestamp.isoformat()}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any] | None:
+    """Decode a cursor built by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Cursor fields (``epoch``, ``seq`` and ``time`` as a datetime), or
+        None if malformed
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position["time"] = datetime.fromisoformat(position["time"])
+    except (ValueError, UnicodeError, TypeError, KeyError):
+        return None
+    if position["time"].tzinfo is None:
+        position["time"] = position["time"].replace(tzinfo=UTC)
+    return position
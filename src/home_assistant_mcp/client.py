@@ -2,48 +2,120 @@
 
 import asyncio
 import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
-import websockets
-from websockets.client import WebSocketClientProtocol
 
+from .change_log import ChangeLog
+from .area_index import AreaIndex
 from .config import HomeAssistantConfig
+from .dashboard_cache import DashboardCache
+from .entity_index import EntityIndex
+from .event_buffer import EventBuffer
+from .event_stream import EventCallback, EventStream
+from .histogram import SIZE_BUCKETS
+from .home_assistant_error import HomeAssistantError
+from .json_patch import apply_patch, content_hash
+from .metrics import METRICS
+from .metrics_registry import MetricsRegistry
 from .models import (
     ApiStatus,
     ConfigEntry,
     Dashboard,
     DashboardConfig,
+    DashboardPatchResult,
     EntityState,
+    FireEventsResult,
     HistoryEntry,
     ServiceCallResponse,
     ServiceDomain,
 )
+from .token_bucket import TokenBucket
+from .tracing import TRACER
 
+if TYPE_CHECKING:
+    from websockets.client import WebSocketClientProtocol
 
-class HomeAssistantError(Exception):
-    """Base exception for Home Assistant client errors."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self, message: str, status_code: int | None = None):
-        super().__init__(message)
-        self.status_code = status_code
+# Event buffers a client keeps open at once
+MAX_EVENT_BUFFERS = 16
+# Seconds an event buffer is kept without being read
+EVENT_BUFFER_IDLE_TIMEOUT = 600.0
+# Seconds an area index is reused when registry changes cannot be followed
+AREA_INDEX_FALLBACK_TTL = 5.0
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """Collapse an API endpoint into a low-cardinality metrics label.
+
+    Args:
+        endpoint: API endpoint (without /api prefix), possibly with a query
+
+    Returns:
+        Endpoint template such as ``/states/{entity_id}``
+    """
+    path = endpoint.split("?", 1)[0]
+    parts = path.strip("/").split("/")
+    if parts[0] == "states" and len(parts) > 1:
+        return "/states/{entity_id}"
+    if parts[0] == "services" and len(parts) > 2:
+        return "/services/{domain}/{service}"
+    if parts[0] == "events" and len(parts) > 1:
+        return "/events/{event_type}"
+    if parts[:2] == ["history", "period"]:
+        return "/history/period"
+    return path or "/"
 
 
 class HomeAssistantClient:
     """Async client for Home Assistant REST API."""
 
-    def __init__(self, config: HomeAssistantConfig):
+    def __init__(self, config: HomeAssistantConfig, metrics: MetricsRegistry | None = None):
         """Initialize the client with configuration.
 
         Args:
             config: Home Assistant configuration
+            metrics: Registry receiving request metrics (defaults to the
+                process-wide registry)
         """
         self.config = config
+        self._metrics = metrics if metrics is not None else METRICS
+        self._in_flight = 0
         self._client: httpx.AsyncClient | None = None
-        self._ws_client: WebSocketClientProtocol | None = None
+        self._ws_client: "WebSocketClientProtocol | None" = None
         self._ws_id: int = 1
         self._ws_lock = asyncio.Lock()
+        self._event_stream: EventStream | None = None
+        self._entity_index: EntityIndex | None = None
+        self._change_log = ChangeLog()
+        self._state_watchers: dict[str, list[EventCallback]] = {}
+        self._state_tracking = False
+        self._state_tracking_lock = asyncio.Lock()
+        self._event_buffers: dict[str, EventBuffer] = {}
+        self._event_buffer_gaps = False
+        self._dashboard_cache = DashboardCache()
+        self._dashboard_tracking = False
+        self._dashboard_tracking_lock = asyncio.Lock()
+        # Dashboard URL path -> lock serializing its patches
+        self._dashboard_patch_locks: dict[str | None, asyncio.Lock] = {}
+        self._entity_index_lock = asyncio.Lock()
+        self._area_index: AreaIndex | None = None
+        # Expiry of an area index built without registry events
+        self._area_index_expires: float | None = None
+        self._area_index_lock = asyncio.Lock()
+        self._registry_tracking = False
+        self._registry_tracking_lock = asyncio.Lock()
+        self._rate_limiters = {
+            "rest": TokenBucket(config.rate_limit_rest, config.rate_limit_burst),
+            "template": TokenBucket(config.rate_limit_template, config.rate_limit_burst),
+            "service": TokenBucket(config.rate_limit_service, config.rate_limit_burst),
+            "ws": TokenBucket(config.rate_limit_ws, config.rate_limit_burst),
+        }
 
     @property
     def _headers(self) -> dict[str, str]:
@@ -76,6 +148,42 @@ class HomeAssistantClient:
                 pass  # Already closed or error closing
             finally:
                 self._ws_client = None
+        if self._event_stream:
+            await self._event_stream.close()
+            self._event_stream = None
+        self._event_buffers.clear()
+        self._event_buffer_gaps = False
+        self._entity_index = None
+        self._state_tracking = False
+        self._state_watchers.clear()
+        self._area_index = None
+        self._registry_tracking = False
+        # Nothing would invalidate the cache without its subscription
+        self._dashboard_cache.clear()
+        self._dashboard_tracking = False
+        self._change_log.mark_gap()
+
+    async def _throttle(self, category: str) -> float:
+        """Wait for the rate limiter of a request category.
+
+        Args:
+            category: Limiter category ('rest', 'template', 'service' or 'ws')
+
+        Returns:
+            Seconds spent waiting in the limiter queue
+        """
+        waited = await self._rate_limiters[category].acquire()
+        if waited > 0:
+            logger.debug(f"Rate limiter '{category}' delayed request by {waited:.3f}s")
+        return waited
+
+    def rate_limit_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every rate limiter.
+
+        Returns:
+            Mapping of limiter category to its statistics (rate, queue, wait times)
+        """
+        return {category: bucket.stats() for category, bucket in self._rate_limiters.items()}
 
     async def __aenter__(self) -> "HomeAssistantClient":
         """Async context manager entry."""
@@ -85,39 +193,102 @@ class HomeAssistantClient:
         """Async context manager exit."""
         await self.close()
 
-    async def _request(
+    async def _send(
         self,
         method: str,
         endpoint: str,
         json: dict[str, Any] | None = None,
-    ) -> Any:
-        """Make an API request.
+        category: str = "rest",
+    ) -> httpx.Response:
+        """Send an HTTP request through the rate limiter and record its metrics.
 
         Args:
             method: HTTP method
             endpoint: API endpoint (without /api prefix)
             json: JSON body for POST requests
+            category: Rate limiter category
 
         Returns:
-            Parsed JSON response
+            Successful HTTP response
 
         Raises:
             HomeAssistantError: If the request fails
         """
+        await self._throttle(category)
+
         client = await self._get_client()
         url = f"/api{endpoint}"
+        labels = {"method": method, "endpoint": _endpoint_label(endpoint)}
 
+        self._in_flight += 1
+        start = time.perf_counter()
         try:
-            response = await client.request(method, url, json=json)
-            response.raise_for_status()
-            return response.json()
+            with TRACER.span(f"http {method}", **labels) as span:
+                response = await client.request(method, url, json=json)
+                if span is not None:
+                    span.set_attribute("status_code", response.status_code)
+                    span.set_attribute("response_bytes", len(response.content))
+                response.raise_for_status()
+            self._metrics.observe(
+                "ha_mcp_http_response_bytes", len(response.content), labels, SIZE_BUCKETS
+            )
+            return response
         except httpx.HTTPStatusError as e:
+            self._metrics.increment(
+                "ha_mcp_http_errors_total", {**labels, "status": str(e.response.status_code)}
+            )
             raise HomeAssistantError(
                 f"HTTP error {e.response.status_code}: {e.response.text}",
                 status_code=e.response.status_code,
             ) from e
         except httpx.RequestError as e:
+            self._metrics.increment("ha_mcp_http_errors_total", {**labels, "status": "error"})
             raise HomeAssistantError(f"Request error: {e}") from e
+        finally:
+            self._in_flight -= 1
+            self._metrics.observe(
+                "ha_mcp_http_request_duration_seconds", time.perf_counter() - start, labels
+            )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make an API request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without /api prefix)
+            json: JSON body for POST requests
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            HomeAssistantError: If the request fails
+        """
+        is_service_call = method == "POST" and endpoint.startswith("/services/")
+        response = await self._send(
+            method, endpoint, json=json, category="service" if is_service_call else "rest"
+        )
+        with TRACER.span("decode"):
+            return response.json()
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get HTTP connection pool usage.
+
+        Returns:
+            Dictionary with requests in flight and open/idle pooled connections
+        """
+        transport = getattr(self._client, "_transport", None)
+        connections = list(getattr(getattr(transport, "_pool", None), "connections", None) or [])
+        return {
+            "in_flight": self._in_flight,
+            "open": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+        }
 
     async def check_api(self) -> ApiStatus:
         """Check if the API is running.
@@ -128,6 +299,26 @@ class HomeAssistantClient:
         data = await self._request("GET", "/")
         return ApiStatus(**data)
 
+    async def warm_up(self, websocket: bool = True) -> None:
+        """Open the connections used by later requests.
+
+        Opens a pooled HTTP connection (including the TLS handshake) with a
+        request to the API root and, optionally, connects and authenticates
+        the WebSocket used for dashboard and registry commands. Requests
+        made concurrently reuse the connections as soon as they are ready.
+
+        Args:
+            websocket: Also open and authenticate the WebSocket
+
+        Raises:
+            HomeAssistantError: If a connection cannot be established
+        """
+        with TRACER.span("warm_up"):
+            await self.check_api()
+            if websocket:
+                async with self._ws_lock:
+                    await self._get_ws_client()
+
     async def get_config(self) -> ConfigEntry:
         """Get Home Assistant configuration.
 
@@ -144,7 +335,8 @@ class HomeAssistantClient:
             List of all entity states
         """
         data = await self._request("GET", "/states")
-        return [EntityState(**item) for item in data]
+        with TRACER.span("validate", model="EntityState", items=len(data)):
+            return [EntityState(**item) for item in data]
 
     async def get_state(self, entity_id: str) -> EntityState:
         """Get state of a specific entity.
@@ -165,7 +357,8 @@ class HomeAssistantClient:
             List of service domains with their services
         """
         data = await self._request("GET", "/services")
-        return [ServiceDomain(**item) for item in data]
+        with TRACER.span("validate", model="ServiceDomain", items=len(data)):
+            return [ServiceDomain(**item) for item in data]
 
     async def call_service(
         self,
@@ -224,9 +417,10 @@ class HomeAssistantClient:
             endpoint += "?" + "&".join(params)
 
         data = await self._request("GET", endpoint)
-        return [
-            [HistoryEntry(**entry) for entry in entity_history] for entity_history in data
-        ]
+        with TRACER.span("validate", model="HistoryEntry", items=len(data)):
+            return [
+                [HistoryEntry(**entry) for entry in entity_history] for entity_history in data
+            ]
 
     async def fire_event(self, event_type: str, event_data: dict[str, Any] | None = None) -> bool:
         """Fire an event.
@@ -241,6 +435,141 @@ class HomeAssistantClient:
         await self._request("POST", f"/events/{event_type}", json=event_data or {})
         return True
 
+    async def fire_events(
+        self, events: list[tuple[str, dict[str, Any] | None]], window: int = 100
+    ) -> FireEventsResult:
+        """Fire many events, pipelined over the authenticated WebSocket.
+
+        Up to ``window`` ``fire_event`` commands are in flight at once, so the
+        batch is not bound by one round trip per event. Each event still
+        passes the WebSocket rate limiter.
+
+        Args:
+            events: ``(event_type, event_data)`` pairs
+            window: Maximum commands awaiting their result
+
+        Returns:
+            Counts, achieved rate and the failure of every failed event
+
+        Raises:
+            HomeAssistantError: If the WebSocket cannot be opened
+        """
+        start = time.perf_counter()
+        with TRACER.span("ws fire_event", events=len(events)):
+            results = await self._ws_pipeline(
+                [
+                    {"type": "fire_event", "event_type": event_type, "event_data": event_data or {}}
+                    for event_type, event_data in events
+                ],
+                window=window,
+            )
+
+        elapsed = time.perf_counter() - start
+        errors = [
+            {"index": index, "event_type": events[index][0], "error": result}
+            for index, (success, result) in enumerate(results)
+            if not success
+        ]
+        fired = len(events) - len(errors)
+        return FireEventsResult(
+            fired=fired,
+            failed=len(errors),
+            elapsed_seconds=round(elapsed, 4),
+            events_per_second=round(fired / elapsed, 1) if elapsed else 0.0,
+            errors=errors,
+        )
+
+    async def _ws_pipeline(self, commands: list[dict[str, Any]], window: int = 100) -> list[tuple[bool, Any]]:
+        """Send WebSocket commands without waiting for each result in turn.
+
+        Commands are sent in windows of up to ``window`` and responses are
+        matched by message ID, so a batch costs about one round trip per
+        window instead of one per command. The WebSocket is held for one
+        window at a time, so other commands are not held up by a long batch.
+        Each command passes the WebSocket rate limiter and is recorded in the
+        same metrics as single commands.
+
+        Args:
+            commands: Commands without their ``id`` (e.g., ``{"type": "get_config"}``)
+            window: Maximum commands awaiting their result
+
+        Returns:
+            ``(success, result)`` per command, in order; the result of a failed
+            command is its error message
+
+        Raises:
+            HomeAssistantError: If the WebSocket cannot be opened
+        """
+        results: list[tuple[bool, Any]] = [(False, "No response")] * len(commands)
+        for first in range(0, len(commands), window):
+            batch = range(first, min(first + window, len(commands)))
+            for _ in batch:
+                await self._throttle("ws")
+            with TRACER.span("ws pipeline", commands=len(batch)) as span:
+                error = await self._ws_pipeline_window(commands, batch, results, span)
+            if error is not None:
+                # Whatever was not confirmed is lost with the connection
+                for index in range(first, len(commands)):
+                    if results[index] == (False, "No response"):
+                        results[index] = (False, error)
+                        self._metrics.increment("ha_mcp_ws_errors_total", {"type": commands[index].get("type")})
+                break
+        return results
+
+    async def _ws_pipeline_window(
+        self, commands: list[dict[str, Any]], batch: range, results: list[tuple[bool, Any]], span: Any
+    ) -> str | None:
+        """Send one window of a pipeline and collect its results.
+
+        Returns:
+            Error message if the connection failed mid-window, else None
+        """
+        import websockets
+
+        # Message ID -> (command index, send time)
+        pending: dict[int, tuple[int, float]] = {}
+        response_bytes = 0
+        async with self._ws_lock:
+            ws = await self._get_ws_client()
+            try:
+                for index in batch:
+                    message_id = self._ws_id
+                    self._ws_id += 1
+                    pending[message_id] = (index, time.perf_counter())
+                    await ws.send(json.dumps({"id": message_id, **commands[index]}))
+                while pending:
+                    response_raw = await ws.recv()
+                    response = json.loads(response_raw)
+                    entry = pending.pop(response.get("id"), None)
+                    if entry is None:
+                        continue
+                    index, sent_at = entry
+                    labels = {"type": commands[index].get("type")}
+                    response_bytes += len(response_raw)
+                    self._metrics.observe("ha_mcp_ws_response_bytes", len(response_raw), labels, SIZE_BUCKETS)
+                    self._metrics.observe(
+                        "ha_mcp_ws_command_duration_seconds", time.perf_counter() - sent_at, labels
+                    )
+                    if response.get("success", False):
+                        results[index] = (True, response.get("result"))
+                    else:
+                        results[index] = (False, response.get("error", {}).get("message", "Unknown error"))
+                        self._metrics.increment("ha_mcp_ws_errors_total", labels)
+            except (websockets.exceptions.WebSocketException, json.JSONDecodeError) as e:
+                # Later responses can no longer be matched, so the connection is dropped
+                self._ws_client = None
+                try:
+                    await ws.close()
+                except (websockets.exceptions.WebSocketException, OSError) as close_error:
+                    logger.debug(f"Error closing WebSocket after failed pipeline: {close_error}")
+                if isinstance(e, json.JSONDecodeError):
+                    return f"Failed to parse response: {e}"
+                return f"WebSocket error: {e}"
+            finally:
+                if span is not None:
+                    span.set_attribute("response_bytes", response_bytes)
+        return None
+
     async def get_entities_by_domain(self, domain: str) -> list[EntityState]:
         """Get all entities for a specific domain.
 
@@ -301,20 +630,10 @@ class HomeAssistantClient:
         Returns:
             Rendered template result as string
         """
-        client = await self._get_client()
-        url = "/api/template"
-
-        try:
-            response = await client.post(url, json={"template": template})
-            response.raise_for_status()
-            return response.text
-        except httpx.HTTPStatusError as e:
-            raise HomeAssistantError(
-                f"HTTP error {e.response.status_code}: {e.response.text}",
-                status_code=e.response.status_code,
-            ) from e
-        except httpx.RequestError as e:
-            raise HomeAssistantError(f"Request error: {e}") from e
+        response = await self._send(
+            "POST", "/template", json={"template": template}, category="template"
+        )
+        return response.text
 
     async def get_areas(self) -> list[str]:
         """Get all configured areas.
@@ -322,9 +641,8 @@ class HomeAssistantClient:
         Returns:
             List of area IDs
         """
-        result = await self.render_template("{{ areas() | list }}")
-        import ast
-        return ast.literal_eval(result)
+        index = await self.get_area_index()
+        return list(index.names)
 
     async def get_area_entities(self, area: str, domain: str | None = None) -> list[str]:
         """Get all entities in an area.
@@ -336,13 +654,8 @@ class HomeAssistantClient:
         Returns:
             List of entity IDs in the area
         """
-        if domain:
-            template = f'{{{{ area_entities("{area}") | select("match", "{domain}") | list }}}}'
-        else:
-            template = f'{{{{ area_entities("{area}") | list }}}}'
-        result = await self.render_template(template)
-        import ast
-        return ast.literal_eval(result)
+        index = await self.get_area_index()
+        return index.area_entities(area, domain)
 
     async def get_area_devices(self, area: str) -> list[str]:
         """Get all devices in an area.
@@ -353,9 +666,8 @@ class HomeAssistantClient:
         Returns:
             List of device IDs in the area
         """
-        result = await self.render_template(f'{{{{ area_devices("{area}") | list }}}}')
-        import ast
-        return ast.literal_eval(result)
+        index = await self.get_area_index()
+        return index.area_devices(area)
 
     async def get_entity_area(self, entity_id: str) -> str | None:
         """Get the area name for an entity.
@@ -366,8 +678,9 @@ class HomeAssistantClient:
         Returns:
             Area name or None if not assigned
         """
-        result = await self.render_template(f'{{{{ area_name("{entity_id}") }}}}')
-        return result.strip() if result.strip() else None
+        index = await self.get_area_index()
+        area_id = index.entity_area(entity_id)
+        return index.names[area_id] if area_id else None
 
     async def get_area_id(self, area_name: str) -> str | None:
         """Get the area ID from an area name.
@@ -378,8 +691,8 @@ class HomeAssistantClient:
         Returns:
             Area ID or None if not found
         """
-        result = await self.render_template(f'{{{{ area_id("{area_name}") }}}}')
-        return result.strip() if result.strip() and result.strip() != "None" else None
+        index = await self.get_area_index()
+        return index.resolve(area_name)
 
     async def get_area_name(self, area_id: str) -> str | None:
         """Get the area name from an area ID.
@@ -390,8 +703,87 @@ class HomeAssistantClient:
         Returns:
             Area name or None if not found
         """
-        result = await self.render_template(f'{{{{ area_name("{area_id}") }}}}')
-        return result.strip() if result.strip() and result.strip() != "None" else None
+        index = await self.get_area_index()
+        return index.names.get(area_id)
+
+    async def get_area_assignments(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Get every area and the area of every entity.
+
+        An entity without an area of its own is in its device's area.
+
+        Returns:
+            Tuple of area names by area ID and area IDs by entity ID (entities
+            without an area are left out)
+
+        Raises:
+            HomeAssistantError: If a registry cannot be read
+        """
+        index = await self.get_area_index()
+        return dict(index.names), index.entity_areas()
+
+    async def get_area_index(self) -> AreaIndex:
+        """Get the join of the area, device and entity registries.
+
+        Built on first use from the three registries, requested in one
+        pipelined batch, and rebuilt after a registry change or an event
+        stream reconnect. If events are unavailable, the index is reused for
+        ``AREA_INDEX_FALLBACK_TTL`` seconds, so a tool looking up many areas
+        reads the registries once.
+
+        Returns:
+            Area index
+
+        Raises:
+            HomeAssistantError: If a registry cannot be read
+        """
+        async with self._area_index_lock:
+            if self._area_index is not None and (
+                self._area_index_expires is None or time.monotonic() < self._area_index_expires
+            ):
+                return self._area_index
+            # Subscribe before loading so no change falls between the two
+            live = await self._track_registry_changes()
+            with TRACER.span("registries"):
+                results = await self._ws_pipeline(
+                    [
+                        {"type": "config/area_registry/list"},
+                        {"type": "config/device_registry/list"},
+                        {"type": "config/entity_registry/list"},
+                    ]
+                )
+            for success, result in results:
+                if not success:
+                    raise HomeAssistantError(f"Registry unavailable: {result}")
+            index = AreaIndex(*(result for _, result in results))
+            self._area_index = index
+            self._area_index_expires = None if live else time.monotonic() + AREA_INDEX_FALLBACK_TTL
+            return index
+
+    async def _track_registry_changes(self) -> bool:
+        """Subscribe to the registry events that invalidate the area and entity indexes.
+
+        Returns:
+            True if the subscriptions are established
+        """
+        if self._registry_tracking:
+            return True
+        async with self._registry_tracking_lock:
+            if self._registry_tracking:
+                return True
+            try:
+                for event_type in ("area_registry_updated", "device_registry_updated", "entity_registry_updated"):
+                    await self.subscribe_events(event_type, lambda event: self._drop_area_index())
+            except HomeAssistantError as e:
+                logger.warning(f"Registry events unavailable, rereading the registries on lookup: {e}")
+                return False
+            self.add_event_reconnect_listener(self._drop_area_index)
+            self._registry_tracking = True
+            return True
+
+    def _drop_area_index(self) -> None:
+        """Discard the area index and the entity index built on it."""
+        self._area_index = None
+        self._entity_index = None
 
     def _get_ws_url(self) -> str:
         """Convert HTTP URL to WebSocket URL.
@@ -407,7 +799,7 @@ class HomeAssistantClient:
         else:
             raise HomeAssistantError(f"Invalid URL format: {url}")
 
-    async def _get_ws_client(self) -> WebSocketClientProtocol:
+    async def _get_ws_client(self) -> "WebSocketClientProtocol":
         """Get or create the WebSocket client with authentication.
 
         Returns:
@@ -418,44 +810,54 @@ class HomeAssistantClient:
         """
         # Check if we have an existing open connection
         if self._ws_client:
-            try:
-                # Try to check if connection is still open
-                if hasattr(self._ws_client, 'closed'):
-                    if not self._ws_client.closed:
-                        return self._ws_client
-                elif hasattr(self._ws_client, 'open'):
-                    if self._ws_client.open:
-                        return self._ws_client
-                else:
-                    # If we can't determine state, assume we need a new connection
+            # Check if the connection is still open; otherwise create a new one
+            if hasattr(self._ws_client, 'closed'):
+                if not self._ws_client.closed:
                     return self._ws_client
-            except Exception:
-                # Connection check failed, create a new one
-                pass
+            elif hasattr(self._ws_client, 'open'):
+                if self._ws_client.open:
+                    return self._ws_client
+            else:
+                # If we can't determine state, assume the connection is usable
+                return self._ws_client
+
+        self._ws_client = await self._ws_connect()
+        return self._ws_client
+
+    async def _ws_connect(self) -> "WebSocketClientProtocol":
+        """Open a new WebSocket connection and authenticate it.
+
+        Returns:
+            Authenticated WebSocket connection
+
+        Raises:
+            HomeAssistantError: If connection or authentication fails
+        """
+        # Imported on first use so REST-only sessions never load websockets
+        import websockets
 
         ws_url = self._get_ws_url()
+        ws: "WebSocketClientProtocol | None" = None
 
         try:
             # Connect to WebSocket
-            self._ws_client = await websockets.connect(
+            ws = await websockets.connect(
                 ws_url,
                 ssl=self.config.verify_ssl if ws_url.startswith("wss://") else None,
             )
 
             # Receive auth_required message
-            auth_msg = await self._ws_client.recv()
+            auth_msg = await ws.recv()
             auth_data = json.loads(auth_msg)
 
             if auth_data.get("type") != "auth_required":
                 raise HomeAssistantError(f"Unexpected message: {auth_data}")
 
             # Send auth token
-            await self._ws_client.send(
-                json.dumps({"type": "auth", "access_token": self.config.token})
-            )
+            await ws.send(json.dumps({"type": "auth", "access_token": self.config.token}))
 
             # Receive auth response
-            auth_response = await self._ws_client.recv()
+            auth_response = await ws.recv()
             auth_result = json.loads(auth_response)
 
             if auth_result.get("type") == "auth_invalid":
@@ -465,7 +867,7 @@ class HomeAssistantClient:
             elif auth_result.get("type") != "auth_ok":
                 raise HomeAssistantError(f"Unexpected auth response: {auth_result}")
 
-            return self._ws_client
+            return ws
 
         except websockets.exceptions.WebSocketException as e:
             raise HomeAssistantError(f"WebSocket connection error: {e}") from e
@@ -485,41 +887,62 @@ class HomeAssistantClient:
         Raises:
             HomeAssistantError: If the request fails
         """
-        async with self._ws_lock:
-            ws = await self._get_ws_client()
-
-            # Prepare message with auto-incrementing ID
-            message_id = self._ws_id
-            self._ws_id += 1
-
-            message = {"id": message_id, "type": message_type, **kwargs}
+        import websockets
 
-            try:
-                # Send message
-                await ws.send(json.dumps(message))
-
-                # Receive response
-                response_raw = await ws.recv()
-                response = json.loads(response_raw)
-
-                # Verify message ID matches
-                if response.get("id") != message_id:
-                    raise HomeAssistantError(
-                        f"Message ID mismatch: expected {message_id}, got {response.get('id')}"
-                    )
+        await self._throttle("ws")
 
-                # Check for success
-                if not response.get("success", False):
-                    error = response.get("error", {})
-                    error_msg = error.get("message", "Unknown error")
-                    raise HomeAssistantError(f"WebSocket request failed: {error_msg}")
-
-                return response.get("result")
-
-            except websockets.exceptions.WebSocketException as e:
-                raise HomeAssistantError(f"WebSocket error: {e}") from e
-            except json.JSONDecodeError as e:
-                raise HomeAssistantError(f"Failed to parse response: {e}") from e
+        labels = {"type": message_type}
+        start = time.perf_counter()
+        try:
+            with TRACER.span(f"ws {message_type}") as span:
+                async with self._ws_lock:
+                    ws = await self._get_ws_client()
+
+                    # Prepare message with auto-incrementing ID
+                    message_id = self._ws_id
+                    self._ws_id += 1
+
+                    message = {"id": message_id, "type": message_type, **kwargs}
+
+                    try:
+                        # Send message
+                        await ws.send(json.dumps(message))
+
+                        # Receive response
+                        response_raw = await ws.recv()
+                        self._metrics.observe(
+                            "ha_mcp_ws_response_bytes", len(response_raw), labels, SIZE_BUCKETS
+                        )
+                        if span is not None:
+                            span.set_attribute("response_bytes", len(response_raw))
+                        with TRACER.span("decode"):
+                            response = json.loads(response_raw)
+
+                        # Verify message ID matches
+                        if response.get("id") != message_id:
+                            raise HomeAssistantError(
+                                f"Message ID mismatch: expected {message_id}, got {response.get('id')}"
+                            )
+
+                        # Check for success
+                        if not response.get("success", False):
+                            error = response.get("error", {})
+                            error_msg = error.get("message", "Unknown error")
+                            raise HomeAssistantError(f"WebSocket request failed: {error_msg}")
+
+                        return response.get("result")
+
+                    except websockets.exceptions.WebSocketException as e:
+                        raise HomeAssistantError(f"WebSocket error: {e}") from e
+                    except json.JSONDecodeError as e:
+                        raise HomeAssistantError(f"Failed to parse response: {e}") from e
+        except HomeAssistantError:
+            self._metrics.increment("ha_mcp_ws_errors_total", labels)
+            raise
+        finally:
+            self._metrics.observe(
+                "ha_mcp_ws_command_duration_seconds", time.perf_counter() - start, labels
+            )
 
     async def list_dashboards(self) -> list[Dashboard]:
         """List all Lovelace dashboards.
@@ -527,8 +950,17 @@ class HomeAssistantClient:
         Returns:
             List of dashboards
         """
+        cache = self._dashboard_cache if await self._track_dashboard_changes() else None
+        if cache is not None and (dashboards := cache.dashboards()) is not None:
+            return dashboards
+
+        generation = self._dashboard_cache.generation
         result = await self._ws_request("lovelace/dashboards/list")
-        return [Dashboard(**item) for item in result]
+        with TRACER.span("validate", model="Dashboard", items=len(result)):
+            dashboards = [Dashboard(**item) for item in result]
+        if cache is not None:
+            cache.store_dashboards(dashboards, generation)
+        return dashboards
 
     async def get_dashboard_config(self, url_path: str | None = None) -> DashboardConfig:
         """Get configuration of a specific dashboard.
@@ -539,12 +971,20 @@ class HomeAssistantClient:
         Returns:
             Dashboard configuration
         """
-        params = {}
-        if url_path is not None:
-            params["url_path"] = url_path
+        _, config = await self._dashboard_config(url_path)
+        return config
+
+    async def _dashboard_config(self, url_path: str | None) -> tuple[dict[str, Any], DashboardConfig]:
+        """Get the raw and parsed config of a dashboard, from the cache if possible."""
+        tracking = await self._track_dashboard_changes()
+        if tracking and (entry := self._dashboard_cache.config(url_path)) is not None:
+            return entry
 
+        params = {"url_path": url_path} if url_path is not None else {}
+        generation = self._dashboard_cache.generation if tracking else -1
         result = await self._ws_request("lovelace/config", **params)
-        return DashboardConfig(**result)
+        with TRACER.span("validate", model="DashboardConfig"):
+            return result, self._dashboard_cache.store_config(url_path, result, generation)
 
     async def create_dashboard(
         self,
@@ -576,8 +1016,27 @@ class HomeAssistantClient:
             params["icon"] = icon
 
         result = await self._ws_request("lovelace/dashboards/create", **params)
+        self._dashboard_cache.drop_dashboards()
         return Dashboard(**result)
 
+    async def create_dashboards(self, dashboards: list[dict[str, Any]]) -> list[Dashboard | HomeAssistantError]:
+        """Create several dashboards with pipelined WebSocket commands.
+
+        Args:
+            dashboards: Fields of each dashboard (``url_path``, ``title`` and
+                optionally ``icon``, ``show_in_sidebar``, ``require_admin``)
+
+        Returns:
+            Created dashboard, or the error raised for it, in order
+        """
+        if not dashboards:
+            return []
+        results = await self._ws_pipeline(
+            [{"type": "lovelace/dashboards/create", **fields} for fields in dashboards]
+        )
+        self._dashboard_cache.drop_dashboards()
+        return [Dashboard(**result) if success else HomeAssistantError(result) for success, result in results]
+
     async def update_dashboard(self, dashboard_id: str, **updates: Any) -> Dashboard:
         """Update an existing dashboard.
 
@@ -590,6 +1049,7 @@ class HomeAssistantClient:
         """
         params = {"dashboard_id": dashboard_id, **updates}
         result = await self._ws_request("lovelace/dashboards/update", **params)
+        self._dashboard_cache.drop_dashboards()
         return Dashboard(**result)
 
     async def delete_dashboard(self, dashboard_id: str) -> bool:
@@ -602,6 +1062,8 @@ class HomeAssistantClient:
             True if successful
         """
         await self._ws_request("lovelace/dashboards/delete", dashboard_id=dashboard_id)
+        # The deleted dashboard's URL path is unknown here
+        self._dashboard_cache.clear()
         return True
 
     async def save_dashboard_config(
@@ -620,5 +1082,378 @@ class HomeAssistantClient:
         if url_path is not None:
             params["url_path"] = url_path
 
-        await self._ws_request("lovelace/config/save", **params)
+        try:
+            await self._ws_request("lovelace/config/save", **params)
+        finally:
+            self._dashboard_cache.drop_config(url_path)
         return True
+
+    async def save_dashboard_configs(
+        self, configs: dict[str | None, dict[str, Any]]
+    ) -> dict[str | None, HomeAssistantError | None]:
+        """Save several dashboard configurations with pipelined WebSocket commands.
+
+        Args:
+            configs: Configuration by dashboard URL path (None for default)
+
+        Returns:
+            None for every saved dashboard, or the error raised for it, by URL path
+        """
+        commands = []
+        for url_path, config in configs.items():
+            command: dict[str, Any] = {"type": "lovelace/config/save", "config": config}
+            if url_path is not None:
+                command["url_path"] = url_path
+            commands.append(command)
+        try:
+            results = await self._ws_pipeline(commands) if commands else []
+        finally:
+            for url_path in configs:
+                self._dashboard_cache.drop_config(url_path)
+        return {
+            url_path: None if success else HomeAssistantError(result)
+            for url_path, (success, result) in zip(configs, results)
+        }
+
+    async def patch_dashboard_config(
+        self,
+        operations: list[dict[str, Any]],
+        url_path: str | None = None,
+        base_hash: str | None = None,
+    ) -> DashboardPatchResult:
+        """Apply JSON Patch operations to a dashboard configuration.
+
+        The patch is applied to the cached copy of the config when there is
+        one, so only the save goes to Home Assistant. The save is skipped when
+        the patch leaves the config unchanged. Patches of one dashboard run one
+        at a time, so a second patch against the same ``base_hash`` sees the
+        first one's save and is refused.
+
+        Args:
+            operations: JSON Patch operations (add, remove, replace, move, copy, test)
+            url_path: Dashboard URL path (None for default)
+            base_hash: Content hash of the config the operations were written
+                against; the patch is refused if the config has changed since
+
+        Returns:
+            Patch result with the content hashes before and after
+
+        Raises:
+            HomeAssistantError: If the config no longer matches ``base_hash`` (409)
+            ValueError: If an operation cannot be applied
+        """
+        lock = self._dashboard_patch_locks.setdefault(url_path, asyncio.Lock())
+        async with lock:
+            current, _ = await self._dashboard_config(url_path)
+            current_hash = content_hash(current)
+            if base_hash and current_hash != base_hash:
+                # A cached copy may predate an event lost while the stream reconnected
+                self._dashboard_cache.drop_config(url_path)
+                current, _ = await self._dashboard_config(url_path)
+                current_hash = content_hash(current)
+            if base_hash and current_hash != base_hash:
+                raise HomeAssistantError(
+                    f"Dashboard '{url_path or 'default'}' was modified since {base_hash} "
+                    f"(current hash {current_hash})",
+                    409,
+                )
+
+            with TRACER.span("dashboard.patch", operations=len(operations)):
+                patched = apply_patch(current, operations)
+                patched_hash = content_hash(patched)
+            changed = patched_hash != current_hash
+            if changed:
+                await self.save_dashboard_config(patched, url_path)
+        return DashboardPatchResult(
+            url_path=url_path,
+            changed=changed,
+            hash=patched_hash,
+            previous_hash=current_hash,
+            operations=len(operations),
+        )
+
+    async def _track_dashboard_changes(self) -> bool:
+        """Subscribe the dashboard cache to the events that make it stale.
+
+        Returns:
+            True if the subscription is established (False if the cache is
+            disabled)
+        """
+        if self._dashboard_tracking:
+            return True
+        async with self._dashboard_tracking_lock:
+            if self._dashboard_tracking:
+                return True
+            if not self.config.dashboard_cache:
+                return False
+            try:
+                await self.subscribe_events("lovelace_updated", self._on_lovelace_updated)
+            except HomeAssistantError as e:
+                logger.warning(f"Dashboard events unavailable, dashboards will not be cached: {e}")
+                return False
+            self.add_event_reconnect_listener(self._dashboard_cache.clear)
+            self._dashboard_tracking = True
+            return True
+
+    def _on_lovelace_updated(self, event: dict[str, Any]) -> None:
+        """Drop the cached config of a dashboard changed in Home Assistant."""
+        self._dashboard_cache.drop_config(event.get("data", {}).get("url_path"))
+
+    def _get_event_stream(self) -> EventStream:
+        """Get or create the event stream used for subscriptions.
+
+        Returns:
+            Event stream sharing this client's connection settings
+        """
+        if self._event_stream is None:
+            self._event_stream = EventStream(self._ws_connect, timeout=self.config.timeout)
+        return self._event_stream
+
+    def add_event_reconnect_listener(self, listener: Callable[[], Any]) -> None:
+        """Register a callback run when the event stream reconnects.
+
+        Events may be lost while disconnected, so anything derived from them
+        should be refreshed by the listener.
+
+        Args:
+            listener: Callable invoked with no arguments
+        """
+        self._get_event_stream().add_reconnect_listener(listener)
+
+    async def subscribe_events(
+        self, event_type: str | None, callback: EventCallback
+    ) -> Callable[[], Awaitable[None]]:
+        """Subscribe to Home Assistant events.
+
+        Events are received on a dedicated WebSocket connection and passed to
+        ``callback`` from a background task as they arrive.
+
+        Args:
+            event_type: Event type to subscribe to (None for all events)
+            callback: Called with each event payload (``event_type``, ``data``, ...)
+
+        Returns:
+            Coroutine function that cancels the subscription
+
+        Raises:
+            HomeAssistantError: If the subscription cannot be established
+        """
+        await self._throttle("ws")
+
+        command: dict[str, Any] = {"type": "subscribe_events"}
+        if event_type:
+            command["event_type"] = event_type
+        return await self._get_event_stream().subscribe(command, callback)
+
+    async def get_entity_index(self) -> EntityIndex:
+        """Get the entity search index, building it on first use.
+
+        The index is kept current from ``state_changed`` events and rebuilt
+        after a registry change or an event stream reconnect. If events are
+        unavailable, a fresh index is built on every call.
+
+        Returns:
+            Index of every entity with its area name
+
+        Raises:
+            HomeAssistantError: If the states cannot be loaded
+        """
+        async with self._entity_index_lock:
+            if self._entity_index is not None:
+                return self._entity_index
+            # Subscribe before loading so no change falls between the two
+            live = await self._track_state_changes()
+            index = await self._build_entity_index()
+            if live:
+                self._entity_index = index
+            return index
+
+    async def get_change_log(self) -> ChangeLog | None:
+        """Get the log of state changes, starting it on first use.
+
+        Returns:
+            Change log fed from ``state_changed`` events, or None if events
+            are unavailable
+        """
+        return self._change_log if await self._track_state_changes() else None
+
+    async def watch_state(self, entity_id: str, callback: EventCallback) -> Callable[[], Awaitable[None]]:
+        """Receive the ``state_changed`` events of one entity.
+
+        Events come from the client's single ``state_changed`` subscription,
+        shared with the entity index and change log, so concurrent watchers
+        add no Home Assistant subscriptions.
+
+        Args:
+            entity_id: Entity ID to watch
+            callback: Called with each ``state_changed`` event of the entity
+
+        Returns:
+            Coroutine function that stops the watch
+
+        Raises:
+            HomeAssistantError: If state change events are unavailable
+        """
+        if not await self._track_state_changes():
+            raise HomeAssistantError("State change events are unavailable")
+        self._state_watchers.setdefault(entity_id, []).append(callback)
+
+        async def unwatch() -> None:
+            watchers = self._state_watchers.get(entity_id, [])
+            if callback in watchers:
+                watchers.remove(callback)
+            if not watchers:
+                self._state_watchers.pop(entity_id, None)
+
+        return unwatch
+
+    async def _track_state_changes(self) -> bool:
+        """Subscribe the entity index and change log to the events keeping them current.
+
+        Returns:
+            True if the subscriptions are established
+        """
+        if self._state_tracking:
+            return True
+        async with self._state_tracking_lock:
+            if self._state_tracking:
+                return True
+            # Entities carry area names, so the index also follows registry changes
+            if not await self._track_registry_changes():
+                return False
+            try:
+                await self.subscribe_events("state_changed", self._on_state_changed)
+            except HomeAssistantError as e:
+                logger.warning(f"State change events unavailable, reading full states instead: {e}")
+                return False
+            self.add_event_reconnect_listener(self._on_state_events_gap)
+            self._state_tracking = True
+            return True
+
+    async def _build_entity_index(self) -> EntityIndex:
+        """Load every state and area into a new entity index."""
+        with TRACER.span("entity_index.build"):
+            states, areas = await asyncio.gather(self.get_states(), self.get_area_index())
+            index = EntityIndex()
+            for state in states:
+                area_id = areas.entity_area(state.entity_id)
+                index.update(state.model_dump(mode="json"), area=areas.names[area_id] if area_id else None)
+            return index
+
+    def _on_state_changed(self, event: dict[str, Any]) -> None:
+        """Apply a ``state_changed`` event to the change log, watchers and entity index."""
+        data = event.get("data", {})
+        entity_id = data.get("entity_id")
+        if not entity_id:
+            return
+        new_state = data.get("new_state")
+        self._change_log.record(entity_id, new_state)
+        for callback in list(self._state_watchers.get(entity_id, ())):
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("State watcher failed")
+        if self._entity_index is None:
+            return
+        if new_state is None:
+            self._entity_index.remove(entity_id)
+        else:
+            self._entity_index.update(new_state)
+
+    def _on_state_events_gap(self) -> None:
+        """Invalidate what was derived from events that may have been missed."""
+        self._entity_index = None
+        self._change_log.mark_gap()
+
+    async def open_event_buffer(
+        self, event_types: list[str], max_events: int = 1000, buffer_id: str | None = None
+    ) -> EventBuffer:
+        """Subscribe to events into a new bounded buffer.
+
+        Buffers not read for :data:`EVENT_BUFFER_IDLE_TIMEOUT` seconds are
+        closed, so abandoned subscriptions do not hold on to their slots.
+
+        Args:
+            event_types: Event types to buffer (empty for all events)
+            max_events: Maximum number of buffered events
+            buffer_id: Subscription identifier (random if None). If a buffer
+                with this identifier is open, it is returned unchanged.
+
+        Returns:
+            Buffer receiving the events
+
+        Raises:
+            HomeAssistantError: If too many buffers are open or the
+                subscription cannot be established
+        """
+        await self._expire_event_buffers()
+        if buffer_id is not None and buffer_id in self._event_buffers:
+            return self._event_buffers[buffer_id]
+        if len(self._event_buffers) >= MAX_EVENT_BUFFERS:
+            raise HomeAssistantError(
+                f"Too many event subscriptions open (limit {MAX_EVENT_BUFFERS}); unsubscribe one first"
+            )
+        buffer = EventBuffer(event_types, max_events, buffer_id)
+        try:
+            for event_type in event_types or [None]:
+                buffer.unsubscribe.append(await self.subscribe_events(event_type, buffer.append))
+        except HomeAssistantError:
+            for unsubscribe in buffer.unsubscribe:
+                await unsubscribe()
+            raise
+        self._event_buffers[buffer.id] = buffer
+        if not self._event_buffer_gaps:
+            self.add_event_reconnect_listener(self._on_event_buffers_gap)
+            self._event_buffer_gaps = True
+        return buffer
+
+    def _on_event_buffers_gap(self) -> None:
+        """Record in every buffer that events may have been lost while reconnecting."""
+        for buffer in self._event_buffers.values():
+            buffer.mark_gap()
+
+    async def _expire_event_buffers(self) -> None:
+        """Close the event buffers nobody read for too long."""
+        deadline = time.monotonic() - EVENT_BUFFER_IDLE_TIMEOUT
+        for buffer_id in [bid for bid, buffer in self._event_buffers.items() if buffer.last_read < deadline]:
+            logger.info(f"Closing event subscription '{buffer_id}' unread for {EVENT_BUFFER_IDLE_TIMEOUT:g}s")
+            await self.close_event_buffer(buffer_id)
+
+    def get_event_buffer(self, buffer_id: str) -> EventBuffer:
+        """Get an open event buffer.
+
+        Args:
+            buffer_id: Subscription identifier
+
+        Returns:
+            The event buffer
+
+        Raises:
+            HomeAssistantError: If no such buffer is open
+        """
+        buffer = self._event_buffers.get(buffer_id)
+        if buffer is None:
+            raise HomeAssistantError(
+                f"Unknown event subscription '{buffer_id}' (closed, or expired after "
+                f"{EVENT_BUFFER_IDLE_TIMEOUT:g}s without reads)",
+                status_code=404,
+            )
+        return buffer
+
+    async def close_event_buffer(self, buffer_id: str) -> EventBuffer:
+        """Unsubscribe an event buffer and forget it.
+
+        Args:
+            buffer_id: Subscription identifier
+
+        Returns:
+            The closed buffer
+
+        Raises:
+            HomeAssistantError: If no such buffer is open
+        """
+        buffer = self.get_event_buffer(buffer_id)
+        del self._event_buffers[buffer_id]
+        for unsubscribe in buffer.unsubscribe:
+            await unsubscribe()
+        return buffer
@@ -0,0 +1,101 @@
+"""Pool of Home Assistant clients, one per configured instance."""
+
+from typing import TYPE_CHECKING
+
+from .config import HomeAssistantConfig
+from .home_assistant_error import HomeAssistantError
+
+if TYPE_CHECKING:
+    from .client import HomeAssistantClient
+
+
+class ClientPool:
+    """Home Assistant clients of several instances, created on first use.
+
+    Each instance keeps its own client, and so its own HTTP connection pool,
+    WebSocket, event stream and rate limiters.
+
+    Attributes:
+        configs: Configuration per instance name
+        default: Name of the instance used when a call names none
+    """
+
+    def __init__(self, configs: dict[str, HomeAssistantConfig], default: str | None = None):
+        """Initialize the pool.
+
+        Args:
+            configs: Configuration per instance name
+            default: Default instance (the first configured one if None)
+
+        Raises:
+            ValueError: If no instance is configured or the default is unknown
+        """
+        if not configs:
+            raise ValueError("At least one Home Assistant instance is required")
+        self.configs = dict(configs)
+        self.default = default if default is not None else next(iter(self.configs))
+        if self.default not in self.configs:
+            raise ValueError(f"Unknown default instance '{self.default}'")
+        self._clients: dict[str, "HomeAssistantClient"] = {}
+
+    def __len__(self) -> int:
+        """Number of configured instances."""
+        return len(self.configs)
+
+    @property
+    def names(self) -> list[str]:
+        """Configured instance names, default first."""
+        return [self.default, *(name for name in self.configs if name != self.default)]
+
+    def get(self, instance: str | None = None) -> "HomeAssistantClient":
+        """Get the client of an instance.
+
+        Args:
+            instance: Instance name (the default instance if None)
+
+        Returns:
+            Client of the instance
+
+        Raises:
+            HomeAssistantError: If the instance is not configured
+        """
+        name = instance if instance is not None else self.default
+        client = self._clients.get(name)
+        if client is None:
+            if name not in self.configs:
+                raise HomeAssistantError(
+                    f"Unknown Home Assistant instance '{name}' (configured: {', '.join(self.names)})"
+                )
+            config = self.configs[name]
+            # Deferred so listing tools does not load the client stack
+            if config.state_daemon_socket:
+                from .shared_state_client import SharedStateClient
+
+                client = self._clients[name] = SharedStateClient(config)
+            else:
+                from .client import HomeAssistantClient
+
+                client = self._clients[name] = HomeAssistantClient(config)
+        return client
+
+    def clients(self) -> dict[str, "HomeAssistantClient"]:
+        """Get the clients of every instance, creating missing ones.
+
+        Returns:
+            Mapping of instance name to client, default first
+        """
+        return {name: self.get(name) for name in self.names}
+
+    def active(self) -> dict[str, "HomeAssistantClient"]:
+        """Get the clients created so far.
+
+        Returns:
+            Mapping of instance name to client
+        """
+        return dict(self._clients)
+
+    async def close(self) -> None:
+        """Close every client."""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
@@ -14,6 +14,27 @@ class HomeAssistantConfig(BaseModel):
     token: str = Field(..., description="Long-lived access token")
     verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
     timeout: float = Field(default=30.0, description="Request timeout in seconds")
+    rate_limit_rest: float = Field(
+        default=0.0, ge=0, description="Max REST requests per second (0 disables limiting)"
+    )
+    rate_limit_template: float = Field(
+        default=0.0, ge=0, description="Max template renders per second (0 disables limiting)"
+    )
+    rate_limit_service: float = Field(
+        default=0.0, ge=0, description="Max service calls per second (0 disables limiting)"
+    )
+    rate_limit_ws: float = Field(
+        default=0.0, ge=0, description="Max WebSocket commands per second (0 disables limiting)"
+    )
+    rate_limit_burst: float | None = Field(
+        default=None, ge=1, description="Burst size for every limiter (default: one second of rate, min 1)"
+    )
+    state_daemon_socket: str | None = Field(
+        default=None, description="Unix socket of a shared state cache daemon (direct if unset)"
+    )
+    dashboard_cache: bool = Field(
+        default=True, description="Cache dashboard lists and configs until lovelace_updated"
+    )
 
     @field_validator("url")
     @classmethod
@@ -30,6 +51,56 @@ class HomeAssistantConfig(BaseModel):
         return v.strip()
 
 
+DEFAULT_INSTANCE = "default"
+"""Instance name used when ``HA_INSTANCES`` is not set."""
+
+
+def _config_from_env(prefix: str = "HA_") -> HomeAssistantConfig:
+    """Build a configuration from ``<prefix>*`` variables.
+
+    Settings missing under the prefix fall back to the shared ``HA_*``
+    variables, so instances only need their own URL and token. The state
+    daemon socket is the exception: a daemon serves a single instance, so it
+    is only read under the prefix.
+
+    Args:
+        prefix: Variable prefix, e.g. ``HA_`` or ``HA_OFFICE_``
+
+    Returns:
+        HomeAssistantConfig instance
+
+    Raises:
+        ValueError: If the URL or token is missing
+    """
+
+    def getenv(name: str, default: str | None = None) -> str | None:
+        return os.getenv(f"{prefix}{name}") or os.getenv(f"HA_{name}", default)
+
+    url = os.getenv(f"{prefix}URL")
+    token = os.getenv(f"{prefix}TOKEN")
+
+    if not url:
+        raise ValueError(f"{prefix}URL environment variable is required")
+    if not token:
+        raise ValueError(f"{prefix}TOKEN environment variable is required")
+
+    burst = getenv("RATE_LIMIT_BURST")
+
+    return HomeAssistantConfig(
+        url=url,
+        token=token,
+        verify_ssl=getenv("VERIFY_SSL", "true").lower() == "true",
+        timeout=float(getenv("TIMEOUT", "30.0")),
+        rate_limit_rest=float(getenv("RATE_LIMIT_REST", "0")),
+        rate_limit_template=float(getenv("RATE_LIMIT_TEMPLATE", "0")),
+        rate_limit_service=float(getenv("RATE_LIMIT_SERVICE", "0")),
+        rate_limit_ws=float(getenv("RATE_LIMIT_WS", "0")),
+        rate_limit_burst=float(burst) if burst else None,
+        state_daemon_socket=os.getenv(f"{prefix}STATE_DAEMON_SOCKET") or None,
+        dashboard_cache=getenv("DASHBOARD_CACHE", "true").lower() == "true",
+    )
+
+
 def load_config(env_file: Path | None = None) -> HomeAssistantConfig:
     """Load configuration from environment variables.
 
@@ -47,17 +118,40 @@ def load_config(env_file: Path | None = None) -> HomeAssistantConfig:
     else:
         load_dotenv()
 
-    url = os.getenv("HA_URL")
-    token = os.getenv("HA_TOKEN")
+    return _config_from_env()
 
-    if not url:
-        raise ValueError("HA_URL environment variable is required")
-    if not token:
-        raise ValueError("HA_TOKEN environment variable is required")
 
-    return HomeAssistantConfig(
-        url=url,
-        token=token,
-        verify_ssl=os.getenv("HA_VERIFY_SSL", "true").lower() == "true",
-        timeout=float(os.getenv("HA_TIMEOUT", "30.0")),
-    )
+def load_instance_configs(env_file: Path | None = None) -> dict[str, HomeAssistantConfig]:
+    """Load the configuration of every Home Assistant instance.
+
+    ``HA_INSTANCES`` lists instance names (e.g. ``house,office,lab``), each
+    configured with ``HA_<NAME>_URL`` and ``HA_<NAME>_TOKEN`` plus optional
+    ``HA_<NAME>_*`` overrides of the other settings. Without it, the single
+    instance configured by ``HA_URL``/``HA_TOKEN`` is named ``default``.
+
+    Args:
+        env_file: Optional path to .env file
+
+    Returns:
+        Mapping of instance name to configuration; the first one is the
+        default instance
+
+    Raises:
+        ValueError: If required environment variables are missing or an
+            instance name is invalid
+    """
+    if env_file:
+        load_dotenv(env_file)
+    else:
+        load_dotenv()
+
+    names = [name.strip().lower() for name in os.getenv("HA_INSTANCES", "").split(",") if name.strip()]
+    if not names:
+        return {DEFAULT_INSTANCE: _config_from_env()}
+
+    configs = {}
+    for name in names:
+        if not name.replace("_", "").isalnum():
+            raise ValueError(f"Invalid instance name '{name}' (use letters, digits and underscores)")
+        configs[name] = _config_from_env(f"HA_{name.upper()}_")
+    return configs
@@ -0,0 +1,51 @@
+"""Event relay connection to the shared state cache daemon."""
+
+import asyncio
+import json
+
+from .daemon_protocol import read_frame, write_message
+
+
+class DaemonEventConnection:
+    """Daemon connection relaying events, used like a Home Assistant WebSocket.
+
+    The event stream sends Home Assistant WebSocket commands (subscribe,
+    unsubscribe) and receives their results and events. The daemon speaks the
+    same messages, framed with its length prefix instead of WebSocket frames,
+    so this adapter gives the stream the ``send``/``recv``/``close`` interface
+    it expects.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Wrap an open connection whose relay request the daemon accepted.
+
+        Args:
+            reader: Stream receiving messages from the daemon
+            writer: Stream sending messages to the daemon
+        """
+        self._reader = reader
+        self._writer = writer
+
+    async def send(self, data: str) -> None:
+        """Send a WebSocket command to the daemon.
+
+        Args:
+            data: JSON-encoded command
+        """
+        await write_message(self._writer, json.loads(data))
+
+    async def recv(self) -> bytes:
+        """Receive the next result or event from the daemon.
+
+        Returns:
+            UTF-8 JSON text of the message
+
+        Raises:
+            asyncio.IncompleteReadError: If the daemon closed the connection
+            ValueError: If the message is too large
+        """
+        return await read_frame(self._reader)
+
+    async def close(self) -> None:
+        """Close the connection, ending the daemon's relay to it."""
+        self._writer.close()
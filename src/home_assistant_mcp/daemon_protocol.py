@@ -0,0 +1,75 @@
+"""Length-prefixed JSON messages exchanged with the state cache daemon."""
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+HEADER = struct.Struct(">I")
+"""Big-endian length of the JSON body that follows."""
+
+MAX_MESSAGE_BYTES = 256 * 1024 * 1024
+
+EVENTS_METHOD = "events"
+"""Request that turns a connection into an event relay."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read the JSON body of one message without decoding it.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        UTF-8 JSON text
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ends mid-message (or
+            before it, when the peer closed the connection)
+        ValueError: If the message is too large
+    """
+    (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if length > MAX_MESSAGE_BYTES:
+        raise ValueError(f"Message of {length} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit")
+    return await reader.readexactly(length)
+
+
+async def read_message(reader: asyncio.StreamReader) -> Any:
+    """Read one message.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Decoded JSON message
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ends mid-message (or
+            before it, when the peer closed the connection)
+        ValueError: If the message is too large or not valid JSON
+    """
+    return json.loads(await read_frame(reader))
+
+
+def encode_message(message: Any) -> bytes:
+    """Encode one message with its length prefix.
+
+    Args:
+        message: JSON-serializable message
+
+    Returns:
+        Bytes to write to the stream
+    """
+    body = json.dumps(message, separators=(",", ":"), default=str).encode()
+    return HEADER.pack(len(body)) + body
+
+
+async def write_message(writer: asyncio.StreamWriter, message: Any) -> None:
+    """Write one message.
+
+    Args:
+        writer: Stream to write to
+        message: JSON-serializable message
+    """
+    writer.write(encode_message(message))
+    await writer.drain()
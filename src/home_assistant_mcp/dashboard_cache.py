@@ -0,0 +1,126 @@
+"""Cache of Lovelace dashboard metadata and configurations."""
+
+import time
+from typing import Any
+
+from .models import Dashboard, DashboardConfig
+
+
+class DashboardCache:
+    """Dashboard list and per-URL-path configs of one client.
+
+    Configs are dropped when Home Assistant reports a change
+    (``lovelace_updated``) or the client saves one itself. Home Assistant
+    sends no event when dashboards are created, renamed or deleted, so the
+    list is dropped on the client's own changes and otherwise expires after
+    ``list_ttl`` seconds.
+
+    Every drop bumps :attr:`generation`. A fetch that started before a drop
+    passes its generation to the ``store`` methods and is not cached, so a
+    response racing an invalidation never overwrites it.
+
+    Attributes:
+        list_ttl: Seconds the dashboard list stays fresh
+        generation: Number of drops so far
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that found no fresh entry
+    """
+
+    def __init__(self, list_ttl: float = 60.0):
+        """Initialize an empty cache.
+
+        Args:
+            list_ttl: Seconds the dashboard list stays fresh
+        """
+        self.list_ttl = list_ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._dashboards: tuple[float, list[Dashboard]] | None = None
+        self._configs: dict[str | None, tuple[dict[str, Any], DashboardConfig]] = {}
+
+    def dashboards(self) -> list[Dashboard] | None:
+        """Get the cached dashboard list.
+
+        Returns:
+            Copy of the list, or None on a miss or expired list
+        """
+        if self._dashboards is None or self._dashboards[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return list(self._dashboards[1])
+
+    def config(self, url_path: str | None) -> tuple[dict[str, Any], DashboardConfig] | None:
+        """Get the cached config of a dashboard.
+
+        Args:
+            url_path: Dashboard URL path (None for default)
+
+        Returns:
+            Tuple of the raw config and its parsed model, or None on a miss
+        """
+        entry = self._configs.get(url_path)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store_dashboards(self, dashboards: list[Dashboard], generation: int) -> None:
+        """Cache the dashboard list if nothing was dropped since it was fetched.
+
+        Args:
+            dashboards: Dashboard list
+            generation: Value of :attr:`generation` when the fetch started
+        """
+        if generation == self.generation:
+            self._dashboards = (time.monotonic() + self.list_ttl, list(dashboards))
+
+    def store_config(self, url_path: str | None, raw: dict[str, Any], generation: int) -> DashboardConfig:
+        """Parse a config and cache it if nothing was dropped since it was fetched.
+
+        Args:
+            url_path: Dashboard URL path (None for default)
+            raw: Config as returned by Home Assistant
+            generation: Value of :attr:`generation` when the fetch started
+
+        Returns:
+            Parsed config
+        """
+        parsed = DashboardConfig(**raw)
+        if generation == self.generation:
+            self._configs[url_path] = (raw, parsed)
+        return parsed
+
+    def drop_config(self, url_path: str | None) -> None:
+        """Drop the config of one dashboard.
+
+        Args:
+            url_path: Dashboard URL path (None for default)
+        """
+        self.generation += 1
+        self._configs.pop(url_path, None)
+
+    def drop_dashboards(self) -> None:
+        """Drop the dashboard list."""
+        self.generation += 1
+        self._dashboards = None
+
+    def clear(self) -> None:
+        """Drop the dashboard list and every config."""
+        self.generation += 1
+        self._dashboards = None
+        self._configs.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cached config count, hits and misses
+        """
+        return {
+            "configs": len(self._configs),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,276 @@
+"""In-memory search index over entity states."""
+
+import heapq
+import operator
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# Comparison operators accepted in query predicates
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Fields with a secondary index (entity IDs per value)
+INDEXED_FIELDS = ("domain", "state", "device_class", "area")
+
+
+def trigrams(text: str) -> set[str]:
+    """Split text into the character trigrams of its words.
+
+    Words are lowercased and padded with spaces, so ``"Kitchen"`` yields
+    ``" ki"``, ``"kit"``, ..., ``"en "`` and short words still match.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Set of trigrams
+    """
+    grams = set()
+    for word in WORD.findall(text.lower()):
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def matches(value: Any, op: str, expected: Any) -> bool:
+    """Evaluate one predicate, comparing numerically when a number is expected.
+
+    Args:
+        value: Actual value (None if the attribute is missing)
+        op: Operator from :data:`OPERATORS`
+        expected: Value to compare with
+
+    Returns:
+        True if the predicate holds. Missing values only satisfy ``!=``;
+        non-numeric values never satisfy a numeric comparison.
+    """
+    if value is None:
+        return op == "!="
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return False
+    elif isinstance(expected, str):
+        value = str(value)
+    try:
+        return OPERATORS[op](value, expected)
+    except TypeError:
+        return False
+
+
+class EntityIndex:
+    """Search and query index over a snapshot of entity states.
+
+    Each entity is indexed by the words of its entity ID, friendly name, area
+    name and device class. A search scores entities by the share of query
+    trigrams they contain, so typos and partial words still match. Queries
+    filter the full states, narrowed first by the secondary indexes on
+    domain, state, device class and area. The index is updated one entity at
+    a time as states change.
+
+    Attributes:
+        entities: Indexed fields per entity ID
+        states: Full state (attributes, ``last_changed``, ...) per entity ID
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.entities: dict[str, dict[str, Any]] = {}
+        self.states: dict[str, dict[str, Any]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._secondary: dict[str, dict[str, set[str]]] = {field: {} for field in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        """Number of indexed entities."""
+        return len(self.entities)
+
+    def update(self, state: dict[str, Any], area: str | None = None) -> None:
+        """Add or refresh an entity.
+
+        Args:
+            state: Entity state (``entity_id``, ``state``, ``attributes``)
+            area: Area name of the entity (keeps the indexed one if None)
+        """
+        entity_id = state["entity_id"]
+        attributes = state.get("attributes") or {}
+        previous = self.entities.get(entity_id)
+        entity = {
+            "entity_id": entity_id,
+            "friendly_name": attributes.get("friendly_name", entity_id),
+            "state": state.get("state"),
+            "area": area if area is not None else (previous or {}).get("area"),
+            "device_class": attributes.get("device_class"),
+        }
+        self._unindex_fields(entity_id)
+        self.entities[entity_id] = entity
+        self.states[entity_id] = state
+        for field, key in self._field_keys(entity_id).items():
+            self._secondary[field].setdefault(key, set()).add(entity_id)
+
+        text = " ".join(
+            str(entity[field]) for field in ("entity_id", "friendly_name", "area", "device_class") if entity[field]
+        )
+        grams = trigrams(text)
+        old_grams = self._grams.get(entity_id, set())
+        if grams == old_grams:
+            return
+        for gram in old_grams - grams:
+            self._postings[gram].discard(entity_id)
+        for gram in grams - old_grams:
+            self._postings.setdefault(gram, set()).add(entity_id)
+        self._grams[entity_id] = grams
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity.
+
+        Args:
+            entity_id: Entity ID
+        """
+        self._unindex_fields(entity_id)
+        self.entities.pop(entity_id, None)
+        self.states.pop(entity_id, None)
+        for gram in self._grams.pop(entity_id, set()):
+            self._postings[gram].discard(entity_id)
+
+    def search(
+        self, query: str, limit: int = 10, domain: str | None = None, min_score: float = 0.3
+    ) -> list[dict[str, Any]]:
+        """Find the entities best matching a query.
+
+        Args:
+            query: Free text, e.g. ``"kitchen ceiling light"``
+            limit: Maximum number of matches
+            domain: Only match entities of this domain
+            min_score: Minimum share of query trigrams a match must contain
+
+        Returns:
+            Indexed fields of the matches with their ``score`` (0-1), best first
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        counts: Counter[str] = Counter()
+        for gram in query_grams:
+            counts.update(self._postings.get(gram, ()))
+
+        prefix = f"{domain}." if domain else ""
+        needed = min_score * len(query_grams)
+        best = heapq.nsmallest(
+            limit,
+            (
+                # Ties go to entities with less unmatched text
+                (-count, len(self._grams[entity_id]), entity_id)
+                for entity_id, count in counts.items()
+                if count >= needed and entity_id.startswith(prefix)
+            ),
+        )
+        return [
+            {**self.entities[entity_id], "score": round(-count / len(query_grams), 3)}
+            for count, _, entity_id in best
+        ]
+
+    def query(
+        self,
+        domain: str | None = None,
+        states: Iterable[str] | None = None,
+        device_class: str | None = None,
+        area: str | None = None,
+        where: Iterable[tuple[str, str, Any]] = (),
+        changed_after: datetime | None = None,
+        changed_before: datetime | None = None,
+    ) -> list[str]:
+        """Find the entities matching every filter.
+
+        Args:
+            domain: Entity domain
+            states: Accepted states (any of them)
+            device_class: Device class (case-insensitive)
+            area: Area name (case-insensitive)
+            where: ``(attribute, operator, value)`` predicates; ``state``
+                compares the state itself. Numbers compare numerically and
+                entities without the attribute only match ``!=``.
+            changed_after: Only entities whose state changed at or after this
+                (timezone-aware) time
+            changed_before: Only entities whose state changed before this
+                (timezone-aware) time
+
+        Returns:
+            Sorted IDs of the matching entities
+
+        Raises:
+            ValueError: If a predicate uses an unknown operator
+        """
+        where = list(where)
+        for _, op, _ in where:
+            if op not in OPERATORS:
+                raise ValueError(f"Unsupported operator '{op}' (use one of {', '.join(OPERATORS)})")
+
+        # Narrow with the secondary indexes, smallest set first
+        candidates: list[set[str]] = []
+        if domain is not None:
+            candidates.append(self._secondary["domain"].get(domain, set()))
+        if states is not None:
+            candidates.append(set().union(*(self._secondary["state"].get(state, ()) for state in states)))
+        if device_class is not None:
+            candidates.append(self._secondary["device_class"].get(device_class.lower(), set()))
+        if area is not None:
+            candidates.append(self._secondary["area"].get(area.lower(), set()))
+        if candidates:
+            candidates.sort(key=len)
+            entity_ids = candidates[0].intersection(*candidates[1:])
+        else:
+            entity_ids = set(self.states)
+
+        found = []
+        for entity_id in entity_ids:
+            state = self.states[entity_id]
+            attributes = state.get("attributes") or {}
+            if not all(
+                matches(state.get("state") if name == "state" else attributes.get(name), op, value)
+                for name, op, value in where
+            ):
+                continue
+            if changed_after is not None or changed_before is not None:
+                last_changed = state.get("last_changed")
+                if last_changed is None:
+                    continue
+                changed = datetime.fromisoformat(str(last_changed))
+                if changed.tzinfo is None:
+                    changed = changed.replace(tzinfo=UTC)
+                if changed_after is not None and changed < changed_after:
+                    continue
+                if changed_before is not None and changed >= changed_before:
+                    continue
+            found.append(entity_id)
+        return sorted(found)
+
+    def _field_keys(self, entity_id: str) -> dict[str, str]:
+        """Get the secondary index keys of an indexed entity."""
+        entity = self.entities[entity_id]
+        keys = {"domain": entity_id.split(".", 1)[0], "state": str(entity["state"])}
+        if entity["device_class"]:
+            keys["device_class"] = str(entity["device_class"]).lower()
+        if entity["area"]:
+            keys["area"] = str(entity["area"]).lower()
+        return keys
+
+    def _unindex_fields(self, entity_id: str) -> None:
+        """Remove an entity from the secondary indexes."""
+        if entity_id not in self.entities:
+            return
+        for field, key in self._field_keys(entity_id).items():
+            self._secondary[field][key].discard(entity_id)
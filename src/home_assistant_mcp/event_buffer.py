@@ -0,0 +1,138 @@
+"""Bounded buffer of Home Assistant events for incremental reading."""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class EventBuffer:
+    """Ring buffer of the events received by one subscription.
+
+    Events are numbered from 1 as they arrive. Readers pass the number of the
+    last event they saw as a cursor and get the ones after it. When the buffer
+    is full the oldest event is dropped, and readers behind it are told how
+    many events they missed. Events Home Assistant sent while the event
+    stream was reconnecting are lost without a count, so the buffer records
+    where such interruptions happened instead.
+
+    Attributes:
+        id: Subscription identifier
+        event_types: Subscribed event types (empty for all events)
+        max_events: Maximum number of buffered events
+        received: Number of events received so far
+        dropped: Number of events evicted from the full buffer
+        interruptions: Number of times the event stream was interrupted
+        last_read: Monotonic time of the last read or wait
+    """
+
+    def __init__(self, event_types: list[str], max_events: int = 1000, buffer_id: str | None = None):
+        """Initialize an empty buffer.
+
+        Args:
+            event_types: Subscribed event types (empty for all events)
+            max_events: Maximum number of buffered events
+            buffer_id: Subscription identifier (random if None)
+        """
+        self.id = buffer_id or uuid.uuid4().hex[:12]
+        self.event_types = list(event_types)
+        self.max_events = max_events
+        self.received = 0
+        self.dropped = 0
+        self.interruptions = 0
+        self.last_read = time.monotonic()
+        self.unsubscribe: list[Callable[[], Awaitable[None]]] = []
+        self._events: deque[tuple[int, dict[str, Any]]] = deque()
+        # Number of the last event received before each interruption
+        self._gaps: deque[int] = deque()
+        self._arrived = asyncio.Event()
+
+    def __len__(self) -> int:
+        """Number of buffered events."""
+        return len(self._events)
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Buffer an event, dropping the oldest one if the buffer is full.
+
+        Args:
+            event: Event payload (``event_type``, ``data``, ``time_fired``, ...)
+        """
+        self.received += 1
+        self._events.append(
+            (
+                self.received,
+                {
+                    "event_type": event.get("event_type"),
+                    "time_fired": event.get("time_fired"),
+                    "data": event.get("data", {}),
+                },
+            )
+        )
+        if len(self._events) > self.max_events:
+            self._events.popleft()
+            self.dropped += 1
+            while self._gaps and self._gaps[0] < self._events[0][0] - 1:
+                self._gaps.popleft()
+        # Wake every reader waiting for this arrival, then re-arm
+        arrived, self._arrived = self._arrived, asyncio.Event()
+        arrived.set()
+
+    def mark_gap(self) -> None:
+        """Record that events may have been lost after the last received one."""
+        self.interruptions += 1
+        if not self._gaps or self._gaps[-1] != self.received:
+            self._gaps.append(self.received)
+
+    def interrupted(self, cursor: int, next_cursor: int) -> bool:
+        """Check whether the stream was interrupted between two cursors.
+
+        Args:
+            cursor: Number of the last event read before
+            next_cursor: Number of the last event read now
+
+        Returns:
+            True if events may have been lost between the events read now
+            (or the one at ``cursor``) and the ones before them
+        """
+        return any(cursor <= gap < next_cursor for gap in self._gaps)
+
+    def read(self, cursor: int = 0, limit: int = 100) -> tuple[list[dict[str, Any]], int, int]:
+        """Get the events after a cursor.
+
+        Args:
+            cursor: Number of the last event already read (0 for the oldest)
+            limit: Maximum number of events returned
+
+        Returns:
+            Tuple of the events (each with its ``seq``), the cursor for the
+            next read, and the number of events after ``cursor`` that were
+            dropped before being read
+        """
+        self.last_read = time.monotonic()
+        first = self._events[0][0] if self._events else self.received + 1
+        missed = max(0, first - 1 - cursor)
+        events = [{"seq": seq, **event} for seq, event in self._events if seq > cursor][:limit]
+        next_cursor = events[-1]["seq"] if events else max(cursor, first - 1)
+        return events, next_cursor, missed
+
+    async def wait(self, cursor: int, timeout: float) -> bool:
+        """Wait until an event after the cursor has arrived.
+
+        Args:
+            cursor: Number of the last event already read
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if events after the cursor are available
+        """
+        self.last_read = time.monotonic()
+        if self.received > cursor:
+            return True
+        try:
+            await asyncio.wait_for(self._arrived.wait(), timeout)
+        except TimeoutError:
+            pass
+        self.last_read = time.monotonic()
+        return self.received > cursor
@@ -0,0 +1,277 @@
+"""Dedicated WebSocket connection for Home Assistant event subscriptions."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from .home_assistant_error import HomeAssistantError
+
+logger = logging.getLogger(__name__)
+
+EventCallback = Callable[[dict[str, Any]], None]
+
+
+class EventStream:
+    """Receive Home Assistant events over a dedicated WebSocket connection.
+
+    Command/response traffic in ``HomeAssistantClient._ws_request`` is strictly
+    sequential, so subscriptions live on their own connection where a background
+    reader task dispatches every incoming event to its callback. When the
+    connection drops it is re-established after ``reconnect_delay`` seconds and
+    every active subscription is renewed.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        timeout: float = 30.0,
+        reconnect_delay: float = 5.0,
+    ):
+        """Initialize the event stream.
+
+        Args:
+            connect: Coroutine factory returning an authenticated WebSocket
+            timeout: Seconds to wait for a subscription to be confirmed
+            reconnect_delay: Seconds to wait between reconnection attempts
+        """
+        self._connect = connect
+        self._timeout = timeout
+        self._reconnect_delay = reconnect_delay
+        self._ws: Any = None
+        self._reader: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self._next_id = 1
+        self._next_handle = 1
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._subscriptions: dict[int, dict[str, Any]] = {}
+        self._handles_by_ws_id: dict[int, int] = {}
+        self._reconnect_listeners: list[Callable[[], None]] = []
+
+    @property
+    def connected(self) -> bool:
+        """Whether the stream currently has a live connection."""
+        return self._ws is not None and self._reader is not None and not self._reader.done()
+
+    def add_reconnect_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after the connection was re-established.
+
+        Events may have been missed while disconnected, so caches fed by the
+        stream use this hook to resynchronize.
+
+        Args:
+            listener: Callable invoked with no arguments
+        """
+        self._reconnect_listeners.append(listener)
+
+    async def subscribe(
+        self, command: dict[str, Any], callback: EventCallback
+    ) -> Callable[[], Awaitable[None]]:
+        """Start a subscription and route its events to a callback.
+
+        Args:
+            command: Subscription command without ``id`` (e.g.
+                ``{"type": "subscribe_events", "event_type": "state_changed"}``)
+            callback: Called with the ``event`` payload of every message
+
+        Returns:
+            Coroutine function that cancels the subscription
+
+        Raises:
+            HomeAssistantError: If Home Assistant rejects or does not confirm
+                the subscription
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._subscriptions[handle] = {"command": command, "callback": callback, "ws_id": None}
+
+        try:
+            async with self._lock:
+                if self._reader is None or self._reader.done():
+                    futures = await self._open()
+                    future = futures.get(handle)
+                elif self._ws is None:
+                    # Reconnecting: the subscription is sent once the stream is back
+                    future = None
+                else:
+                    future = await self._send_subscription(handle)
+
+            if future is not None:
+                response = await asyncio.wait_for(future, self._timeout)
+                if not response.get("success", False):
+                    error_msg = response.get("error", {}).get("message", "Unknown error")
+                    raise HomeAssistantError(f"Subscription failed: {error_msg}")
+        except asyncio.TimeoutError as e:
+            self._forget(handle)
+            raise HomeAssistantError("Subscription was not confirmed in time") from e
+        except Exception:
+            self._forget(handle)
+            raise
+
+        return partial(self.unsubscribe, handle)
+
+    async def unsubscribe(self, handle: int) -> None:
+        """Cancel a subscription.
+
+        Args:
+            handle: Subscription handle created by :meth:`subscribe`
+        """
+        subscription = self._forget(handle)
+        if subscription is None or subscription["ws_id"] is None or self._ws is None:
+            return
+        try:
+            await self._send({"type": "unsubscribe_events", "subscription": subscription["ws_id"]})
+        except Exception as e:
+            logger.debug(f"Failed to unsubscribe from events: {e}", exc_info=True)
+
+    async def close(self) -> None:
+        """Stop the reader task and close the connection."""
+        self._closed = True
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.debug("Event stream reader had failed", exc_info=True)
+            self._reader = None
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                # Already closed, or the connection broke while closing
+                logger.debug("Error closing event stream connection", exc_info=True)
+            finally:
+                self._ws = None
+        self._fail_pending()
+
+    def _forget(self, handle: int) -> dict[str, Any] | None:
+        """Drop a subscription from the local registry.
+
+        Args:
+            handle: Subscription handle
+
+        Returns:
+            The removed subscription, if it existed
+        """
+        subscription = self._subscriptions.pop(handle, None)
+        if subscription is not None and subscription["ws_id"] is not None:
+            self._handles_by_ws_id.pop(subscription["ws_id"], None)
+        return subscription
+
+    async def _open(self) -> dict[int, asyncio.Future[dict[str, Any]]]:
+        """Connect, start the reader and (re)send every subscription.
+
+        Returns:
+            Confirmation futures keyed by subscription handle
+        """
+        self._closed = False
+        self._ws = await self._connect()
+        self._reader = asyncio.create_task(self._read_loop())
+        return {handle: await self._send_subscription(handle) for handle in list(self._subscriptions)}
+
+    async def _send(self, payload: dict[str, Any]) -> asyncio.Future[dict[str, Any]]:
+        """Send a command and return a future resolved with its result message.
+
+        Args:
+            payload: Command without ``id``
+
+        Returns:
+            Future resolved by the reader task with the raw result message
+        """
+        message_id = self._next_id
+        self._next_id += 1
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        await self._ws.send(json.dumps({"id": message_id, **payload}))
+        return future
+
+    async def _send_subscription(self, handle: int) -> asyncio.Future[dict[str, Any]]:
+        """Send the subscription command of a handle and map its WebSocket ID.
+
+        Args:
+            handle: Subscription handle
+
+        Returns:
+            Confirmation future
+        """
+        subscription = self._subscriptions[handle]
+        if subscription["ws_id"] is not None:
+            self._handles_by_ws_id.pop(subscription["ws_id"], None)
+        subscription["ws_id"] = self._next_id
+        self._handles_by_ws_id[self._next_id] = handle
+        return await self._send(subscription["command"])
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        """Route an incoming message to its subscription or pending command.
+
+        Args:
+            message: Decoded WebSocket message
+        """
+        message_type = message.get("type")
+        if message_type == "event":
+            handle = self._handles_by_ws_id.get(message.get("id"))
+            subscription = self._subscriptions.get(handle) if handle is not None else None
+            if subscription is None:
+                return
+            try:
+                subscription["callback"](message.get("event", {}))
+            except Exception:
+                logger.exception("Event callback failed")
+        elif message_type == "result":
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+
+    def _fail_pending(self) -> None:
+        """Resolve every in-flight command as failed."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_result({"success": False, "error": {"message": "Connection lost"}})
+
+    async def _read_loop(self) -> None:
+        """Read messages until cancelled, reconnecting on connection loss."""
+        while not self._closed:
+            try:
+                raw = await self._ws.recv()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event stream disconnected: {e}")
+                self._fail_pending()
+                await self._reconnect()
+                continue
+
+            try:
+                message = json.loads(raw)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse event message: {e}")
+                continue
+            self._dispatch(message)
+
+    async def _reconnect(self) -> None:
+        """Re-establish the connection and renew every subscription."""
+        self._ws = None
+        while not self._closed:
+            await asyncio.sleep(self._reconnect_delay)
+            try:
+                self._ws = await self._connect()
+                for handle in list(self._subscriptions):
+                    await self._send_subscription(handle)
+            except Exception as e:
+                logger.warning(f"Event stream reconnection failed: {e}")
+                self._ws = None
+                continue
+
+            logger.info("Event stream reconnected")
+            for listener in self._reconnect_listeners:
+                try:
+                    listener()
+                except Exception:
+                    logger.exception("Reconnect listener failed")
+            return
@@ -0,0 +1,97 @@
+"""Fixed-bucket histogram for latency and payload size metrics."""
+
+import bisect
+import math
+from collections.abc import Sequence
+from typing import Any
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Bucket upper bounds in seconds."""
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+"""Bucket upper bounds in bytes."""
+
+
+class Histogram:
+    """Cumulative histogram with Prometheus-compatible bucket semantics.
+
+    Attributes:
+        bounds: Sorted bucket upper bounds (``+Inf`` is implicit)
+        count: Number of observations
+        total: Sum of all observed values
+    """
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            bounds: Sorted bucket upper bounds
+        """
+        self.bounds = tuple(bounds)
+        self.count = 0
+        self.total = 0.0
+        self._counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+        """
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Get cumulative counts per bucket.
+
+        Returns:
+            List of (upper bound, observations <= bound), ending with ``+Inf``
+        """
+        running = 0
+        buckets = []
+        for bound, count in zip((*self.bounds, math.inf), self._counts):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value (0.0 without observations). Values in the overflow
+            bucket are reported as the largest finite bound.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, cumulative in self.cumulative_buckets():
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    return self.bounds[-1] if self.bounds else 0.0
+                in_bucket = cumulative - previous
+                fraction = (rank - previous) / in_bucket if in_bucket else 0.0
+                return lower + (bound - lower) * fraction
+            lower, previous = bound, cumulative
+        return lower
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarize the histogram.
+
+        Returns:
+            Dictionary with count, sum, mean and estimated p50/p95/p99
+        """
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "p99": round(self.quantile(0.99), 6),
+        }
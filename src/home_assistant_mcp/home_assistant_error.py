@@ -0,0 +1,9 @@
+"""Exception raised by the Home Assistant client layer."""
+
+
+class HomeAssistantError(Exception):
+    """Base exception for Home Assistant client errors."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
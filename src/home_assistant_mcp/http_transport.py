@@ -0,0 +1,267 @@
+"""Streamable HTTP transport serving many MCP sessions from one process."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.types import Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Host header patterns of the loopback interface
+LOOPBACK_HOSTS = ["127.0.0.1:*", "localhost:*", "[::1]:*"]
+
+
+class HttpTransport:
+    """Serve an MCP server over Streamable HTTP to concurrent clients.
+
+    Every client gets its own MCP session, but all sessions run in this
+    process and share its Home Assistant client, connection pool and caches.
+    New sessions beyond ``max_sessions`` are refused with HTTP 503 until a
+    client ends its session (``DELETE`` with its ``mcp-session-id``) or a
+    session expires. Clients that crash or disconnect never send ``DELETE``,
+    so a session without a request in flight for ``session_idle_timeout``
+    seconds is terminated.
+
+    Requests whose ``Host`` or ``Origin`` header names neither the loopback
+    interface, the bound host nor an allowed entry are refused, so a web page
+    cannot reach the endpoint through DNS rebinding.
+
+    Attributes:
+        path: URL path of the MCP endpoint
+        host: Interface served
+        max_sessions: Maximum number of concurrent sessions
+        session_idle_timeout: Seconds an idle session is kept (0 keeps it
+            until the client ends it)
+        url: Endpoint URL once started
+    """
+
+    def __init__(
+        self,
+        server: Server,
+        path: str = "/mcp",
+        max_sessions: int = 32,
+        session_idle_timeout: float = 1800.0,
+        host: str = "127.0.0.1",
+        allowed_hosts: list[str] | None = None,
+        allowed_origins: list[str] | None = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            server: MCP server handling the sessions
+            path: URL path of the MCP endpoint
+            max_sessions: Maximum number of concurrent sessions
+            session_idle_timeout: Seconds an idle session is kept (0 keeps it
+                until the client ends it)
+            host: Interface to serve
+            allowed_hosts: ``Host`` headers accepted besides the loopback
+                interface and ``host`` (``name:*`` matches any port)
+            allowed_origins: ``Origin`` headers accepted besides those of the
+                loopback interface and ``host``
+        """
+        self.path = path
+        self.host = host
+        self.max_sessions = max_sessions
+        self.session_idle_timeout = session_idle_timeout
+        self.url: str | None = None
+        hosts = [*LOOPBACK_HOSTS, f"[{host}]:*" if ":" in host else f"{host}:*"]
+        security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=True,
+            allowed_hosts=[*hosts, *(allowed_hosts or [])],
+            allowed_origins=[*(f"http://{pattern}" for pattern in hosts), *(allowed_origins or [])],
+        )
+        self.session_manager = StreamableHTTPSessionManager(server, security_settings=security)
+        self.app = Starlette(
+            routes=[Route(path, endpoint=self, methods=["GET", "POST", "DELETE"])],
+            lifespan=self._lifespan,
+        )
+        self._server: uvicorn.Server | None = None
+        self._serve_task: asyncio.Task[None] | None = None
+        # Session ID -> [requests in flight, monotonic time of the last request end]
+        self._sessions: dict[str, list[float]] = {}
+        # New-session requests admitted but not yet assigned an ID
+        self._reserved_sessions = 0
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of open MCP sessions."""
+        return len(self._sessions)
+
+    async def expire_idle_sessions(self) -> int:
+        """Terminate sessions idle for longer than the timeout.
+
+        Returns:
+            Number of sessions terminated
+        """
+        if not self.session_idle_timeout:
+            return 0
+        deadline = time.monotonic() - self.session_idle_timeout
+        idle = [sid for sid, (in_flight, last) in self._sessions.items() if not in_flight and last < deadline]
+        for session_id in idle:
+            logger.info(f"Expiring MCP session {session_id} idle for over {self.session_idle_timeout:g}s")
+            await self._terminate(session_id)
+        return len(idle)
+
+    async def _terminate(self, session_id: str) -> None:
+        """End a session the way its client would, with a ``DELETE`` request."""
+        scope: Scope = {
+            "type": "http",
+            "method": "DELETE",
+            "path": self.path,
+            "query_string": b"",
+            # Sent from the loopback interface so it passes the Host check
+            "headers": [(b"host", b"127.0.0.1:0"), (MCP_SESSION_ID_HEADER.encode(), session_id.encode())],
+        }
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            pass
+
+        self._sessions.pop(session_id, None)
+        await self.session_manager.handle_request(scope, receive, send)
+        self._prune_terminated()
+
+    def _prune_terminated(self) -> None:
+        """Forget sessions that were terminated.
+
+        The session manager keeps terminated transports, which would grow
+        without bound in a long-lived process, and has no public way to drop
+        them. This reaches into its private ``_server_instances`` (mcp 1.x)
+        and does nothing if that attribute changes. Requests for a pruned
+        session get 404, as they would from the terminated transport.
+        """
+        transports = getattr(self.session_manager, "_server_instances", None)
+        if not isinstance(transports, dict):
+            return
+        for session_id in [sid for sid, transport in transports.items() if getattr(transport, "is_terminated", False)]:
+            del transports[session_id]
+
+    async def _expire_periodically(self) -> None:
+        """Expire idle sessions until cancelled."""
+        interval = min(self.session_idle_timeout / 2, 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            await self.expire_idle_sessions()
+
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """Run the session manager and idle expiry while the application is up."""
+        async with self.session_manager.run():
+            expiry = asyncio.create_task(self._expire_periodically()) if self.session_idle_timeout else None
+            try:
+                yield
+            finally:
+                if expiry is not None:
+                    expiry.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await expiry
+                self._sessions.clear()
+                self._reserved_sessions = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request to the MCP endpoint (ASGI interface)."""
+        self._prune_terminated()
+        headers = dict(scope.get("headers", []))
+        session_id = headers.get(MCP_SESSION_ID_HEADER.encode(), b"").decode() or None
+        new_session = session_id is None and scope.get("method") == "POST"
+        if new_session and self.active_sessions + self._reserved_sessions >= self.max_sessions:
+            await self.expire_idle_sessions()
+            if self.active_sessions + self._reserved_sessions >= self.max_sessions:
+                logger.warning(f"Refusing new MCP session: {self.max_sessions} sessions open")
+                response = JSONResponse(
+                    {"error": f"Too many sessions (limit {self.max_sessions})"},
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                )
+                await response(scope, receive, send)
+                return
+
+        # Hold a slot until the session has its ID, so concurrent requests
+        # for new sessions cannot all pass the limit
+        reserved = new_session
+        if reserved:
+            self._reserved_sessions += 1
+        status = 0
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal session_id, status, reserved
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if session_id is None:
+                    # A new session learns its ID from the response
+                    response_headers = dict(message.get("headers", []))
+                    new_id = response_headers.get(MCP_SESSION_ID_HEADER.encode())
+                    if new_id and status < 400:
+                        session_id = new_id.decode()
+                        self._sessions[session_id] = [1, time.monotonic()]
+                        if reserved:
+                            self._reserved_sessions -= 1
+                            reserved = False
+            await send(message)
+
+        session = self._sessions.get(session_id) if session_id else None
+        if session is not None:
+            session[0] += 1
+        try:
+            await self.session_manager.handle_request(scope, receive, tracking_send)
+        finally:
+            if reserved:
+                self._reserved_sessions -= 1
+            session = self._sessions.get(session_id) if session_id else None
+            if session is not None:
+                session[0] -= 1
+                session[1] = time.monotonic()
+                ended = scope.get("method") == "DELETE" and status < 400
+                if ended or status == HTTPStatus.NOT_FOUND:
+                    del self._sessions[session_id]
+
+    async def serve(self, port: int = 8000) -> None:
+        """Serve until the process is interrupted.
+
+        Args:
+            port: TCP port to bind
+        """
+        self.url = f"http://{self.host}:{port}{self.path}"
+        config = uvicorn.Config(self.app, host=self.host, port=port, log_level="warning", lifespan="on")
+        await uvicorn.Server(config).serve()
+
+    async def start(self, port: int = 0) -> str:
+        """Start serving in the background.
+
+        Args:
+            port: TCP port to bind (0 picks a free port)
+
+        Returns:
+            Endpoint URL, e.g. ``http://127.0.0.1:8000/mcp``
+        """
+        config = uvicorn.Config(self.app, host=self.host, port=port, log_level="warning", lifespan="on")
+        self._server = uvicorn.Server(config)
+        self._serve_task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._serve_task.done():
+                self._serve_task.result()
+            await asyncio.sleep(0.01)
+        bound_port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://{self.host}:{bound_port}{self.path}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving and end every open session."""
+        if self._server is not None and self._serve_task is not None:
+            self._server.should_exit = True
+            await self._serve_task
+        self._server = None
+        self._serve_task = None
@@ -0,0 +1,135 @@
+"""JSON Patch (RFC 6902) operations and content hashes of JSON documents."""
+
+import copy
+import hashlib
+import json
+from typing import Any
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+
+def content_hash(document: Any) -> str:
+    """Hash a JSON document independently of its key order.
+
+    Args:
+        document: JSON-compatible data
+
+    Returns:
+        First 16 hex digits of the SHA-256 of the canonical JSON
+    """
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def apply_patch(document: Any, operations: list[dict[str, Any]]) -> Any:
+    """Apply JSON Patch operations to a copy of a document.
+
+    Either every operation applies or the document is left as is.
+
+    Args:
+        document: JSON-compatible data (not modified)
+        operations: Operations such as ``{"op": "replace", "path": "/views/0/title",
+            "value": "Home"}``
+
+    Returns:
+        Patched copy of the document
+
+    Raises:
+        ValueError: If an operation is malformed, its path does not exist, or
+            a ``test`` operation fails
+    """
+    result = copy.deepcopy(document)
+    for number, operation in enumerate(operations, 1):
+        try:
+            result = _apply(result, operation)
+        except KeyError as e:
+            raise ValueError(f"Operation {number} ({operation.get('op')} {operation.get('path')}): missing {e}") from e
+        except (IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Operation {number} ({operation.get('op')} {operation.get('path')}): {e}") from e
+    return result
+
+
+def _apply(document: Any, operation: dict[str, Any]) -> Any:
+    op = operation.get("op")
+    if op not in OPERATIONS:
+        raise ValueError(f"unsupported op (use one of {', '.join(OPERATIONS)})")
+    path = _parse_pointer(operation["path"])
+
+    if op == "test":
+        if _get(document, path) != operation["value"]:
+            raise ValueError("test failed")
+        return document
+    if op == "remove":
+        return _remove(document, path)
+    if op == "replace":
+        _get(document, path)
+        return _add(_remove(document, path), path, copy.deepcopy(operation["value"]))
+    if op == "add":
+        return _add(document, path, copy.deepcopy(operation["value"]))
+
+    source = _parse_pointer(operation["from"])
+    value = copy.deepcopy(_get(document, source))
+    if op == "move":
+        if path[: len(source)] == source and path != source:
+            raise ValueError("cannot move a value into itself")
+        document = _remove(document, source)
+    return _add(document, path, value)
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"path must start with '/': {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _index(container: list[Any], token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise ValueError(f"invalid list index {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise IndexError(f"list index {index} out of range")
+    return index
+
+
+def _get(document: Any, path: list[str]) -> Any:
+    for token in path:
+        if isinstance(document, list):
+            document = document[_index(document, token)]
+        elif isinstance(document, dict):
+            document = document[token]
+        else:
+            raise TypeError(f"cannot descend into {type(document).__name__}")
+    return document
+
+
+def _add(document: Any, path: list[str], value: Any) -> Any:
+    if not path:
+        return value
+    parent = _get(document, path[:-1])
+    token = path[-1]
+    if isinstance(parent, list):
+        # A replaced item was removed first, so it is re-inserted at its index
+        parent.insert(_index(parent, token, allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[token] = value
+    else:
+        raise TypeError(f"cannot add to {type(parent).__name__}")
+    return document
+
+
+def _remove(document: Any, path: list[str]) -> Any:
+    if not path:
+        return None
+    parent = _get(document, path[:-1])
+    token = path[-1]
+    if isinstance(parent, list):
+        del parent[_index(parent, token)]
+    elif isinstance(parent, dict):
+        del parent[token]
+    else:
+        raise TypeError(f"cannot remove from {type(parent).__name__}")
+    return document
@@ -0,0 +1,36 @@
+"""Span exporter appending one JSON object per line to a local file."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+class JsonlSpanExporter:
+    """Write finished spans to a JSON Lines file.
+
+    The file is opened in append mode with line buffering, so every span is
+    on disk as soon as it ends and several runs can share one file.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the exporter.
+
+        Args:
+            path: File to append spans to (parent directories are created)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", buffering=1, encoding="utf-8")
+
+    def export(self, span: dict[str, Any]) -> None:
+        """Append one span.
+
+        Args:
+            span: Serialized span
+        """
+        self._file.write(json.dumps(span, default=str) + "\n")
+
+    async def shutdown(self) -> None:
+        """Close the file."""
+        if not self._file.closed:
+            self._file.close()
@@ -0,0 +1,5 @@
+"""Process-wide metrics registry shared by the client, server and tools."""
+
+from .metrics_registry import MetricsRegistry
+
+METRICS = MetricsRegistry()
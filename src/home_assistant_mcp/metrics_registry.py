@@ -0,0 +1,162 @@
+"""In-process registry of histograms, counters and gauges."""
+
+import logging
+import math
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from .histogram import LATENCY_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+LabelKey = tuple[tuple[str, str], ...]
+GaugeCollector = Callable[[], Iterable[tuple[dict[str, str], float]]]
+
+
+def _label_key(labels: dict[str, str] | None) -> LabelKey:
+    """Build a hashable, order-independent key from a label set."""
+    return tuple(sorted((labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: dict[str, str] | None = None) -> str:
+    """Render a label set in Prometheus exposition format."""
+    pairs = list(key) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value in Prometheus exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Collects labelled metrics and exposes them as JSON or Prometheus text.
+
+    Histograms and counters are updated on the hot path. Gauges are computed
+    lazily by collector callbacks whenever the registry is read, so sampling
+    connection pools or caches costs nothing between reads.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._gauges: dict[str, GaugeCollector] = {}
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        bounds: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """Record a histogram observation.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            labels: Label set of the series
+            bounds: Bucket bounds used when the series is created
+        """
+        series = self._histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(bounds)
+        histogram.observe(value)
+
+    def increment(self, name: str, labels: dict[str, str] | None = None, amount: float = 1.0) -> None:
+        """Increase a counter.
+
+        Args:
+            name: Metric name
+            labels: Label set of the series
+            amount: Amount to add
+        """
+        series = self._counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0.0) + amount
+
+    def register_gauge(self, name: str, collect: GaugeCollector) -> None:
+        """Register (or replace) a gauge computed on read.
+
+        Args:
+            name: Metric name
+            collect: Callable returning (labels, value) pairs
+        """
+        self._gauges[name] = collect
+
+    def reset(self) -> None:
+        """Drop every recorded metric and gauge."""
+        self._histograms.clear()
+        self._counters.clear()
+        self._gauges.clear()
+
+    def _collect_gauges(self) -> dict[str, list[tuple[LabelKey, float]]]:
+        """Evaluate every gauge collector, skipping the ones that fail."""
+        gauges: dict[str, list[tuple[LabelKey, float]]] = {}
+        for name, collect in self._gauges.items():
+            try:
+                gauges[name] = [(_label_key(labels), float(value)) for labels, value in collect()]
+            except Exception:
+                logger.debug(f"Gauge collector for {name} failed", exc_info=True)
+                continue
+        return gauges
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get all metrics as plain data.
+
+        Returns:
+            Dictionary with ``histograms``, ``counters`` and ``gauges``, each
+            mapping a metric name to a list of labelled series
+        """
+        return {
+            "histograms": {
+                name: [{"labels": dict(key), **hist.snapshot()} for key, hist in series.items()]
+                for name, series in self._histograms.items()
+            },
+            "counters": {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            },
+            "gauges": {
+                name: [{"labels": dict(key), "value": value} for key, value in samples]
+                for name, samples in self._collect_gauges().items()
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        lines: list[str] = []
+        for name, series in sorted(self._histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in series.items():
+                for bound, cumulative in hist.cumulative_buckets():
+                    le = {"le": _format_value(bound)}
+                    lines.append(f"{name}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(hist.total)}")
+                lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        for name, series in sorted(self._counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        for name, samples in sorted(self._collect_gauges().items()):
+            lines.append(f"# TYPE {name} gauge")
+            for key, value in samples:
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
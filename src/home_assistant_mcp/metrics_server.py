@@ -0,0 +1,56 @@
+"""Minimal HTTP endpoint serving metrics in the Prometheus text format."""
+
+import asyncio
+import logging
+
+from .metrics_registry import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+READ_TIMEOUT = 5.0
+
+
+async def start_metrics_server(
+    registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464
+) -> asyncio.Server:
+    """Start serving ``GET /metrics`` for a registry.
+
+    The endpoint is intended for a local Prometheus scraper, so it only
+    understands the request line and closes the connection after every
+    response.
+
+    Args:
+        registry: Registry to expose
+        host: Interface to bind (localhost by default)
+        port: TCP port to bind (0 picks a free port)
+
+    Returns:
+        Running asyncio server (close it to stop serving)
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+            while await asyncio.wait_for(reader.readline(), READ_TIMEOUT) not in (b"\r\n", b"\n", b""):
+                pass  # Headers are not needed
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?", 1)[0] == "/metrics":
+                status, content_type = "200 OK", CONTENT_TYPE
+                body = registry.render_prometheus().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.debug(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
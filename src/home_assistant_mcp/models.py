@@ -73,6 +73,18 @@ class ServiceCallResponse(BaseModel):
     )
 
 
+class FireEventsResult(BaseModel):
+    """Outcome of firing a batch of events."""
+
+    fired: int = Field(..., description="Events Home Assistant accepted")
+    failed: int = Field(..., description="Events that failed")
+    elapsed_seconds: float = Field(..., description="Wall time of the whole batch")
+    events_per_second: float = Field(..., description="Achieved firing rate")
+    errors: list[dict[str, Any]] = Field(
+        default_factory=list, description="Failures by event index (index, event_type, error)"
+    )
+
+
 class HistoryEntry(BaseModel):
     """Represents a history entry for an entity."""
 
@@ -103,6 +115,16 @@ class DashboardConfig(BaseModel):
     strategy: dict[str, Any] | None = Field(None, description="Dashboard strategy")
 
 
+class DashboardPatchResult(BaseModel):
+    """Outcome of patching a dashboard configuration."""
+
+    url_path: str | None = Field(None, description="Dashboard URL path (None for default)")
+    changed: bool = Field(..., description="Whether the patched config was saved")
+    hash: str = Field(..., description="Content hash of the config after the patch")
+    previous_hash: str = Field(..., description="Content hash of the config before the patch")
+    operations: int = Field(..., description="Number of operations applied")
+
+
 class DashboardList(BaseModel):
     """Represents a list of dashboards."""
 
@@ -0,0 +1,118 @@
+"""Span exporter sending batches to an OTLP/HTTP collector (JSON encoding)."""
+
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Convert an attribute value to an OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: dict[str, Any]) -> dict[str, Any]:
+    """Convert a serialized span to an OTLP JSON span."""
+    otlp: dict[str, Any] = {
+        "traceId": span["trace_id"],
+        "spanId": span["span_id"],
+        "name": span["name"],
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span["start_time_ns"]),
+        "endTimeUnixNano": str(span["end_time_ns"]),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)} for key, value in span["attributes"].items()
+        ],
+        "status": {"code": 2, "message": span["error"]} if span["error"] else {"code": 1},
+    }
+    if span["parent_id"]:
+        otlp["parentSpanId"] = span["parent_id"]
+    return otlp
+
+
+class OtlpSpanExporter:
+    """Batch spans and POST them to ``<endpoint>/v1/traces``.
+
+    Spans are buffered and sent in the background once ``batch_size`` spans
+    are pending; the remainder is flushed on shutdown. Export failures are
+    logged and the batch is dropped, so a missing collector never affects
+    tool calls.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "home-assistant-mcp",
+        batch_size: int = 64,
+        timeout: float = 5.0,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Collector base URL (e.g. ``http://localhost:4318``)
+            service_name: ``service.name`` resource attribute
+            batch_size: Spans buffered before a batch is sent
+            timeout: HTTP timeout in seconds
+        """
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._client = httpx.AsyncClient(timeout=timeout)
+        self._buffer: list[dict[str, Any]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def export(self, span: dict[str, Any]) -> None:
+        """Buffer one span, sending a batch once the buffer is full.
+
+        Args:
+            span: Serialized span
+        """
+        self._buffer.append(span)
+        if len(self._buffer) >= self.batch_size:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Send every buffered span."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": self.service_name}}
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "home_assistant_mcp"},
+                            "spans": [_otlp_span(span) for span in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            response = await self._client.post(self.url, json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Dropped {len(batch)} spans, OTLP export failed: {e}")
+
+    async def shutdown(self) -> None:
+        """Wait for in-flight batches, flush the rest and close the client."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush()
+        await self._client.aclose()
@@ -0,0 +1,142 @@
+"""Server-side store of the remaining pages of oversized tool outputs."""
+
+import time
+import uuid
+from collections import OrderedDict
+
+# Rough size of a model token in bytes of JSON text
+BYTES_PER_TOKEN = 4
+# Room kept on every page for the paging note
+_NOTE_BYTES = 160
+
+
+class OutputPages:
+    """Splits tool outputs larger than a byte budget into pages.
+
+    An oversized output is cut into pages of whole chunks (list items or
+    lines of JSON). The first page is returned right away; the full output is
+    kept for ``ttl`` seconds so the following pages are served from memory
+    with a continuation token instead of being fetched from Home Assistant
+    again.
+
+    Attributes:
+        max_bytes: Largest output returned in one piece (0 disables paging)
+        ttl: Seconds a paged output is kept
+        max_entries: Maximum number of paged outputs kept
+    """
+
+    def __init__(self, max_bytes: int = 65536, ttl: float = 300.0, max_entries: int = 256):
+        """Initialize an empty store.
+
+        Args:
+            max_bytes: Largest output returned in one piece (0 disables paging)
+            ttl: Seconds a paged output is kept
+            max_entries: Maximum number of paged outputs kept before evicting
+                the least recently read one
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._outputs: OrderedDict[str, tuple[float, str, list[str], list[int], bool]] = OrderedDict()
+
+    def configure(self, max_bytes: int, max_tokens: int | None = None, ttl: float | None = None) -> None:
+        """Set the output budget.
+
+        Args:
+            max_bytes: Largest output in bytes (0 for no byte limit)
+            max_tokens: Largest output in estimated tokens (None for no limit)
+            ttl: Seconds a paged output is kept (unchanged if None)
+        """
+        if max_tokens:
+            token_bytes = max_tokens * BYTES_PER_TOKEN
+            max_bytes = min(max_bytes, token_bytes) if max_bytes else token_bytes
+        self.max_bytes = max_bytes
+        if ttl is not None:
+            self.ttl = ttl
+
+    def fits(self, header: str, body: str) -> bool:
+        """Check whether an output can be returned in one piece.
+
+        Args:
+            header: First line of the output
+            body: Rest of the output
+
+        Returns:
+            True if paging is disabled or the output is within the budget
+        """
+        if not self.max_bytes:
+            return True
+        # Character count is a lower bound of the encoded size
+        if len(header) + len(body) + 1 > self.max_bytes:
+            return False
+        return len(header.encode()) + len(body.encode()) + 1 <= self.max_bytes
+
+    def paginate(self, header: str, chunks: list[str], as_list: bool) -> str:
+        """Store an oversized output and get its first page.
+
+        Args:
+            header: Line repeated on top of every page ("" for none)
+            chunks: Pieces the output is cut between (serialized list items,
+                or lines of JSON text)
+            as_list: True if the chunks are items of a JSON array, so each
+                page is a valid array on its own
+
+        Returns:
+            Text of the first page
+        """
+        self._expire()
+        output_id = uuid.uuid4().hex[:12]
+        sizes = [len(chunk.encode()) + 2 for chunk in chunks]
+        self._outputs[output_id] = (time.monotonic() + self.ttl, header, chunks, sizes, as_list)
+        while len(self._outputs) > self.max_entries:
+            self._outputs.popitem(last=False)
+        return self._page(output_id, 0)
+
+    def page(self, token: str) -> str | None:
+        """Get the page a continuation token points to.
+
+        Args:
+            token: Continuation token from a previous page
+
+        Returns:
+            Text of the page, or None if the token is malformed or its output
+            has expired
+        """
+        self._expire()
+        output_id, _, offset = token.partition("-")
+        if output_id not in self._outputs or not offset.isdigit():
+            return None
+        if int(offset) >= len(self._outputs[output_id][2]):
+            return None
+        self._outputs.move_to_end(output_id)
+        return self._page(output_id, int(offset))
+
+    def __len__(self) -> int:
+        """Number of paged outputs kept."""
+        return len(self._outputs)
+
+    def _page(self, output_id: str, start: int) -> str:
+        _, header, chunks, sizes, as_list = self._outputs[output_id]
+        budget = max(self.max_bytes - len(header.encode()) - _NOTE_BYTES, 0)
+        end, used = start, 0
+        # Always at least one chunk, so every page makes progress
+        while end < len(chunks) and (end == start or used + sizes[end] <= budget):
+            used += sizes[end]
+            end += 1
+
+        if as_list:
+            body = "[\n" + ",\n".join(chunks[start:end]) + "\n]"
+            unit = "items"
+        else:
+            body = "\n".join(chunks[start:end])
+            unit = "lines"
+        note = f"Showing {unit} {start + 1}-{end} of {len(chunks)}."
+        if end < len(chunks):
+            note += f' Call again with "continuation": "{output_id}-{end}" for the next page.'
+        return f"{header}\n{body}\n{note}" if header else f"{body}\n{note}"
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = [output_id for output_id, entry in self._outputs.items() if entry[0] < now]
+        for output_id in expired:
+            del self._outputs[output_id]
@@ -1,6 +1,10 @@
 """MCP Server for Home Assistant integration."""
 
-from typing import Any
+import argparse
+import asyncio
+import time
+import weakref
+from typing import TYPE_CHECKING, Any
 
 import logging
 import httpx
@@ -8,83 +12,493 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from .client import HomeAssistantClient, HomeAssistantError
-from .config import HomeAssistantConfig, load_config
-from .tools import TOOLS_LIST, TOOLS_MAP
+from .client_pool import ClientPool
+from .config import load_instance_configs
+from .home_assistant_error import HomeAssistantError
+from .histogram import SIZE_BUCKETS
+from .jsonl_span_exporter import JsonlSpanExporter
+from .metrics import METRICS
+from .metrics_server import start_metrics_server
+from .otlp_span_exporter import OtlpSpanExporter
+from .server_config import ServerConfig, load_server_config
+from .span import current_span
+from .span_exporter import SpanExporter
+from .tool_profiler import ToolProfiler
+from .tool_result_cache import ToolResultCache
+from .tool_scheduler import ToolScheduler
+from .trace_log_filter import TraceLogFilter
+from .tools import (
+    TOOLS_CACHE_EVENTS,
+    TOOLS_CACHE_TTL,
+    TOOLS_FAN_OUT,
+    TOOLS_INVALIDATES,
+    TOOLS_LIST,
+    TOOLS_MAP,
+    TOOLS_PRIORITY,
+)
+from .tools.tool_priority import ToolPriority
+from .tools.utils import BYPASS_CACHE_ARG, OUTPUT_PAGES
+from .tracing import TRACER
+
+if TYPE_CHECKING:
+    from .client import HomeAssistantClient
 
 # Create the MCP server instance
 server = Server("home-assistant-mcp")
 
-# Global client instance (initialized when server starts)
-_client: HomeAssistantClient | None = None
-_config: HomeAssistantConfig | None = None
+# Global client pool (initialized when server starts)
+_pool: ClientPool | None = None
+_server_config: ServerConfig | None = None
+_scheduler: ToolScheduler | None = None
+_tool_cache: ToolResultCache | None = None
+_profiler: ToolProfiler | None = None
+# Clients whose event stream already invalidates the tool cache
+_cache_subscribed_clients: "weakref.WeakSet[HomeAssistantClient]" = weakref.WeakSet()
+
+# Per-call argument selecting the Home Assistant instance
+INSTANCE_ARG = "instance"
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format="%(asctime)s - %(name)s - %(levelname)s - [%(trace_id)s] %(message)s",
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(TraceLogFilter())
 logger = logging.getLogger("home-assistant-mcp")
 
 
-def get_client() -> HomeAssistantClient:
-    """Get the Home Assistant client instance."""
-    global _client, _config
-    if _client is None:
-        if _config is None:
-            _config = load_config()
-        _client = HomeAssistantClient(_config)
-    return _client
+def get_client_pool() -> ClientPool:
+    """Get the pool of Home Assistant clients, one per configured instance."""
+    global _pool
+    if _pool is None:
+        _pool = ClientPool(load_instance_configs())
+        _register_client_gauges(_pool)
+    return _pool
+
+
+def get_client(instance: str | None = None) -> "HomeAssistantClient":
+    """Get the Home Assistant client of an instance.
+
+    There is no await between the check and the assignment of a client, so
+    concurrent first calls (and the startup pre-warm) on the event loop share
+    one client per instance.
+
+    Args:
+        instance: Instance name (the default instance if None)
+    """
+    return get_client_pool().get(instance)
+
+
+def _register_client_gauges(pool: ClientPool) -> None:
+    """Expose connection pool and rate limiter usage of every client as gauges."""
+    METRICS.register_gauge(
+        "ha_mcp_http_pool_connections",
+        lambda: [
+            ({"instance": instance, "state": state}, count)
+            for instance, client in pool.active().items()
+            for state, count in client.pool_stats().items()
+        ],
+    )
+    METRICS.register_gauge(
+        "ha_mcp_rate_limit_wait_seconds_total",
+        lambda: [
+            ({"instance": instance, "category": category}, stats["total_wait"])
+            for instance, client in pool.active().items()
+            for category, stats in client.rate_limit_stats().items()
+        ],
+    )
+    METRICS.register_gauge(
+        "ha_mcp_rate_limit_waiting",
+        lambda: [
+            ({"instance": instance, "category": category}, stats["waiting"])
+            for instance, client in pool.active().items()
+            for category, stats in client.rate_limit_stats().items()
+        ],
+    )
+
+
+def get_server_config() -> ServerConfig:
+    """Get the MCP server configuration."""
+    global _server_config
+    if _server_config is None:
+        _server_config = load_server_config()
+    return _server_config
+
+
+def get_scheduler() -> ToolScheduler:
+    """Get the tool scheduler instance."""
+    global _scheduler
+    if _scheduler is None:
+        server_config = get_server_config()
+        _scheduler = ToolScheduler(
+            {
+                ToolPriority.CONTROL: server_config.concurrency_control,
+                ToolPriority.METADATA: server_config.concurrency_metadata,
+                ToolPriority.BULK: server_config.concurrency_bulk,
+                ToolPriority.WAIT: server_config.concurrency_wait,
+            }
+        )
+        scheduler = _scheduler
+        for state in ("running", "waiting"):
+            METRICS.register_gauge(
+                f"ha_mcp_scheduler_{state}",
+                lambda state=state: [
+                    ({"priority": priority}, stats[state])
+                    for priority, stats in scheduler.stats().items()
+                ],
+            )
+    return _scheduler
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Get the tool result cache instance."""
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = ToolResultCache(max_entries=get_server_config().tool_cache_max_entries)
+        cache = _tool_cache
+        METRICS.register_gauge(
+            "ha_mcp_tool_cache_hit_ratio", lambda: [({}, cache.stats()["hit_ratio"])]
+        )
+        METRICS.register_gauge(
+            "ha_mcp_tool_cache_lookups",
+            lambda: [({"result": "hit"}, cache.hits), ({"result": "miss"}, cache.misses)],
+        )
+        METRICS.register_gauge("ha_mcp_tool_cache_entries", lambda: [({}, cache.stats()["entries"])])
+    return _tool_cache
+
+
+def get_profiler() -> ToolProfiler:
+    """Get the tool profiler instance."""
+    global _profiler
+    if _profiler is None:
+        server_config = get_server_config()
+        _profiler = ToolProfiler(
+            server_config.profile_dir,
+            tools=server_config.profile_tools,
+            sample_rate=server_config.profile_sample_rate,
+            top_n=server_config.profile_top_n,
+        )
+    return _profiler
+
+
+async def _subscribe_cache_invalidation(client: "HomeAssistantClient") -> None:
+    """Invalidate cached tool results on the Home Assistant events they depend on.
+
+    Subscriptions are made once per client. If they cannot be established,
+    cached results simply live until their TTL expires.
+
+    Args:
+        client: Client whose event stream feeds the invalidation
+    """
+    if client in _cache_subscribed_clients:
+        return
+    _cache_subscribed_clients.add(client)
+
+    cache = get_tool_cache()
+    tools_by_event: dict[str, list[str]] = {}
+    for tool_name, event_types in TOOLS_CACHE_EVENTS.items():
+        for event_type in event_types:
+            tools_by_event.setdefault(event_type, []).append(tool_name)
+
+    results = await asyncio.gather(
+        *(
+            client.subscribe_events(
+                event_type, lambda event, names=tool_names: cache.invalidate(names)
+            )
+            for event_type, tool_names in tools_by_event.items()
+        ),
+        return_exceptions=True,
+    )
+    for event_type, result in zip(tools_by_event, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Cache invalidation for '{event_type}' unavailable: {result}")
+
+    # Events may be missed while the stream reconnects
+    client.add_event_reconnect_listener(cache.invalidate)
+
+
+def _with_instance_argument(tool: Tool, pool: ClientPool) -> Tool:
+    """Add the optional instance argument to a tool definition."""
+    description = f"Home Assistant instance (default: {pool.default})"
+    if tool.name in TOOLS_FAN_OUT:
+        description = "Home Assistant instance (default: all instances, merged)"
+    properties = {
+        **tool.inputSchema.get("properties", {}),
+        INSTANCE_ARG: {"type": "string", "enum": pool.names, "description": description},
+    }
+    return tool.model_copy(update={"inputSchema": {**tool.inputSchema, "properties": properties}})
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools for Home Assistant control."""
-    return TOOLS_LIST
+    """List available tools for Home Assistant control.
+
+    With several Home Assistant instances configured, every tool accepts an
+    optional ``instance`` argument.
+    """
+    try:
+        pool = get_client_pool()
+    except ValueError:
+        # Missing configuration is reported by the first tool call
+        return TOOLS_LIST
+    if len(pool) == 1:
+        return TOOLS_LIST
+    return [_with_instance_argument(tool, pool) for tool in TOOLS_LIST]
+
+
+async def _execute_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Run a tool through the result cache and the priority scheduler.
+
+    Args:
+        name: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        Tool output
+    """
+    if name not in TOOLS_MAP:
+        logger.warning(f"Unknown tool requested: {name}")
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    bypass_cache = bool(arguments.get(BYPASS_CACHE_ARG, False))
+    instance = arguments.get(INSTANCE_ARG)
+    arguments = {k: v for k, v in arguments.items() if k not in (BYPASS_CACHE_ARG, INSTANCE_ARG)}
+    client = get_client(instance)
+    # get_client() created the pool; fan-out tools query every instance by default
+    fan_out = instance is None and name in TOOLS_FAN_OUT and _pool is not None and len(_pool) > 1
+    cache_arguments = {**arguments, INSTANCE_ARG: instance}
+
+    cache = get_tool_cache() if get_server_config().tool_cache_enabled else None
+    cache_ttl = TOOLS_CACHE_TTL.get(name) if cache is not None else None
+    if cache_ttl and not bypass_cache:
+        cached = cache.get(name, cache_arguments)
+        span = current_span.get()
+        if span is not None:
+            span.set_attribute("cache_hit", cached is not None)
+        if cached is not None:
+            logger.info(f"Cache hit for tool: {name}")
+            return cached
+
+    generation: int | None = None
+    if cache_ttl:
+        # Subscribe and snapshot before executing, so an invalidation during
+        # the call keeps its result out of the cache
+        await _subscribe_cache_invalidation(client)
+        generation = cache.generation
+
+    priority = TOOLS_PRIORITY.get(name, ToolPriority.METADATA)
+    async with get_scheduler().slot(priority):
+        logger.info(f"Executing tool: {name} (priority: {priority})")
+        logger.debug(f"Tool arguments: {arguments}")
+
+        if fan_out:
+            result = await TOOLS_FAN_OUT[name](_pool.clients(), arguments)
+        else:
+            result = await TOOLS_MAP[name](client, arguments)
+
+    if cache is not None:
+        if cache_ttl:
+            cache.set(name, cache_arguments, result, cache_ttl, generation)
+        if name in TOOLS_INVALIDATES:
+            cache.invalidate(TOOLS_INVALIDATES[name])
+
+    return result
+
+
+def _record_tool_metrics(
+    name: str, duration: float, result: list[TextContent], error_type: str | None
+) -> None:
+    """Record latency, payload size and errors of a tool call."""
+    labels = {"tool": name}
+    METRICS.observe("ha_mcp_tool_duration_seconds", duration, labels)
+    payload_size = sum(len(item.text.encode()) for item in result if isinstance(item, TextContent))
+    METRICS.observe("ha_mcp_tool_response_bytes", payload_size, labels, SIZE_BUCKETS)
+    if error_type is not None:
+        METRICS.increment("ha_mcp_tool_errors_total", {"tool": name, "error": error_type})
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls for Home Assistant operations."""
-    try:
-        client = get_client()
+    with TRACER.span(f"tool {name}", tool=name) as span:
+        start = time.perf_counter()
+        error_type: str | None = None
+        profiler = get_profiler()
+        try:
+            if profiler.enabled and name in TOOLS_MAP and profiler.should_profile(name):
+                with profiler.profile(name):
+                    result = await _execute_tool(name, arguments)
+            else:
+                result = await _execute_tool(name, arguments)
+        except KeyError as e:
+            error_type = type(e).__name__
+            logger.error(f"Missing required argument: {e}")
+            result = [TextContent(type="text", text=f"Missing required argument: {e}")]
+        except TypeError as e:
+            error_type = type(e).__name__
+            logger.error(f"Invalid argument type: {e}")
+            result = [TextContent(type="text", text=f"Invalid argument type: {e}")]
+        except httpx.TimeoutException as e:
+            error_type = type(e).__name__
+            logger.error("Request timed out")
+            result = [TextContent(type="text", text="Request timed out")]
+        except HomeAssistantError as e:
+            error_type = type(e).__name__
+            logger.error(f"Home Assistant error: {e}")
+            result = [TextContent(type="text", text=f"Home Assistant error: {e}")]
+        except Exception as e:
+            error_type = type(e).__name__
+            logger.exception(f"Unexpected error executing {name}")
+            result = [TextContent(type="text", text=f"Internal error: {e}")]
 
-        if name not in TOOLS_MAP:
-            logger.warning(f"Unknown tool requested: {name}")
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        if span is not None and error_type is not None:
+            span.error = f"{error_type}: {result[0].text}"
+        if name in TOOLS_MAP:
+            _record_tool_metrics(name, time.perf_counter() - start, result, error_type)
+        return result
+
+
+def _prewarm_tools(names: list[str]) -> list[str]:
+    """Select the configured pre-warm tools that can be prefetched.
+
+    Only cacheable read tools without required arguments qualify, since their
+    results are kept by the tool result cache for the first real call.
+    """
+    required = {tool.name: tool.inputSchema.get("required", []) for tool in TOOLS_LIST}
+    selected = []
+    for name in names:
+        if name not in TOOLS_CACHE_TTL or required.get(name):
+            logger.warning(f"Tool '{name}' cannot be prefetched (not a cacheable tool without arguments)")
+            continue
+        selected.append(name)
+    return selected
 
-        logger.info(f"Executing tool: {name}")
-        logger.debug(f"Tool arguments: {arguments}")
-        
-        return await TOOLS_MAP[name](client, arguments)
-
-    except KeyError as e:
-        logger.error(f"Missing required argument: {e}")
-        return [TextContent(type="text", text=f"Missing required argument: {e}")]
-    except TypeError as e:
-        logger.error(f"Invalid argument type: {e}")
-        return [TextContent(type="text", text=f"Invalid argument type: {e}")]
-    except httpx.TimeoutException:
-        logger.error("Request timed out")
-        return [TextContent(type="text", text="Request timed out")]
-    except HomeAssistantError as e:
-        logger.error(f"Home Assistant error: {e}")
-        return [TextContent(type="text", text=f"Home Assistant error: {e}")]
-    except Exception as e:
-        logger.exception(f"Unexpected error executing {name}")
-        return [TextContent(type="text", text=f"Internal error: {e}")]
+
+async def prewarm(server_config: ServerConfig) -> None:
+    """Prepare the Home Assistant connection before the first tool call.
+
+    Creates the client of every instance, opens its pooled HTTP connection,
+    authenticates its WebSocket and prefetches the configured read tools
+    (from the default instance), all concurrently.
+    Failures are logged and leave the work to the first tool call.
+
+    Args:
+        server_config: Server configuration listing the tools to prefetch
+    """
+    with TRACER.span("prewarm"):
+        start = time.perf_counter()
+        try:
+            clients = get_client_pool().clients()
+        except Exception as e:
+            logger.warning(f"Pre-warm skipped: {e}")
+            return
+
+        tools = _prewarm_tools(server_config.prewarm_tools)
+        steps = [f"connections of {instance}" for instance in clients] + tools
+        results = await asyncio.gather(
+            *(client.warm_up() for client in clients.values()),
+            *(_execute_tool(name, {}) for name in tools),
+            return_exceptions=True,
+        )
+        for step, result in zip(steps, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Pre-warm of {step} failed: {result}")
+        logger.info(f"Pre-warm finished in {time.perf_counter() - start:.2f}s")
+
+
+def _build_span_exporters(server_config: ServerConfig) -> list[SpanExporter]:
+    """Create the span exporters enabled in the server configuration."""
+    exporters: list[SpanExporter] = []
+    if server_config.trace_file:
+        exporters.append(JsonlSpanExporter(server_config.trace_file))
+    if server_config.trace_otlp_endpoint:
+        exporters.append(OtlpSpanExporter(server_config.trace_otlp_endpoint))
+    return exporters
 
 
 async def run_server() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    server_config = get_server_config()
+    metrics_server = None
+    if server_config.metrics_port:
+        metrics_server = await start_metrics_server(
+            METRICS, server_config.metrics_host, server_config.metrics_port
+        )
+        logger.info(
+            f"Prometheus metrics on http://{server_config.metrics_host}:{server_config.metrics_port}/metrics"
+        )
 
+    OUTPUT_PAGES.configure(
+        server_config.output_max_bytes,
+        max_tokens=server_config.output_max_tokens,
+        ttl=server_config.output_page_ttl,
+    )
+    TRACER.set_exporters(_build_span_exporters(server_config))
+    if TRACER.enabled:
+        logger.info("Tracing enabled")
 
-def main() -> None:
-    """Main entry point."""
-    import asyncio
+    prewarm_task = asyncio.create_task(prewarm(server_config)) if server_config.prewarm else None
 
+    try:
+        if server_config.transport == "http":
+            # Deferred so stdio sessions never load the HTTP server stack
+            from .http_transport import HttpTransport
+
+            transport = HttpTransport(
+                server,
+                server_config.http_path,
+                server_config.max_sessions,
+                server_config.session_idle_timeout,
+                host=server_config.http_host,
+                allowed_hosts=server_config.allowed_hosts,
+                allowed_origins=server_config.allowed_origins,
+            )
+            METRICS.register_gauge("ha_mcp_sessions", lambda: [({}, transport.active_sessions)])
+            logger.info(
+                f"Serving MCP over Streamable HTTP on http://{server_config.http_host}:"
+                f"{server_config.http_port}{server_config.http_path} "
+                f"(up to {server_config.max_sessions} sessions)"
+            )
+            await transport.serve(server_config.http_port)
+        else:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        if prewarm_task is not None and not prewarm_task.done():
+            prewarm_task.cancel()
+        await TRACER.shutdown()
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+
+
+def _apply_cli_arguments(argv: list[str] | None = None) -> None:
+    """Override the transport settings of the server configuration from the command line."""
+    global _server_config
+    parser = argparse.ArgumentParser(description="MCP server for Home Assistant")
+    parser.add_argument("--transport", choices=["stdio", "http"], help="MCP transport (env: HA_MCP_TRANSPORT)")
+    parser.add_argument("--host", help="HTTP transport interface (env: HA_MCP_HOST)")
+    parser.add_argument("--port", type=int, help="HTTP transport port (env: HA_MCP_PORT)")
+    parser.add_argument("--max-sessions", type=int, help="Concurrent HTTP sessions (env: HA_MCP_MAX_SESSIONS)")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        "transport": args.transport,
+        "http_host": args.host,
+        "http_port": args.port,
+        "max_sessions": args.max_sessions,
+    }
+    updates = {key: value for key, value in overrides.items() if value is not None}
+    if updates:
+        _server_config = ServerConfig.model_validate(
+            {**get_server_config().model_dump(), **updates}
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point."""
+    _apply_cli_arguments(argv)
     asyncio.run(run_server())
 
 
@@ -0,0 +1,129 @@
+"""Configuration of the MCP server process (independent of the HA connection)."""
+
+import os
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ServerConfig(BaseModel):
+    """Configuration for the MCP server dispatch layer."""
+
+    transport: Literal["stdio", "http"] = Field(
+        default="stdio", description="MCP transport (stdio, or Streamable HTTP for many clients)"
+    )
+    http_host: str = Field(default="127.0.0.1", description="Interface the HTTP transport listens on")
+    http_port: int = Field(default=8000, ge=0, description="Port of the HTTP transport")
+    http_path: str = Field(default="/mcp", description="URL path of the HTTP transport endpoint")
+    max_sessions: int = Field(
+        default=32, ge=1, description="Concurrent MCP sessions accepted by the HTTP transport"
+    )
+    session_idle_timeout: float = Field(
+        default=1800.0, ge=0, description="Seconds before an idle HTTP session is ended (0 never ends it)"
+    )
+    allowed_hosts: list[str] = Field(
+        default_factory=list, description="Host headers accepted besides loopback and the HTTP host"
+    )
+    allowed_origins: list[str] = Field(
+        default_factory=list, description="Origin headers accepted besides loopback and the HTTP host"
+    )
+
+    concurrency_control: int = Field(
+        default=8, ge=1, description="Concurrent control tool calls (turn on/off, services)"
+    )
+    concurrency_metadata: int = Field(
+        default=4, ge=1, description="Concurrent metadata tool calls (config, areas, dashboards)"
+    )
+    concurrency_bulk: int = Field(
+        default=2, ge=1, description="Concurrent bulk tool calls (entity listings, history)"
+    )
+    concurrency_wait: int = Field(
+        default=16, ge=1, description="Concurrent tool calls waiting for events (wait for state)"
+    )
+    tool_cache_enabled: bool = Field(default=True, description="Cache results of read tools")
+    tool_cache_max_entries: int = Field(
+        default=256, ge=1, description="Maximum number of cached tool results"
+    )
+    output_max_bytes: int = Field(
+        default=65536, ge=0, description="Largest tool output before it is paged (0 disables paging)"
+    )
+    output_max_tokens: int | None = Field(
+        default=None, ge=1, description="Token budget of tool outputs (about 4 bytes per token)"
+    )
+    output_page_ttl: float = Field(
+        default=300.0, gt=0, description="Seconds the remaining pages of a paged output are kept"
+    )
+    metrics_port: int | None = Field(
+        default=None, description="Port of the Prometheus metrics endpoint (disabled if unset)"
+    )
+    metrics_host: str = Field(
+        default="127.0.0.1", description="Interface the metrics endpoint listens on"
+    )
+    trace_file: str | None = Field(
+        default=None, description="JSON Lines file receiving finished spans (disabled if unset)"
+    )
+    trace_otlp_endpoint: str | None = Field(
+        default=None, description="OTLP/HTTP collector base URL receiving spans (disabled if unset)"
+    )
+    profile_tools: list[str] = Field(
+        default_factory=list, description="Tools profiled on every call"
+    )
+    profile_sample_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Fraction of other tool calls profiled"
+    )
+    profile_dir: str = Field(
+        default="profiles", description="Directory receiving profile dumps and the summary"
+    )
+    profile_top_n: int = Field(
+        default=30, ge=1, description="Functions listed in the hot-function summary"
+    )
+    prewarm: bool = Field(
+        default=True, description="Open the Home Assistant connections when the server starts"
+    )
+    prewarm_tools: list[str] = Field(
+        default_factory=list, description="Cacheable read tools prefetched when the server starts"
+    )
+
+
+def load_server_config() -> ServerConfig:
+    """Load server configuration from environment variables.
+
+    Returns:
+        ServerConfig instance
+    """
+    metrics_port = os.getenv("HA_METRICS_PORT")
+    output_max_tokens = os.getenv("HA_OUTPUT_MAX_TOKENS")
+    profile_tools = os.getenv("HA_PROFILE_TOOLS", "")
+    prewarm_tools = os.getenv("HA_PREWARM_TOOLS", "")
+    allowed_hosts = os.getenv("HA_MCP_ALLOWED_HOSTS", "")
+    allowed_origins = os.getenv("HA_MCP_ALLOWED_ORIGINS", "")
+
+    return ServerConfig(
+        transport=os.getenv("HA_MCP_TRANSPORT", "stdio").lower(),
+        http_host=os.getenv("HA_MCP_HOST", "127.0.0.1"),
+        http_port=int(os.getenv("HA_MCP_PORT", "8000")),
+        http_path=os.getenv("HA_MCP_PATH", "/mcp"),
+        max_sessions=int(os.getenv("HA_MCP_MAX_SESSIONS", "32")),
+        session_idle_timeout=float(os.getenv("HA_MCP_SESSION_IDLE_TIMEOUT", "1800")),
+        allowed_hosts=[host.strip() for host in allowed_hosts.split(",") if host.strip()],
+        allowed_origins=[origin.strip() for origin in allowed_origins.split(",") if origin.strip()],
+        concurrency_control=int(os.getenv("HA_CONCURRENCY_CONTROL", "8")),
+        concurrency_metadata=int(os.getenv("HA_CONCURRENCY_METADATA", "4")),
+        concurrency_bulk=int(os.getenv("HA_CONCURRENCY_BULK", "2")),
+        concurrency_wait=int(os.getenv("HA_CONCURRENCY_WAIT", "16")),
+        tool_cache_enabled=os.getenv("HA_TOOL_CACHE", "true").lower() == "true",
+        tool_cache_max_entries=int(os.getenv("HA_TOOL_CACHE_MAX_ENTRIES", "256")),
+        output_max_bytes=int(os.getenv("HA_OUTPUT_MAX_BYTES", "65536")),
+        output_max_tokens=int(output_max_tokens) if output_max_tokens else None,
+        output_page_ttl=float(os.getenv("HA_OUTPUT_PAGE_TTL", "300")),
+        metrics_port=int(metrics_port) if metrics_port else None,
+        metrics_host=os.getenv("HA_METRICS_HOST", "127.0.0.1"),
+        trace_file=os.getenv("HA_TRACE_FILE") or None,
+        trace_otlp_endpoint=os.getenv("HA_TRACE_OTLP_ENDPOINT") or None,
+        profile_tools=[name.strip() for name in profile_tools.split(",") if name.strip()],
+        profile_sample_rate=float(os.getenv("HA_PROFILE_SAMPLE_RATE", "0")),
+        profile_dir=os.getenv("HA_PROFILE_DIR", "profiles"),
+        profile_top_n=int(os.getenv("HA_PROFILE_TOP_N", "30")),
+        prewarm=os.getenv("HA_PREWARM", "true").lower() == "true",
+        prewarm_tools=[name.strip() for name in prewarm_tools.split(",") if name.strip()],
+    )
@@ -0,0 +1,223 @@
+"""Home Assistant client reading states from the shared state cache daemon."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .client import HomeAssistantClient
+from .config import HomeAssistantConfig
+from .daemon_event_connection import DaemonEventConnection
+from .daemon_protocol import EVENTS_METHOD, read_message, write_message
+from .event_stream import EventStream
+from .home_assistant_error import HomeAssistantError
+from .metrics_registry import MetricsRegistry
+from .models import EntityState
+from .tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+# Seconds before retrying the daemon after it was unreachable
+RETRY_INTERVAL = 30.0
+
+
+class SharedStateClient(HomeAssistantClient):
+    """Client answering state reads, area lookups and events from the daemon.
+
+    Reads go to the :mod:`state_cache_daemon` listening on
+    ``config.state_daemon_socket``, and so do event subscriptions (entity
+    index, change log, waits, cache invalidation, event buffers), which the
+    daemon relays from its one Home Assistant subscription per event type.
+    Everything else (service calls, history, dashboards, ...) goes to Home
+    Assistant directly. When the daemon is not running, reads and
+    subscriptions fall back to Home Assistant and the daemon is tried again
+    after :data:`RETRY_INTERVAL` seconds.
+    """
+
+    def __init__(self, config: HomeAssistantConfig, metrics: MetricsRegistry | None = None):
+        """Initialize the client.
+
+        Args:
+            config: Home Assistant configuration with ``state_daemon_socket`` set
+            metrics: Registry receiving request metrics (defaults to the
+                process-wide registry)
+        """
+        super().__init__(config, metrics)
+        self.socket_path = config.state_daemon_socket
+        self._daemon_retry_at = 0.0
+        self._daemon_id = 1
+
+    async def _from_daemon(self, method: str, fallback: Callable[[], Awaitable[Any]], **args: Any) -> Any:
+        """Ask the daemon, or Home Assistant directly if the daemon is unreachable.
+
+        Args:
+            method: Daemon method name
+            fallback: Coroutine function reading the value from Home Assistant
+            **args: Method arguments
+
+        Returns:
+            Result from the daemon (JSON) or from the fallback
+
+        Raises:
+            HomeAssistantError: If the daemon or Home Assistant reports an error
+        """
+        if not self.socket_path or time.monotonic() < self._daemon_retry_at:
+            return await fallback()
+
+        request_id = self._daemon_id
+        self._daemon_id += 1
+        try:
+            with TRACER.span("daemon", method=method):
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+                try:
+                    await write_message(writer, {"id": request_id, "method": method, "args": args})
+                    response = await read_message(reader)
+                finally:
+                    writer.close()
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.warning(f"State cache daemon unavailable ({e}), reading from Home Assistant")
+            self._daemon_retry_at = time.monotonic() + RETRY_INTERVAL
+            return await fallback()
+
+        if "error" in response:
+            raise HomeAssistantError(response["error"], status_code=response.get("status_code"))
+        return response["result"]
+
+    def _get_event_stream(self) -> EventStream:
+        """Get or create the event stream, relayed by the daemon when it runs.
+
+        Returns:
+            Event stream connected through :meth:`_event_connect`
+        """
+        if self._event_stream is None:
+            self._event_stream = EventStream(self._event_connect, timeout=self.config.timeout)
+        return self._event_stream
+
+    async def _event_connect(self) -> Any:
+        """Connect the event stream to the daemon, or to Home Assistant if it is unreachable.
+
+        The stream reconnects through here, so a stream that fell back to
+        Home Assistant keeps that connection until it drops.
+
+        Returns:
+            Daemon relay connection or authenticated WebSocket
+        """
+        if self.socket_path and time.monotonic() >= self._daemon_retry_at:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+                await write_message(writer, {"id": 0, "method": EVENTS_METHOD, "args": {}})
+                response = await read_message(reader)
+                if response.get("result") == "ok":
+                    return DaemonEventConnection(reader, writer)
+                writer.close()
+                raise ValueError(response.get("error", "event relay refused"))
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                logger.warning(f"State cache daemon unavailable ({e}), subscribing to Home Assistant")
+                self._daemon_retry_at = time.monotonic() + RETRY_INTERVAL
+        return await self._ws_connect()
+
+    async def get_states(self) -> list[EntityState]:
+        """Get all entity states.
+
+        Returns:
+            List of all entity states
+        """
+        data = await self._from_daemon("get_states", super().get_states)
+        if data and isinstance(data[0], EntityState):
+            return data
+        with TRACER.span("validate", model="EntityState", items=len(data)):
+            return [EntityState(**item) for item in data]
+
+    async def get_state(self, entity_id: str) -> EntityState:
+        """Get state of a specific entity.
+
+        Args:
+            entity_id: Entity ID (e.g., 'light.living_room')
+
+        Returns:
+            Entity state
+        """
+        data = await self._from_daemon(
+            "get_state", lambda: super(SharedStateClient, self).get_state(entity_id), entity_id=entity_id
+        )
+        return data if isinstance(data, EntityState) else EntityState(**data)
+
+    async def get_areas(self) -> list[str]:
+        """Get all configured areas.
+
+        Returns:
+            List of area IDs
+        """
+        return await self._from_daemon("get_areas", super().get_areas)
+
+    async def get_area_entities(self, area: str, domain: str | None = None) -> list[str]:
+        """Get all entities in an area.
+
+        Args:
+            area: Area ID or name
+            domain: Optional domain to filter (e.g., 'light', 'switch')
+
+        Returns:
+            List of entity IDs in the area
+        """
+        return await self._from_daemon(
+            "get_area_entities",
+            lambda: super(SharedStateClient, self).get_area_entities(area, domain),
+            area=area,
+            domain=domain,
+        )
+
+    async def get_area_devices(self, area: str) -> list[str]:
+        """Get all devices in an area.
+
+        Args:
+            area: Area ID or name
+
+        Returns:
+            List of device IDs in the area
+        """
+        return await self._from_daemon(
+            "get_area_devices", lambda: super(SharedStateClient, self).get_area_devices(area), area=area
+        )
+
+    async def get_entity_area(self, entity_id: str) -> str | None:
+        """Get the area name for an entity.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Area name or None if not assigned
+        """
+        return await self._from_daemon(
+            "get_entity_area",
+            lambda: super(SharedStateClient, self).get_entity_area(entity_id),
+            entity_id=entity_id,
+        )
+
+    async def get_area_id(self, area_name: str) -> str | None:
+        """Get the area ID from an area name.
+
+        Args:
+            area_name: Area name
+
+        Returns:
+            Area ID or None if not found
+        """
+        return await self._from_daemon(
+            "get_area_id", lambda: super(SharedStateClient, self).get_area_id(area_name), area_name=area_name
+        )
+
+    async def get_area_name(self, area_id: str) -> str | None:
+        """Get the area name from an area ID.
+
+        Args:
+            area_id: Area ID
+
+        Returns:
+            Area name or None if not found
+        """
+        return await self._from_daemon(
+            "get_area_name", lambda: super(SharedStateClient, self).get_area_name(area_id), area_id=area_id
+        )
@@ -0,0 +1,16 @@
+"""Local Home Assistant simulator for benchmarks and offline tests."""
+
+from .behavior_spec import BehaviorSpec
+from .fake_home_assistant import DEFAULT_TOKEN, FakeHomeAssistant
+from .install_spec import InstallSpec
+from .synthetic_install import SyntheticInstall
+from .template_renderer import TemplateRenderer
+
+__all__ = [
+    "BehaviorSpec",
+    "DEFAULT_TOKEN",
+    "FakeHomeAssistant",
+    "InstallSpec",
+    "SyntheticInstall",
+    "TemplateRenderer",
+]
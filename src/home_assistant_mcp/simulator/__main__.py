@@ -0,0 +1,87 @@
+"""Run the Home Assistant simulator as a standalone server.
+
+Example::
+
+    python -m home_assistant_mcp.simulator --entities 12000 --latency-ms 20 --port 8123
+
+Point the MCP server at it with ``HA_URL=http://127.0.0.1:8123`` and
+``HA_TOKEN=simulator-token``.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from .behavior_spec import BehaviorSpec
+from .fake_home_assistant import DEFAULT_TOKEN, FakeHomeAssistant
+from .install_spec import InstallSpec
+from .synthetic_install import SyntheticInstall
+
+logger = logging.getLogger("home-assistant-simulator")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Simulated Home Assistant REST and WebSocket APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8123)
+    parser.add_argument("--token", default=DEFAULT_TOKEN)
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--areas", type=int, default=20)
+    parser.add_argument("--devices-per-area", type=int, default=5)
+    parser.add_argument("--history-points", type=int, default=24)
+    parser.add_argument("--dashboards", type=int, default=3)
+    parser.add_argument("--dashboard-views", type=int, default=3)
+    parser.add_argument("--cards-per-view", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--state-changes-per-second", type=float, default=0.0)
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the simulator until cancelled."""
+    install = SyntheticInstall(
+        InstallSpec(
+            entities=args.entities,
+            areas=args.areas,
+            devices_per_area=args.devices_per_area,
+            history_points=args.history_points,
+            dashboards=args.dashboards,
+            dashboard_views=args.dashboard_views,
+            cards_per_view=args.cards_per_view,
+            seed=args.seed,
+        )
+    )
+    behavior = BehaviorSpec(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        state_changes_per_second=args.state_changes_per_second,
+        seed=args.seed,
+    )
+    simulator = FakeHomeAssistant(install, token=args.token, behavior=behavior)
+    url = await simulator.start(args.host, args.port)
+    logger.info(f"Simulating {len(install.states)} entities in {len(install.areas)} areas")
+    logger.info(f"HA_URL={url} HA_TOKEN={args.token}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
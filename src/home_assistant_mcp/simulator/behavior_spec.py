@@ -0,0 +1,20 @@
+"""Network behaviour and activity injected by the simulator."""
+
+from pydantic import BaseModel, Field
+
+
+class BehaviorSpec(BaseModel):
+    """Latency, failures and background activity of a simulated Home Assistant."""
+
+    latency_ms: float = Field(default=0.0, ge=0, description="Added delay per REST request or WS command")
+    jitter_ms: float = Field(
+        default=0.0, ge=0, description="Maximum random deviation from the added delay"
+    )
+    error_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Fraction of requests and commands that fail"
+    )
+    error_status: int = Field(default=500, ge=400, le=599, description="HTTP status of injected REST errors")
+    state_changes_per_second: float = Field(
+        default=0.0, ge=0, description="Rate of generated background state changes"
+    )
+    seed: int | None = Field(default=None, description="Random seed of injected behaviour")
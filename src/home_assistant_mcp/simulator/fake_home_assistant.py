@@ -0,0 +1,391 @@
+"""HTTP and WebSocket server imitating the Home Assistant APIs."""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from .behavior_spec import BehaviorSpec
+from .synthetic_install import SyntheticInstall, slugify, utc_now
+from .template_renderer import TemplateRenderer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN = "simulator-token"
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class FakeHomeAssistant:
+    """Serve a :class:`SyntheticInstall` over the Home Assistant REST and WebSocket APIs.
+
+    The server runs in-process on uvicorn, so benchmarks and tests can point a
+    real ``HomeAssistantClient`` at it. Service calls change entity states and
+    fire ``state_changed`` events to WebSocket subscribers, like Home Assistant.
+    A :class:`BehaviorSpec` adds latency, jitter and failures to every REST
+    request and WebSocket command, and a background stream of state changes.
+    WebSocket commands of one connection are processed concurrently, so a
+    slow command does not hold back the ones sent after it.
+
+    Attributes:
+        install: Installation being served
+        behavior: Injected latency, failures and background activity
+        token: Access token accepted by both APIs
+        url: Base URL once the server is started
+        requests: Number of REST requests and WebSocket commands handled
+        injected_errors: Number of failures injected
+    """
+
+    def __init__(
+        self,
+        install: SyntheticInstall | None = None,
+        token: str = DEFAULT_TOKEN,
+        behavior: BehaviorSpec | None = None,
+    ):
+        """Initialize the simulator.
+
+        Args:
+            install: Installation to serve (a default install if None)
+            token: Access token accepted by both APIs
+            behavior: Injected behaviour (none by default)
+        """
+        self.install = install or SyntheticInstall()
+        self.token = token
+        self.behavior = behavior or BehaviorSpec()
+        self.url: str | None = None
+        self.requests = 0
+        self.injected_errors = 0
+        self._random = random.Random(self.behavior.seed)
+        self._renderer = TemplateRenderer(self.install)
+        self._subscriptions: dict[WebSocket, dict[int, str | None]] = {}
+        self._server: uvicorn.Server | None = None
+        self._serve_task: asyncio.Task[None] | None = None
+        self._activity_task: asyncio.Task[None] | None = None
+        route = self._route
+        self.app = Starlette(
+            routes=[
+                Route("/api/", route(self._api_status)),
+                Route("/api/config", route(self._get_config)),
+                Route("/api/states", route(self._get_states)),
+                Route("/api/states/{entity_id}", route(self._state), methods=["GET", "POST"]),
+                Route("/api/services", route(self._get_services)),
+                Route("/api/services/{domain}/{service}", route(self._call_service), methods=["POST"]),
+                Route("/api/history/period", route(self._get_history)),
+                Route("/api/history/period/{start}", route(self._get_history)),
+                Route("/api/template", route(self._render_template), methods=["POST"]),
+                Route("/api/events", route(self._get_events)),
+                Route("/api/events/{event_type}", route(self._fire_event), methods=["POST"]),
+                WebSocketRoute("/api/websocket", self._websocket),
+            ]
+        )
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in the background.
+
+        Args:
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+
+        Returns:
+            Base URL of the simulator
+        """
+        config = uvicorn.Config(self.app, host=host, port=port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._serve_task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._serve_task.done():
+                self._serve_task.result()
+            await asyncio.sleep(0.01)
+        bound_port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}"
+        if self.behavior.state_changes_per_second > 0:
+            self._activity_task = asyncio.create_task(self._generate_state_changes())
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop the server and close every WebSocket connection."""
+        if self._activity_task is not None:
+            self._activity_task.cancel()
+            try:
+                await self._activity_task
+            except asyncio.CancelledError:
+                pass
+            self._activity_task = None
+        if self._server is not None and self._serve_task is not None:
+            self._server.should_exit = True
+            await self._serve_task
+        self._server = None
+        self._serve_task = None
+
+    async def __aenter__(self) -> "FakeHomeAssistant":
+        """Start the simulator on a free local port."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop the simulator."""
+        await self.stop()
+
+    async def _simulate_network(self) -> bool:
+        """Apply injected latency and decide whether the operation fails.
+
+        Returns:
+            True if a failure must be injected
+        """
+        self.requests += 1
+        behavior = self.behavior
+        if behavior.latency_ms or behavior.jitter_ms:
+            jitter = self._random.uniform(-behavior.jitter_ms, behavior.jitter_ms)
+            await asyncio.sleep(max(0.0, behavior.latency_ms + jitter) / 1000)
+        if behavior.error_rate and self._random.random() < behavior.error_rate:
+            self.injected_errors += 1
+            return True
+        return False
+
+    def _route(self, handler: Handler) -> Handler:
+        """Wrap a REST handler with authentication and injected behaviour."""
+
+        async def endpoint(request: Request) -> Response:
+            if request.headers.get("authorization") != f"Bearer {self.token}":
+                return PlainTextResponse("401: Unauthorized", status_code=401)
+            if await self._simulate_network():
+                return JSONResponse(
+                    {"message": "Simulated failure"}, status_code=self.behavior.error_status
+                )
+            return await handler(request)
+
+        return endpoint
+
+    async def _generate_state_changes(self) -> None:
+        """Emit random state changes at the configured rate until cancelled."""
+        interval = 1.0 / self.behavior.state_changes_per_second
+        while True:
+            await asyncio.sleep(interval)
+            old, new = self.install.random_state_change(self._random)
+            await self.fire(
+                "state_changed", {"entity_id": new["entity_id"], "old_state": old, "new_state": new}
+            )
+
+    async def _api_status(self, request: Request) -> Response:
+        return JSONResponse({"message": "API running."})
+
+    async def _get_config(self, request: Request) -> Response:
+        return JSONResponse(self.install.config)
+
+    async def _get_states(self, request: Request) -> Response:
+        return JSONResponse(list(self.install.states.values()))
+
+    async def _state(self, request: Request) -> Response:
+        entity_id = request.path_params["entity_id"]
+        if request.method == "POST":
+            body = await request.json()
+            old, new = self.install.set_state(entity_id, str(body["state"]), body.get("attributes"))
+            await self.fire("state_changed", {"entity_id": entity_id, "old_state": old, "new_state": new})
+            return JSONResponse(new, status_code=200 if old else 201)
+        state = self.install.states.get(entity_id)
+        if state is None:
+            return JSONResponse({"message": "Entity not found."}, status_code=404)
+        return JSONResponse(state)
+
+    async def _get_services(self, request: Request) -> Response:
+        return JSONResponse(self.install.services)
+
+    async def _call_service(self, request: Request) -> Response:
+        domain = request.path_params["domain"]
+        service = request.path_params["service"]
+        data = await request.json() if await request.body() else {}
+        changes = self.install.apply_service(domain, service, data)
+        await self.fire("call_service", {"domain": domain, "service": service, "service_data": data})
+        for old, new in changes:
+            await self.fire(
+                "state_changed", {"entity_id": new["entity_id"], "old_state": old, "new_state": new}
+            )
+        return JSONResponse([new for _, new in changes])
+
+    async def _get_history(self, request: Request) -> Response:
+        end = utc_now()
+        try:
+            start_param = request.path_params.get("start")
+            start = datetime.fromisoformat(start_param) if start_param else end - timedelta(days=1)
+            if "end_time" in request.query_params:
+                end = datetime.fromisoformat(request.query_params["end_time"])
+        except ValueError:
+            return JSONResponse({"message": "Invalid datetime"}, status_code=400)
+        if start.tzinfo is None:
+            start = start.astimezone()
+        if end.tzinfo is None:
+            end = end.astimezone()
+
+        filter_ids = request.query_params.get("filter_entity_id", "")
+        entity_ids = [entity_id for entity_id in filter_ids.split(",") if entity_id]
+        return JSONResponse(self.install.history(entity_ids, start, end))
+
+    async def _render_template(self, request: Request) -> Response:
+        body = await request.json()
+        try:
+            return PlainTextResponse(self._renderer.render(body.get("template", "")))
+        except ValueError as e:
+            return JSONResponse({"message": f"Error rendering template: {e}"}, status_code=400)
+
+    async def _get_events(self, request: Request) -> Response:
+        listeners: dict[str, int] = {}
+        for subscriptions in self._subscriptions.values():
+            for event_type in subscriptions.values():
+                key = event_type or "*"
+                listeners[key] = listeners.get(key, 0) + 1
+        return JSONResponse(
+            [{"event": event, "listener_count": count} for event, count in listeners.items()]
+        )
+
+    async def _fire_event(self, request: Request) -> Response:
+        event_type = request.path_params["event_type"]
+        data = await request.json() if await request.body() else {}
+        await self.fire(event_type, data)
+        return JSONResponse({"message": f"Event {event_type} fired."})
+
+    async def fire(self, event_type: str, data: dict[str, Any]) -> None:
+        """Deliver an event to every matching WebSocket subscription.
+
+        Args:
+            event_type: Event type
+            data: Event data
+        """
+        event = {
+            "event_type": event_type,
+            "data": data,
+            "origin": "LOCAL",
+            "time_fired": utc_now().isoformat(),
+            "context": {"id": None, "parent_id": None, "user_id": None},
+        }
+        sends = [
+            websocket.send_json({"id": subscription_id, "type": "event", "event": event})
+            for websocket, subscriptions in list(self._subscriptions.items())
+            for subscription_id, subscribed_type in list(subscriptions.items())
+            if subscribed_type in (None, event_type)
+        ]
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
+
+    async def _websocket(self, websocket: WebSocket) -> None:
+        """Handle one WebSocket connection (auth handshake, then commands)."""
+        await websocket.accept()
+        await websocket.send_json({"type": "auth_required", "ha_version": self.install.config["version"]})
+        try:
+            auth = await websocket.receive_json()
+            if auth.get("type") != "auth" or auth.get("access_token") != self.token:
+                await websocket.send_json({"type": "auth_invalid", "message": "Invalid access token"})
+                await websocket.close()
+                return
+            await websocket.send_json({"type": "auth_ok", "ha_version": self.install.config["version"]})
+
+            self._subscriptions[websocket] = {}
+            commands: set[asyncio.Task[None]] = set()
+            while True:
+                message = await websocket.receive_json()
+                task = asyncio.create_task(self._handle_command(websocket, message))
+                commands.add(task)
+                task.add_done_callback(commands.discard)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._subscriptions.pop(websocket, None)
+
+    async def _handle_command(self, websocket: WebSocket, message: dict[str, Any]) -> None:
+        """Execute a WebSocket command and send its result message."""
+        try:
+            await websocket.send_json(await self._command_result(websocket, message))
+        except Exception as e:
+            logger.debug(f"Failed to answer WebSocket command: {e}", exc_info=True)
+
+    async def _command_result(self, websocket: WebSocket, message: dict[str, Any]) -> dict[str, Any]:
+        """Execute a WebSocket command and build its result message."""
+        message_id = message.get("id")
+        if await self._simulate_network():
+            return self._error(message_id, "unknown_error", "Simulated failure")
+        try:
+            result = await self._execute_command(websocket, message)
+        except KeyError as e:
+            return self._error(message_id, "not_found", f"Unable to find {e}")
+        except ValueError as e:
+            return self._error(message_id, "invalid_format", str(e))
+        return {"id": message_id, "type": "result", "success": True, "result": result}
+
+    @staticmethod
+    def _error(message_id: Any, code: str, text: str) -> dict[str, Any]:
+        return {"id": message_id, "type": "result", "success": False, "error": {"code": code, "message": text}}
+
+    async def _execute_command(self, websocket: WebSocket, message: dict[str, Any]) -> Any:
+        """Run one WebSocket command against the install."""
+        command = message.get("type")
+        install = self.install
+        if command == "ping":
+            return None
+        if command == "subscribe_events":
+            self._subscriptions[websocket][message["id"]] = message.get("event_type")
+            return None
+        if command == "unsubscribe_events":
+            del self._subscriptions[websocket][message["subscription"]]
+            return None
+        if command == "fire_event":
+            await self.fire(message["event_type"], message.get("event_data") or {})
+            return {"context": {"id": None, "parent_id": None, "user_id": None}}
+        if command == "config/area_registry/list":
+            return install.area_registry()
+        if command == "config/device_registry/list":
+            return install.device_registry()
+        if command == "config/entity_registry/list":
+            return install.entity_registry()
+        if command == "get_states":
+            return list(install.states.values())
+        if command == "get_config":
+            return install.config
+        if command == "lovelace/dashboards/list":
+            return list(install.dashboards.values())
+        if command == "lovelace/config":
+            url_path = message.get("url_path")
+            if url_path not in install.dashboard_configs:
+                raise KeyError(f"dashboard '{url_path}'")
+            return install.dashboard_configs[url_path]
+        if command == "lovelace/config/save":
+            install.dashboard_configs[message.get("url_path")] = message["config"]
+            await self.fire("lovelace_updated", {"url_path": message.get("url_path"), "mode": "storage"})
+            return None
+        if command == "lovelace/dashboards/create":
+            url_path = message["url_path"]
+            if "-" not in url_path:
+                raise ValueError("Url path needs to contain a hyphen (-)")
+            dashboard_id = slugify(url_path)
+            if dashboard_id in install.dashboards:
+                raise ValueError(f"Dashboard '{url_path}' already exists")
+            dashboard = {
+                "id": dashboard_id,
+                "url_path": url_path,
+                "title": message["title"],
+                "icon": message.get("icon"),
+                "show_in_sidebar": message.get("show_in_sidebar", True),
+                "require_admin": message.get("require_admin", False),
+                "mode": "storage",
+            }
+            install.dashboards[dashboard_id] = dashboard
+            install.dashboard_configs[url_path] = {"views": []}
+            return dashboard
+        if command == "lovelace/dashboards/update":
+            dashboard = install.dashboards[message["dashboard_id"]]
+            for key in ("title", "icon", "show_in_sidebar", "require_admin"):
+                if key in message:
+                    dashboard[key] = message[key]
+            return dashboard
+        if command == "lovelace/dashboards/delete":
+            dashboard = install.dashboards.pop(message["dashboard_id"])
+            install.dashboard_configs.pop(dashboard["url_path"], None)
+            return None
+        raise ValueError(f"Unknown command '{command}'")
@@ -0,0 +1,18 @@
+"""Size parameters of a synthetic Home Assistant installation."""
+
+from pydantic import BaseModel, Field
+
+
+class InstallSpec(BaseModel):
+    """Shape of a generated installation."""
+
+    entities: int = Field(default=500, ge=1, description="Number of entities")
+    areas: int = Field(default=20, ge=1, description="Number of areas")
+    devices_per_area: int = Field(default=5, ge=1, description="Devices created in every area")
+    history_points: int = Field(
+        default=24, ge=0, description="State changes recorded per entity and day of history"
+    )
+    dashboards: int = Field(default=3, ge=0, description="Number of storage dashboards")
+    dashboard_views: int = Field(default=3, ge=1, description="Views per dashboard")
+    cards_per_view: int = Field(default=10, ge=0, description="Cards per dashboard view")
+    seed: int = Field(default=42, description="Random seed, same seed gives the same install")
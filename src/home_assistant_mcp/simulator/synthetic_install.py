@@ -0,0 +1,466 @@
+"""Generated Home Assistant installation served by the simulator."""
+
+import random
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .install_spec import InstallSpec
+
+# Entity mix of a typical installation: (domain, weight)
+DOMAIN_WEIGHTS = (
+    ("sensor", 40),
+    ("binary_sensor", 15),
+    ("light", 15),
+    ("switch", 10),
+    ("climate", 4),
+    ("cover", 6),
+    ("media_player", 4),
+    ("fan", 3),
+    ("lock", 3),
+)
+
+AREA_NAMES = (
+    "Living Room", "Kitchen", "Bedroom", "Bathroom", "Office", "Garage", "Hallway",
+    "Dining Room", "Guest Room", "Basement", "Attic", "Garden", "Laundry", "Nursery",
+)
+
+SENSOR_CLASSES = (
+    ("temperature", "°C", 16.0, 28.0),
+    ("humidity", "%", 30.0, 70.0),
+    ("power", "W", 0.0, 2500.0),
+    ("illuminance", "lx", 0.0, 1000.0),
+)
+
+BINARY_SENSOR_CLASSES = ("motion", "door", "window", "occupancy")
+
+SERVICE_STATES = {
+    "turn_on": "on",
+    "turn_off": "off",
+    "open_cover": "open",
+    "close_cover": "closed",
+    "lock": "locked",
+    "unlock": "unlocked",
+}
+
+
+def slugify(value: str) -> str:
+    """Convert a name to a Home Assistant style identifier."""
+    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+
+def utc_now() -> datetime:
+    """Get the current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+class SyntheticInstall:
+    """In-memory Home Assistant installation (states, areas, devices, dashboards).
+
+    The data is generated deterministically from an :class:`InstallSpec`.
+    History is not stored: it is derived on request from the entity and the
+    time window, so large installs stay cheap to simulate.
+
+    Attributes:
+        spec: Parameters the install was generated from
+        states: Current state objects by entity ID
+        areas: Area names by area ID
+        devices: Area ID of every device ID
+        entity_devices: Device ID of every entity ID
+        entity_areas: Area ID of entities assigned to an area other than
+            their device's
+        services: Service domains as returned by ``/api/services``
+        config: Core configuration as returned by ``/api/config``
+        dashboards: Storage dashboards by dashboard ID
+        dashboard_configs: Lovelace configs by URL path (None is the default
+            dashboard)
+    """
+
+    def __init__(self, spec: InstallSpec | None = None):
+        """Generate an installation.
+
+        Args:
+            spec: Size parameters (defaults to :class:`InstallSpec` defaults)
+        """
+        self.spec = spec or InstallSpec()
+        self._random = random.Random(self.spec.seed)
+        self.states: dict[str, dict[str, Any]] = {}
+        self.areas: dict[str, str] = {}
+        self.devices: dict[str, str] = {}
+        self.entity_devices: dict[str, str] = {}
+        self.entity_areas: dict[str, str] = {}
+        self.dashboards: dict[str, dict[str, Any]] = {}
+        self.dashboard_configs: dict[str | None, dict[str, Any]] = {}
+
+        self._generate_areas()
+        self._generate_entities()
+        self._generate_dashboards()
+        self.services = self._build_services()
+        self.config = {
+            "components": sorted({entity_id.split(".")[0] for entity_id in self.states}),
+            "config_dir": "/config",
+            "elevation": 0,
+            "latitude": 52.37,
+            "longitude": 4.89,
+            "location_name": "Simulator",
+            "time_zone": "UTC",
+            "unit_system": {"length": "km", "mass": "g", "temperature": "°C", "volume": "L"},
+            "version": "2025.1.0",
+        }
+
+    def _generate_areas(self) -> None:
+        """Create areas and their devices."""
+        for index in range(self.spec.areas):
+            base = AREA_NAMES[index % len(AREA_NAMES)]
+            name = base if index < len(AREA_NAMES) else f"{base} {index // len(AREA_NAMES) + 1}"
+            area_id = slugify(name)
+            self.areas[area_id] = name
+            for device in range(self.spec.devices_per_area):
+                self.devices[f"{area_id}_device_{device + 1}"] = area_id
+
+    def _generate_entities(self) -> None:
+        """Create entities spread over the devices."""
+        domains = [domain for domain, _ in DOMAIN_WEIGHTS]
+        weights = [weight for _, weight in DOMAIN_WEIGHTS]
+        device_ids = list(self.devices)
+        area_ids = list(self.areas)
+        counters: dict[str, int] = {}
+        for index in range(self.spec.entities):
+            domain = self._random.choices(domains, weights)[0]
+            device_id = device_ids[index % len(device_ids)]
+            area_name = self.areas[self.devices[device_id]]
+            counters[domain] = counters.get(domain, 0) + 1
+            object_id = f"{slugify(area_name)}_{domain}_{counters[domain]}"
+            entity_id = f"{domain}.{object_id}"
+
+            state, attributes = self._initial_state(domain)
+            attributes["friendly_name"] = f"{area_name} {domain.replace('_', ' ').title()} {counters[domain]}"
+            self.entity_devices[entity_id] = device_id
+            self.states[entity_id] = self._state_object(entity_id, state, attributes)
+            # Like in real installs, a few entities are placed apart from their device
+            if index % 10 == 9 and len(area_ids) > 1:
+                device_area = area_ids.index(self.devices[device_id])
+                self.entity_areas[entity_id] = area_ids[(device_area + 1) % len(area_ids)]
+
+    def _initial_state(self, domain: str) -> tuple[str, dict[str, Any]]:
+        """Pick a plausible state and attributes for an entity of a domain."""
+        rnd = self._random
+        if domain == "sensor":
+            device_class, unit, low, high = rnd.choice(SENSOR_CLASSES)
+            value = round(rnd.uniform(low, high), 1)
+            return str(value), {
+                "device_class": device_class,
+                "unit_of_measurement": unit,
+                "state_class": "measurement",
+            }
+        if domain == "binary_sensor":
+            return rnd.choice(("on", "off")), {"device_class": rnd.choice(BINARY_SENSOR_CLASSES)}
+        if domain == "light":
+            state = rnd.choice(("on", "off"))
+            attributes: dict[str, Any] = {"supported_color_modes": ["brightness"]}
+            if state == "on":
+                attributes["brightness"] = rnd.randint(1, 255)
+            return state, attributes
+        if domain == "climate":
+            return rnd.choice(("heat", "off", "auto")), {
+                "current_temperature": round(rnd.uniform(17, 24), 1),
+                "temperature": 21,
+                "hvac_modes": ["off", "heat", "auto"],
+            }
+        if domain == "cover":
+            return rnd.choice(("open", "closed")), {"current_position": rnd.choice((0, 100))}
+        if domain == "media_player":
+            return rnd.choice(("playing", "paused", "off")), {"volume_level": 0.3}
+        if domain == "lock":
+            return rnd.choice(("locked", "unlocked")), {}
+        return rnd.choice(("on", "off")), {}
+
+    @staticmethod
+    def _state_object(
+        entity_id: str, state: str, attributes: dict[str, Any], when: datetime | None = None
+    ) -> dict[str, Any]:
+        """Build a state object as returned by ``/api/states``."""
+        timestamp = (when or utc_now()).isoformat()
+        return {
+            "entity_id": entity_id,
+            "state": state,
+            "attributes": attributes,
+            "last_changed": timestamp,
+            "last_updated": timestamp,
+            "last_reported": timestamp,
+            "context": {"id": f"{random.getrandbits(64):016x}", "parent_id": None, "user_id": None},
+        }
+
+    def _generate_dashboards(self) -> None:
+        """Create storage dashboards with entity cards."""
+        entity_ids = list(self.states)
+        self.dashboard_configs[None] = {"title": "Home", "views": [{"title": "Overview", "cards": []}]}
+        for index in range(self.spec.dashboards):
+            url_path = f"dashboard-{index + 1}"
+            dashboard_id = slugify(url_path)
+            self.dashboards[dashboard_id] = {
+                "id": dashboard_id,
+                "url_path": url_path,
+                "title": f"Dashboard {index + 1}",
+                "icon": "mdi:view-dashboard",
+                "show_in_sidebar": True,
+                "require_admin": False,
+                "mode": "storage",
+            }
+            views = []
+            for view in range(self.spec.dashboard_views):
+                cards = [
+                    {"type": "entities", "entities": self._random.sample(entity_ids, min(5, len(entity_ids)))}
+                    for _ in range(self.spec.cards_per_view)
+                ]
+                views.append({"title": f"View {view + 1}", "path": f"view-{view + 1}", "cards": cards})
+            self.dashboard_configs[url_path] = {"title": f"Dashboard {index + 1}", "views": views}
+
+    def _build_services(self) -> list[dict[str, Any]]:
+        """Build service descriptions for every entity domain."""
+        domain_services = {
+            "homeassistant": ("turn_on", "turn_off", "toggle", "reload_all"),
+            "light": ("turn_on", "turn_off", "toggle"),
+            "switch": ("turn_on", "turn_off", "toggle"),
+            "fan": ("turn_on", "turn_off", "toggle"),
+            "climate": ("set_temperature", "set_hvac_mode", "turn_on", "turn_off"),
+            "cover": ("open_cover", "close_cover", "toggle"),
+            "media_player": ("turn_on", "turn_off", "media_play", "media_pause"),
+            "lock": ("lock", "unlock"),
+        }
+        return [
+            {
+                "domain": domain,
+                "services": {
+                    service: {
+                        "name": service.replace("_", " ").capitalize(),
+                        "description": f"{service.replace('_', ' ').capitalize()} {domain} entities.",
+                        "fields": {},
+                        "target": {"entity": [{"domain": [domain]}]},
+                    }
+                    for service in services
+                },
+            }
+            for domain, services in domain_services.items()
+        ]
+
+    def resolve_area_id(self, area: str) -> str | None:
+        """Resolve an area given by ID or name.
+
+        Args:
+            area: Area ID or name
+
+        Returns:
+            Area ID, or None if unknown
+        """
+        if area in self.areas:
+            return area
+        lowered = area.lower()
+        for area_id, name in self.areas.items():
+            if name.lower() == lowered:
+                return area_id
+        return None
+
+    def entity_area_id(self, entity_id: str) -> str | None:
+        """Get the effective area of an entity (own area, else its device's)."""
+        if entity_id in self.entity_areas:
+            return self.entity_areas[entity_id]
+        device_id = self.entity_devices.get(entity_id)
+        return self.devices.get(device_id) if device_id else None
+
+    def area_entities(self, area: str) -> list[str]:
+        """Get entity IDs in an area (given by ID or name)."""
+        area_id = self.resolve_area_id(area)
+        return [entity_id for entity_id in self.states if self.entity_area_id(entity_id) == area_id]
+
+    def area_devices(self, area: str) -> list[str]:
+        """Get device IDs in an area (given by ID or name)."""
+        area_id = self.resolve_area_id(area)
+        return [device_id for device_id, device_area in self.devices.items() if device_area == area_id]
+
+    def area_name(self, lookup: str) -> str | None:
+        """Get the area name of an area, device or entity ID."""
+        if lookup in self.areas:
+            return self.areas[lookup]
+        area_id = self.entity_area_id(lookup) if lookup in self.states else self.devices.get(lookup)
+        return self.areas[area_id] if area_id else None
+
+    def area_registry(self) -> list[dict[str, Any]]:
+        """Get areas as returned by ``config/area_registry/list``."""
+        return [
+            {
+                "area_id": area_id,
+                "name": name,
+                "aliases": [],
+                "floor_id": None,
+                "icon": None,
+                "labels": [],
+                "picture": None,
+            }
+            for area_id, name in self.areas.items()
+        ]
+
+    def device_registry(self) -> list[dict[str, Any]]:
+        """Get devices as returned by ``config/device_registry/list``."""
+        return [
+            {
+                "id": device_id,
+                "area_id": area_id,
+                "name": device_id.replace("_", " ").title(),
+                "name_by_user": None,
+                "manufacturer": "Simulator",
+                "model": "Virtual device",
+                "disabled_by": None,
+                "labels": [],
+            }
+            for device_id, area_id in self.devices.items()
+        ]
+
+    def entity_registry(self) -> list[dict[str, Any]]:
+        """Get entities as returned by ``config/entity_registry/list``."""
+        return [
+            {
+                "entity_id": entity_id,
+                "id": f"{index:08x}",
+                "unique_id": f"simulator_{entity_id}",
+                "platform": "simulator",
+                "device_id": self.entity_devices.get(entity_id),
+                "area_id": self.entity_areas.get(entity_id),
+                "name": None,
+                "original_name": state["attributes"].get("friendly_name"),
+                "icon": None,
+                "entity_category": None,
+                "disabled_by": None,
+                "hidden_by": None,
+                "labels": [],
+            }
+            for index, (entity_id, state) in enumerate(self.states.items())
+        ]
+
+    def set_state(
+        self, entity_id: str, state: str, attributes: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Write the state of an entity.
+
+        Args:
+            entity_id: Entity ID (created if it does not exist)
+            state: New state
+            attributes: New attributes (current ones are kept if None)
+
+        Returns:
+            Tuple of old state object (None for new entities) and new one
+        """
+        old = self.states.get(entity_id)
+        if attributes is None:
+            attributes = dict(old["attributes"]) if old else {}
+        new = self._state_object(entity_id, state, attributes)
+        if old is not None and old["state"] == state:
+            new["last_changed"] = old["last_changed"]
+        self.states[entity_id] = new
+        return old, new
+
+    def random_state_change(
+        self, rnd: random.Random
+    ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Change the state of a random entity the way devices report updates.
+
+        Numeric sensors drift, on/off entities flip and other entities are
+        re-reported with their current state.
+
+        Args:
+            rnd: Random generator picking the entity and new value
+
+        Returns:
+            Tuple of old and new state object
+        """
+        entity_id = rnd.choice(list(self.states))
+        current = self.states[entity_id]["state"]
+        try:
+            new_state = str(round(float(current) + rnd.uniform(-0.5, 0.5), 1))
+        except ValueError:
+            new_state = {"on": "off", "off": "on"}.get(current, current)
+        return self.set_state(entity_id, new_state)
+
+    def apply_service(
+        self, domain: str, service: str, data: dict[str, Any]
+    ) -> list[tuple[dict[str, Any] | None, dict[str, Any]]]:
+        """Apply the effect of a service call on the targeted entities.
+
+        Args:
+            domain: Service domain
+            service: Service name
+            data: Service data (``entity_id`` selects the targets)
+
+        Returns:
+            (old, new) state pairs of every changed entity
+        """
+        targets = data.get("entity_id") or []
+        if isinstance(targets, str):
+            targets = [targets]
+
+        changes = []
+        for entity_id in targets:
+            current = self.states.get(entity_id)
+            if current is None:
+                continue
+            new_state = SERVICE_STATES.get(service)
+            if service == "toggle":
+                new_state = "off" if current["state"] == "on" else "on"
+            if new_state is None:
+                continue
+            attributes = dict(current["attributes"])
+            for key, value in data.items():
+                if key != "entity_id":
+                    attributes[key] = value
+            changes.append(self.set_state(entity_id, new_state, attributes))
+        return changes
+
+    def history(
+        self, entity_ids: list[str], start: datetime, end: datetime
+    ) -> list[list[dict[str, Any]]]:
+        """Derive state history for entities within a time window.
+
+        Args:
+            entity_ids: Entities to include (all entities if empty)
+            start: Start of the window
+            end: End of the window
+
+        Returns:
+            One list of history entries per entity
+        """
+        result = []
+        points = max(1, round(self.spec.history_points * (end - start) / timedelta(days=1)))
+        step = (end - start) / points
+        for entity_id in entity_ids or list(self.states):
+            current = self.states.get(entity_id)
+            if current is None:
+                continue
+            rnd = random.Random(f"{self.spec.seed}:{entity_id}")
+            entries = []
+            for index in range(points if self.spec.history_points else 1):
+                when = start + step * index
+                state = current["state"]
+                if index < points - 1:
+                    state = self._historic_state(rnd, current)
+                entries.append(
+                    {
+                        "entity_id": entity_id,
+                        "state": state,
+                        "attributes": current["attributes"],
+                        "last_changed": when.isoformat(),
+                        "last_updated": when.isoformat(),
+                    }
+                )
+            result.append(entries)
+        return result
+
+    @staticmethod
+    def _historic_state(rnd: random.Random, current: dict[str, Any]) -> str:
+        """Derive a past state from the current one."""
+        try:
+            value = float(current["state"])
+        except ValueError:
+            if current["state"] in ("on", "off"):
+                return rnd.choice(("on", "off"))
+            return current["state"]
+        return str(round(value * rnd.uniform(0.9, 1.1), 1))
@@ -0,0 +1,124 @@
+"""Renderer for the subset of Home Assistant templates used by the MCP tools."""
+
+import ast
+import re
+from collections.abc import Callable
+from typing import Any
+
+from .synthetic_install import SyntheticInstall
+
+EXPRESSION = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
+CALL = re.compile(r"^(\w+)\((.*)\)$", re.DOTALL)
+
+
+def _split_pipes(expression: str) -> list[str]:
+    """Split an expression on ``|`` filters, ignoring pipes inside strings."""
+    parts, current, quote = [], [], None
+    for char in expression:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "|":
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return parts
+
+
+def _parse_call(text: str) -> tuple[str, tuple[Any, ...]]:
+    """Parse ``name(arg, ...)`` with literal arguments."""
+    match = CALL.match(text)
+    if match is None:
+        return text, ()
+    name, raw_args = match.groups()
+    try:
+        args = ast.literal_eval(f"({raw_args},)") if raw_args.strip() else ()
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"Unsupported arguments in '{text}'") from e
+    return name, args
+
+
+class TemplateRenderer:
+    """Evaluate ``{{ ... }}`` expressions against a synthetic install.
+
+    Supported are the area helpers (``areas``, ``area_entities``,
+    ``area_devices``, ``area_name``, ``area_id``), ``states``, ``state_attr``
+    and ``is_state``, optionally followed by the ``list``, ``count``,
+    ``length`` and ``select("match", pattern)`` filters. Anything else raises
+    ValueError, which the simulator reports like a template error.
+    """
+
+    def __init__(self, install: SyntheticInstall):
+        """Initialize the renderer.
+
+        Args:
+            install: Installation the template functions read from
+        """
+        self.install = install
+        self._functions: dict[str, Callable[..., Any]] = {
+            "areas": lambda: list(install.areas),
+            "area_entities": install.area_entities,
+            "area_devices": install.area_devices,
+            "area_name": install.area_name,
+            "area_id": install.resolve_area_id,
+            "states": self._states,
+            "state_attr": self._state_attr,
+            "is_state": lambda entity_id, state: self._states(entity_id) == state,
+        }
+
+    def render(self, template: str) -> str:
+        """Render a template.
+
+        Args:
+            template: Template text
+
+        Returns:
+            Rendered text
+
+        Raises:
+            ValueError: If the template uses unsupported syntax
+        """
+        return EXPRESSION.sub(lambda match: self._render_value(self._evaluate(match.group(1))), template)
+
+    def _evaluate(self, expression: str) -> Any:
+        """Evaluate one expression with its filters."""
+        head, *filters = _split_pipes(expression.strip())
+        name, args = _parse_call(head)
+        function = self._functions.get(name)
+        if function is None:
+            raise ValueError(f"Unsupported template function '{name}'")
+        value = function(*args)
+
+        for filter_text in filters:
+            filter_name, filter_args = _parse_call(filter_text)
+            if filter_name == "list":
+                value = list(value)
+            elif filter_name in ("count", "length"):
+                value = len(value)
+            elif filter_name == "select" and filter_args[:1] == ("match",) and len(filter_args) == 2:
+                pattern = re.compile(filter_args[1])
+                value = [item for item in value if pattern.match(str(item))]
+            else:
+                raise ValueError(f"Unsupported template filter '{filter_text}'")
+        return value
+
+    @staticmethod
+    def _render_value(value: Any) -> str:
+        """Render a value the way Home Assistant prints template results."""
+        if value is None:
+            return "None"
+        return str(value)
+
+    def _states(self, entity_id: str) -> str:
+        """Get the state of an entity (``unknown`` if missing)."""
+        state = self.install.states.get(entity_id)
+        return state["state"] if state else "unknown"
+
+    def _state_attr(self, entity_id: str, attribute: str) -> Any:
+        """Get an attribute of an entity (None if missing)."""
+        state = self.install.states.get(entity_id)
+        return state["attributes"].get(attribute) if state else None
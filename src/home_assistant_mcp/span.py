@@ -0,0 +1,104 @@
+"""A single timed operation within a trace."""
+
+import secrets
+import time
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tracer import Tracer
+
+current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+"""Span active in the current task, used as parent of new spans."""
+
+
+class Span:
+    """Timed operation that is also a context manager.
+
+    Entering the span makes it the parent of spans started inside the block
+    (including in awaited coroutines of the same task). Leaving it records the
+    end time, marks the span as failed if an exception escaped, and hands it to
+    the tracer for export.
+
+    Attributes:
+        name: Operation name (e.g. ``tool ha_list_entities``)
+        trace_id: 32-hex-digit ID shared by every span of a trace
+        span_id: 16-hex-digit ID of this span
+        parent_id: ID of the parent span, None for the root
+        attributes: Key/value details attached to the span
+        error: Error description if the operation failed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tracer: "Tracer",
+        parent: "Span | None" = None,
+        attributes: dict[str, Any] | None = None,
+    ):
+        """Initialize the span.
+
+        Args:
+            name: Operation name
+            tracer: Tracer that exports the span when it ends
+            parent: Parent span (None starts a new trace)
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.error: str | None = None
+        self.start_time_ns = 0
+        self.end_time_ns = 0
+        self._tracer = tracer
+        self._token: Token["Span | None"] | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a detail to the span.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+        """
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        """Start the span and make it the current span."""
+        self.start_time_ns = time.time_ns()
+        self._token = current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """End the span, restore the previous span and export it."""
+        self.end_time_ns = time.time_ns()
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc_val}"
+        if self._token is not None:
+            current_span.reset(self._token)
+            self._token = None
+        self._tracer.finish(self)
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (0 until the span ended)."""
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000 if self.end_time_ns else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the span.
+
+        Returns:
+            Dictionary with IDs, name, timing, attributes and error
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
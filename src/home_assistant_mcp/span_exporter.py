@@ -0,0 +1,17 @@
+"""Interface of span export destinations."""
+
+from typing import Any, Protocol
+
+
+class SpanExporter(Protocol):
+    """Destination for finished spans."""
+
+    def export(self, span: dict[str, Any]) -> None:
+        """Accept one finished span.
+
+        Args:
+            span: Span serialized by ``Span.to_dict``
+        """
+
+    async def shutdown(self) -> None:
+        """Flush pending spans and release resources."""
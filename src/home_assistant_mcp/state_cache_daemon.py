@@ -0,0 +1,381 @@
+"""Sidecar daemon sharing one Home Assistant connection between MCP processes.
+
+Every stdio MCP session is its own process. Pointed at this daemon with
+``HA_STATE_DAEMON_SOCKET``, they read entity states and area lookups from its
+cache and receive events through it, instead of each loading ``/api/states``
+and subscribing to events::
+
+    python -m home_assistant_mcp.state_cache_daemon --socket /tmp/ha-mcp.sock
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .client import HomeAssistantClient
+from .config import load_instance_configs
+from .daemon_protocol import EVENTS_METHOD, encode_message, read_message, write_message
+from .event_stream import EventCallback
+from .home_assistant_error import HomeAssistantError
+
+logger = logging.getLogger(__name__)
+
+# Area lookups answered from the registry cache, keyed by method and arguments
+REGISTRY_METHODS = (
+    "get_areas",
+    "get_area_entities",
+    "get_area_devices",
+    "get_entity_area",
+    "get_area_id",
+    "get_area_name",
+)
+
+# Events that make cached area lookups stale
+REGISTRY_EVENTS = ("area_registry_updated", "device_registry_updated", "entity_registry_updated")
+
+# Bytes queued for a peer that does not read its events before it is dropped
+MAX_PEER_BUFFER = 16 * 1024 * 1024
+
+
+class StateCacheDaemon:
+    """Serve cached states, area lookups and events over a Unix domain socket.
+
+    The state cache is loaded once and then kept current from
+    ``state_changed`` events. Area lookups are cached until a registry event
+    arrives. Both caches are rebuilt when the event stream reconnects, since
+    events may have been missed.
+
+    A connection that sends the ``events`` request becomes an event relay
+    speaking the ``subscribe_events``/``unsubscribe_events`` subset of the
+    Home Assistant WebSocket API. The daemon holds one Home Assistant
+    subscription per event type, however many processes listen, and closes
+    every relay when its own stream reconnects so the processes resynchronize
+    too.
+
+    Attributes:
+        client: Client of the Home Assistant instance being shared
+        socket_path: Path of the Unix domain socket
+        requests: Number of requests served
+    """
+
+    def __init__(self, client: HomeAssistantClient, socket_path: str | Path):
+        """Initialize the daemon.
+
+        Args:
+            client: Client of the Home Assistant instance being shared
+            socket_path: Path of the Unix domain socket
+        """
+        self.client = client
+        self.socket_path = Path(socket_path)
+        self.requests = 0
+        self._states: dict[str, dict[str, Any]] = {}
+        self._registry: dict[str, Any] = {}
+        self._server: asyncio.Server | None = None
+        # Event type (None for all) -> upstream unsubscribe, and local listeners
+        self._upstream: dict[str | None, Callable[[], Awaitable[None]]] = {}
+        self._listeners: dict[str | None, list[EventCallback]] = {}
+        self._subscribe_lock = asyncio.Lock()
+        self._relays: set[asyncio.StreamWriter] = set()
+        self._reload_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Load the caches, subscribe to events and start listening.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+            HomeAssistantError: If Home Assistant cannot be reached
+        """
+        if await self._socket_in_use():
+            raise RuntimeError(f"A state cache daemon is already listening on {self.socket_path}")
+
+        # Subscribe before loading so no change falls between the two
+        await self.subscribe("state_changed", self._on_state_changed)
+        for event_type in REGISTRY_EVENTS:
+            await self.subscribe(event_type, lambda event: self._registry.clear())
+        self.client.add_event_reconnect_listener(self._on_reconnect)
+        await self._load_states()
+
+        # A socket file left by a daemon that did not shut down cleanly
+        self.socket_path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path)
+        )
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"State cache daemon serving {len(self._states)} states on {self.socket_path}")
+
+    async def stop(self) -> None:
+        """Stop listening and release the Home Assistant connection."""
+        if self._server is not None:
+            self._server.close()
+            self._close_relays()
+            await self._server.wait_closed()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+        for unsubscribe in self._upstream.values():
+            try:
+                await unsubscribe()
+            except HomeAssistantError:
+                pass  # The connection is going away anyway
+        self._upstream.clear()
+        self._listeners.clear()
+        await self.client.close()
+
+    async def _socket_in_use(self) -> bool:
+        """Check whether a daemon answers on the socket path."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            _, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def subscribe(self, event_type: str | None, callback: EventCallback) -> Callable[[], Awaitable[None]]:
+        """Listen to Home Assistant events, sharing one subscription per event type.
+
+        Args:
+            event_type: Event type (None for all events)
+            callback: Called with each event payload
+
+        Returns:
+            Coroutine function that removes the listener, and the Home
+            Assistant subscription with its last listener
+
+        Raises:
+            HomeAssistantError: If the subscription cannot be established
+        """
+        async with self._subscribe_lock:
+            if event_type not in self._upstream:
+                self._upstream[event_type] = await self.client.subscribe_events(
+                    event_type, partial(self._fan_out, event_type)
+                )
+                self._listeners[event_type] = []
+            self._listeners[event_type].append(callback)
+        return partial(self._unsubscribe, event_type, callback)
+
+    async def _unsubscribe(self, event_type: str | None, callback: EventCallback) -> None:
+        """Remove a listener, and the Home Assistant subscription with the last one."""
+        async with self._subscribe_lock:
+            listeners = self._listeners.get(event_type)
+            if listeners is None or callback not in listeners:
+                return
+            listeners.remove(callback)
+            if listeners:
+                return
+            del self._listeners[event_type]
+            unsubscribe = self._upstream.pop(event_type)
+        try:
+            await unsubscribe()
+        except HomeAssistantError as e:
+            logger.debug(f"Failed to unsubscribe from {event_type or 'all'} events: {e}")
+
+    def _fan_out(self, event_type: str | None, event: dict[str, Any]) -> None:
+        """Pass an event to every listener of its subscription."""
+        for callback in list(self._listeners.get(event_type, ())):
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Event listener failed")
+
+    async def __aenter__(self) -> "StateCacheDaemon":
+        """Start the daemon."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop the daemon."""
+        await self.stop()
+
+    async def _load_states(self) -> None:
+        """Replace the state cache with a fresh snapshot."""
+        states = await self.client.get_states()
+        self._states = {state.entity_id: state.model_dump(mode="json") for state in states}
+
+    def _on_state_changed(self, event: dict[str, Any]) -> None:
+        """Apply a ``state_changed`` event to the state cache."""
+        data = event.get("data", {})
+        entity_id = data.get("entity_id")
+        if not entity_id:
+            return
+        new_state = data.get("new_state")
+        if new_state is None:
+            self._states.pop(entity_id, None)
+        else:
+            self._states[entity_id] = new_state
+
+    def _on_reconnect(self) -> None:
+        """Rebuild the caches after events may have been missed."""
+        self._registry.clear()
+        self._reload_task = asyncio.create_task(self._reload_states())
+        # Relayed processes missed the same events; reconnecting makes them resynchronize
+        self._close_relays()
+
+    def _close_relays(self) -> None:
+        """Close every event relay connection."""
+        for writer in list(self._relays):
+            writer.close()
+        self._relays.clear()
+
+    async def _reload_states(self) -> None:
+        """Reload the state cache, keeping the old one on failure."""
+        try:
+            await self._load_states()
+        except HomeAssistantError as e:
+            logger.warning(f"Failed to reload states after reconnecting: {e}")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests of one connection until the peer closes it."""
+        try:
+            while True:
+                try:
+                    request = await read_message(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                self.requests += 1
+                if request.get("method") == EVENTS_METHOD:
+                    await write_message(writer, {"id": request.get("id"), "result": "ok"})
+                    await self._relay_events(reader, writer)
+                    return
+                try:
+                    result = await self._dispatch(request.get("method", ""), request.get("args", {}))
+                    response = {"id": request.get("id"), "result": result}
+                except HomeAssistantError as e:
+                    response = {"id": request.get("id"), "error": str(e), "status_code": e.status_code}
+                except (KeyError, TypeError) as e:
+                    response = {"id": request.get("id"), "error": f"Invalid request: {e}", "status_code": 400}
+                await write_message(writer, response)
+        except (ConnectionError, ValueError) as e:
+            logger.debug(f"State cache connection failed: {e}")
+        finally:
+            writer.close()
+
+    async def _relay_events(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve event subscriptions of one process until it disconnects.
+
+        Args:
+            reader: Stream of subscription commands
+            writer: Stream receiving command results and events
+        """
+        # Command ID of the process -> listener removal
+        subscriptions: dict[int, Callable[[], Awaitable[None]]] = {}
+        self._relays.add(writer)
+
+        def forward(message_id: int, event: dict[str, Any]) -> None:
+            if writer.is_closing():
+                return
+            if writer.transport.get_write_buffer_size() > MAX_PEER_BUFFER:
+                logger.warning("Dropping an event relay that stopped reading its events")
+                writer.close()
+                return
+            writer.write(encode_message({"id": message_id, "type": "event", "event": event}))
+
+        try:
+            while True:
+                try:
+                    command = await read_message(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                message_id = command.get("id")
+                result: dict[str, Any] = {"id": message_id, "type": "result", "success": True, "result": None}
+                if command.get("type") == "subscribe_events":
+                    try:
+                        subscriptions[message_id] = await self.subscribe(
+                            command.get("event_type"), partial(forward, message_id)
+                        )
+                    except HomeAssistantError as e:
+                        result.update(success=False, error={"code": "subscription_failed", "message": str(e)})
+                elif command.get("type") == "unsubscribe_events":
+                    unsubscribe = subscriptions.pop(command.get("subscription"), None)
+                    if unsubscribe is not None:
+                        await unsubscribe()
+                else:
+                    result.update(
+                        success=False,
+                        error={"code": "unknown_command", "message": f"Unsupported command: {command.get('type')}"},
+                    )
+                await write_message(writer, result)
+        finally:
+            self._relays.discard(writer)
+            for unsubscribe in subscriptions.values():
+                await unsubscribe()
+
+    async def _dispatch(self, method: str, args: dict[str, Any]) -> Any:
+        """Answer one request from the caches, filling them on a miss.
+
+        Args:
+            method: Client method name
+            args: Keyword arguments of the method
+
+        Returns:
+            JSON-serializable result
+
+        Raises:
+            HomeAssistantError: If the method is unknown or Home Assistant fails
+        """
+        if method == "get_states":
+            return list(self._states.values())
+        if method == "get_state":
+            state = self._states.get(args["entity_id"])
+            if state is None:
+                # Not seen yet: ask Home Assistant (raises 404 for unknown entities)
+                state = (await self.client.get_state(args["entity_id"])).model_dump(mode="json")
+                self._states[state["entity_id"]] = state
+            return state
+        if method in REGISTRY_METHODS:
+            key = f"{method}:{json.dumps(args, sort_keys=True)}"
+            if key not in self._registry:
+                self._registry[key] = await getattr(self.client, method)(**args)
+            return self._registry[key]
+        raise HomeAssistantError(f"Unknown state cache method: {method}")
+
+
+async def run_daemon(socket_path: str | None = None, instance: str | None = None) -> None:
+    """Run the daemon until interrupted.
+
+    Args:
+        socket_path: Path of the Unix domain socket (the instance's
+            ``state_daemon_socket`` setting if None)
+        instance: Instance name (see ``HA_INSTANCES``; the default instance if None)
+
+    Raises:
+        ValueError: If the instance is unknown or no socket path is configured
+    """
+    configs = load_instance_configs()
+    name = instance or next(iter(configs))
+    if name not in configs:
+        raise ValueError(f"Unknown Home Assistant instance '{name}'")
+    socket_path = socket_path or configs[name].state_daemon_socket
+    if not socket_path:
+        raise ValueError("--socket or HA_STATE_DAEMON_SOCKET is required")
+
+    async with StateCacheDaemon(HomeAssistantClient(configs[name]), socket_path):
+        await asyncio.Event().wait()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", help="Unix domain socket path (env: HA_STATE_DAEMON_SOCKET)")
+    parser.add_argument("--instance", help="Home Assistant instance to share (default: the first one)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    try:
+        asyncio.run(run_daemon(args.socket, args.instance))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Token-bucket rate limiter for outgoing Home Assistant requests."""
+
+import asyncio
+import time
+from typing import Any
+
+
+class TokenBucket:
+    """Async token bucket that makes callers wait for capacity instead of failing.
+
+    Waiters are served in FIFO order. The bucket keeps running totals of how
+    long callers had to queue so the configured rates can be sized from
+    real traffic.
+
+    Attributes:
+        rate: Tokens added per second. A rate of 0 disables limiting.
+        burst: Maximum number of tokens the bucket can hold.
+        acquired: Number of tokens handed out so far.
+        total_wait: Accumulated seconds callers spent waiting.
+        max_wait: Longest single wait in seconds.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 disables limiting)
+            burst: Bucket capacity (defaults to one second worth of tokens, min 1)
+
+        Raises:
+            ValueError: If burst is below 1, since a request takes a whole token
+        """
+        if burst is not None and burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._waiting = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the bucket limits anything at all."""
+        return self.rate > 0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting until one becomes available.
+
+        Returns:
+            Seconds spent waiting for the token (queue time included)
+        """
+        if not self.enabled:
+            return 0.0
+
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                while self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def stats(self) -> dict[str, Any]:
+        """Get limiter statistics.
+
+        Returns:
+            Dictionary with rate, burst, queue length and wait times
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waiting": self._waiting,
+            "total_wait": round(self.total_wait, 6),
+            "avg_wait": round(self.total_wait / self.acquired, 6) if self.acquired else 0.0,
+            "max_wait": round(self.max_wait, 6),
+        }
@@ -0,0 +1,151 @@
+"""Opt-in cProfile hook for MCP tool executions."""
+
+import io
+import logging
+import random
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILE = "summary.txt"
+
+
+class ToolProfiler:
+    """Profile selected or sampled tool calls and keep a hot-function summary.
+
+    Each profiled call writes a ``<timestamp>-<tool>.prof`` dump (readable with
+    ``python -m pstats`` or snakeviz) to the profile directory, and the
+    statistics of all profiled calls are merged into ``summary.txt`` listing
+    the top functions by cumulative time. Only ``max_dumps`` dumps are kept.
+
+    cProfile can only run once per thread, so a call that starts while another
+    one is being profiled runs unprofiled. Because tool calls are coroutines,
+    a profile also contains work of other tasks that ran on the event loop
+    while the profiled call was awaiting.
+
+    Attributes:
+        directory: Directory receiving dumps and the summary
+        tools: Tool names profiled on every call
+        sample_rate: Fraction of other calls profiled (0 to 1)
+        top_n: Number of functions listed in the summary
+        max_dumps: Number of per-call dumps kept on disk
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        tools: Iterable[str] = (),
+        sample_rate: float = 0.0,
+        top_n: int = 30,
+        max_dumps: int = 100,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            directory: Directory receiving dumps and the summary
+            tools: Tool names profiled on every call
+            sample_rate: Fraction of other calls profiled (0 to 1)
+            top_n: Number of functions listed in the summary
+            max_dumps: Number of per-call dumps kept on disk
+        """
+        self.directory = Path(directory)
+        self.tools = frozenset(tools)
+        self.sample_rate = sample_rate
+        self.top_n = top_n
+        self.max_dumps = max_dumps
+        self._active = False
+        self._stats: "pstats.Stats | None" = None
+        self._calls: Counter[str] = Counter()
+        self._dumps: list[Path] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any call can be profiled."""
+        return bool(self.tools) or self.sample_rate > 0
+
+    def should_profile(self, name: str) -> bool:
+        """Decide whether a tool call is profiled.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            True if the tool is selected or the call was sampled
+        """
+        if name in self.tools:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block as one call of a tool.
+
+        Args:
+            name: Tool name used in the dump file name and summary
+        """
+        if self._active:
+            yield
+            return
+
+        # Imported on first use so servers without profiling never load it
+        import cProfile
+
+        profiler = cProfile.Profile()
+        self._active = True
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._active = False
+            try:
+                self._record(name, profiler)
+            except OSError as e:
+                logger.warning(f"Failed to write profile of {name}: {e}")
+
+    def _record(self, name: str, profiler: "cProfile.Profile") -> None:
+        """Write the dump of one call and refresh the summary."""
+        import pstats
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime("%Y%m%dT%H%M%S")
+        path = self.directory / f"{timestamp}-{time.time_ns() % 1_000_000:06d}-{name}.prof"
+        profiler.dump_stats(path)
+        self._dumps.append(path)
+        while len(self._dumps) > self.max_dumps:
+            self._dumps.pop(0).unlink(missing_ok=True)
+
+        self._calls[name] += 1
+        if self._stats is None:
+            self._stats = pstats.Stats(profiler)
+        else:
+            self._stats.add(profiler)
+        (self.directory / SUMMARY_FILE).write_text(self.summary())
+        logger.info(f"Profile of {name} written to {path}")
+
+    def summary(self) -> str:
+        """Render the hot-function summary of every profiled call.
+
+        Returns:
+            Profiled call counts per tool followed by the top functions by
+            cumulative time
+        """
+        lines = ["Profiled calls:"]
+        lines += [f"  {name}: {count}" for name, count in self._calls.most_common()]
+        if self._stats is not None:
+            import pstats
+
+            output = io.StringIO()
+            self._stats.stream = output
+            self._stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+            lines += ["", output.getvalue()]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,135 @@
+"""TTL cache for MCP tool results, keyed by tool name and arguments."""
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+INVALIDATE_ALL = "*"
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool results with per-entry expiry.
+
+    Keys are built from the tool name and its arguments normalized to a
+    canonical JSON form, so ``{"a": 1, "b": None}`` and ``{"a": 1}`` share an
+    entry regardless of key order.
+
+    Every invalidation bumps :attr:`generation`. A tool call that started
+    before an invalidation passes its generation to :meth:`set` and is not
+    cached, so a read racing a write never stores the result from before it.
+
+    Attributes:
+        max_entries: Maximum number of cached results
+        generation: Number of invalidations so far
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that found no fresh entry
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results before evicting the
+                least recently used one
+        """
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        """Build the cache key of a tool call.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tuple of tool name and canonical JSON of the non-null arguments
+        """
+        normalized = {k: v for k, v in arguments.items() if v is not None}
+        return name, json.dumps(normalized, sort_keys=True, default=str)
+
+    def get(self, name: str, arguments: dict[str, Any]) -> Any | None:
+        """Look up a fresh cached result.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Cached result, or None on a miss or expired entry
+        """
+        key = self.make_key(name, arguments)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self, name: str, arguments: dict[str, Any], result: Any, ttl: float, generation: int | None = None
+    ) -> None:
+        """Store a tool result, unless an invalidation happened since it was computed.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            result: Result to cache
+            ttl: Seconds the result stays fresh
+            generation: Value of :attr:`generation` when the tool call started
+                (None stores unconditionally)
+        """
+        if generation is not None and generation != self.generation:
+            return
+        key = self.make_key(name, arguments)
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, names: Iterable[str] | None = None) -> int:
+        """Drop cached results.
+
+        Args:
+            names: Tool names whose entries are dropped. None, or a collection
+                containing ``"*"``, drops everything.
+
+        Returns:
+            Number of entries removed
+        """
+        self.generation += 1
+        names = set(names) if names is not None else {INVALIDATE_ALL}
+        if INVALIDATE_ALL in names:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        stale = [key for key in self._entries if key[0] in names]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, hits, misses and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
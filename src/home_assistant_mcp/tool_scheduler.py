@@ -0,0 +1,65 @@
+"""Priority-aware scheduler for MCP tool executions."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .tools.tool_priority import ToolPriority
+
+
+class ToolScheduler:
+    """Run tool calls in priority classes, each with its own concurrency limit.
+
+    Control actions, metadata reads and bulk reads never compete for the same
+    slots, so a long ``ha_get_history`` cannot delay a ``ha_turn_off``.
+    """
+
+    def __init__(self, limits: dict[ToolPriority, int]):
+        """Initialize the scheduler.
+
+        Args:
+            limits: Maximum concurrent executions per priority class
+        """
+        self.limits = dict(limits)
+        self._semaphores = {priority: asyncio.Semaphore(n) for priority, n in limits.items()}
+        self._running = dict.fromkeys(limits, 0)
+        self._waiting = dict.fromkeys(limits, 0)
+
+    @asynccontextmanager
+    async def slot(self, priority: ToolPriority) -> AsyncIterator[None]:
+        """Hold an execution slot of a priority class.
+
+        Args:
+            priority: Priority class of the tool being executed
+
+        Yields:
+            None once a slot is available
+        """
+        self._waiting[priority] += 1
+        try:
+            await self._semaphores[priority].acquire()
+        finally:
+            self._waiting[priority] -= 1
+
+        self._running[priority] += 1
+        try:
+            yield
+        finally:
+            self._running[priority] -= 1
+            self._semaphores[priority].release()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get scheduler statistics.
+
+        Returns:
+            Mapping of priority class to its limit, running and waiting counts
+        """
+        return {
+            str(priority): {
+                "limit": self.limits[priority],
+                "running": self._running[priority],
+                "waiting": self._waiting[priority],
+            }
+            for priority in self.limits
+        }
@@ -3,7 +3,11 @@ from . import (
     ha_health_check,
     ha_get_config,
     ha_list_entities,
+    ha_search_entities,
+    ha_query_entities,
+    ha_get_changes,
     ha_get_entity_state,
+    ha_wait_for_state,
     ha_list_services,
     ha_call_service,
     ha_turn_on,
@@ -11,6 +15,10 @@ from . import (
     ha_toggle,
     ha_get_history,
     ha_fire_event,
+    ha_fire_events,
+    ha_subscribe_events,
+    ha_read_events,
+    ha_unsubscribe_events,
     ha_list_areas,
     ha_get_area_entities,
     ha_get_area_devices,
@@ -20,14 +28,21 @@ from . import (
     ha_get_dashboard,
     ha_create_dashboard,
     ha_update_dashboard,
+    ha_patch_dashboard,
+    ha_generate_dashboards,
     ha_delete_dashboard,
+    ha_metrics,
 )
 
 ALL_TOOL_MODULES = [
     ha_health_check,
     ha_get_config,
     ha_list_entities,
+    ha_search_entities,
+    ha_query_entities,
+    ha_get_changes,
     ha_get_entity_state,
+    ha_wait_for_state,
     ha_list_services,
     ha_call_service,
     ha_turn_on,
@@ -35,6 +50,10 @@ ALL_TOOL_MODULES = [
     ha_toggle,
     ha_get_history,
     ha_fire_event,
+    ha_fire_events,
+    ha_subscribe_events,
+    ha_read_events,
+    ha_unsubscribe_events,
     ha_list_areas,
     ha_get_area_entities,
     ha_get_area_devices,
@@ -44,8 +63,26 @@ ALL_TOOL_MODULES = [
     ha_get_dashboard,
     ha_create_dashboard,
     ha_update_dashboard,
+    ha_patch_dashboard,
+    ha_generate_dashboards,
     ha_delete_dashboard,
+    ha_metrics,
 ]
 
 TOOLS_LIST = [m.TOOL_DEF for m in ALL_TOOL_MODULES]
 TOOLS_MAP = {m.TOOL_DEF.name: m.execute for m in ALL_TOOL_MODULES}
+TOOLS_PRIORITY = {m.TOOL_DEF.name: m.PRIORITY for m in ALL_TOOL_MODULES}
+
+# Result caching: read tools declare CACHE_TTL (and optionally CACHE_EVENTS that
+# make their results stale), write tools declare which tools they INVALIDATE.
+TOOLS_CACHE_TTL = {m.TOOL_DEF.name: m.CACHE_TTL for m in ALL_TOOL_MODULES if hasattr(m, "CACHE_TTL")}
+TOOLS_CACHE_EVENTS = {
+    m.TOOL_DEF.name: m.CACHE_EVENTS for m in ALL_TOOL_MODULES if getattr(m, "CACHE_EVENTS", ())
+}
+TOOLS_INVALIDATES = {
+    m.TOOL_DEF.name: m.INVALIDATES for m in ALL_TOOL_MODULES if hasattr(m, "INVALIDATES")
+}
+
+# Fan-out: read tools that can query every Home Assistant instance at once
+# declare execute_all, which receives the clients by instance name.
+TOOLS_FAN_OUT = {m.TOOL_DEF.name: m.execute_all for m in ALL_TOOL_MODULES if hasattr(m, "execute_all")}
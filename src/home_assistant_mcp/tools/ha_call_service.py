@@ -1,8 +1,12 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
 from .utils import format_response
+from home_assistant_mcp.tool_result_cache import INVALIDATE_ALL
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_call_service",
@@ -31,7 +35,10 @@ TOOL_DEF = Tool(
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.CONTROL
+INVALIDATES = (INVALIDATE_ALL,)
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     domain = arguments["domain"]
     service = arguments["service"]
     entity_id = arguments.get("entity_id")
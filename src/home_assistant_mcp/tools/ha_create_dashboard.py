@@ -1,8 +1,11 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
 from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_create_dashboard",
@@ -35,7 +38,10 @@ TOOL_DEF = Tool(
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+INVALIDATES = ("ha_list_dashboards", "ha_get_dashboard")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     url_path = arguments["url_path"]
     title = arguments["title"]
     icon = arguments.get("icon")
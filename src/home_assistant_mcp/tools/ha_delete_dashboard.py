@@ -1,7 +1,10 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_delete_dashboard",
@@ -18,7 +21,10 @@ TOOL_DEF = Tool(
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+INVALIDATES = ("ha_list_dashboards", "ha_get_dashboard")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     dashboard_id = arguments["dashboard_id"]
     await client.delete_dashboard(dashboard_id)
     return [TextContent(type="text", text=f"Dashboard '{dashboard_id}' deleted successfully.")]
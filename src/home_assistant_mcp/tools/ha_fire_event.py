@@ -1,7 +1,10 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_fire_event",
@@ -22,7 +25,9 @@ TOOL_DEF = Tool(
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.CONTROL
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     event_type = arguments["event_type"]
     event_data = arguments.get("event_data", {})
     await client.fire_event(event_type, event_data)
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+MAX_EVENTS = 10000
+
+TOOL_DEF = Tool(
+    name="ha_fire_events",
+    description=(
+        "Fire many events in one call, pipelined over the WebSocket. "
+        "Reports the achieved events per second and every failed event"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "events": {
+                "type": "array",
+                "description": f"Events to fire, in order (max: {MAX_EVENTS})",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "event_type": {"type": "string"},
+                        "event_data": {"type": "object"},
+                    },
+                    "required": ["event_type"],
+                },
+                "maxItems": MAX_EVENTS,
+            },
+            "window": {
+                "type": "integer",
+                "description": "Maximum events awaiting confirmation at once (default: 100)",
+                "minimum": 1,
+                "maximum": 1000,
+            },
+        },
+        "required": ["events"],
+    },
+)
+
+PRIORITY = ToolPriority.BULK
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    events = arguments["events"]
+    if len(events) > MAX_EVENTS:
+        return [TextContent(type="text", text=f"Too many events: {len(events)} (max {MAX_EVENTS})")]
+    window = max(1, min(int(arguments.get("window") or 100), 1000))
+
+    result = await client.fire_events(
+        [(event["event_type"], event.get("event_data")) for event in events], window=window
+    )
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"Fired {result.fired} of {len(events)} events "
+                f"({result.events_per_second:g} events/s):\n{format_response(result)}"
+            ),
+        )
+    ]
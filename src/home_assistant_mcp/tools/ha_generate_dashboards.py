@@ -0,0 +1,168 @@
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+# Card order within a view; other domains follow alphabetically
+DOMAIN_TITLES = {
+    "light": "Lights",
+    "switch": "Switches",
+    "fan": "Fans",
+    "cover": "Covers",
+    "lock": "Locks",
+    "climate": "Climate",
+    "media_player": "Media",
+    "camera": "Cameras",
+    "sensor": "Sensors",
+    "binary_sensor": "Binary Sensors",
+}
+# Domains shown with one dedicated card per entity instead of a shared list
+ENTITY_CARDS = {
+    "climate": "thermostat",
+    "media_player": "media-control",
+    "camera": "picture-entity",
+}
+
+TOOL_DEF = Tool(
+    name="ha_generate_dashboards",
+    description=(
+        "Generate dashboard views for every area (or selected areas) in one pass, with cards "
+        "grouped by domain. Builds one dashboard with a view per area when url_path is given, "
+        "otherwise one dashboard per area"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "areas": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Area IDs or names to include (default: all areas)",
+            },
+            "domains": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Domains to include (e.g., ['light', 'climate']; default: all)",
+            },
+            "url_path": {
+                "type": "string",
+                "description": "Dashboard receiving one view per area (must contain a hyphen, e.g., 'home-areas')",
+            },
+            "title": {
+                "type": "string",
+                "description": "Title of the url_path dashboard (default: 'Areas')",
+            },
+            "dry_run": {
+                "type": "boolean",
+                "description": "Return the generated configs without saving them",
+            },
+        },
+        "required": [],
+    },
+)
+
+PRIORITY = ToolPriority.BULK
+INVALIDATES = ("ha_list_dashboards", "ha_get_dashboard")
+
+def _cards(entity_ids: list[str]) -> list[dict[str, Any]]:
+    by_domain: dict[str, list[str]] = {}
+    for entity_id in sorted(entity_ids):
+        by_domain.setdefault(entity_id.split(".", 1)[0], []).append(entity_id)
+    order = [d for d in DOMAIN_TITLES if d in by_domain] + sorted(d for d in by_domain if d not in DOMAIN_TITLES)
+
+    cards = []
+    for domain in order:
+        if domain in ENTITY_CARDS:
+            cards.extend({"type": ENTITY_CARDS[domain], "entity": entity_id} for entity_id in by_domain[domain])
+        else:
+            title = DOMAIN_TITLES.get(domain, domain.replace("_", " ").title())
+            cards.append({"type": "entities", "title": title, "entities": by_domain[domain]})
+    return cards
+
+def _slug(area_id: str) -> str:
+    return area_id.replace("_", "-").lower()
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    url_path = arguments.get("url_path")
+    domains = set(arguments.get("domains") or [])
+    dry_run = bool(arguments.get("dry_run", False))
+
+    (area_names, entity_areas), states = await asyncio.gather(
+        client.get_area_assignments(), client.get_states()
+    )
+
+    selected = list(area_names)
+    if arguments.get("areas"):
+        by_key = {key.casefold(): area_id for area_id, name in area_names.items() for key in (area_id, name)}
+        unknown = [area for area in arguments["areas"] if area.casefold() not in by_key]
+        if unknown:
+            return [TextContent(type="text", text=f"Unknown areas: {', '.join(unknown)}")]
+        selected = list(dict.fromkeys(by_key[area.casefold()] for area in arguments["areas"]))
+
+    members: dict[str, list[str]] = {area_id: [] for area_id in selected}
+    for state in states:
+        area_id = entity_areas.get(state.entity_id)
+        if area_id in members and (not domains or state.entity_id.split(".", 1)[0] in domains):
+            members[area_id].append(state.entity_id)
+
+    views = [
+        {"title": area_names[area_id], "path": _slug(area_id), "cards": _cards(members[area_id])}
+        for area_id in sorted(selected, key=lambda area_id: area_names[area_id].casefold())
+        if members[area_id]
+    ]
+    if not views:
+        return [TextContent(type="text", text="No entities found in the selected areas")]
+
+    # url_path -> (title, config)
+    if url_path:
+        dashboards = {url_path: (arguments.get("title") or "Areas", {"views": views})}
+    else:
+        dashboards = {f"area-{view['path']}": (view["title"], {"views": [view]}) for view in views}
+
+    if dry_run:
+        configs = {path: config for path, (_, config) in dashboards.items()}
+        return [
+            TextContent(
+                type="text",
+                text=f"Generated {len(dashboards)} dashboards (not saved):\n{format_response(configs)}",
+            )
+        ]
+
+    existing = {dashboard.url_path for dashboard in await client.list_dashboards()}
+    missing = [path for path in dashboards if path not in existing]
+    created = await client.create_dashboards(
+        [{"url_path": path, "title": dashboards[path][0], "icon": "mdi:floor-plan"} for path in missing]
+    )
+    errors = {path: result for path, result in zip(missing, created) if isinstance(result, Exception)}
+    created_paths = {path for path in missing if path not in errors}
+
+    saved = await client.save_dashboard_configs(
+        {path: config for path, (_, config) in dashboards.items() if path not in errors}
+    )
+    errors.update({path: error for path, error in saved.items() if error is not None})
+
+    summary = []
+    for path, (title, config) in dashboards.items():
+        row = {
+            "url_path": path,
+            "title": title,
+            "views": len(config["views"]),
+            "cards": sum(len(view["cards"]) for view in config["views"]),
+            "created": path in created_paths,
+        }
+        if path in errors:
+            row["error"] = str(errors[path])
+        summary.append(row)
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"Saved {len(dashboards) - len(errors)} of {len(dashboards)} dashboards "
+                f"({len(views)} area views):\n{format_response(summary)}"
+            ),
+        )
+    ]
@@ -1,8 +1,18 @@
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_area_devices",
@@ -14,17 +24,20 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Area ID or name (e.g., 'salon', 'kitchen')",
             },
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": ["area"],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 60.0
+CACHE_EVENTS = ("area_registry_updated", "device_registry_updated")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     area = arguments["area"]
     devices = await client.get_area_devices(area)
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(devices)} devices in area '{area}':\n{json.dumps(devices, indent=2)}",
-        )
-    ]
+    return paged_response(f"Found {len(devices)} devices in area '{area}':", devices)
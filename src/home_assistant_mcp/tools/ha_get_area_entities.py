@@ -1,8 +1,18 @@
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_area_entities",
@@ -18,12 +28,20 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Optional domain to filter entities (e.g., 'light', 'switch', 'sensor')",
             },
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": ["area"],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 60.0
+CACHE_EVENTS = ("area_registry_updated", "device_registry_updated", "entity_registry_updated")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     area = arguments["area"]
     domain = arguments.get("domain")
     entities = await client.get_area_entities(area, domain=domain)
@@ -46,9 +64,4 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
             })
 
     filter_msg = f" (domain: {domain})" if domain else ""
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(entities)} entities in area '{area}'{filter_msg}:\n{json.dumps(entity_info, indent=2)}",
-        )
-    ]
+    return paged_response(f"Found {len(entities)} entities in area '{area}'{filter_msg}:", entity_info)
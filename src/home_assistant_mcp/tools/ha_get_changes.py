@@ -0,0 +1,82 @@
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.change_log import decode_cursor, encode_cursor
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+TOOL_DEF = Tool(
+    name="ha_get_changes",
+    description=(
+        "Get the entities whose state or attributes changed since a cursor. Call without a "
+        "cursor to start tracking, then pass the returned cursor to get only the changes"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "cursor": {
+                "type": "string",
+                "description": "Cursor returned by the previous call (omit to start tracking)",
+            },
+            "domain": {
+                "type": "string",
+                "description": "Optional domain to filter changes (e.g., 'light', 'binary_sensor')",
+            },
+        },
+        "required": [],
+    },
+)
+
+PRIORITY = ToolPriority.METADATA
+
+def _row(entity_id: str, state: dict[str, Any] | None) -> dict[str, Any]:
+    if state is None:
+        return {"entity_id": entity_id, "removed": True}
+    return {
+        "entity_id": entity_id,
+        "state": state.get("state"),
+        "attributes": state.get("attributes", {}),
+        "last_updated": state.get("last_updated"),
+    }
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    cursor = arguments.get("cursor")
+    domain = arguments.get("domain")
+    position = decode_cursor(cursor) if cursor else None
+    if cursor and position is None:
+        return [TextContent(type="text", text="Invalid cursor; call without a cursor to start tracking")]
+
+    change_log = await client.get_change_log()
+    changes = change_log.since(cursor) if change_log is not None and cursor else None
+
+    if changes is None and position is not None:
+        # No change log, or the cursor predates it: compare last_updated times
+        states = await client.get_states()
+        changes = [
+            (state.entity_id, state.model_dump(mode="json"))
+            for state in states
+            if state.last_updated is not None and state.last_updated > position["time"]
+        ]
+        latest = max((s.last_updated for s in states if s.last_updated), default=position["time"])
+        next_time = max(latest, position["time"])
+    else:
+        next_time = datetime.now(UTC)
+
+    if change_log is not None:
+        next_cursor = change_log.cursor()
+    else:
+        next_cursor = encode_cursor(None, 0, next_time)
+
+    if changes is None:
+        return [TextContent(type="text", text=f"Tracking changes from now.\nCursor: {next_cursor}")]
+
+    rows = [_row(entity_id, state) for entity_id, state in changes if not domain or entity_id.startswith(f"{domain}.")]
+    return [
+        TextContent(
+            type="text",
+            text=f"{len(rows)} entities changed.\nCursor: {next_cursor}\n{format_response(rows)}",
+        )
+    ]
@@ -1,19 +1,28 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
-from .utils import format_response
+from .utils import BYPASS_CACHE_ARG, BYPASS_CACHE_PROPERTY, format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_config",
     description="Get Home Assistant configuration including version, location, and loaded components",
     inputSchema={
         "type": "object",
-        "properties": {},
+        "properties": {
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+        },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 300.0
+CACHE_EVENTS = ("core_config_updated", "component_loaded")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     result = await client.get_config()
     return [TextContent(type="text", text=format_response(result))]
@@ -1,8 +1,18 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
-from .utils import format_response
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_dashboard",
@@ -14,12 +24,20 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Dashboard URL path (optional, null for default)",
             },
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 60.0
+CACHE_EVENTS = ("lovelace_updated",)
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     url_path = arguments.get("url_path")
     config = await client.get_dashboard_config(url_path)
-    return [TextContent(type="text", text=format_response(config))]
+    return paged_response("", config)
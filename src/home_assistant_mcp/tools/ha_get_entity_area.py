@@ -1,7 +1,11 @@
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import BYPASS_CACHE_ARG, BYPASS_CACHE_PROPERTY
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_entity_area",
@@ -13,12 +17,17 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Entity ID (e.g., 'light.living_room')",
             },
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
         },
         "required": ["entity_id"],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 60.0
+CACHE_EVENTS = ("area_registry_updated", "device_registry_updated", "entity_registry_updated")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     entity_id = arguments["entity_id"]
     area = await client.get_entity_area(entity_id)
     if area:
@@ -1,9 +1,12 @@
 
-import json
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import CONTINUATION_ARG, CONTINUATION_PROPERTY, continued_response, paged_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_get_history",
@@ -20,12 +23,17 @@ TOOL_DEF = Tool(
                 "description": "Number of hours of history to retrieve (default: 24)",
                 "default": 24,
             },
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": ["entity_id"],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.BULK
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     entity_id = arguments["entity_id"]
     hours_ago = arguments.get("hours_ago", 24)
 
@@ -43,9 +51,4 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
                     "last_changed": str(entry.last_changed) if entry.last_changed else None,
                 }
             )
-    return [
-        TextContent(
-            type="text",
-            text=f"History for {entity_id} (last {hours_ago} hours):\n{json.dumps(entries, indent=2)}",
-        )
-    ]
+    return paged_response(f"History for {entity_id} (last {hours_ago} hours):", entries)
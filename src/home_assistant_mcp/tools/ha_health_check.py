@@ -1,7 +1,11 @@
 
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_health_check",
@@ -13,6 +17,26 @@ TOOL_DEF = Tool(
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
     result = await client.check_api()
     return [TextContent(type="text", text=f"Home Assistant API is running: {result.message}")]
+
+async def execute_all(clients: dict[str, "HomeAssistantClient"], arguments: dict[str, Any]) -> list[TextContent]:
+    results = await asyncio.gather(
+        *(client.check_api() for client in clients.values()), return_exceptions=True
+    )
+    lines = [
+        f"{instance}: unreachable ({result})"
+        if isinstance(result, Exception)
+        else f"{instance}: running ({result.message})"
+        for instance, result in zip(clients, results)
+    ]
+    running = sum(1 for result in results if not isinstance(result, Exception))
+    return [
+        TextContent(
+            type="text",
+            text=f"{running} of {len(clients)} Home Assistant instances running:\n" + "\n".join(lines),
+        )
+    ]
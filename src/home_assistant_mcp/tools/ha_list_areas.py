@@ -1,20 +1,39 @@
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_list_areas",
     description="List all configured areas in Home Assistant",
     inputSchema={
         "type": "object",
-        "properties": {},
+        "properties": {
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
+        },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 300.0
+CACHE_EVENTS = ("area_registry_updated",)
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     areas = await client.get_areas()
     # Get friendly names for each area
     area_info = []
@@ -24,9 +43,4 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
             "area_id": area_id,
             "name": area_name or area_id,
         })
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(areas)} areas:\n{json.dumps(area_info, indent=2)}",
-        )
-    ]
+    return paged_response(f"Found {len(areas)} areas:", area_info)
@@ -1,20 +1,39 @@
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_list_dashboards",
     description="List all Lovelace dashboards",
     inputSchema={
         "type": "object",
-        "properties": {},
+        "properties": {
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
+        },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 60.0
+CACHE_EVENTS = ()
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     dashboards = await client.list_dashboards()
     dashboard_list = [
         {
@@ -27,9 +46,4 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
         }
         for d in dashboards
     ]
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(dashboards)} dashboards:\n{json.dumps(dashboard_list, indent=2)}",
-        )
-    ]
+    return paged_response(f"Found {len(dashboards)} dashboards:", dashboard_list)
@@ -1,8 +1,12 @@
 
-import json
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import CONTINUATION_ARG, CONTINUATION_PROPERTY, continued_response, paged_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_list_entities",
@@ -14,20 +18,22 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Optional domain to filter entities (e.g., 'light', 'switch', 'sensor', 'climate')",
             },
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
-    domain = arguments.get("domain")
+PRIORITY = ToolPriority.BULK
+
+async def _list_entities(client: "HomeAssistantClient", domain: str | None) -> list[dict[str, Any]]:
     if domain:
         entities = await client.get_entities_by_domain(domain)
     else:
         entities = await client.get_states()
 
     # Return simplified list
-    entity_list = [
+    return [
         {
             "entity_id": e.entity_id,
             "state": e.state,
@@ -35,9 +41,21 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
         }
         for e in entities
     ]
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(entity_list)} entities:\n{json.dumps(entity_list, indent=2)}",
-        )
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
+    entity_list = await _list_entities(client, arguments.get("domain"))
+    return paged_response(f"Found {len(entity_list)} entities:", entity_list)
+
+async def execute_all(clients: dict[str, "HomeAssistantClient"], arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
+    domain = arguments.get("domain")
+    results = await asyncio.gather(*(_list_entities(client, domain) for client in clients.values()))
+    entity_list = [
+        {"instance": instance, **entity}
+        for instance, entities in zip(clients, results)
+        for entity in entities
     ]
+    return paged_response(f"Found {len(entity_list)} entities in {len(clients)} instances:", entity_list)
@@ -1,8 +1,18 @@
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from mcp.types import Tool, TextContent
-from home_assistant_mcp.client import HomeAssistantClient
+from .utils import (
+    BYPASS_CACHE_ARG,
+    BYPASS_CACHE_PROPERTY,
+    CONTINUATION_ARG,
+    CONTINUATION_PROPERTY,
+    continued_response,
+    paged_response,
+)
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
 
 TOOL_DEF = Tool(
     name="ha_list_services",
@@ -14,12 +24,20 @@ TOOL_DEF = Tool(
                 "type": "string",
                 "description": "Optional domain to filter services (e.g., 'light', 'switch')",
             },
+            BYPASS_CACHE_ARG: BYPASS_CACHE_PROPERTY,
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
         },
         "required": [],
     },
 )
 
-async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> list[TextContent]:
+PRIORITY = ToolPriority.METADATA
+CACHE_TTL = 300.0
+CACHE_EVENTS = ("service_registered", "service_removed")
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
     services = await client.get_services()
     domain = arguments.get("domain")
     if domain:
@@ -35,9 +53,4 @@ async def execute(client: HomeAssistantClient, arguments: dict[str, Any]) -> lis
                     "description": service_def.description or "No description",
                 }
             )
-    return [
-        TextContent(
-            type="text",
-            text=f"Found {len(service_list)} services:\n{json.dumps(service_list, indent=2)}",
-        )
-    ]
+    return paged_response(f"Found {len(service_list)} services:", service_list)
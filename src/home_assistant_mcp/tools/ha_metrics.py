@@ -0,0 +1,36 @@
+import json
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.metrics import METRICS
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+TOOL_DEF = Tool(
+    name="ha_metrics",
+    description=(
+        "Get MCP server performance metrics: latency percentiles, error counts and payload "
+        "sizes per tool, REST endpoint and WebSocket command, plus connection pool, "
+        "scheduler and cache gauges"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "format": {
+                "type": "string",
+                "enum": ["json", "prometheus"],
+                "description": "Output format (default: json summary with p50/p95/p99)",
+                "default": "json",
+            },
+        },
+        "required": [],
+    },
+)
+
+PRIORITY = ToolPriority.METADATA
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if arguments.get("format") == "prometheus":
+        return [TextContent(type="text", text=METRICS.render_prometheus())]
+    return [TextContent(type="text", text=json.dumps(METRICS.snapshot(), indent=2))]
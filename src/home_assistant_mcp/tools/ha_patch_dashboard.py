@@ -0,0 +1,68 @@
+
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.json_patch import OPERATIONS
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+TOOL_DEF = Tool(
+    name="ha_patch_dashboard",
+    description=(
+        "Edit a dashboard configuration with JSON Patch operations (e.g., replace one card) "
+        "instead of saving the whole config. Saves only if something changed; pass no "
+        "operations to get the current content hash"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "url_path": {
+                "type": "string",
+                "description": "Dashboard URL path (optional, null for default)",
+            },
+            "operations": {
+                "type": "array",
+                "description": (
+                    "JSON Patch operations applied in order, all or nothing "
+                    "(e.g., {'op': 'replace', 'path': '/views/0/cards/2/entity', 'value': 'light.desk'})"
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "op": {"type": "string", "enum": list(OPERATIONS)},
+                        "path": {"type": "string", "description": "JSON Pointer (e.g., '/views/0/cards/-')"},
+                        "value": {"description": "Value for add, replace and test"},
+                        "from": {"type": "string", "description": "Source JSON Pointer for move and copy"},
+                    },
+                    "required": ["op", "path"],
+                },
+            },
+            "base_hash": {
+                "type": "string",
+                "description": "Content hash the operations were written against; refused if the dashboard changed since",
+            },
+        },
+        "required": ["operations"],
+    },
+)
+
+PRIORITY = ToolPriority.METADATA
+INVALIDATES = ("ha_get_dashboard",)
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    url_path = arguments.get("url_path")
+    try:
+        result = await client.patch_dashboard_config(
+            arguments["operations"], url_path=url_path, base_hash=arguments.get("base_hash")
+        )
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Patch not applied: {e}")]
+
+    name = url_path or "default"
+    if result.changed:
+        summary = f"Dashboard '{name}' patched with {result.operations} operations and saved."
+    else:
+        summary = f"Dashboard '{name}' unchanged; nothing saved."
+    return [TextContent(type="text", text=f"{summary}\n{format_response(result)}")]
@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.entity_index import OPERATORS
+from .utils import CONTINUATION_ARG, CONTINUATION_PROPERTY, continued_response, paged_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+MAX_LIMIT = 500
+
+TOOL_DEF = Tool(
+    name="ha_query_entities",
+    description=(
+        "Find entities matching structured filters (domain, state, device class, area, "
+        "attribute comparisons such as brightness > 100 or battery_level < 20, time since "
+        "last change) and return only the matching rows"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "domain": {
+                "type": "string",
+                "description": "Entity domain (e.g., 'light', 'sensor')",
+            },
+            "state": {
+                "anyOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}],
+                "description": "State, or list of accepted states (e.g., 'on' or ['unavailable', 'unknown'])",
+            },
+            "device_class": {
+                "type": "string",
+                "description": "Device class (e.g., 'battery', 'temperature', 'door')",
+            },
+            "area": {
+                "type": "string",
+                "description": "Area name (e.g., 'Kitchen')",
+            },
+            "where": {
+                "type": "array",
+                "description": (
+                    "Attribute predicates, all of which must hold. Use attribute 'state' to "
+                    "compare the state itself (e.g., numeric sensor values)"
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "attribute": {"type": "string"},
+                        "op": {"type": "string", "enum": list(OPERATORS)},
+                        "value": {"type": ["string", "number", "boolean"]},
+                    },
+                    "required": ["attribute", "op", "value"],
+                },
+            },
+            "changed_within_minutes": {
+                "type": "number",
+                "description": "Only entities whose state changed in the last N minutes",
+            },
+            "unchanged_for_minutes": {
+                "type": "number",
+                "description": "Only entities whose state has not changed for at least N minutes",
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum number of rows (default: 100, max: {MAX_LIMIT})",
+                "minimum": 1,
+                "maximum": MAX_LIMIT,
+            },
+            CONTINUATION_ARG: CONTINUATION_PROPERTY,
+        },
+        "required": [],
+    },
+)
+
+PRIORITY = ToolPriority.METADATA
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    if CONTINUATION_ARG in arguments:
+        return continued_response(arguments[CONTINUATION_ARG])
+    where = [(p["attribute"], p["op"], p["value"]) for p in arguments.get("where") or []]
+    states = arguments.get("state")
+    if isinstance(states, str):
+        states = [states]
+    now = datetime.now(UTC)
+    within = arguments.get("changed_within_minutes")
+    unchanged = arguments.get("unchanged_for_minutes")
+    limit = max(1, min(int(arguments.get("limit") or 100), MAX_LIMIT))
+
+    index = await client.get_entity_index()
+    try:
+        entity_ids = index.query(
+            domain=arguments.get("domain"),
+            states=states,
+            device_class=arguments.get("device_class"),
+            area=arguments.get("area"),
+            where=where,
+            changed_after=now - timedelta(minutes=within) if within is not None else None,
+            changed_before=now - timedelta(minutes=unchanged) if unchanged is not None else None,
+        )
+    except ValueError as e:
+        return [TextContent(type="text", text=str(e))]
+
+    # Only the attributes the predicates looked at, not the whole state
+    attribute_names = sorted({name for name, _, _ in where if name != "state"})
+    rows = []
+    for entity_id in entity_ids[:limit]:
+        entity = index.entities[entity_id]
+        state = index.states[entity_id]
+        row = {
+            "entity_id": entity_id,
+            "friendly_name": entity["friendly_name"],
+            "state": entity["state"],
+            "area": entity["area"],
+            "last_changed": state.get("last_changed"),
+        }
+        attributes = state.get("attributes") or {}
+        for name in attribute_names:
+            row[name] = attributes.get(name)
+        rows.append(row)
+
+    shown = f" (showing {len(rows)})" if len(rows) < len(entity_ids) else ""
+    return paged_response(f"Found {len(entity_ids)} matching entities{shown}:", rows)
@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+MAX_LIMIT = 500
+MAX_WAIT = 60.0
+
+TOOL_DEF = Tool(
+    name="ha_read_events",
+    description=(
+        "Read the events buffered by an ha_subscribe_events subscription after a cursor, "
+        "optionally waiting for new ones. Reports events dropped because the buffer was full "
+        "and interruptions of the event stream"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "subscription_id": {
+                "type": "string",
+                "description": "Subscription ID returned by ha_subscribe_events",
+            },
+            "cursor": {
+                "type": "integer",
+                "description": "Cursor returned by the previous read (default: 0, the oldest buffered event)",
+                "minimum": 0,
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum number of events (default: 100, max: {MAX_LIMIT})",
+                "minimum": 1,
+                "maximum": MAX_LIMIT,
+            },
+            "wait_seconds": {
+                "type": "number",
+                "description": f"Seconds to wait for an event if none is buffered (default: 0, max: {MAX_WAIT:.0f})",
+                "minimum": 0,
+                "maximum": MAX_WAIT,
+            },
+            "unsubscribe": {
+                "type": "boolean",
+                "description": "End the subscription after this read",
+            },
+        },
+        "required": ["subscription_id"],
+    },
+)
+
+PRIORITY = ToolPriority.WAIT
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    subscription_id = arguments["subscription_id"]
+    cursor = max(0, int(arguments.get("cursor") or 0))
+    limit = max(1, min(int(arguments.get("limit") or 100), MAX_LIMIT))
+    wait_seconds = max(0.0, min(float(arguments.get("wait_seconds") or 0), MAX_WAIT))
+
+    buffer = client.get_event_buffer(subscription_id)
+    if wait_seconds:
+        await buffer.wait(cursor, wait_seconds)
+    events, next_cursor, missed = buffer.read(cursor, limit)
+    interrupted = buffer.interrupted(cursor, next_cursor)
+    if arguments.get("unsubscribe"):
+        await client.close_event_buffer(subscription_id)
+
+    summary = {
+        "subscription_id": subscription_id,
+        "cursor": next_cursor,
+        "returned": len(events),
+        "pending": buffer.received - next_cursor,
+        "missed": missed,
+        "dropped_total": buffer.dropped,
+        "interrupted": interrupted,
+        "interruptions_total": buffer.interruptions,
+        "events": events,
+    }
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"Read {len(events)} events ({missed} missed"
+                f"{', stream interrupted, more may be missing' if interrupted else ''}):\n"
+                f"{format_response(summary)}"
+            ),
+        )
+    ]
@@ -0,0 +1,76 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+MAX_LIMIT = 50
+
+TOOL_DEF = Tool(
+    name="ha_search_entities",
+    description=(
+        "Fuzzy search entities by name, entity ID, area or device class "
+        "(e.g., 'kitchen ceiling light'); returns the best matches ranked by score"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Free text describing the entity (typos and partial words are fine)",
+            },
+            "domain": {
+                "type": "string",
+                "description": "Optional domain to restrict the search (e.g., 'light', 'sensor')",
+            },
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum number of matches (default: 10, max: {MAX_LIMIT})",
+                "minimum": 1,
+                "maximum": MAX_LIMIT,
+            },
+        },
+        "required": ["query"],
+    },
+)
+
+PRIORITY = ToolPriority.METADATA
+
+def _limit(arguments: dict[str, Any]) -> int:
+    return max(1, min(int(arguments.get("limit") or 10), MAX_LIMIT))
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    query = arguments["query"]
+    index = await client.get_entity_index()
+    matches = index.search(query, limit=_limit(arguments), domain=arguments.get("domain"))
+    return [
+        TextContent(
+            type="text",
+            text=f"Found {len(matches)} entities matching '{query}':\n{format_response(matches)}",
+        )
+    ]
+
+async def execute_all(clients: dict[str, "HomeAssistantClient"], arguments: dict[str, Any]) -> list[TextContent]:
+    query = arguments["query"]
+    limit = _limit(arguments)
+    indexes = await asyncio.gather(*(client.get_entity_index() for client in clients.values()))
+    matches = sorted(
+        (
+            {"instance": instance, **match}
+            for instance, index in zip(clients, indexes)
+            for match in index.search(query, limit=limit, domain=arguments.get("domain"))
+        ),
+        key=lambda match: -match["score"],
+    )[:limit]
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"Found {len(matches)} entities matching '{query}' in {len(clients)} instances:\n"
+                f"{format_response(matches)}"
+            ),
+        )
+    ]
@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+MAX_EVENTS = 10000
+
+TOOL_DEF = Tool(
+    name="ha_subscribe_events",
+    description=(
+        "Start buffering Home Assistant events (e.g., motion, button presses) on the server. "
+        "Returns a subscription ID to read the buffered events with ha_read_events"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "event_types": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Event types to buffer (e.g., ['state_changed', 'zha_event']); empty for all events",
+            },
+            "subscription_id": {
+                "type": "string",
+                "description": "Optional name for the subscription; subscribing again with it returns the open one",
+            },
+            "max_events": {
+                "type": "integer",
+                "description": f"Buffer size; the oldest events are dropped when full (default: 1000, max: {MAX_EVENTS})",
+                "minimum": 1,
+                "maximum": MAX_EVENTS,
+            },
+        },
+        "required": [],
+    },
+)
+
+PRIORITY = ToolPriority.CONTROL
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    event_types = arguments.get("event_types") or []
+    if isinstance(event_types, str):
+        event_types = [event_types]
+    max_events = max(1, min(int(arguments.get("max_events") or 1000), MAX_EVENTS))
+
+    buffer = await client.open_event_buffer(event_types, max_events, arguments.get("subscription_id"))
+    subscription = {
+        "subscription_id": buffer.id,
+        "event_types": buffer.event_types or ["*"],
+        "max_events": buffer.max_events,
+        "received": buffer.received,
+        "cursor": 0,
+    }
+    return [
+        TextContent(
+            type="text",
+            text=f"Subscribed to events:\n{format_response(subscription)}",
+        )
+    ]
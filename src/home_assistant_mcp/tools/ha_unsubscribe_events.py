@@ -0,0 +1,40 @@
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+TOOL_DEF = Tool(
+    name="ha_unsubscribe_events",
+    description="End an ha_subscribe_events subscription and discard its buffered events",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "subscription_id": {
+                "type": "string",
+                "description": "Subscription ID returned by ha_subscribe_events",
+            },
+        },
+        "required": ["subscription_id"],
+    },
+)
+
+PRIORITY = ToolPriority.CONTROL
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    subscription_id = arguments["subscription_id"]
+    try:
+        buffer = await client.close_event_buffer(subscription_id)
+    except HomeAssistantError:
+        return [TextContent(type="text", text=f"No event subscription '{subscription_id}' is open")]
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"Unsubscribed {buffer.id}: {buffer.received} events received, "
+                f"{len(buffer)} buffered events discarded, {buffer.dropped} dropped"
+            ),
+        )
+    ]
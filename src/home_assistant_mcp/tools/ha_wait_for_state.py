@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+from mcp.types import Tool, TextContent
+from home_assistant_mcp.entity_index import OPERATORS, matches
+from .utils import format_response
+from .tool_priority import ToolPriority
+
+if TYPE_CHECKING:
+    from home_assistant_mcp.client import HomeAssistantClient
+
+DEFAULT_TIMEOUT = 60.0
+MAX_TIMEOUT = 600.0
+
+TOOL_DEF = Tool(
+    name="ha_wait_for_state",
+    description=(
+        "Wait until an entity reaches a state (e.g., 'on') or a numeric condition on its state "
+        "or an attribute (e.g., current_temperature >= 21), then return its state. "
+        "Returns immediately if the condition already holds"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "entity_id": {
+                "type": "string",
+                "description": "Entity ID to watch (e.g., 'climate.living_room')",
+            },
+            "state": {
+                "type": "string",
+                "description": "Target state (e.g., 'on', 'open', 'home')",
+            },
+            "attribute": {
+                "type": "string",
+                "description": "Attribute to compare instead of the state (e.g., 'current_temperature')",
+            },
+            "op": {
+                "type": "string",
+                "enum": list(OPERATORS),
+                "description": "Comparison operator used with value (default: '==')",
+            },
+            "value": {
+                "type": ["string", "number", "boolean"],
+                "description": "Value the state or attribute is compared with",
+            },
+            "timeout": {
+                "type": "number",
+                "description": f"Seconds to wait (default: {DEFAULT_TIMEOUT:.0f}, max: {MAX_TIMEOUT:.0f})",
+                "minimum": 0,
+                "maximum": MAX_TIMEOUT,
+            },
+        },
+        "required": ["entity_id"],
+    },
+)
+
+PRIORITY = ToolPriority.WAIT
+
+def _summary(state: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "entity_id": state.get("entity_id"),
+        "state": state.get("state"),
+        "attributes": state.get("attributes", {}),
+        "last_changed": state.get("last_changed"),
+    }
+
+async def execute(client: "HomeAssistantClient", arguments: dict[str, Any]) -> list[TextContent]:
+    entity_id = arguments["entity_id"]
+    if "state" in arguments:
+        attribute, op, expected = None, "==", arguments["state"]
+    elif "value" in arguments:
+        attribute, op, expected = arguments.get("attribute"), arguments.get("op", "=="), arguments["value"]
+    else:
+        return [TextContent(type="text", text="Either state or value is required")]
+    if op not in OPERATORS:
+        return [TextContent(type="text", text=f"Unsupported operator '{op}' (use one of {', '.join(OPERATORS)})")]
+    timeout = max(0.0, min(float(arguments.get("timeout", DEFAULT_TIMEOUT)), MAX_TIMEOUT))
+    condition = f"{attribute or 'state'} {op} {expected!r}"
+
+    def holds(state: dict[str, Any]) -> bool:
+        value = state.get("attributes", {}).get(attribute) if attribute else state.get("state")
+        return matches(value, op, expected)
+
+    latest: dict[str, Any] = {}
+    reached: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+
+    def on_state_changed(event: dict[str, Any]) -> None:
+        new_state = event.get("data", {}).get("new_state")
+        if new_state is None or reached.done():
+            return
+        latest.update(new_state)
+        if holds(new_state):
+            reached.set_result(new_state)
+
+    # Watch before reading the current state so no change falls in between
+    start = time.monotonic()
+    unsubscribe = await client.watch_state(entity_id, on_state_changed)
+    try:
+        current = (await client.get_state(entity_id)).model_dump(mode="json")
+        if not latest:
+            latest.update(current)
+        if holds(current) and not reached.done():
+            reached.set_result(current)
+        try:
+            final = await asyncio.wait_for(reached, timeout)
+        except TimeoutError:
+            return [
+                TextContent(
+                    type="text",
+                    text=(
+                        f"Timed out after {timeout:g}s waiting for {entity_id} {condition}. "
+                        f"Current state:\n{format_response(_summary(latest))}"
+                    ),
+                )
+            ]
+    finally:
+        await unsubscribe()
+
+    return [
+        TextContent(
+            type="text",
+            text=(
+                f"{entity_id} reached {condition} after {time.monotonic() - start:.1f}s:\n"
+                f"{format_response(_summary(final))}"
+            ),
+        )
+    ]
@@ -0,0 +1,23 @@
+"""Scheduling priority classes for MCP tools."""
+
+from enum import StrEnum
+
+
+class ToolPriority(StrEnum):
+    """Priority class a tool is scheduled in.
+
+    Each class has its own concurrency limit, so heavy reads cannot starve
+    user-facing control actions.
+    """
+
+    CONTROL = "control"
+    """Actions that change device state (turn on/off, services, events)."""
+
+    METADATA = "metadata"
+    """Small reads such as config, single entity state, areas or dashboards."""
+
+    BULK = "bulk"
+    """Large reads such as full state listings or history."""
+
+    WAIT = "wait"
+    """Calls that mostly sleep until an event arrives (waiting for a state)."""
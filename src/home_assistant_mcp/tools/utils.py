@@ -1,15 +1,86 @@
-
 import json
+import textwrap
 from typing import Any
 
-def format_response(data: Any) -> str:
-    """Format response data as JSON string."""
+from mcp.types import TextContent
+
+from home_assistant_mcp.output_pages import OutputPages
+from home_assistant_mcp.tracing import TRACER
+
+# Argument of list tools that returns the next page of an oversized output
+CONTINUATION_ARG = "continuation"
+CONTINUATION_PROPERTY = {
+    "type": "string",
+    "description": "Continuation token from a previous page of this tool's output",
+}
+
+# Argument of cached tools that skips the tool result cache
+BYPASS_CACHE_ARG = "bypass_cache"
+BYPASS_CACHE_PROPERTY = {
+    "type": "boolean",
+    "description": "Skip the server-side result cache and fetch fresh data",
+}
+
+# Shared by every tool; the server applies the configured budget on start
+OUTPUT_PAGES = OutputPages()
+
+
+def _jsonable(data: Any) -> Any:
     if hasattr(data, "model_dump"):
-        return json.dumps(data.model_dump(), indent=2, default=str)
+        return data.model_dump()
     if isinstance(data, list):
-        return json.dumps(
-            [item.model_dump() if hasattr(item, "model_dump") else item for item in data],
-            indent=2,
-            default=str,
+        return [item.model_dump() if hasattr(item, "model_dump") else item for item in data]
+    return data
+
+
+def format_response(data: Any) -> str:
+    """Format response data as JSON string."""
+    with TRACER.span("serialize"):
+        return json.dumps(_jsonable(data), indent=2, default=str)
+
+
+def paged_response(header: str, data: Any) -> list[TextContent]:
+    """Format response data, paging it if it exceeds the output budget.
+
+    Outputs within the budget are identical to ``header`` followed by
+    :func:`format_response`. Larger lists are cut between items, so each page
+    is a valid JSON array; other data is cut between lines of its JSON.
+
+    Args:
+        header: Line shown on top of every page (e.g., "Found 12 entities:"),
+            or "" for none
+        data: Response data
+
+    Returns:
+        Tool output holding the first page and, if paged, a continuation token
+    """
+    body = format_response(data)
+    if OUTPUT_PAGES.fits(header, body):
+        return [TextContent(type="text", text=f"{header}\n{body}" if header else body)]
+
+    with TRACER.span("paginate"):
+        if isinstance(data, list):
+            items = _jsonable(data)
+            chunks = [textwrap.indent(json.dumps(item, indent=2, default=str), "  ") for item in items]
+            text = OUTPUT_PAGES.paginate(header, chunks, as_list=True)
+        else:
+            text = OUTPUT_PAGES.paginate(header, body.splitlines(), as_list=False)
+    return [TextContent(type="text", text=text)]
+
+
+def continued_response(token: str) -> list[TextContent]:
+    """Get the next page of an output paged by :func:`paged_response`.
+
+    Args:
+        token: Continuation token from the previous page
+
+    Returns:
+        Tool output holding the page
+    """
+    text = OUTPUT_PAGES.page(token)
+    if text is None:
+        text = (
+            "Continuation expired or unknown; call the tool again without it "
+            "(with bypass_cache for cached tools)"
         )
-    return json.dumps(data, indent=2, default=str)
+    return [TextContent(type="text", text=text)]
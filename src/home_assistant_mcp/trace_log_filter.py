@@ -0,0 +1,25 @@
+"""Logging filter that stamps records with the active trace ID."""
+
+import logging
+
+from .tracer import current_trace_id
+
+
+class TraceLogFilter(logging.Filter):
+    """Add a ``trace_id`` attribute to every log record.
+
+    Records emitted inside a span carry its trace ID, so log lines can be
+    joined with exported traces; other records get ``-``.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Stamp the record and let it through.
+
+        Args:
+            record: Log record being emitted
+
+        Returns:
+            Always True
+        """
+        record.trace_id = current_trace_id() or "-"
+        return True
@@ -0,0 +1,89 @@
+"""Lightweight tracer producing nested spans."""
+
+import contextlib
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from .span import Span, current_span
+from .span_exporter import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+_DISABLED = contextlib.nullcontext()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the configured exporters.
+
+    Without exporters the tracer is disabled: :meth:`span` returns a shared
+    no-op context manager that yields None, so instrumented code pays only for
+    one attribute check.
+    """
+
+    def __init__(self, exporters: Sequence[SpanExporter] = ()):
+        """Initialize the tracer.
+
+        Args:
+            exporters: Span exporters (none disables tracing)
+        """
+        self._exporters: list[SpanExporter] = list(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return bool(self._exporters)
+
+    def set_exporters(self, exporters: Sequence[SpanExporter]) -> None:
+        """Replace the exporters (an empty list disables tracing).
+
+        Args:
+            exporters: New span exporters
+        """
+        self._exporters = list(exporters)
+
+    def span(self, name: str, **attributes: Any) -> Span | contextlib.nullcontext[None]:
+        """Create a span that is a child of the current span.
+
+        Args:
+            name: Operation name
+            **attributes: Initial span attributes
+
+        Returns:
+            Span context manager, or a no-op context yielding None when
+            tracing is disabled
+        """
+        if not self._exporters:
+            return _DISABLED
+        return Span(name, self, parent=current_span.get(), attributes=attributes)
+
+    def finish(self, span: Span) -> None:
+        """Export a finished span.
+
+        Args:
+            span: Span that just ended
+        """
+        data = span.to_dict()
+        for exporter in self._exporters:
+            try:
+                exporter.export(data)
+            except Exception:
+                logger.exception("Span export failed")
+
+    async def shutdown(self) -> None:
+        """Flush and close every exporter."""
+        for exporter in self._exporters:
+            try:
+                await exporter.shutdown()
+            except Exception:
+                logger.exception("Span exporter shutdown failed")
+
+
+def current_trace_id() -> str | None:
+    """Get the trace ID of the span active in the current task.
+
+    Returns:
+        Trace ID, or None outside of any span
+    """
+    span = current_span.get()
+    return span.trace_id if span else None
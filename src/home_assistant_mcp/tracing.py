@@ -0,0 +1,5 @@
+"""Process-wide tracer shared by the client and server."""
+
+from .tracer import Tracer
+
+TRACER = Tracer()
@@ -0,0 +1,159 @@
+"""Integration tests of the Streamable HTTP transport against the simulator."""
+
+import asyncio
+import json
+from contextlib import AsyncExitStack
+
+import httpx
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+import home_assistant_mcp.server as server_module
+from home_assistant_mcp.client_pool import ClientPool
+from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.http_transport import HttpTransport
+from home_assistant_mcp.simulator import FakeHomeAssistant, InstallSpec, SyntheticInstall
+
+
+@pytest.fixture
+async def simulator():
+    """Run a small simulated install and point the server at it."""
+    async with FakeHomeAssistant(SyntheticInstall(InstallSpec(entities=30, areas=2))) as sim:
+        server_module._pool = ClientPool({"default": HomeAssistantConfig(url=sim.url, token=sim.token)})
+        server_module._tool_cache = None
+        yield sim
+        server_module._pool = None
+        server_module._tool_cache = None
+
+
+@pytest.fixture
+async def transport(simulator: FakeHomeAssistant):
+    """Serve the MCP server over HTTP on a free port."""
+    http_transport = HttpTransport(server_module.server, max_sessions=3)
+    await http_transport.start()
+    yield http_transport
+    await http_transport.stop()
+
+
+async def open_session(stack: AsyncExitStack, url: str) -> ClientSession:
+    """Open an initialized MCP session over Streamable HTTP."""
+    read_stream, write_stream, _ = await stack.enter_async_context(streamable_http_client(url))
+    session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+    await session.initialize()
+    return session
+
+
+class TestHttpTransport:
+    """Tests for serving several MCP clients from one process."""
+
+    async def test_sessions_share_one_client(self, transport: HttpTransport, simulator: FakeHomeAssistant):
+        """Test that concurrent sessions are served by one Home Assistant client."""
+        entity_id = next(iter(simulator.install.states))
+        async with AsyncExitStack() as stack:
+            sessions = [await open_session(stack, transport.url) for _ in range(3)]
+            assert transport.active_sessions == 3
+
+            results = await asyncio.gather(
+                *(
+                    session.call_tool("ha_get_entity_state", {"entity_id": entity_id})
+                    for session in sessions
+                    for _ in range(4)
+                )
+            )
+
+        assert all(json.loads(result.content[0].text)["entity_id"] == entity_id for result in results)
+        assert len(server_module._pool.active()) == 1
+        assert server_module._pool.get().pool_stats()["open"] <= 12
+
+    async def test_session_limit(self, transport: HttpTransport):
+        """Test that sessions beyond the limit are refused until one ends."""
+        async with AsyncExitStack() as stack:
+            for _ in range(3):
+                await open_session(stack, transport.url)
+
+            async with httpx.AsyncClient() as http:
+                response = await http.post(
+                    transport.url,
+                    json={"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+                    headers={"Accept": "application/json, text/event-stream"},
+                )
+            assert response.status_code == 503
+
+        async with AsyncExitStack() as stack:
+            session = await open_session(stack, transport.url)
+            tools = await session.list_tools()
+            assert any(tool.name == "ha_get_entity_state" for tool in tools.tools)
+
+    async def test_abandoned_sessions_expire(self, simulator: FakeHomeAssistant):
+        """Test that sessions whose clients vanished without DELETE stop counting against the limit."""
+        transport = HttpTransport(server_module.server, max_sessions=2, session_idle_timeout=0.2)
+        await transport.start()
+        initialize = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "1"}},
+        }
+        headers = {"Accept": "application/json, text/event-stream"}
+        try:
+            async with httpx.AsyncClient() as http:
+                for _ in range(2):
+                    response = await http.post(transport.url, json=initialize, headers=headers)
+                    assert response.status_code == 200
+                assert transport.active_sessions == 2
+                assert (await http.post(transport.url, json=initialize, headers=headers)).status_code == 503
+
+                await asyncio.sleep(0.3)
+                response = await http.post(transport.url, json=initialize, headers=headers)
+                assert response.status_code == 200
+                assert transport.active_sessions == 1
+        finally:
+            await transport.stop()
+
+    async def test_foreign_host_and_origin_rejected(self, transport: HttpTransport):
+        """Test that requests from a rebound DNS name or a foreign page are refused."""
+        initialize = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+        headers = {"Accept": "application/json, text/event-stream"}
+        async with httpx.AsyncClient() as http:
+            response = await http.post(
+                transport.url, json=initialize, headers={**headers, "Host": "attacker.example:8000"}
+            )
+            assert response.status_code == 421
+            response = await http.post(
+                transport.url, json=initialize, headers={**headers, "Origin": "http://attacker.example"}
+            )
+            assert response.status_code == 403
+        assert transport.active_sessions == 0
+
+    async def test_allowed_host(self, simulator: FakeHomeAssistant):
+        """Test that configured Host headers are accepted."""
+        transport = HttpTransport(server_module.server, allowed_hosts=["ha-mcp.lan:*"])
+        await transport.start()
+        try:
+            async with AsyncExitStack() as stack:
+                http = await stack.enter_async_context(httpx.AsyncClient(headers={"Host": "ha-mcp.lan:8000"}))
+                read_stream, write_stream, _ = await stack.enter_async_context(
+                    streamable_http_client(transport.url, http_client=http)
+                )
+                session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+                await session.initialize()
+                assert transport.active_sessions == 1
+        finally:
+            await transport.stop()
+
+    async def test_concurrent_new_sessions_respect_limit(self, transport: HttpTransport):
+        """Test that new sessions requested at once cannot exceed the limit."""
+        initialize = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "1"}},
+        }
+        headers = {"Accept": "application/json, text/event-stream"}
+        async with httpx.AsyncClient() as http:
+            responses = await asyncio.gather(
+                *(http.post(transport.url, json=initialize, headers=headers) for _ in range(6))
+            )
+        assert sorted(response.status_code for response in responses) == [200, 200, 200, 503, 503, 503]
+        assert transport.active_sessions == 3
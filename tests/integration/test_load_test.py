@@ -0,0 +1,36 @@
+"""Integration test of the MCP stdio load-test harness."""
+
+import pytest
+
+from benchmarks.load_test import format_report, parse_mix, run_load_test
+from home_assistant_mcp.simulator import InstallSpec
+
+
+class TestLoadTest:
+    """Tests for the load-test harness."""
+
+    def test_parse_mix(self):
+        """Test parsing weighted tool mixes."""
+        assert parse_mix("ha_get_entity_state=10, ha_turn_on") == {
+            "ha_get_entity_state": 10,
+            "ha_turn_on": 1,
+        }
+
+    async def test_unknown_tool_in_mix(self):
+        """Test that tools without load test arguments are rejected."""
+        with pytest.raises(ValueError, match="ha_nonexistent"):
+            await run_load_test(InstallSpec(entities=5, areas=1), mix={"ha_nonexistent": 1})
+
+    async def test_drives_spawned_server(self):
+        """Test concurrent calls against a spawned server over stdio."""
+        report = await run_load_test(
+            InstallSpec(entities=20, areas=2),
+            mix={"ha_get_entity_state": 3, "ha_turn_on": 1, "ha_health_check": 1},
+            concurrency=4,
+            requests=20,
+        )
+
+        assert report["overall"]["count"] == 20
+        assert report["overall"]["errors"] == 0, report["tools"]
+        assert sum(result["count"] for result in report["tools"].values()) == 20
+        assert "TOTAL" in format_report(report)
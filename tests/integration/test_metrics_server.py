@@ -0,0 +1,41 @@
+"""Integration tests for the Prometheus metrics endpoint."""
+
+import httpx
+import pytest
+
+from home_assistant_mcp.metrics_registry import MetricsRegistry
+from home_assistant_mcp.metrics_server import start_metrics_server
+
+
+@pytest.fixture
+async def metrics_url():
+    """Serve a registry on a free localhost port."""
+    registry = MetricsRegistry()
+    registry.increment("ha_mcp_tool_errors_total", {"tool": "ha_get_config", "error": "KeyError"})
+    server = await start_metrics_server(registry, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+class TestMetricsServer:
+    """Tests for the metrics HTTP endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_metrics(self, metrics_url: str):
+        """Test that GET /metrics returns Prometheus text."""
+        async with httpx.AsyncClient() as http:
+            response = await http.get(f"{metrics_url}/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'ha_mcp_tool_errors_total{error="KeyError",tool="ha_get_config"} 1' in response.text
+
+    @pytest.mark.asyncio
+    async def test_unknown_path(self, metrics_url: str):
+        """Test that other paths return 404."""
+        async with httpx.AsyncClient() as http:
+            response = await http.get(f"{metrics_url}/other")
+
+        assert response.status_code == 404
@@ -24,11 +24,15 @@ import home_assistant_mcp.server as server_module
 @pytest.fixture(autouse=True)
 def reset_server_state():
     """Reset server global state before each test."""
-    server_module._client = None
-    server_module._config = None
+    server_module._pool = None
+    server_module._scheduler = None
+    server_module._tool_cache = None
+    server_module._profiler = None
     yield
-    server_module._client = None
-    server_module._config = None
+    server_module._pool = None
+    server_module._scheduler = None
+    server_module._tool_cache = None
+    server_module._profiler = None
 
 
 @pytest.fixture
@@ -97,11 +101,8 @@ class TestCallTool:
             mock_client = AsyncMock(spec=HomeAssistantClient)
             mock_client.check_api = AsyncMock(return_value=ApiStatus(message="API running."))
 
-            with patch.object(server_module, "_client", mock_client):
-                with patch.object(server_module, "_config", ha_config):
-                    # Need to also patch get_client to return our mock
-                    with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
-                        result = await call_tool("ha_health_check", {})
+            with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+                result = await call_tool("ha_health_check", {})
 
             assert len(result) == 1
             assert "API running" in result[0].text
@@ -0,0 +1,512 @@
+"""Integration tests running the real client against the Home Assistant simulator."""
+
+import asyncio
+import json
+import time
+
+import pytest
+import websockets
+
+from home_assistant_mcp.client import HomeAssistantClient, HomeAssistantError
+from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.simulator import BehaviorSpec, FakeHomeAssistant, InstallSpec, SyntheticInstall
+from home_assistant_mcp.tools import TOOLS_MAP
+
+
+@pytest.fixture
+async def simulator():
+    """Run a small simulated install on a free port."""
+    async with FakeHomeAssistant(SyntheticInstall(InstallSpec(entities=80, areas=3))) as sim:
+        yield sim
+
+
+@pytest.fixture
+async def client(simulator: FakeHomeAssistant):
+    """Create a client connected to the simulator."""
+    config = HomeAssistantConfig(url=simulator.url, token=simulator.token)
+    async with HomeAssistantClient(config) as ha_client:
+        yield ha_client
+
+
+class TestSimulatorRest:
+    """REST API behaviour of the simulator."""
+
+    async def test_states(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test listing and reading states."""
+        states = await client.get_states()
+        assert len(states) == 80
+
+        state = await client.get_state(states[0].entity_id)
+        assert state.state == simulator.install.states[states[0].entity_id]["state"]
+
+    async def test_unknown_entity(self, client: HomeAssistantClient):
+        """Test that unknown entities return 404."""
+        with pytest.raises(HomeAssistantError) as exc_info:
+            await client.get_state("light.nowhere")
+        assert exc_info.value.status_code == 404
+
+    async def test_invalid_token(self, simulator: FakeHomeAssistant):
+        """Test that requests with a wrong token are rejected."""
+        config = HomeAssistantConfig(url=simulator.url, token="wrong")
+        async with HomeAssistantClient(config) as ha_client:
+            with pytest.raises(HomeAssistantError) as exc_info:
+                await ha_client.check_api()
+        assert exc_info.value.status_code == 401
+
+    async def test_area_lookups(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test the registry based area helpers."""
+        assert await client.get_areas() == list(simulator.install.areas)
+        assert await client.get_area_name("kitchen") == "Kitchen"
+        assert await client.get_area_entities("kitchen") == simulator.install.area_entities("kitchen")
+
+
+class TestSimulatorWebSocket:
+    """WebSocket API behaviour of the simulator."""
+
+    async def test_dashboard_lifecycle(self, client: HomeAssistantClient):
+        """Test creating, configuring, updating and deleting a dashboard."""
+        dashboard = await client.create_dashboard(url_path="sim-test", title="Sim")
+        await client.save_dashboard_config({"views": [{"title": "One"}]}, "sim-test")
+        config = await client.get_dashboard_config("sim-test")
+        updated = await client.update_dashboard(dashboard.id, title="Renamed")
+        await client.delete_dashboard(dashboard.id)
+
+        assert config.views == [{"title": "One"}]
+        assert updated.title == "Renamed"
+        assert dashboard.id not in [d.id for d in await client.list_dashboards()]
+
+    async def test_state_changed_events(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that service calls are delivered as state_changed events."""
+        light = next(e for e in simulator.install.states if e.startswith("light."))
+        received = asyncio.Event()
+        events: list[dict] = []
+
+        def on_event(event: dict) -> None:
+            events.append(event)
+            received.set()
+
+        await client.subscribe_events("state_changed", on_event)
+        await client.turn_off(light)
+        await asyncio.wait_for(received.wait(), 5)
+
+        assert events[0]["data"]["entity_id"] == light
+        assert events[0]["data"]["new_state"]["state"] == "off"
+
+
+class TestToolsAgainstSimulator:
+    """Every tool runs against the simulator without errors."""
+
+    async def test_read_tools(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test representative read tools end to end."""
+        entity_id = next(iter(simulator.install.states))
+        for name, arguments in (
+            ("ha_list_entities", {}),
+            ("ha_list_areas", {}),
+            ("ha_search_entities", {"query": "kitchen light"}),
+            ("ha_get_history", {"entity_id": entity_id}),
+            ("ha_get_entity_area", {"entity_id": entity_id}),
+            ("ha_get_dashboard", {"url_path": "dashboard-1"}),
+        ):
+            result = await TOOLS_MAP[name](client, arguments)
+            assert result[0].text
+
+
+class TestEntityIndex:
+    """Entity search index kept current from events."""
+
+    async def test_index_follows_state_changes(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that the index is built once and updated incrementally."""
+        index = await client.get_entity_index()
+        entity_id = next(e for e in simulator.install.states if e.startswith("light."))
+        area = simulator.install.area_name(entity_id)
+
+        assert len(index) == 80
+        assert index.entities[entity_id]["area"] == area
+        assert await client.get_entity_index() is index
+
+        requests = simulator.requests
+        await client.turn_off(entity_id)
+        for _ in range(100):
+            if index.entities[entity_id]["state"] == "off":
+                break
+            await asyncio.sleep(0.02)
+
+        assert index.entities[entity_id]["state"] == "off"
+        assert index.entities[entity_id]["area"] == area
+        assert simulator.requests == requests + 1  # Only the service call
+
+    async def test_registry_change_rebuilds_index(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that registry events discard the index."""
+        index = await client.get_entity_index()
+
+        await simulator.fire("area_registry_updated", {"action": "update", "area_id": "kitchen"})
+        for _ in range(100):
+            if client._entity_index is None:
+                break
+            await asyncio.sleep(0.02)
+
+        assert await client.get_entity_index() is not index
+
+
+class TestAreaIndex:
+    """Area lookups answered from the joined registries."""
+
+    async def test_lookups_match_install(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that every area's entities match the simulated membership after one load."""
+        await client.get_area_index()
+        requests = simulator.requests
+
+        for area_id in simulator.install.areas:
+            assert sorted(await client.get_area_entities(area_id)) == sorted(simulator.install.area_entities(area_id))
+        entity_id = next(e for e in simulator.install.states if simulator.install.area_name(e))
+        assert await client.get_entity_area(entity_id) == simulator.install.area_name(entity_id)
+        assert simulator.requests == requests
+
+    async def test_registry_change_rebuilds_index(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that registry events discard the area index."""
+        index = await client.get_area_index()
+
+        await simulator.fire("device_registry_updated", {"action": "update", "device_id": "x"})
+        for _ in range(100):
+            if client._area_index is None:
+                break
+            await asyncio.sleep(0.02)
+
+        assert await client.get_area_index() is not index
+
+
+class TestChangeTracking:
+    """Delta polling with ha_get_changes."""
+
+    async def test_changes_since_cursor(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that only entities changed after the cursor are returned."""
+        entity_id = next(e for e in simulator.install.states if e.startswith("light."))
+        start = await TOOLS_MAP["ha_get_changes"](client, {})
+        cursor = start[0].text.split("Cursor: ")[1].strip()
+
+        await client.turn_off(entity_id)
+        for _ in range(100):
+            result = await TOOLS_MAP["ha_get_changes"](client, {"cursor": cursor})
+            if result[0].text.startswith("1 entities changed"):
+                break
+            await asyncio.sleep(0.02)
+
+        rows = json.loads(result[0].text.split("\n", 2)[2])
+        assert [(row["entity_id"], row["state"]) for row in rows] == [(entity_id, "off")]
+
+
+class TestWaitForState:
+    """Waiting for states with ha_wait_for_state."""
+
+    async def test_returns_when_state_is_reached(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that the wait ends on the state_changed event, without polling."""
+        entity_id = next(e for e in simulator.install.states if e.startswith("light."))
+        await client.turn_on(entity_id)
+
+        wait = asyncio.create_task(
+            TOOLS_MAP["ha_wait_for_state"](client, {"entity_id": entity_id, "state": "off", "timeout": 5})
+        )
+        await asyncio.sleep(0.1)
+        requests = simulator.requests
+        await client.turn_off(entity_id)
+        result = await wait
+
+        assert f"{entity_id} reached state == 'off'" in result[0].text
+        assert simulator.requests == requests + 1  # Only the service call
+
+    async def test_concurrent_waits_share_one_subscription(
+        self, client: HomeAssistantClient, simulator: FakeHomeAssistant
+    ):
+        """Test that concurrent waits add no state_changed subscriptions."""
+        entity_ids = [e for e in simulator.install.states if e.startswith("light.")][:4]
+        for entity_id in entity_ids:
+            await client.turn_on(entity_id)
+
+        waits = [
+            asyncio.create_task(
+                TOOLS_MAP["ha_wait_for_state"](client, {"entity_id": entity_id, "state": "off", "timeout": 5})
+            )
+            for entity_id in entity_ids
+        ]
+        await asyncio.sleep(0.1)
+        subscribed = [
+            event_type for subscriptions in simulator._subscriptions.values() for event_type in subscriptions.values()
+        ]
+        assert subscribed.count("state_changed") == 1
+
+        for entity_id in entity_ids:
+            await client.turn_off(entity_id)
+        results = await asyncio.gather(*waits)
+        assert all("reached state == 'off'" in result[0].text for result in results)
+
+
+class TestEventSubscriptions:
+    """Buffered event subscriptions with ha_subscribe_events and ha_read_events."""
+
+    async def test_burst_is_buffered(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that a burst of events is read back in batches with drops reported."""
+        await TOOLS_MAP["ha_subscribe_events"](
+            client, {"event_types": ["button_pressed"], "max_events": 8, "subscription_id": "buttons"}
+        )
+        for n in range(10):
+            await simulator.fire("button_pressed", {"n": n})
+        await simulator.fire("other_event", {})
+
+        result = await TOOLS_MAP["ha_read_events"](
+            client, {"subscription_id": "buttons", "limit": 5, "wait_seconds": 2}
+        )
+        for _ in range(100):
+            if client.get_event_buffer("buttons").received == 10:
+                break
+            await asyncio.sleep(0.02)
+        result = await TOOLS_MAP["ha_read_events"](client, {"subscription_id": "buttons", "unsubscribe": True})
+
+        summary = json.loads(result[0].text.split("\n", 1)[1])
+        assert summary["missed"] == 2
+        assert [event["data"]["n"] for event in summary["events"]] == list(range(2, 10))
+        with pytest.raises(HomeAssistantError):
+            client.get_event_buffer("buttons")
+
+
+class TestBulkEvents:
+    """Pipelined event firing with fire_events."""
+
+    async def test_fire_events_reach_subscribers(self, client: HomeAssistantClient):
+        """Test that every fired event is delivered in order."""
+        buffer = await client.open_event_buffer(["bulk_event"], max_events=1000)
+
+        result = await client.fire_events([("bulk_event", {"n": n}) for n in range(500)])
+        for _ in range(100):
+            if buffer.received == 500:
+                break
+            await asyncio.sleep(0.02)
+
+        assert result.fired == 500
+        assert result.failed == 0
+        assert result.events_per_second > 0
+        events, _, _ = buffer.read(0, limit=1000)
+        assert [event["data"]["n"] for event in events] == list(range(500))
+
+    async def test_failures_are_reported_per_event(self):
+        """Test that injected command failures are listed by event index."""
+        install = SyntheticInstall(InstallSpec(entities=5, areas=1))
+        async with FakeHomeAssistant(install, behavior=BehaviorSpec(error_rate=0.3, seed=7)) as sim:
+            config = HomeAssistantConfig(url=sim.url, token=sim.token)
+            async with HomeAssistantClient(config) as ha_client:
+                result = await ha_client.fire_events([("bulk_event", {"n": n}) for n in range(100)])
+
+        assert result.failed > 0
+        assert result.fired + result.failed == 100
+        assert all(error["error"] == "Simulated failure" for error in result.errors)
+        assert [error["index"] for error in result.errors] == sorted(error["index"] for error in result.errors)
+
+
+class TestDashboardPatch:
+    """Incremental dashboard edits with patch_dashboard_config."""
+
+    async def test_patch_saves_only_changes(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that patches are saved, and no-op patches are not."""
+        url_path = next(d["url_path"] for d in simulator.install.dashboards.values())
+        first = await client.patch_dashboard_config(
+            [{"op": "replace", "path": "/views/0/title", "value": "Patched"}], url_path
+        )
+        saves = []
+        await client.subscribe_events("lovelace_updated", saves.append)
+        second = await client.patch_dashboard_config(
+            [{"op": "replace", "path": "/views/0/title", "value": "Patched"}], url_path, base_hash=first.hash
+        )
+        await asyncio.sleep(0.1)
+
+        assert first.changed
+        assert simulator.install.dashboard_configs[url_path]["views"][0]["title"] == "Patched"
+        assert not second.changed
+        assert second.previous_hash == first.hash
+        assert saves == []
+
+    async def test_stale_hash_is_refused(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that a concurrent save makes an older base hash fail."""
+        base = await client.patch_dashboard_config([])
+        config = dict(simulator.install.dashboard_configs[None], title="Changed elsewhere")
+        await client.save_dashboard_config(config)
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(HomeAssistantError) as exc_info:
+            await client.patch_dashboard_config(
+                [{"op": "replace", "path": "/title", "value": "Mine"}], base_hash=base.hash
+            )
+
+        assert exc_info.value.status_code == 409
+        assert simulator.install.dashboard_configs[None]["title"] == "Changed elsewhere"
+
+    async def test_concurrent_patches_are_serialized(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that of two patches against the same hash, the second is refused."""
+        base = await client.patch_dashboard_config([])
+
+        results = await asyncio.gather(
+            client.patch_dashboard_config([{"op": "replace", "path": "/title", "value": "A"}], base_hash=base.hash),
+            client.patch_dashboard_config([{"op": "replace", "path": "/title", "value": "B"}], base_hash=base.hash),
+            return_exceptions=True,
+        )
+
+        assert results[0].changed
+        assert isinstance(results[1], HomeAssistantError)
+        assert results[1].status_code == 409
+        assert simulator.install.dashboard_configs[None]["title"] == "A"
+
+
+class TestDashboardCache:
+    """Dashboard reads answered from the client cache."""
+
+    async def test_repeated_reads_are_free(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that cached lists and configs make no further requests."""
+        url_path = next(d["url_path"] for d in simulator.install.dashboards.values())
+        first_list = await client.list_dashboards()
+        first_config = await client.get_dashboard_config(url_path)
+        requests = simulator.requests
+
+        for _ in range(5):
+            assert await client.list_dashboards() == first_list
+            assert await client.get_dashboard_config(url_path) == first_config
+
+        assert simulator.requests == requests
+
+    async def test_external_save_invalidates(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that lovelace_updated from another client drops the cached config."""
+        await client.get_dashboard_config()
+        config = HomeAssistantConfig(url=simulator.url, token=simulator.token)
+        async with HomeAssistantClient(config) as other:
+            await other.save_dashboard_config({"title": "Elsewhere", "views": []})
+        await asyncio.sleep(0.1)
+
+        assert (await client.get_dashboard_config()).title == "Elsewhere"
+
+    async def test_reuse_after_close(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that a reused client drops its cache and subscribes again."""
+        await client.get_dashboard_config()
+        await client.close()
+
+        async with client:
+            requests = simulator.requests
+            await client.get_dashboard_config()
+            assert simulator.requests > requests
+
+            config = HomeAssistantConfig(url=simulator.url, token=simulator.token)
+            async with HomeAssistantClient(config) as other:
+                await other.save_dashboard_config({"title": "After reuse", "views": []})
+            await asyncio.sleep(0.1)
+
+            assert (await client.get_dashboard_config()).title == "After reuse"
+
+    async def test_own_changes_invalidate(self, client: HomeAssistantClient):
+        """Test that the client's own writes are visible on the next read."""
+        before = await client.list_dashboards()
+        dashboard = await client.create_dashboard(url_path="cache-test", title="Cache")
+        assert dashboard.id in [d.id for d in await client.list_dashboards()]
+        await client.save_dashboard_config({"views": [{"title": "Mine"}]}, "cache-test")
+        assert (await client.get_dashboard_config("cache-test")).views == [{"title": "Mine"}]
+        await client.delete_dashboard(dashboard.id)
+
+        assert [d.id for d in await client.list_dashboards()] == [d.id for d in before]
+
+
+class TestDashboardGeneration:
+    """Bulk dashboard generation from the registries."""
+
+    async def test_area_assignments_follow_devices(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test that registry joins match the simulated area membership."""
+        area_names, entity_areas = await client.get_area_assignments()
+
+        assert area_names == simulator.install.areas
+        for area_id in simulator.install.areas:
+            expected = set(simulator.install.area_entities(area_id))
+            assert {e for e, a in entity_areas.items() if a == area_id} == expected
+
+    async def test_generate_in_few_round_trips(self):
+        """Test that a dashboard per area costs a few round trips, not one per command."""
+        install = SyntheticInstall(InstallSpec(entities=300, areas=30))
+        async with FakeHomeAssistant(install, behavior=BehaviorSpec(latency_ms=50)) as sim:
+            config = HomeAssistantConfig(url=sim.url, token=sim.token)
+            async with HomeAssistantClient(config) as ha_client:
+                await ha_client.warm_up()
+                start = time.perf_counter()
+                result = await TOOLS_MAP["ha_generate_dashboards"](ha_client, {})
+                elapsed = time.perf_counter() - start
+
+        assert "Saved 30 of 30 dashboards" in result[0].text
+        assert sum(1 for path in install.dashboard_configs if path and path.startswith("area-")) == 30
+        # 66 commands at 50 ms each would take 3.3 s one after another
+        assert elapsed < 1.0
+
+
+class TestSimulatorBehavior:
+    """Injected latency, failures and background activity."""
+
+    async def test_latency_is_added(self):
+        """Test that every request is delayed by the configured latency."""
+        install = SyntheticInstall(InstallSpec(entities=5, areas=1))
+        async with FakeHomeAssistant(install, behavior=BehaviorSpec(latency_ms=50)) as sim:
+            config = HomeAssistantConfig(url=sim.url, token=sim.token)
+            async with HomeAssistantClient(config) as ha_client:
+                start = time.perf_counter()
+                await ha_client.check_api()
+                assert time.perf_counter() - start >= 0.05
+
+    async def test_errors_are_injected(self):
+        """Test that failures are injected in REST and WebSocket calls."""
+        install = SyntheticInstall(InstallSpec(entities=5, areas=1))
+        behavior = BehaviorSpec(error_rate=1.0, error_status=503)
+        async with FakeHomeAssistant(install, behavior=behavior) as sim:
+            config = HomeAssistantConfig(url=sim.url, token=sim.token)
+            async with HomeAssistantClient(config) as ha_client:
+                with pytest.raises(HomeAssistantError) as exc_info:
+                    await ha_client.get_states()
+                assert exc_info.value.status_code == 503
+                with pytest.raises(HomeAssistantError, match="Simulated failure"):
+                    await ha_client.list_dashboards()
+            # The dashboard cache's lovelace_updated subscription fails as well
+            assert sim.injected_errors == 3
+
+    async def test_state_change_stream(self):
+        """Test that background state changes reach subscribers."""
+        install = SyntheticInstall(InstallSpec(entities=20, areas=1))
+        behavior = BehaviorSpec(state_changes_per_second=200, seed=1)
+        async with FakeHomeAssistant(install, behavior=behavior) as sim:
+            config = HomeAssistantConfig(url=sim.url, token=sim.token)
+            async with HomeAssistantClient(config) as ha_client:
+                events: list[dict] = []
+                await ha_client.subscribe_events("state_changed", events.append)
+                await asyncio.sleep(0.2)
+
+        assert len(events) >= 5
+        assert all(event["data"]["new_state"]["entity_id"] in install.states for event in events)
+
+    async def test_registries(self, client: HomeAssistantClient, simulator: FakeHomeAssistant):
+        """Test the area, device and entity registry commands."""
+        areas = await client._ws_request("config/area_registry/list")
+        devices = await client._ws_request("config/device_registry/list")
+        entities = await client._ws_request("config/entity_registry/list")
+
+        assert [area["area_id"] for area in areas] == list(simulator.install.areas)
+        assert len(devices) == len(simulator.install.devices)
+        assert len(entities) == len(simulator.install.states)
+        overridden = [entity for entity in entities if entity["area_id"]]
+        assert overridden
+        assert overridden[0]["entity_id"] in await client.get_area_entities(overridden[0]["area_id"])
+
+    async def test_websocket_commands_run_concurrently(self):
+        """Test that a connection's commands are answered independently."""
+        install = SyntheticInstall(InstallSpec(entities=5, areas=1))
+        async with FakeHomeAssistant(install, behavior=BehaviorSpec(latency_ms=100)) as sim:
+            ws = await websockets.connect(sim.url.replace("http", "ws") + "/api/websocket")
+            await ws.recv()
+            await ws.send(json.dumps({"type": "auth", "access_token": sim.token}))
+            await ws.recv()
+
+            start = time.perf_counter()
+            for message_id in range(1, 6):
+                await ws.send(json.dumps({"id": message_id, "type": "ping"}))
+            ids = {json.loads(await ws.recv())["id"] for _ in range(5)}
+            await ws.close()
+
+        assert ids == {1, 2, 3, 4, 5}
+        assert time.perf_counter() - start < 0.4
@@ -0,0 +1,43 @@
+"""Integration test of the server's cold start budget."""
+
+from benchmarks.startup_benchmark import (
+    DEFERRED_MODULES,
+    check_budget,
+    format_report,
+    parse_importtime,
+    run_startup_benchmark,
+)
+
+
+class TestStartupTime:
+    """Tests for the startup-time benchmark."""
+
+    def test_parse_importtime(self):
+        """Test parsing ``-X importtime`` lines."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:        80 |        200 | json\n"
+        )
+
+        assert parse_importtime(output) == {"json.decoder": (120, 120), "json": (80, 200)}
+
+    def test_check_budget(self):
+        """Test reporting budget violations."""
+        report = {"total_ms": 900.0, "package_ms": 40.0, "deferred_imported": ["websockets"]}
+
+        violations = check_budget(report, budget_ms=800, package_budget_ms=50)
+
+        assert len(violations) == 2
+        assert "websockets" in violations[1]
+        assert check_budget({**report, "deferred_imported": []}, None, 50) == []
+
+    def test_cold_start_within_budget(self):
+        """Test that startup defers the client stack and stays within budget."""
+        report = run_startup_benchmark(runs=1)
+
+        assert report["deferred_imported"] == [], f"Deferred modules imported: {report['deferred_imported']}"
+        assert set(DEFERRED_MODULES).isdisjoint(entry["module"] for entry in report["slowest"])
+        # Generous enough for slow CI machines; catches eager heavy imports
+        assert report["package_ms"] < 250
+        assert "home_assistant_mcp.server" in format_report(report)
@@ -0,0 +1,164 @@
+"""Integration tests of the shared state cache daemon against the simulator."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from home_assistant_mcp.client import HomeAssistantClient, HomeAssistantError
+from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.shared_state_client import SharedStateClient
+from home_assistant_mcp.simulator import FakeHomeAssistant, InstallSpec, SyntheticInstall
+from home_assistant_mcp.state_cache_daemon import StateCacheDaemon
+
+
+@pytest.fixture
+async def simulator():
+    """Run a small simulated install on a free port."""
+    async with FakeHomeAssistant(SyntheticInstall(InstallSpec(entities=40, areas=3))) as sim:
+        yield sim
+
+
+@pytest.fixture
+def config(simulator: FakeHomeAssistant, tmp_path) -> HomeAssistantConfig:
+    """Configuration pointing at the simulator and a daemon socket."""
+    return HomeAssistantConfig(
+        url=simulator.url, token=simulator.token, state_daemon_socket=str(tmp_path / "state.sock")
+    )
+
+
+@pytest.fixture
+async def daemon(config: HomeAssistantConfig):
+    """Run the daemon on the configured socket."""
+    async with StateCacheDaemon(HomeAssistantClient(config), config.state_daemon_socket) as state_daemon:
+        yield state_daemon
+
+
+@pytest.fixture
+async def client(config: HomeAssistantConfig):
+    """Create a client reading states from the daemon."""
+    async with SharedStateClient(config) as shared_client:
+        yield shared_client
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    """Wait until a condition holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.02)
+
+
+async def listener_counts(simulator: FakeHomeAssistant) -> dict[str, int]:
+    """Number of Home Assistant subscriptions per event type."""
+    async with httpx.AsyncClient() as http:
+        response = await http.get(
+            f"{simulator.url}/api/events", headers={"Authorization": f"Bearer {simulator.token}"}
+        )
+    return {entry["event"]: entry["listener_count"] for entry in response.json()}
+
+
+class TestStateCacheDaemon:
+    """Tests for sharing one Home Assistant connection between clients."""
+
+    async def test_states_served_from_cache(
+        self, daemon: StateCacheDaemon, client: SharedStateClient, simulator: FakeHomeAssistant
+    ):
+        """Test that state reads are answered by the daemon, not Home Assistant."""
+        requests_before = simulator.requests
+
+        states = await client.get_states()
+        entity_id = states[0].entity_id
+        state = await client.get_state(entity_id)
+
+        assert len(states) == 40
+        assert state.state == simulator.install.states[entity_id]["state"]
+        assert simulator.requests == requests_before
+        assert daemon.requests == 2
+
+    async def test_state_changes_are_applied(
+        self, daemon: StateCacheDaemon, client: SharedStateClient, simulator: FakeHomeAssistant
+    ):
+        """Test that the cache follows state_changed events."""
+        entity_id = next(e for e in simulator.install.states if e.startswith(("light.", "switch.")))
+        domain = entity_id.split(".")[0]
+        await client.call_service(domain, "turn_off", entity_id)
+        await wait_for(lambda: self._state_is(client, entity_id, "off"))
+
+        await client.call_service(domain, "turn_on", entity_id)
+        await wait_for(lambda: self._state_is(client, entity_id, "on"))
+
+    @staticmethod
+    async def _state_is(client: SharedStateClient, entity_id: str, state: str) -> bool:
+        return (await client.get_state(entity_id)).state == state
+
+    async def test_area_lookups_are_cached(
+        self, daemon: StateCacheDaemon, client: SharedStateClient, simulator: FakeHomeAssistant
+    ):
+        """Test that area lookups reach Home Assistant once."""
+        areas = await client.get_areas()
+        requests_after_first = simulator.requests
+
+        assert await client.get_areas() == areas == list(simulator.install.areas)
+        # The daemon answers new lookups from the area index it already loaded
+        assert await client.get_area_name("kitchen") == "Kitchen"
+        assert simulator.requests == requests_after_first
+
+    async def test_unknown_entity(self, daemon: StateCacheDaemon, client: SharedStateClient):
+        """Test that Home Assistant errors reach the client with their status."""
+        with pytest.raises(HomeAssistantError) as exc_info:
+            await client.get_state("light.nowhere")
+        assert exc_info.value.status_code == 404
+
+    async def test_fallback_without_daemon(self, client: SharedStateClient, simulator: FakeHomeAssistant):
+        """Test that reads go to Home Assistant when no daemon is running."""
+        states = await client.get_states()
+
+        assert len(states) == 40
+        assert await client.get_area_name("kitchen") == "Kitchen"
+
+    async def test_processes_share_event_subscriptions(
+        self, daemon: StateCacheDaemon, config: HomeAssistantConfig, simulator: FakeHomeAssistant
+    ):
+        """Test that event-driven features of every process use the daemon's subscriptions."""
+        entity_id = next(e for e in simulator.install.states if e.startswith(("light.", "switch.")))
+        domain = entity_id.split(".")[0]
+        async with SharedStateClient(config) as first, SharedStateClient(config) as second:
+            indexes = [await first.get_entity_index(), await second.get_entity_index()]
+            assert await first.get_change_log() is not None
+
+            counts = await listener_counts(simulator)
+            assert counts["state_changed"] == 1
+            assert counts["entity_registry_updated"] == 1
+
+            await first.call_service(domain, "turn_off", entity_id)
+
+            async def both_updated() -> bool:
+                return all(index.entities[entity_id]["state"] == "off" for index in indexes)
+
+            await wait_for(both_updated)
+
+    async def test_relays_resynchronize_on_daemon_reconnect(
+        self, daemon: StateCacheDaemon, client: SharedStateClient
+    ):
+        """Test that processes rebuild event-fed caches when the daemon's stream reconnects."""
+        index = await client.get_entity_index()
+        client._get_event_stream()._reconnect_delay = 0.05
+
+        daemon._on_reconnect()
+
+        async def dropped() -> bool:
+            return client._entity_index is None
+
+        await wait_for(dropped)
+        assert await client.get_entity_index() is not index
+
+    async def test_second_daemon_is_refused(
+        self, daemon: StateCacheDaemon, config: HomeAssistantConfig, client: SharedStateClient
+    ):
+        """Test that a daemon does not take over the socket of a running one."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            await StateCacheDaemon(HomeAssistantClient(config), config.state_daemon_socket).start()
+
+        assert len(await client.get_states()) == 40
+        assert daemon.requests == 1
@@ -0,0 +1,31 @@
+"""Integration test of the tool benchmark suite."""
+
+import json
+
+from benchmarks.tool_benchmark import format_report, run_benchmark
+from home_assistant_mcp.simulator import InstallSpec
+from home_assistant_mcp.tools import TOOLS_MAP
+
+
+class TestToolBenchmark:
+    """Tests for the benchmark runner."""
+
+    async def test_every_tool_runs_without_errors(self):
+        """Test a tiny benchmark run over all tools."""
+        report = await run_benchmark(InstallSpec(entities=40, areas=2), iterations=2, warmup=0)
+
+        assert set(report["tools"]) == set(TOOLS_MAP)
+        for name, result in report["tools"].items():
+            assert result["errors"] == 0, (name, result["first_error"])
+            assert result["count"] == 2
+            assert result["p50_ms"] <= result["p99_ms"]
+        json.dumps(report)
+
+    async def test_report_compares_with_baseline(self):
+        """Test the p50 delta column against a baseline."""
+        report = await run_benchmark(InstallSpec(entities=10, areas=1), iterations=1, warmup=0, tools=["ha_health_check"])
+
+        table = format_report(report, baseline=report)
+
+        assert "ha_health_check" in table
+        assert "+0.0%" in table
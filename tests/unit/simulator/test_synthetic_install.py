@@ -0,0 +1,94 @@
+"""Unit tests for the synthetic install generator."""
+
+import random
+from datetime import timedelta
+
+from home_assistant_mcp.simulator import InstallSpec, SyntheticInstall
+from home_assistant_mcp.simulator.synthetic_install import utc_now
+
+
+class TestSyntheticInstall:
+    """Tests for SyntheticInstall."""
+
+    def test_generates_requested_sizes(self):
+        """Test that the install matches its spec."""
+        install = SyntheticInstall(
+            InstallSpec(entities=120, areas=4, devices_per_area=3, dashboards=2, dashboard_views=2, cards_per_view=4)
+        )
+
+        assert len(install.states) == 120
+        assert len(install.areas) == 4
+        assert len(install.devices) == 12
+        assert len(install.dashboards) == 2
+        config = install.dashboard_configs["dashboard-1"]
+        assert len(config["views"]) == 2
+        assert len(config["views"][0]["cards"]) == 4
+
+    def test_same_seed_same_install(self):
+        """Test that generation is deterministic."""
+        first = SyntheticInstall(InstallSpec(entities=50, seed=7))
+        second = SyntheticInstall(InstallSpec(entities=50, seed=7))
+        assert list(first.states) == list(second.states)
+
+    def test_area_lookups(self):
+        """Test area helpers by ID and by name."""
+        install = SyntheticInstall(InstallSpec(entities=30, areas=2))
+        entity_id = next(iter(install.states))
+        area_id = install.devices[install.entity_devices[entity_id]]
+
+        assert entity_id in install.area_entities(area_id)
+        assert install.area_entities(install.areas[area_id]) == install.area_entities(area_id)
+        assert install.resolve_area_id(install.areas[area_id].upper()) == area_id
+        assert install.area_name(entity_id) == install.areas[area_id]
+        assert install.area_name("unknown.entity") is None
+
+    def test_apply_service(self):
+        """Test that service calls change the targeted entity states."""
+        install = SyntheticInstall(InstallSpec(entities=200))
+        light = next(entity_id for entity_id in install.states if entity_id.startswith("light."))
+        install.states[light]["state"] = "off"
+
+        changes = install.apply_service("light", "turn_on", {"entity_id": light, "brightness": 10})
+
+        [(old, new)] = changes
+        assert old["state"] == "off"
+        assert new["state"] == "on"
+        assert install.states[light]["attributes"]["brightness"] == 10
+
+    def test_history_density(self):
+        """Test that history has the configured number of points per day."""
+        install = SyntheticInstall(InstallSpec(entities=10, history_points=48))
+        entity_id = next(iter(install.states))
+        end = utc_now()
+
+        [entries] = install.history([entity_id], end - timedelta(hours=12), end)
+
+        assert len(entries) == 24
+        assert entries[-1]["state"] == install.states[entity_id]["state"]
+
+    def test_entity_area_overrides_device_area(self):
+        """Test that entities placed apart from their device follow their own area."""
+        install = SyntheticInstall(InstallSpec(entities=30, areas=3))
+        entity_id, area_id = next(iter(install.entity_areas.items()))
+
+        assert install.devices[install.entity_devices[entity_id]] != area_id
+        assert entity_id in install.area_entities(area_id)
+        assert install.area_name(entity_id) == install.areas[area_id]
+
+    def test_random_state_change(self):
+        """Test that generated changes update the stored state."""
+        install = SyntheticInstall(InstallSpec(entities=20))
+        old, new = install.random_state_change(random.Random(3))
+
+        assert old["entity_id"] == new["entity_id"]
+        assert install.states[new["entity_id"]] is new
+
+    def test_registries(self):
+        """Test registry listings."""
+        install = SyntheticInstall(InstallSpec(entities=20, areas=2, devices_per_area=2))
+
+        assert len(install.area_registry()) == 2
+        assert {device["area_id"] for device in install.device_registry()} == set(install.areas)
+        entities = install.entity_registry()
+        assert {entity["entity_id"] for entity in entities} == set(install.states)
+        assert all(entity["device_id"] in install.devices for entity in entities)
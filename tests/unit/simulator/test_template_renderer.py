@@ -0,0 +1,48 @@
+"""Unit tests for the simulator template renderer."""
+
+import ast
+
+import pytest
+
+from home_assistant_mcp.simulator import InstallSpec, SyntheticInstall, TemplateRenderer
+
+
+@pytest.fixture
+def install() -> SyntheticInstall:
+    """Create a small install."""
+    return SyntheticInstall(InstallSpec(entities=60, areas=3))
+
+
+class TestTemplateRenderer:
+    """Tests for TemplateRenderer."""
+
+    def test_areas(self, install: SyntheticInstall):
+        """Test listing areas like the client expects."""
+        result = TemplateRenderer(install).render("{{ areas() | list }}")
+        assert ast.literal_eval(result) == list(install.areas)
+
+    def test_area_entities_with_domain_filter(self, install: SyntheticInstall):
+        """Test filtering area entities by domain."""
+        renderer = TemplateRenderer(install)
+        result = renderer.render('{{ area_entities("kitchen") | select("match", "light") | list }}')
+
+        entities = ast.literal_eval(result)
+        assert entities == [e for e in install.area_entities("kitchen") if e.startswith("light")]
+
+    def test_area_name_and_id(self, install: SyntheticInstall):
+        """Test resolving area names and IDs."""
+        renderer = TemplateRenderer(install)
+        assert renderer.render('{{ area_name("kitchen") }}') == "Kitchen"
+        assert renderer.render('{{ area_id("Kitchen") }}') == "kitchen"
+        assert renderer.render('{{ area_id("Nowhere") }}') == "None"
+
+    def test_states_with_surrounding_text(self, install: SyntheticInstall):
+        """Test rendering state lookups inside literal text."""
+        entity_id = next(iter(install.states))
+        result = TemplateRenderer(install).render(f"State: {{{{ states('{entity_id}') }}}}!")
+        assert result == f"State: {install.states[entity_id]['state']}!"
+
+    def test_unsupported_function_raises(self, install: SyntheticInstall):
+        """Test that unknown functions are rejected."""
+        with pytest.raises(ValueError, match="now"):
+            TemplateRenderer(install).render("{{ now() }}")
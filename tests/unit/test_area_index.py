@@ -0,0 +1,71 @@
+"""Unit tests for the area index."""
+
+from home_assistant_mcp.area_index import AreaIndex
+
+
+def _index() -> AreaIndex:
+    return AreaIndex(
+        areas=[{"area_id": "living_room", "name": "Living Room"}, {"area_id": "garage", "name": None}],
+        devices=[
+            {"id": "tv", "area_id": "living_room"},
+            {"id": "opener", "area_id": "garage"},
+            {"id": "orphan", "area_id": "deleted_area"},
+        ],
+        entities=[
+            {"entity_id": "media_player.tv", "area_id": None, "device_id": "tv"},
+            {"entity_id": "light.tv_backlight", "area_id": "garage", "device_id": "tv"},
+            {"entity_id": "light.living_room", "area_id": "living_room", "device_id": None},
+            {"entity_id": "lightning.sensor", "area_id": "living_room", "device_id": None},
+            {"entity_id": "cover.garage_door", "area_id": None, "device_id": "opener"},
+            {"entity_id": "sensor.orphan", "area_id": None, "device_id": "orphan"},
+            {"entity_id": "sun.sun", "area_id": None, "device_id": None},
+        ],
+    )
+
+
+class TestAreaIndex:
+    """Tests for AreaIndex."""
+
+    def test_names_default_to_area_id(self):
+        """Test that an area without a name is listed under its ID."""
+        assert _index().names == {"living_room": "Living Room", "garage": "garage"}
+
+    def test_resolve_by_id_or_name(self):
+        """Test that areas resolve from their ID or case-insensitive name."""
+        index = _index()
+        assert index.resolve("living_room") == "living_room"
+        assert index.resolve("living room") == "living_room"
+        assert index.resolve("Attic") is None
+
+    def test_entities_inherit_device_area(self):
+        """Test that an entity's own area overrides its device's area."""
+        index = _index()
+        assert index.area_entities("Living Room") == ["media_player.tv", "light.living_room", "lightning.sensor"]
+        assert index.area_entities("garage") == ["light.tv_backlight", "cover.garage_door"]
+        assert index.entity_area("light.tv_backlight") == "garage"
+
+    def test_domain_filter_matches_whole_domain(self):
+        """Test that the domain filter does not match domains sharing a prefix."""
+        assert _index().area_entities("living_room", domain="light") == ["light.living_room"]
+
+    def test_area_devices(self):
+        """Test listing the devices of an area."""
+        index = _index()
+        assert index.area_devices("living_room") == ["tv"]
+        assert index.area_devices("attic") == []
+
+    def test_unassigned_entities_are_left_out(self):
+        """Test that entities without a known area have none."""
+        index = _index()
+        assert index.entity_area("sun.sun") is None
+        assert index.entity_area("sensor.orphan") is None
+        assert "sun.sun" not in index.entity_areas()
+        assert index.area_entities("deleted_area") == []
+
+    def test_results_are_copies(self):
+        """Test that callers cannot modify the index through results."""
+        index = _index()
+        index.area_entities("garage").clear()
+        index.entity_areas().clear()
+        assert index.area_entities("garage")
+        assert index.entity_areas()
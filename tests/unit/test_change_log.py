@@ -0,0 +1,73 @@
+"""Unit tests for the state change log."""
+
+from datetime import UTC, datetime
+
+from home_assistant_mcp.change_log import ChangeLog, decode_cursor, encode_cursor
+
+
+def state(entity_id: str, value: str) -> dict:
+    """Build a minimal state."""
+    return {"entity_id": entity_id, "state": value, "attributes": {}}
+
+
+class TestChangeLog:
+    """Tests for ChangeLog."""
+
+    def test_changes_since_cursor(self):
+        """Test that only later changes are returned, latest per entity."""
+        log = ChangeLog()
+        log.record("light.a", state("light.a", "on"))
+        cursor = log.cursor()
+        log.record("light.b", state("light.b", "on"))
+        log.record("light.a", state("light.a", "off"))
+        log.record("light.c", None)
+
+        changes = log.since(cursor)
+
+        assert [entity_id for entity_id, _ in changes] == ["light.b", "light.a", "light.c"]
+        assert changes[1][1]["state"] == "off"
+        assert changes[2][1] is None
+        assert log.since(log.cursor()) == []
+
+    def test_evicted_changes_expire_cursors(self):
+        """Test that cursors older than the retained changes are refused."""
+        log = ChangeLog(max_entries=2)
+        cursor = log.cursor()
+        for entity_id in ("light.a", "light.b", "light.c"):
+            log.record(entity_id, state(entity_id, "on"))
+
+        assert len(log) == 2
+        assert log.since(cursor) is None
+
+    def test_gap_expires_cursors(self):
+        """Test that cursors issued before a gap are refused."""
+        log = ChangeLog()
+        cursor = log.cursor()
+        log.mark_gap()
+
+        assert log.since(cursor) is None
+        assert log.since(log.cursor()) == []
+
+    def test_foreign_and_malformed_cursors(self):
+        """Test that cursors of other logs or garbage are refused."""
+        log = ChangeLog()
+
+        assert log.since(ChangeLog().cursor()) is None
+        assert log.since("not-a-cursor") is None
+
+
+class TestCursorEncoding:
+    """Tests for encode_cursor and decode_cursor."""
+
+    def test_round_trip(self):
+        """Test that cursor fields survive encoding."""
+        timestamp = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+
+        position = decode_cursor(encode_cursor("abc", 7, timestamp))
+
+        assert position == {"epoch": "abc", "seq": 7, "time": timestamp}
+
+    def test_malformed(self):
+        """Test that undecodable cursors yield None."""
+        assert decode_cursor("%%%") is None
+        assert decode_cursor("W10=") is None  # "[]"
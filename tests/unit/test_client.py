@@ -1,13 +1,23 @@
 """Unit tests for Home Assistant client."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pytest_httpx import HTTPXMock
 
-from home_assistant_mcp.client import HomeAssistantClient, HomeAssistantError
+from home_assistant_mcp.client import (
+    AREA_INDEX_FALLBACK_TTL,
+    EVENT_BUFFER_IDLE_TIMEOUT,
+    MAX_EVENT_BUFFERS,
+    HomeAssistantClient,
+    HomeAssistantError,
+    _endpoint_label,
+)
 from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.metrics_registry import MetricsRegistry
+from home_assistant_mcp.tracer import Tracer
 
 
 class TestHomeAssistantClient:
@@ -16,7 +26,8 @@ class TestHomeAssistantClient:
     @pytest.fixture
     def client(self, ha_config: HomeAssistantConfig) -> HomeAssistantClient:
         """Create a client for testing."""
-        return HomeAssistantClient(ha_config)
+        # WebSocket mocks script one connection; the dashboard cache would open the event stream too
+        return HomeAssistantClient(ha_config.model_copy(update={"dashboard_cache": False}))
 
     @pytest.mark.asyncio
     async def test_check_api(self, client: HomeAssistantClient, httpx_mock: HTTPXMock, mock_api_status: dict):
@@ -27,6 +38,29 @@ class TestHomeAssistantClient:
             result = await client.check_api()
             assert result.message == "API running."
 
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections(
+        self, client: HomeAssistantClient, httpx_mock: HTTPXMock, mock_api_status: dict, mock_dashboard: dict
+    ):
+        """Test that warm_up opens HTTP and authenticated WebSocket connections reused later."""
+        httpx_mock.add_response(url="http://localhost:8123/api/", json=mock_api_status)
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.recv = AsyncMock(side_effect=[
+            json.dumps({"type": "auth_required"}),
+            json.dumps({"type": "auth_ok"}),
+            json.dumps({"id": 1, "type": "result", "success": True, "result": [mock_dashboard]}),
+        ])
+        mock_ws.send = AsyncMock()
+
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws) as connect:
+            async with client:
+                await client.warm_up()
+                await client.list_dashboards()
+
+        connect.assert_called_once()
+        assert json.loads(mock_ws.send.call_args_list[0][0][0])["type"] == "auth"
+
     @pytest.mark.asyncio
     async def test_get_config(self, client: HomeAssistantClient, httpx_mock: HTTPXMock, mock_config: dict):
         """Test getting Home Assistant config."""
@@ -229,105 +263,117 @@ class TestHomeAssistantClient:
             result = await client.render_template("{{ areas() | list }}")
             assert result == "['salon', 'cocina', 'dormitorio']"
 
+    @pytest.fixture
+    def registries(self) -> list[tuple[bool, list[dict]]]:
+        """Pipelined results of the area, device and entity registry listings."""
+        return [
+            (True, [{"area_id": "salon", "name": "Salón"}, {"area_id": "cocina", "name": "Cocina"}]),
+            (True, [{"id": "device_1", "area_id": "salon"}, {"id": "device_2", "area_id": "salon"}]),
+            (
+                True,
+                [
+                    {"entity_id": "light.salon", "area_id": "salon", "device_id": None},
+                    {"entity_id": "light.lampara_tele", "area_id": None, "device_id": "device_1"},
+                    {"entity_id": "sensor.salon_temp", "area_id": None, "device_id": "device_2"},
+                    {"entity_id": "light.cocina_main", "area_id": "cocina", "device_id": "device_1"},
+                    {"entity_id": "light.unassigned", "area_id": None, "device_id": None},
+                ],
+            ),
+        ]
+
+    @pytest.fixture
+    def area_client(self, client: HomeAssistantClient, registries: list) -> HomeAssistantClient:
+        """Client whose registries and event subscriptions are mocked."""
+        client._ws_pipeline = AsyncMock(return_value=registries)
+        client.subscribe_events = AsyncMock()
+        return client
+
     @pytest.mark.asyncio
-    async def test_get_areas(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_areas(self, area_client: HomeAssistantClient):
         """Test getting all areas."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="['salon', 'cocina', 'dormitorio']",
-        )
-
-        async with client:
-            result = await client.get_areas()
-            assert result == ["salon", "cocina", "dormitorio"]
-            assert len(result) == 3
+        assert await area_client.get_areas() == ["salon", "cocina"]
 
     @pytest.mark.asyncio
-    async def test_get_area_entities(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
-        """Test getting entities in an area."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="['light.salon', 'switch.salon', 'sensor.salon_temp']",
-        )
+    async def test_get_area_entities(self, area_client: HomeAssistantClient):
+        """Test getting entities in an area, including those of its devices."""
+        result = await area_client.get_area_entities("salon")
+        assert result == ["light.salon", "light.lampara_tele", "sensor.salon_temp"]
 
-        async with client:
-            result = await client.get_area_entities("salon")
-            assert len(result) == 3
-            assert "light.salon" in result
+    @pytest.mark.asyncio
+    async def test_get_area_entities_by_name(self, area_client: HomeAssistantClient):
+        """Test that an area can be given by its name, case-insensitively."""
+        assert await area_client.get_area_entities("cocina") == await area_client.get_area_entities("COCINA")
+        assert await area_client.get_area_entities("salón") == await area_client.get_area_entities("salon")
 
     @pytest.mark.asyncio
-    async def test_get_area_entities_with_domain(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_area_entities_with_domain(self, area_client: HomeAssistantClient):
         """Test getting entities in an area filtered by domain."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="['light.salon', 'light.lampara']",
-        )
-
-        async with client:
-            result = await client.get_area_entities("salon", domain="light")
-            assert len(result) == 2
-            assert all(e.startswith("light.") for e in result)
+        result = await area_client.get_area_entities("salon", domain="light")
+        assert result == ["light.salon", "light.lampara_tele"]
 
     @pytest.mark.asyncio
-    async def test_get_area_devices(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_area_devices(self, area_client: HomeAssistantClient):
         """Test getting devices in an area."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="['device_1', 'device_2']",
-        )
-
-        async with client:
-            result = await client.get_area_devices("salon")
-            assert len(result) == 2
-            assert "device_1" in result
+        assert await area_client.get_area_devices("salon") == ["device_1", "device_2"]
+        assert await area_client.get_area_devices("unknown") == []
 
     @pytest.mark.asyncio
-    async def test_get_entity_area(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
-        """Test getting the area for an entity."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="Salón",
-        )
-
-        async with client:
-            result = await client.get_entity_area("light.lampara_tele")
-            assert result == "Salón"
+    async def test_get_entity_area(self, area_client: HomeAssistantClient):
+        """Test that an entity's own area overrides its device's area."""
+        assert await area_client.get_entity_area("light.lampara_tele") == "Salón"
+        assert await area_client.get_entity_area("light.cocina_main") == "Cocina"
 
     @pytest.mark.asyncio
-    async def test_get_entity_area_none(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_entity_area_none(self, area_client: HomeAssistantClient):
         """Test getting the area for an entity not assigned to any area."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="",
-        )
-
-        async with client:
-            result = await client.get_entity_area("light.unassigned")
-            assert result is None
+        assert await area_client.get_entity_area("light.unassigned") is None
 
     @pytest.mark.asyncio
-    async def test_get_area_id(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_area_id(self, area_client: HomeAssistantClient):
         """Test getting area ID from area name."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="salon",
-        )
-
-        async with client:
-            result = await client.get_area_id("Salón")
-            assert result == "salon"
+        assert await area_client.get_area_id("Salón") == "salon"
+        assert await area_client.get_area_id("Nowhere") is None
 
     @pytest.mark.asyncio
-    async def test_get_area_name(self, client: HomeAssistantClient, httpx_mock: HTTPXMock):
+    async def test_get_area_name(self, area_client: HomeAssistantClient):
         """Test getting area name from area ID."""
-        httpx_mock.add_response(
-            url="http://localhost:8123/api/template",
-            text="Salón",
-        )
+        assert await area_client.get_area_name("salon") == "Salón"
+        assert await area_client.get_area_name("nowhere") is None
 
-        async with client:
-            result = await client.get_area_name("salon")
-            assert result == "Salón"
+    @pytest.mark.asyncio
+    async def test_area_index_built_once(self, area_client: HomeAssistantClient):
+        """Test that lookups share one registry load until a registry changes."""
+        await area_client.get_areas()
+        await area_client.get_area_entities("salon")
+        await area_client.get_entity_area("light.salon")
+        assert area_client._ws_pipeline.await_count == 1
+        assert area_client.subscribe_events.await_count == 3
+
+        callback = area_client.subscribe_events.await_args_list[0].args[1]
+        callback({"event_type": "area_registry_updated", "data": {"action": "update", "area_id": "salon"}})
+        await area_client.get_areas()
+        assert area_client._ws_pipeline.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_area_index_without_events(self, area_client: HomeAssistantClient):
+        """Test that the index is reused briefly when events are unavailable."""
+        area_client.subscribe_events.side_effect = HomeAssistantError("Events unavailable")
+        areas = await area_client.get_areas()
+        for area_id in areas:
+            await area_client.get_area_name(area_id)
+        assert area_client._ws_pipeline.await_count == 1
+
+        # Age the index past its lifetime
+        area_client._area_index_expires -= AREA_INDEX_FALLBACK_TTL
+        await area_client.get_areas()
+        assert area_client._ws_pipeline.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_area_index_registry_error(self, area_client: HomeAssistantClient, registries: list):
+        """Test that a failed registry listing raises an error."""
+        registries[1] = (False, "Unauthorized")
+        with pytest.raises(HomeAssistantError, match="Registry unavailable"):
+            await area_client.get_areas()
 
     @pytest.mark.asyncio
     async def test_get_ws_url_http(self, client: HomeAssistantClient):
@@ -355,7 +401,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.list_dashboards()
                 assert len(result) == 2
@@ -375,7 +421,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.get_dashboard_config()
                 assert result.title == "Test Dashboard"
@@ -394,7 +440,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.get_dashboard_config(url_path="test-dashboard")
                 assert result.title == "Test Dashboard"
@@ -415,7 +461,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.create_dashboard(
                     url_path="test-dashboard",
@@ -444,7 +490,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.update_dashboard("test_dashboard", title="Updated Dashboard")
                 assert result.title == "Updated Dashboard"
@@ -462,7 +508,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.delete_dashboard("test_dashboard")
                 assert result is True
@@ -485,7 +531,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             async with client:
                 result = await client.save_dashboard_config(config, url_path="test-dashboard")
                 assert result is True
@@ -501,7 +547,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             with pytest.raises(HomeAssistantError) as exc_info:
                 async with client:
                     await client.list_dashboards()
@@ -524,12 +570,100 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
             with pytest.raises(HomeAssistantError) as exc_info:
                 async with client:
                     await client.list_dashboards()
             assert "Dashboard not found" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_fire_events_pipelined(self, client: HomeAssistantClient):
+        """Test that events are sent ahead of their results and failures are reported."""
+        sent: list[dict] = []
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.send = AsyncMock(side_effect=lambda raw: sent.append(json.loads(raw)))
+        mock_ws.recv = AsyncMock(side_effect=[
+            json.dumps({"type": "auth_required"}),
+            json.dumps({"type": "auth_ok"}),
+            json.dumps({"id": 2, "type": "result", "success": False, "error": {"message": "Invalid"}}),
+            json.dumps({"id": 1, "type": "result", "success": True, "result": {}}),
+            json.dumps({"id": 3, "type": "result", "success": True, "result": {}}),
+        ])
+
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+            async with client:
+                result = await client.fire_events(
+                    [("a", {"n": 1}), ("b", None), ("c", {})], window=2
+                )
+
+        assert [m["event_type"] for m in sent[1:]] == ["a", "b", "c"]
+        assert sent[2]["event_data"] == {}
+        assert result.fired == 2
+        assert result.failed == 1
+        assert result.errors == [{"index": 1, "event_type": "b", "error": "Invalid"}]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_malformed_frame(self, ha_config: HomeAssistantConfig):
+        """Test that a malformed frame fails the rest of the batch and drops the connection."""
+        registry = MetricsRegistry()
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.recv = AsyncMock(side_effect=[
+            json.dumps({"type": "auth_required"}),
+            json.dumps({"type": "auth_ok"}),
+            json.dumps({"id": 1, "type": "result", "success": True, "result": {}}),
+            "not json",
+        ])
+
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+            async with HomeAssistantClient(ha_config, metrics=registry) as client:
+                result = await client.fire_events([("a", None), ("b", None), ("c", None)], window=2)
+                assert client._ws_client is None
+
+        assert result.fired == 1
+        assert [error["index"] for error in result.errors] == [1, 2]
+        assert result.errors[0]["error"].startswith("Failed to parse response")
+        mock_ws.close.assert_called()
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["ha_mcp_ws_errors_total"] == [
+            {"labels": {"type": "fire_event"}, "value": 2.0}
+        ]
+        assert snapshot["histograms"]["ha_mcp_ws_command_duration_seconds"][0]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pipeline_releases_connection_between_windows(self, client: HomeAssistantClient):
+        """Test that other commands can use the WebSocket between pipeline windows."""
+        sent: list[dict] = []
+        other: list[asyncio.Task] = []
+
+        async def send(raw: str) -> None:
+            message = json.loads(raw)
+            sent.append(message)
+            if message.get("event_type") == "a":
+                # Queued while the first window holds the connection
+                other.append(asyncio.create_task(client._ws_request("get_config")))
+                await asyncio.sleep(0)
+
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.send = AsyncMock(side_effect=send)
+        mock_ws.recv = AsyncMock(side_effect=[
+            json.dumps({"type": "auth_required"}),
+            json.dumps({"type": "auth_ok"}),
+            json.dumps({"id": 1, "type": "result", "success": True, "result": {}}),
+            json.dumps({"id": 2, "type": "result", "success": True, "result": {"version": "1"}}),
+            json.dumps({"id": 3, "type": "result", "success": True, "result": {}}),
+        ])
+
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+            async with client:
+                result = await client.fire_events([("a", None), ("b", None)], window=1)
+                assert await other[0] == {"version": "1"}
+
+        assert result.fired == 2
+        assert [m.get("event_type", m["type"]) for m in sent[1:]] == ["a", "get_config", "b"]
+
     @pytest.mark.asyncio
     async def test_ws_connection_reuse(self, client: HomeAssistantClient, mock_dashboard: dict):
         """Test that WebSocket connection is reused across multiple requests."""
@@ -543,7 +677,7 @@ class TestHomeAssistantClient:
         ])
         mock_ws.send = AsyncMock()
 
-        with patch("home_assistant_mcp.client.websockets.connect", new_callable=AsyncMock, return_value=mock_ws) as mock_connect:
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws) as mock_connect:
             async with client:
                 await client.list_dashboards()
                 await client.list_dashboards()
@@ -552,3 +686,228 @@ class TestHomeAssistantClient:
                 assert mock_connect.call_count == 1
                 # But we should have sent two requests (plus one auth message)
                 assert mock_ws.send.call_count == 3  # 1 auth + 2 requests
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_categories(
+        self, client: HomeAssistantClient, httpx_mock: HTTPXMock, mock_entity_states: list[dict]
+    ):
+        """Test that requests are routed to the matching rate limiter."""
+        client._rate_limiters["rest"].rate = 1000
+        client._rate_limiters["service"].rate = 1000
+        client._rate_limiters["template"].rate = 1000
+        httpx_mock.add_response(url="http://localhost:8123/api/states", json=mock_entity_states)
+        httpx_mock.add_response(url="http://localhost:8123/api/services/light/turn_on", json=[])
+        httpx_mock.add_response(url="http://localhost:8123/api/template", text="ok")
+
+        async with client:
+            await client.get_states()
+            await client.turn_on("light.living_room")
+            await client.render_template("{{ 1 }}")
+
+        stats = client.rate_limit_stats()
+        assert stats["rest"]["acquired"] == 1
+        assert stats["service"]["acquired"] == 1
+        assert stats["template"]["acquired"] == 1
+        assert stats["ws"]["acquired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_delays_requests(
+        self, ha_config: HomeAssistantConfig, httpx_mock: HTTPXMock, mock_api_status: dict
+    ):
+        """Test that requests over the configured rate wait rather than fail."""
+        ha_config.rate_limit_rest = 50
+        ha_config.rate_limit_burst = 1
+        httpx_mock.add_response(url="http://localhost:8123/api/", json=mock_api_status, is_reusable=True)
+
+        async with HomeAssistantClient(ha_config) as client:
+            await client.check_api()
+            await client.check_api()
+
+            stats = client.rate_limit_stats()["rest"]
+            assert stats["acquired"] == 2
+            assert stats["max_wait"] > 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_events(self, client: HomeAssistantClient):
+        """Test that subscriptions are sent on the event stream."""
+        stream = AsyncMock()
+        stream.subscribe = AsyncMock(return_value="unsubscribe")
+        client._event_stream = stream
+
+        callback = MagicMock()
+        result = await client.subscribe_events("state_changed", callback)
+
+        assert result == "unsubscribe"
+        stream.subscribe.assert_called_once_with(
+            {"type": "subscribe_events", "event_type": "state_changed"}, callback
+        )
+
+    @pytest.mark.asyncio
+    async def test_watch_state_shares_one_subscription(self, client: HomeAssistantClient):
+        """Test that state watchers are fed from the client's single state_changed subscription."""
+        client.subscribe_events = AsyncMock()
+        kitchen, hall = MagicMock(), MagicMock()
+
+        unwatch = await client.watch_state("light.kitchen", kitchen)
+        await client.watch_state("light.hall", hall)
+        event = {"data": {"entity_id": "light.kitchen", "new_state": {"state": "on"}}}
+        client._on_state_changed(event)
+        await unwatch()
+        client._on_state_changed(event)
+
+        kitchen.assert_called_once_with(event)
+        hall.assert_not_called()
+        subscribed = [call.args[0] for call in client.subscribe_events.await_args_list]
+        assert subscribed.count("state_changed") == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drops_state_watchers(self, client: HomeAssistantClient):
+        """Test that watchers from before close are not fed by the reused client."""
+        client.subscribe_events = AsyncMock()
+        stale, fresh = MagicMock(), MagicMock()
+
+        await client.watch_state("light.kitchen", stale)
+        await client.close()
+        await client.watch_state("light.kitchen", fresh)
+        client._on_state_changed({"data": {"entity_id": "light.kitchen", "new_state": {"state": "on"}}})
+
+        stale.assert_not_called()
+        fresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_watch_state_without_events(self, client: HomeAssistantClient):
+        """Test that watching fails when state change events are unavailable."""
+        client.subscribe_events = AsyncMock(side_effect=HomeAssistantError("Events unavailable"))
+
+        with pytest.raises(HomeAssistantError, match="unavailable"):
+            await client.watch_state("light.kitchen", MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_idle_event_buffers_expire(self, client: HomeAssistantClient):
+        """Test that buffers nobody reads are closed to free their slots."""
+        unsubscribe = AsyncMock()
+        client.subscribe_events = AsyncMock(return_value=unsubscribe)
+        client.add_event_reconnect_listener = MagicMock()
+
+        for n in range(MAX_EVENT_BUFFERS):
+            await client.open_event_buffer(["motion"], buffer_id=f"b{n}")
+        with pytest.raises(HomeAssistantError, match="Too many"):
+            await client.open_event_buffer(["motion"])
+
+        client.get_event_buffer("b1").last_read -= EVENT_BUFFER_IDLE_TIMEOUT + 1
+        await client.open_event_buffer(["motion"], buffer_id="new")
+
+        unsubscribe.assert_awaited_once()
+        assert client.get_event_buffer("new").id == "new"
+        assert client.get_event_buffer("b0").id == "b0"
+        with pytest.raises(HomeAssistantError, match="expired"):
+            client.get_event_buffer("b1")
+
+    @pytest.mark.asyncio
+    async def test_reconnect_marks_event_buffer_gap(self, client: HomeAssistantClient):
+        """Test that an event stream reconnect is recorded in every open buffer."""
+        client.subscribe_events = AsyncMock()
+        client.add_event_reconnect_listener = MagicMock()
+
+        buffer = await client.open_event_buffer(["motion"])
+        await client.open_event_buffer(["door"])
+        client.add_event_reconnect_listener.assert_called_once()
+        client.add_event_reconnect_listener.call_args.args[0]()
+
+        assert buffer.interruptions == 1
+
+    @pytest.mark.asyncio
+    async def test_close_stops_event_stream(self, client: HomeAssistantClient):
+        """Test that closing the client closes the event stream."""
+        stream = AsyncMock()
+        client._event_stream = stream
+
+        await client.close()
+
+        stream.close.assert_called_once()
+        assert client._event_stream is None
+
+    @pytest.mark.asyncio
+    async def test_request_metrics(
+        self, ha_config: HomeAssistantConfig, httpx_mock: HTTPXMock, mock_entity_state: dict
+    ):
+        """Test that REST requests record latency, payload size and errors."""
+        registry = MetricsRegistry()
+        httpx_mock.add_response(
+            url="http://localhost:8123/api/states/light.living_room", json=mock_entity_state
+        )
+        httpx_mock.add_response(url="http://localhost:8123/api/states/light.missing", status_code=404)
+
+        async with HomeAssistantClient(ha_config, metrics=registry) as client:
+            await client.get_state("light.living_room")
+            with pytest.raises(HomeAssistantError):
+                await client.get_state("light.missing")
+
+        snapshot = registry.snapshot()
+        labels = {"method": "GET", "endpoint": "/states/{entity_id}"}
+        latency = snapshot["histograms"]["ha_mcp_http_request_duration_seconds"]
+        assert latency == [{**latency[0], "labels": labels, "count": 2}]
+        assert snapshot["histograms"]["ha_mcp_http_response_bytes"][0]["count"] == 1
+        assert snapshot["counters"]["ha_mcp_http_errors_total"] == [
+            {"labels": {**labels, "status": "404"}, "value": 1.0}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ws_request_metrics(self, ha_config: HomeAssistantConfig, mock_dashboards_list: list[dict]):
+        """Test that WebSocket commands record latency per command type."""
+        registry = MetricsRegistry()
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        mock_ws.recv = AsyncMock(side_effect=[
+            json.dumps({"type": "auth_required"}),
+            json.dumps({"type": "auth_ok"}),
+            json.dumps({"id": 1, "type": "result", "success": True, "result": mock_dashboards_list}),
+        ])
+        mock_ws.send = AsyncMock()
+
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+            config = ha_config.model_copy(update={"dashboard_cache": False})
+            async with HomeAssistantClient(config, metrics=registry) as client:
+                await client.list_dashboards()
+
+        series = registry.snapshot()["histograms"]["ha_mcp_ws_command_duration_seconds"]
+        assert series[0]["labels"] == {"type": "lovelace/dashboards/list"}
+        assert series[0]["count"] == 1
+
+    def test_endpoint_label(self):
+        """Test that endpoints are collapsed into low-cardinality labels."""
+        assert _endpoint_label("/") == "/"
+        assert _endpoint_label("/states") == "/states"
+        assert _endpoint_label("/states/light.kitchen") == "/states/{entity_id}"
+        assert _endpoint_label("/services/light/turn_on") == "/services/{domain}/{service}"
+        assert _endpoint_label("/events/my_event") == "/events/{event_type}"
+        assert (
+            _endpoint_label("/history/period/2024-01-01T00:00:00?filter_entity_id=light.x")
+            == "/history/period"
+        )
+
+    def test_pool_stats_without_connections(self, client: HomeAssistantClient):
+        """Test pool statistics before any request was made."""
+        assert client.pool_stats() == {"in_flight": 0, "open": 0, "idle": 0}
+
+    @pytest.mark.asyncio
+    async def test_request_spans(
+        self, client: HomeAssistantClient, httpx_mock: HTTPXMock, mock_entity_states: list
+    ):
+        """Test that a request records HTTP, decode and validation spans."""
+        httpx_mock.add_response(url="http://localhost:8123/api/states", json=mock_entity_states)
+        spans: list[dict] = []
+        exporter = MagicMock(export=spans.append)
+        tracer = Tracer([exporter])
+
+        with patch("home_assistant_mcp.client.TRACER", tracer):
+            with tracer.span("tool ha_list_entities") as root:
+                await client.get_states()
+
+        by_name = {span["name"]: span for span in spans}
+        assert by_name["http GET"]["attributes"]["endpoint"] == "/states"
+        assert by_name["http GET"]["attributes"]["status_code"] == 200
+        assert by_name["validate"]["attributes"] == {"model": "EntityState", "items": len(mock_entity_states)}
+        for name in ("http GET", "decode", "validate"):
+            assert by_name[name]["parent_id"] == root.span_id
+            assert by_name[name]["trace_id"] == root.trace_id
@@ -0,0 +1,82 @@
+"""Unit tests for the Home Assistant client pool."""
+
+import pytest
+
+from home_assistant_mcp.client import HomeAssistantClient
+from home_assistant_mcp.client_pool import ClientPool
+from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
+
+
+@pytest.fixture
+def pool() -> ClientPool:
+    """Create a pool of two instances."""
+    return ClientPool(
+        {
+            "house": HomeAssistantConfig(url="http://house:8123", token="a"),
+            "lab": HomeAssistantConfig(url="http://lab:8123", token="b"),
+        }
+    )
+
+
+class TestClientPool:
+    """Tests for ClientPool."""
+
+    def test_default_is_first_instance(self, pool: ClientPool):
+        """Test that the first configured instance is the default."""
+        assert pool.default == "house"
+        assert pool.names == ["house", "lab"]
+        assert len(pool) == 2
+
+    def test_explicit_default(self):
+        """Test choosing another default instance."""
+        configs = {
+            "house": HomeAssistantConfig(url="http://house:8123", token="a"),
+            "lab": HomeAssistantConfig(url="http://lab:8123", token="b"),
+        }
+        assert ClientPool(configs, default="lab").names == ["lab", "house"]
+        with pytest.raises(ValueError):
+            ClientPool(configs, default="office")
+
+    def test_clients_are_created_on_first_use(self, pool: ClientPool):
+        """Test that clients are created lazily and reused."""
+        assert pool.active() == {}
+
+        client = pool.get()
+
+        assert isinstance(client, HomeAssistantClient)
+        assert client.config.url == "http://house:8123"
+        assert pool.get("house") is client
+        assert list(pool.active()) == ["house"]
+
+    def test_clients_creates_every_instance(self, pool: ClientPool):
+        """Test getting the clients of all instances."""
+        clients = pool.clients()
+
+        assert list(clients) == ["house", "lab"]
+        assert clients["lab"].config.url == "http://lab:8123"
+
+    def test_unknown_instance(self, pool: ClientPool):
+        """Test that unknown instances are reported with the configured ones."""
+        with pytest.raises(HomeAssistantError, match="configured: house, lab"):
+            pool.get("office")
+
+    def test_empty_pool_raises_error(self):
+        """Test that a pool needs at least one instance."""
+        with pytest.raises(ValueError):
+            ClientPool({})
+
+    async def test_close(self, pool: ClientPool):
+        """Test that closing the pool forgets its clients."""
+        pool.clients()
+        await pool.close()
+        assert pool.active() == {}
+
+    def test_state_daemon_socket_selects_shared_client(self):
+        """Test that instances with a daemon socket read states from the daemon."""
+        from home_assistant_mcp.shared_state_client import SharedStateClient
+
+        pool = ClientPool(
+            {"house": HomeAssistantConfig(url="http://house:8123", token="a", state_daemon_socket="/tmp/s")}
+        )
+        assert isinstance(pool.get(), SharedStateClient)
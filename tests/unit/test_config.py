@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
-from home_assistant_mcp.config import HomeAssistantConfig, load_config
+from home_assistant_mcp.config import HomeAssistantConfig, load_config, load_instance_configs
 
 
 class TestHomeAssistantConfig:
@@ -64,6 +64,33 @@ class TestHomeAssistantConfig:
         )
         assert config.verify_ssl is False
 
+    def test_rate_limits_disabled_by_default(self):
+        """Test that rate limiting is disabled unless configured."""
+        config = HomeAssistantConfig(url="http://localhost:8123", token="test_token")
+        assert config.rate_limit_rest == 0.0
+        assert config.rate_limit_template == 0.0
+        assert config.rate_limit_service == 0.0
+        assert config.rate_limit_ws == 0.0
+        assert config.rate_limit_burst is None
+
+    def test_negative_rate_limit_raises_error(self):
+        """Test that negative rate limits are rejected."""
+        with pytest.raises(ValueError):
+            HomeAssistantConfig(
+                url="http://localhost:8123",
+                token="test_token",
+                rate_limit_rest=-1,
+            )
+
+    def test_fractional_burst_raises_error(self):
+        """Test that a burst below one token is rejected."""
+        with pytest.raises(ValueError):
+            HomeAssistantConfig(
+                url="http://localhost:8123",
+                token="test_token",
+                rate_limit_burst=0.5,
+            )
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -91,12 +118,36 @@ class TestLoadConfig:
                 "HA_TOKEN": "my_secret_token",
                 "HA_VERIFY_SSL": "false",
                 "HA_TIMEOUT": "60",
+                "HA_DASHBOARD_CACHE": "false",
             },
             clear=False,
         ):
             config = load_config()
             assert config.verify_ssl is False
             assert config.timeout == 60.0
+            assert config.dashboard_cache is False
+
+    def test_load_config_with_rate_limits(self):
+        """Test loading rate limits from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_URL": "http://192.168.1.100:8123",
+                "HA_TOKEN": "my_secret_token",
+                "HA_RATE_LIMIT_REST": "20",
+                "HA_RATE_LIMIT_TEMPLATE": "2",
+                "HA_RATE_LIMIT_SERVICE": "10",
+                "HA_RATE_LIMIT_WS": "5",
+                "HA_RATE_LIMIT_BURST": "4",
+            },
+            clear=False,
+        ):
+            config = load_config()
+            assert config.rate_limit_rest == 20.0
+            assert config.rate_limit_template == 2.0
+            assert config.rate_limit_service == 10.0
+            assert config.rate_limit_ws == 5.0
+            assert config.rate_limit_burst == 4.0
 
     def test_load_config_missing_url(self, tmp_path):
         """Test that missing URL raises error."""
@@ -121,3 +172,98 @@ class TestLoadConfig:
         ):
             with pytest.raises(ValueError, match="HA_TOKEN environment variable is required"):
                 load_config(env_file=fake_env)
+
+
+class TestLoadInstanceConfigs:
+    """Tests for load_instance_configs function."""
+
+    def test_single_instance_without_instance_list(self, tmp_path):
+        """Test that HA_URL/HA_TOKEN configure the default instance."""
+        with patch.dict(
+            os.environ, {"HA_URL": "http://localhost:8123", "HA_TOKEN": "token"}, clear=True
+        ):
+            configs = load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+        assert list(configs) == ["default"]
+        assert configs["default"].url == "http://localhost:8123"
+
+    def test_named_instances(self, tmp_path):
+        """Test loading several instances with shared and overridden settings."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_INSTANCES": "house, Lab",
+                "HA_HOUSE_URL": "http://house:8123",
+                "HA_HOUSE_TOKEN": "house_token",
+                "HA_LAB_URL": "https://lab:8123",
+                "HA_LAB_TOKEN": "lab_token",
+                "HA_LAB_VERIFY_SSL": "false",
+                "HA_TIMEOUT": "10",
+                "HA_RATE_LIMIT_REST": "5",
+            },
+            clear=True,
+        ):
+            configs = load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+        assert list(configs) == ["house", "lab"]
+        assert configs["house"].token == "house_token"
+        assert configs["house"].verify_ssl is True
+        assert configs["lab"].verify_ssl is False
+        assert configs["lab"].timeout == 10.0
+        assert configs["lab"].rate_limit_rest == 5.0
+
+    def test_instance_missing_url(self, tmp_path):
+        """Test that every listed instance needs its own URL."""
+        with patch.dict(
+            os.environ,
+            {"HA_INSTANCES": "office", "HA_URL": "http://localhost:8123", "HA_OFFICE_TOKEN": "t"},
+            clear=True,
+        ):
+            with pytest.raises(ValueError, match="HA_OFFICE_URL environment variable is required"):
+                load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+    def test_invalid_instance_name(self, tmp_path):
+        """Test that instance names must be usable in variable names."""
+        with patch.dict(os.environ, {"HA_INSTANCES": "my-house"}, clear=True):
+            with pytest.raises(ValueError, match="Invalid instance name"):
+                load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+    def test_state_daemon_socket_per_instance(self, tmp_path):
+        """Test that named instances never use the socket of another instance's daemon."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_INSTANCES": "house,lab",
+                "HA_HOUSE_URL": "http://house:8123",
+                "HA_HOUSE_TOKEN": "house_token",
+                "HA_LAB_URL": "http://lab:8123",
+                "HA_LAB_TOKEN": "lab_token",
+                "HA_STATE_DAEMON_SOCKET": "/tmp/house.sock",
+                "HA_LAB_STATE_DAEMON_SOCKET": "/tmp/lab.sock",
+            },
+            clear=True,
+        ):
+            configs = load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+        assert configs["house"].state_daemon_socket is None
+        assert configs["lab"].state_daemon_socket == "/tmp/lab.sock"
+
+    def test_state_daemon_socket_not_inherited(self, tmp_path):
+        """Test that the shared socket setting does not route named instances to one daemon."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_INSTANCES": "house,lab",
+                "HA_HOUSE_URL": "http://house:8123",
+                "HA_HOUSE_TOKEN": "house_token",
+                "HA_LAB_URL": "http://lab:8123",
+                "HA_LAB_TOKEN": "lab_token",
+                "HA_STATE_DAEMON_SOCKET": "/tmp/house.sock",
+                "HA_HOUSE_STATE_DAEMON_SOCKET": "/tmp/house.sock",
+            },
+            clear=True,
+        ):
+            configs = load_instance_configs(env_file=tmp_path / ".env.nonexistent")
+
+        assert configs["house"].state_daemon_socket == "/tmp/house.sock"
+        assert configs["lab"].state_daemon_socket is None
@@ -0,0 +1,72 @@
+"""Unit tests for the dashboard cache."""
+
+from unittest.mock import patch
+
+from home_assistant_mcp.dashboard_cache import DashboardCache
+from home_assistant_mcp.models import Dashboard
+
+
+def _dashboard(index: int) -> Dashboard:
+    return Dashboard(id=f"d{index}", url_path=f"dash-{index}", title=f"Dashboard {index}")
+
+
+class TestDashboardCache:
+    """Tests for DashboardCache."""
+
+    def test_config_is_parsed_once(self):
+        """Test that a stored config is returned with its parsed model."""
+        cache = DashboardCache()
+        raw = {"title": "Home", "views": [{"title": "One"}]}
+
+        assert cache.config(None) is None
+        parsed = cache.store_config(None, raw, cache.generation)
+
+        assert cache.config(None) == (raw, parsed)
+        assert parsed.views == [{"title": "One"}]
+        assert cache.stats() == {"configs": 1, "hits": 1, "misses": 1}
+
+    def test_drop_config_is_per_url_path(self):
+        """Test that dropping one config keeps the others."""
+        cache = DashboardCache()
+        cache.store_config(None, {"views": []}, cache.generation)
+        cache.store_config("energy", {"views": []}, cache.generation)
+
+        cache.drop_config("energy")
+
+        assert cache.config("energy") is None
+        assert cache.config(None) is not None
+
+    def test_fetch_racing_a_drop_is_not_cached(self):
+        """Test that a result fetched before an invalidation is discarded."""
+        cache = DashboardCache()
+        generation = cache.generation
+        cache.drop_config(None)
+
+        parsed = cache.store_config(None, {"title": "Stale"}, generation)
+        cache.store_dashboards([_dashboard(1)], generation)
+
+        assert parsed.title == "Stale"
+        assert cache.config(None) is None
+        assert cache.dashboards() is None
+
+    def test_dashboard_list_expires(self):
+        """Test that the list is fresh for list_ttl seconds."""
+        cache = DashboardCache(list_ttl=10)
+        cache.store_dashboards([_dashboard(1), _dashboard(2)], cache.generation)
+
+        dashboards = cache.dashboards()
+        dashboards.clear()
+        assert [d.id for d in cache.dashboards()] == ["d1", "d2"]
+        with patch("home_assistant_mcp.dashboard_cache.time.monotonic", return_value=1e12):
+            assert cache.dashboards() is None
+
+    def test_clear(self):
+        """Test that clear drops the list and every config."""
+        cache = DashboardCache()
+        cache.store_dashboards([_dashboard(1)], cache.generation)
+        cache.store_config("energy", {"views": []}, cache.generation)
+
+        cache.clear()
+
+        assert cache.dashboards() is None
+        assert cache.config("energy") is None
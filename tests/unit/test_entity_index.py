@@ -0,0 +1,158 @@
+"""Unit tests for the entity search index."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from home_assistant_mcp.entity_index import EntityIndex, trigrams
+
+
+def state(entity_id: str, friendly_name: str, value: str = "on", **attributes) -> dict:
+    """Build a state as returned by Home Assistant."""
+    return {"entity_id": entity_id, "state": value, "attributes": {"friendly_name": friendly_name, **attributes}}
+
+
+def build_index() -> EntityIndex:
+    """Index a few entities of a small home."""
+    index = EntityIndex()
+    index.update(state("light.kitchen_ceiling", "Kitchen Ceiling Light"), area="Kitchen")
+    index.update(state("light.kitchen_counter", "Kitchen Counter Strip"), area="Kitchen")
+    index.update(state("light.bedroom", "Bedroom Lamp"), area="Bedroom")
+    index.update(
+        state("sensor.kitchen_temperature", "Kitchen Temperature", "21.5", device_class="temperature"),
+        area="Kitchen",
+    )
+    return index
+
+
+class TestTrigrams:
+    """Tests for the trigrams function."""
+
+    def test_words_are_padded(self):
+        """Test that words are lowercased and padded."""
+        assert trigrams("Hi") == {" hi", "hi "}
+        assert trigrams("light.kitchen") >= {" li", "ght", "en "}
+
+    def test_empty_text(self):
+        """Test that punctuation alone yields no trigrams."""
+        assert trigrams(" - ") == set()
+
+
+class TestEntityIndex:
+    """Tests for EntityIndex."""
+
+    def test_best_match_first(self):
+        """Test that the entity matching every query word ranks first."""
+        matches = build_index().search("kitchen ceiling light")
+
+        assert matches[0]["entity_id"] == "light.kitchen_ceiling"
+        assert matches[0]["score"] == 1.0
+        assert matches[0]["area"] == "Kitchen"
+        assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
+
+    def test_typos_still_match(self):
+        """Test that misspelled queries find the entity."""
+        assert build_index().search("bedrom lmp")[0]["entity_id"] == "light.bedroom"
+
+    def test_device_class_and_domain_filter(self):
+        """Test matching the device class and restricting the domain."""
+        index = build_index()
+
+        assert index.search("temperature")[0]["entity_id"] == "sensor.kitchen_temperature"
+        assert all(m["entity_id"].startswith("light.") for m in index.search("kitchen", domain="light"))
+
+    def test_limit_and_min_score(self):
+        """Test the number of matches and dropping weak ones."""
+        index = build_index()
+
+        assert len(index.search("kitchen", limit=2)) == 2
+        assert index.search("garage door opener") == []
+        assert index.search("") == []
+
+    def test_update_keeps_area_and_reindexes(self):
+        """Test that state updates keep the area and follow renamed entities."""
+        index = build_index()
+
+        index.update(state("light.bedroom", "Reading Lamp", "off"))
+
+        entity = index.entities["light.bedroom"]
+        assert entity["state"] == "off"
+        assert entity["area"] == "Bedroom"
+        assert index.search("reading")[0]["entity_id"] == "light.bedroom"
+
+    def test_remove(self):
+        """Test that removed entities are no longer found."""
+        index = build_index()
+
+        index.remove("light.bedroom")
+        index.remove("light.unknown")
+
+        assert len(index) == 3
+        assert all(m["entity_id"] != "light.bedroom" for m in index.search("bedroom lamp", min_score=0))
+
+
+def build_query_index() -> EntityIndex:
+    """Index entities with numeric attributes and change times."""
+    index = EntityIndex()
+    for entity_id, value, attributes, area, changed in (
+        ("light.hall", "on", {"brightness": 200}, "Hall", "2024-01-15T10:00:00+00:00"),
+        ("light.porch", "on", {"brightness": 40}, "Outside", "2024-01-15T12:00:00+00:00"),
+        ("light.attic", "off", {}, "Attic", "2024-01-14T08:00:00+00:00"),
+        ("sensor.door_battery", "15", {"device_class": "battery"}, "Hall", "2024-01-15T11:00:00+00:00"),
+        ("sensor.remote_battery", "80", {"device_class": "battery"}, None, "2024-01-15T11:00:00+00:00"),
+        ("sensor.window_battery", "unavailable", {"device_class": "battery"}, None, "2024-01-15T09:00:00"),
+    ):
+        index.update(
+            {"entity_id": entity_id, "state": value, "attributes": attributes, "last_changed": changed},
+            area=area,
+        )
+    return index
+
+
+class TestEntityIndexQuery:
+    """Tests for EntityIndex.query."""
+
+    def test_secondary_filters(self):
+        """Test filtering on domain, states, device class and area."""
+        index = build_query_index()
+
+        assert index.query(domain="light", states=["on"]) == ["light.hall", "light.porch"]
+        assert index.query(states=["off", "unavailable"]) == ["light.attic", "sensor.window_battery"]
+        assert len(index.query(device_class="BATTERY")) == 3
+        assert index.query(area="hall") == ["light.hall", "sensor.door_battery"]
+        assert index.query(domain="climate") == []
+        assert len(index.query()) == 6
+
+    def test_numeric_predicates(self):
+        """Test comparing attributes and states numerically."""
+        index = build_query_index()
+
+        assert index.query(where=[("brightness", ">", 100)]) == ["light.hall"]
+        assert index.query(device_class="battery", where=[("state", "<", 20)]) == ["sensor.door_battery"]
+        assert index.query(domain="light", where=[("brightness", "!=", 40)]) == ["light.attic", "light.hall"]
+
+    def test_change_time_filters(self):
+        """Test filtering on the time of the last state change."""
+        index = build_query_index()
+
+        after = index.query(changed_after=datetime(2024, 1, 15, 10, 30, tzinfo=UTC))
+        before = index.query(domain="light", changed_before=datetime(2024, 1, 15, tzinfo=UTC))
+
+        assert after == ["light.porch", "sensor.door_battery", "sensor.remote_battery"]
+        assert before == ["light.attic"]
+
+    def test_updates_move_entities_between_index_keys(self):
+        """Test that state changes update the secondary indexes."""
+        index = build_query_index()
+
+        index.update({"entity_id": "light.attic", "state": "on", "attributes": {"brightness": 255}})
+        index.remove("light.porch")
+
+        assert index.query(domain="light", states=["on"]) == ["light.attic", "light.hall"]
+        assert index.query(states=["off"]) == []
+        assert index.query(area="attic") == ["light.attic"]
+
+    def test_unknown_operator(self):
+        """Test that unknown operators are rejected."""
+        with pytest.raises(ValueError, match="Unsupported operator"):
+            build_query_index().query(where=[("brightness", "~", 1)])
@@ -0,0 +1,75 @@
+"""Unit tests for the event ring buffer."""
+
+import asyncio
+
+from home_assistant_mcp.event_buffer import EventBuffer
+
+
+def event(n: int) -> dict:
+    """Build a button press event."""
+    return {"event_type": "button_pressed", "time_fired": f"2024-01-15T10:00:0{n % 10}+00:00", "data": {"n": n}}
+
+
+class TestEventBuffer:
+    """Tests for EventBuffer."""
+
+    def test_read_in_batches(self):
+        """Test reading events incrementally with a cursor."""
+        buffer = EventBuffer(["button_pressed"])
+        for n in range(5):
+            buffer.append(event(n))
+
+        first, cursor, missed = buffer.read(0, limit=3)
+        rest, cursor, _ = buffer.read(cursor)
+
+        assert [e["data"]["n"] for e in first] == [0, 1, 2]
+        assert [e["seq"] for e in rest] == [4, 5]
+        assert missed == 0
+        assert buffer.read(cursor) == ([], 5, 0)
+
+    def test_full_buffer_drops_oldest(self):
+        """Test that overflow drops the oldest events and reports them as missed."""
+        buffer = EventBuffer([], max_events=3)
+        for n in range(5):
+            buffer.append(event(n))
+
+        events, cursor, missed = buffer.read(0)
+
+        assert len(buffer) == 3
+        assert buffer.dropped == 2
+        assert missed == 2
+        assert [e["data"]["n"] for e in events] == [2, 3, 4]
+        assert buffer.read(3) == (events[1:], 5, 0)
+
+    def test_empty_buffer_after_drops(self):
+        """Test the cursor of a reader that is up to date."""
+        buffer = EventBuffer([], max_events=1)
+        buffer.append(event(1))
+        buffer.append(event(2))
+
+        assert buffer.read(2) == ([], 2, 0)
+
+    async def test_wait_for_event(self):
+        """Test waiting until an event arrives after the cursor."""
+        buffer = EventBuffer([])
+
+        waiter = asyncio.create_task(buffer.wait(0, timeout=1))
+        await asyncio.sleep(0.01)
+        buffer.append(event(1))
+
+        assert await waiter is True
+        assert await buffer.wait(1, timeout=0.01) is False
+
+    def test_interruption_is_reported_once(self):
+        """Test that readers crossing a stream interruption are told about it."""
+        buffer = EventBuffer([])
+        buffer.append(event(1))
+        buffer.mark_gap()
+        buffer.append(event(2))
+
+        _, cursor, _ = buffer.read(0, limit=1)
+        assert buffer.interrupted(0, cursor) is False
+        _, next_cursor, _ = buffer.read(cursor)
+        assert buffer.interrupted(cursor, next_cursor) is True
+        assert buffer.interrupted(next_cursor, next_cursor) is False
+        assert buffer.interruptions == 1
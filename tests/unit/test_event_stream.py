@@ -0,0 +1,129 @@
+"""Unit tests for the event stream."""
+
+import asyncio
+import json
+
+import pytest
+
+from home_assistant_mcp.event_stream import EventStream
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
+
+
+class FakeWebSocket:
+    """In-memory WebSocket that confirms every command it receives."""
+
+    def __init__(self, success: bool = True):
+        self.sent: list[dict] = []
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.success = success
+        self.closed = False
+
+    async def send(self, raw: str) -> None:
+        message = json.loads(raw)
+        self.sent.append(message)
+        result = {"id": message["id"], "type": "result", "success": self.success, "result": None}
+        if not self.success:
+            result["error"] = {"message": "Unknown command"}
+        self.incoming.put_nowait(json.dumps(result))
+
+    async def recv(self) -> str:
+        item = await self.incoming.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def push_event(self, subscription_id: int, event: dict) -> None:
+        self.incoming.put_nowait(json.dumps({"id": subscription_id, "type": "event", "event": event}))
+
+
+async def _drain() -> None:
+    """Let the reader task process queued messages."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestEventStream:
+    """Tests for EventStream."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_dispatches_events(self):
+        """Test that events of a subscription reach its callback."""
+        ws = FakeWebSocket()
+
+        async def connect():
+            return ws
+
+        stream = EventStream(connect)
+        received = []
+        await stream.subscribe({"type": "subscribe_events", "event_type": "state_changed"}, received.append)
+
+        assert ws.sent[0] == {"id": 1, "type": "subscribe_events", "event_type": "state_changed"}
+        ws.push_event(1, {"event_type": "state_changed", "data": {"entity_id": "light.x"}})
+        ws.push_event(99, {"event_type": "other"})
+        await _drain()
+
+        assert received == [{"event_type": "state_changed", "data": {"entity_id": "light.x"}}]
+        await stream.close()
+        assert ws.closed is True
+
+    @pytest.mark.asyncio
+    async def test_rejected_subscription_raises(self):
+        """Test that a failed subscription raises HomeAssistantError."""
+        ws = FakeWebSocket(success=False)
+
+        async def connect():
+            return ws
+
+        stream = EventStream(connect)
+        with pytest.raises(HomeAssistantError, match="Unknown command"):
+            await stream.subscribe({"type": "subscribe_events"}, lambda event: None)
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_dispatch(self):
+        """Test that unsubscribing sends the command and stops callbacks."""
+        ws = FakeWebSocket()
+
+        async def connect():
+            return ws
+
+        stream = EventStream(connect)
+        received = []
+        unsubscribe = await stream.subscribe({"type": "subscribe_events"}, received.append)
+        await unsubscribe()
+        ws.push_event(1, {"event_type": "late"})
+        await _drain()
+
+        assert ws.sent[1]["type"] == "unsubscribe_events"
+        assert ws.sent[1]["subscription"] == 1
+        assert received == []
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_renews_subscriptions(self):
+        """Test that a dropped connection is re-established and resubscribed."""
+        first, second = FakeWebSocket(), FakeWebSocket()
+        sockets = [first, second]
+
+        async def connect():
+            return sockets.pop(0)
+
+        stream = EventStream(connect, reconnect_delay=0)
+        reconnected = []
+        stream.add_reconnect_listener(lambda: reconnected.append(True))
+        received = []
+        await stream.subscribe({"type": "subscribe_events", "event_type": "e"}, received.append)
+
+        first.incoming.put_nowait(ConnectionError("dropped"))
+        await _drain()
+
+        assert reconnected == [True]
+        resubscribe = second.sent[0]
+        assert resubscribe["type"] == "subscribe_events"
+        second.push_event(resubscribe["id"], {"event_type": "e"})
+        await _drain()
+        assert received == [{"event_type": "e"}]
+        await stream.close()
@@ -0,0 +1,54 @@
+"""Unit tests for the histogram."""
+
+import math
+
+from home_assistant_mcp.histogram import Histogram
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_counts_and_sum(self):
+        """Test that observations update count and sum."""
+        hist = Histogram((1.0, 2.0))
+        hist.observe(0.5)
+        hist.observe(1.5)
+        hist.observe(5.0)
+
+        assert hist.count == 3
+        assert hist.total == 7.0
+
+    def test_cumulative_buckets(self):
+        """Test cumulative bucket counts including +Inf."""
+        hist = Histogram((1.0, 2.0))
+        for value in (0.5, 1.0, 1.5, 5.0):
+            hist.observe(value)
+
+        assert hist.cumulative_buckets() == [(1.0, 2), (2.0, 3), (math.inf, 4)]
+
+    def test_quantile_interpolates_within_bucket(self):
+        """Test quantile estimation by linear interpolation."""
+        hist = Histogram((10.0, 20.0))
+        for _ in range(10):
+            hist.observe(15.0)
+
+        assert hist.quantile(0.5) == 15.0
+        assert hist.quantile(1.0) == 20.0
+
+    def test_quantile_overflow_reports_largest_bound(self):
+        """Test that values above every bound report the largest bound."""
+        hist = Histogram((1.0,))
+        hist.observe(100.0)
+
+        assert hist.quantile(0.99) == 1.0
+
+    def test_empty_snapshot(self):
+        """Test snapshot without observations."""
+        assert Histogram().snapshot() == {
+            "count": 0,
+            "sum": 0.0,
+            "mean": 0.0,
+            "p50": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+        }
@@ -0,0 +1,108 @@
+"""Unit tests for JSON Patch operations and content hashes."""
+
+import pytest
+
+from home_assistant_mcp.json_patch import apply_patch, content_hash
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        "title": "Home",
+        "views": [{"title": "Living", "cards": [{"type": "light", "entity": "light.a"}]}],
+    }
+
+
+class TestApplyPatch:
+    """Tests for apply_patch."""
+
+    def test_replace_add_remove(self, config: dict):
+        """Test the basic operations on objects and lists."""
+        result = apply_patch(
+            config,
+            [
+                {"op": "replace", "path": "/views/0/cards/0/entity", "value": "light.b"},
+                {"op": "add", "path": "/views/0/cards/-", "value": {"type": "entities"}},
+                {"op": "add", "path": "/views/0/cards/0", "value": {"type": "markdown"}},
+                {"op": "remove", "path": "/title"},
+            ],
+        )
+
+        assert [card["type"] for card in result["views"][0]["cards"]] == ["markdown", "light", "entities"]
+        assert result["views"][0]["cards"][1]["entity"] == "light.b"
+        assert "title" not in result
+
+    def test_move_and_copy(self, config: dict):
+        """Test that move and copy read from the from pointer."""
+        result = apply_patch(
+            config,
+            [
+                {"op": "copy", "from": "/views/0", "path": "/views/-"},
+                {"op": "move", "from": "/title", "path": "/views/1/title"},
+            ],
+        )
+
+        assert result["views"][1] == {"title": "Home", "cards": config["views"][0]["cards"]}
+        assert "title" not in result
+
+    def test_escaped_pointer(self):
+        """Test that ~1 and ~0 decode to / and ~."""
+        result = apply_patch({"a/b": {"~c": 1}}, [{"op": "replace", "path": "/a~1b/~0c", "value": 2}])
+
+        assert result == {"a/b": {"~c": 2}}
+
+    def test_document_is_not_modified(self, config: dict):
+        """Test that the patch works on a copy, even when it fails midway."""
+        original_hash = content_hash(config)
+
+        apply_patch(config, [{"op": "replace", "path": "/title", "value": "Other"}])
+        with pytest.raises(ValueError):
+            apply_patch(
+                config,
+                [
+                    {"op": "remove", "path": "/views/0/cards/0"},
+                    {"op": "remove", "path": "/views/5"},
+                ],
+            )
+
+        assert content_hash(config) == original_hash
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"op": "remove", "path": "/missing"},
+            {"op": "replace", "path": "/views/1", "value": {}},
+            {"op": "add", "path": "/views/01", "value": {}},
+            {"op": "add", "path": "title", "value": "x"},
+            {"op": "test", "path": "/title", "value": "Away"},
+            {"op": "move", "from": "/views", "path": "/views/0/nested"},
+            {"op": "merge", "path": "/title"},
+            {"op": "add", "path": "/title/x", "value": 1},
+        ],
+    )
+    def test_invalid_operations(self, config: dict, operation: dict):
+        """Test that invalid operations raise ValueError naming the operation."""
+        with pytest.raises(ValueError, match="Operation 1"):
+            apply_patch(config, [operation])
+
+    def test_passing_test_operation(self, config: dict):
+        """Test that a matching test operation lets the patch through."""
+        result = apply_patch(
+            config,
+            [
+                {"op": "test", "path": "/title", "value": "Home"},
+                {"op": "replace", "path": "/title", "value": "House"},
+            ],
+        )
+
+        assert result["title"] == "House"
+
+
+class TestContentHash:
+    """Tests for content_hash."""
+
+    def test_key_order_does_not_matter(self):
+        """Test that equal documents hash equally."""
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+        assert len(content_hash({})) == 16
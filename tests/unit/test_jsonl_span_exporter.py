@@ -0,0 +1,39 @@
+"""Unit tests for the JSON Lines span exporter."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from home_assistant_mcp.jsonl_span_exporter import JsonlSpanExporter
+from home_assistant_mcp.tracer import Tracer
+
+
+class TestJsonlSpanExporter:
+    """Tests for JsonlSpanExporter."""
+
+    @pytest.mark.asyncio
+    async def test_writes_one_line_per_span(self, tmp_path: Path):
+        """Test that every span becomes one JSON line."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = JsonlSpanExporter(path)
+        tracer = Tracer([exporter])
+
+        with tracer.span("root"):
+            with tracer.span("child"):
+                pass
+        await tracer.shutdown()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["child", "root"]
+
+    @pytest.mark.asyncio
+    async def test_appends_to_existing_file(self, tmp_path: Path):
+        """Test that spans are appended across exporter instances."""
+        path = tmp_path / "spans.jsonl"
+        for name in ("first", "second"):
+            exporter = JsonlSpanExporter(path)
+            exporter.export({"name": name})
+            await exporter.shutdown()
+
+        assert len(path.read_text().splitlines()) == 2
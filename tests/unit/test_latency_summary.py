@@ -0,0 +1,23 @@
+"""Unit tests for benchmark latency statistics."""
+
+from benchmarks.latency_summary import percentile, summarize_latencies
+
+
+class TestLatencySummary:
+    """Tests for percentile and summarize_latencies."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile(samples, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_summary_in_milliseconds(self):
+        """Test that the summary converts seconds to milliseconds."""
+        summary = summarize_latencies([0.002, 0.001, 0.003])
+        assert summary["count"] == 3
+        assert summary["min_ms"] == 1.0
+        assert summary["p50_ms"] == 2.0
+        assert summary["max_ms"] == 3.0
@@ -0,0 +1,71 @@
+"""Unit tests for the metrics registry."""
+
+from home_assistant_mcp.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_histogram_series_per_label_set(self):
+        """Test that each label set gets its own histogram."""
+        registry = MetricsRegistry()
+        registry.observe("latency", 0.1, {"tool": "a"})
+        registry.observe("latency", 0.2, {"tool": "a"})
+        registry.observe("latency", 0.3, {"tool": "b"})
+
+        series = registry.snapshot()["histograms"]["latency"]
+        counts = {entry["labels"]["tool"]: entry["count"] for entry in series}
+        assert counts == {"a": 2, "b": 1}
+
+    def test_counter_increment(self):
+        """Test counter accumulation."""
+        registry = MetricsRegistry()
+        registry.increment("errors", {"tool": "a"})
+        registry.increment("errors", {"tool": "a"}, amount=2)
+
+        assert registry.snapshot()["counters"]["errors"] == [{"labels": {"tool": "a"}, "value": 3.0}]
+
+    def test_gauges_are_collected_on_read(self):
+        """Test that gauge collectors are evaluated at snapshot time."""
+        registry = MetricsRegistry()
+        state = {"value": 1}
+        registry.register_gauge("pool", lambda: [({"state": "open"}, state["value"])])
+        state["value"] = 5
+
+        assert registry.snapshot()["gauges"]["pool"] == [{"labels": {"state": "open"}, "value": 5.0}]
+
+    def test_failing_gauge_is_skipped(self):
+        """Test that a broken collector does not break the snapshot."""
+        registry = MetricsRegistry()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.register_gauge("broken", broken)
+        assert registry.snapshot()["gauges"] == {}
+
+    def test_render_prometheus(self):
+        """Test Prometheus exposition output."""
+        registry = MetricsRegistry()
+        registry.observe("latency_seconds", 0.02, {"tool": "ha_get_config"}, bounds=(0.01, 0.05))
+        registry.increment("errors_total", {"tool": 'we"ird'})
+        registry.register_gauge("entries", lambda: [({}, 3)])
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{tool="ha_get_config",le="0.01"} 0' in text
+        assert 'latency_seconds_bucket{tool="ha_get_config",le="0.05"} 1' in text
+        assert 'latency_seconds_bucket{tool="ha_get_config",le="+Inf"} 1' in text
+        assert 'latency_seconds_count{tool="ha_get_config"} 1' in text
+        assert 'errors_total{tool="we\\"ird"} 1' in text
+        assert "# TYPE entries gauge\nentries 3" in text
+        assert text.endswith("\n")
+
+    def test_reset(self):
+        """Test that reset drops every metric."""
+        registry = MetricsRegistry()
+        registry.increment("errors")
+        registry.reset()
+
+        assert registry.snapshot() == {"histograms": {}, "counters": {}, "gauges": {}}
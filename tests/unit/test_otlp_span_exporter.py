@@ -0,0 +1,74 @@
+"""Unit tests for the OTLP span exporter."""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from home_assistant_mcp.otlp_span_exporter import OtlpSpanExporter
+from home_assistant_mcp.tracer import Tracer
+
+
+class TestOtlpSpanExporter:
+    """Tests for OtlpSpanExporter."""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_batch(self, httpx_mock: HTTPXMock):
+        """Test that buffered spans are sent as OTLP JSON on shutdown."""
+        httpx_mock.add_response(url="http://collector:4318/v1/traces", json={})
+        tracer = Tracer([OtlpSpanExporter("http://collector:4318/")])
+
+        with tracer.span("tool ha_get_config", tool="ha_get_config", cached=True):
+            with tracer.span("http GET", status_code=200):
+                pass
+        await tracer.shutdown()
+
+        payload = json.loads(httpx_mock.get_request().content)
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {
+            "stringValue": "home-assistant-mcp"
+        }
+        child, root = resource_spans["scopeSpans"][0]["spans"]
+        assert root["name"] == "tool ha_get_config"
+        assert "parentSpanId" not in root
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["traceId"] == root["traceId"]
+        assert {"key": "status_code", "value": {"intValue": "200"}} in child["attributes"]
+        assert {"key": "cached", "value": {"boolValue": True}} in root["attributes"]
+        assert root["status"] == {"code": 1}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_immediately(self, httpx_mock: HTTPXMock):
+        """Test that reaching the batch size triggers an export."""
+        httpx_mock.add_response(url="http://collector:4318/v1/traces", json={})
+        exporter = OtlpSpanExporter("http://collector:4318", batch_size=2)
+        tracer = Tracer([exporter])
+
+        for name in ("a", "b"):
+            with tracer.span(name):
+                pass
+        await exporter.shutdown()
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 1
+        assert len(json.loads(requests[0].content)["resourceSpans"][0]["scopeSpans"][0]["spans"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_export_is_dropped(self, httpx_mock: HTTPXMock):
+        """Test that collector errors do not propagate."""
+        httpx_mock.add_response(url="http://collector:4318/v1/traces", status_code=503)
+        exporter = OtlpSpanExporter("http://collector:4318")
+        exporter.export(
+            {
+                "trace_id": "0" * 32,
+                "span_id": "1" * 16,
+                "parent_id": None,
+                "name": "failing",
+                "start_time_ns": 1,
+                "end_time_ns": 2,
+                "attributes": {},
+                "error": "HomeAssistantError: boom",
+            }
+        )
+
+        await exporter.shutdown()
@@ -0,0 +1,90 @@
+"""Unit tests for the output page store."""
+
+import json
+from unittest.mock import patch
+
+from home_assistant_mcp.output_pages import OutputPages
+
+
+def _items(count: int) -> list[str]:
+    return [json.dumps({"n": n, "name": "x" * 40}) for n in range(count)]
+
+
+class TestOutputPages:
+    """Tests for OutputPages."""
+
+    def test_fits_within_budget(self):
+        """Test that outputs are measured against the byte budget."""
+        pages = OutputPages(max_bytes=20)
+
+        assert pages.fits("Header:", "0123456789")
+        assert not pages.fits("Header:", "0123456789abcdef")
+        assert OutputPages(max_bytes=0).fits("Header:", "x" * 100000)
+
+    def test_pages_cover_every_item_once(self):
+        """Test that following continuation tokens yields every item in order."""
+        pages = OutputPages(max_bytes=600)
+        text = pages.paginate("Found 50 items:", _items(50), as_list=True)
+
+        seen = []
+        while True:
+            lines = text.split("\n")
+            assert lines[0] == "Found 50 items:"
+            seen.extend(item["n"] for item in json.loads("\n".join(lines[1:-1])))
+            if "continuation" not in lines[-1]:
+                break
+            text = pages.page(lines[-1].split('"')[3])
+
+        assert seen == list(range(50))
+        assert "Showing items" in lines[-1]
+
+    def test_oversized_item_gets_its_own_page(self):
+        """Test that a single item above the budget still makes progress."""
+        pages = OutputPages(max_bytes=100)
+        text = pages.paginate("", ['"' + "x" * 500 + '"', '"y"'], as_list=True)
+
+        assert "Showing items 1-1 of 2." in text
+        assert pages.page(text.split('"')[-2]).endswith("Showing items 2-2 of 2.")
+
+    def test_line_pages(self):
+        """Test that non-list outputs are cut between lines."""
+        pages = OutputPages(max_bytes=300)
+        lines = [f'  "key_{n}": "value",' for n in range(40)]
+        text = pages.paginate("", lines, as_list=False)
+
+        assert text.startswith('  "key_0": "value",')
+        assert "Showing lines 1-" in text
+
+    def test_unknown_or_expired_token(self):
+        """Test that stale tokens are rejected."""
+        pages = OutputPages(max_bytes=200, ttl=10)
+        text = pages.paginate("", _items(20), as_list=True)
+        token = text.split('"')[-2]
+
+        assert pages.page("nope-1") is None
+        assert pages.page(token.split("-")[0] + "-999") is None
+        with patch("home_assistant_mcp.output_pages.time.monotonic", return_value=1e12):
+            assert pages.page(token) is None
+        assert len(pages) == 0
+
+    def test_oldest_output_is_evicted(self):
+        """Test that the store is bounded."""
+        pages = OutputPages(max_bytes=200, max_entries=2)
+        first = pages.paginate("", _items(20), as_list=True).split('"')[-2]
+        pages.paginate("", _items(20), as_list=True)
+        pages.paginate("", _items(20), as_list=True)
+
+        assert len(pages) == 2
+        assert pages.page(first) is None
+
+    def test_configure_with_token_budget(self):
+        """Test that the smaller of the byte and token budgets applies."""
+        pages = OutputPages()
+
+        pages.configure(65536, max_tokens=1000, ttl=60)
+        assert pages.max_bytes == 4000
+        assert pages.ttl == 60
+        pages.configure(0, max_tokens=1000)
+        assert pages.max_bytes == 4000
+        pages.configure(2000, max_tokens=1000)
+        assert pages.max_bytes == 2000
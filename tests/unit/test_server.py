@@ -1,50 +1,61 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from home_assistant_mcp.server import get_client, list_tools, call_tool
+from mcp.types import TextContent
+
+import home_assistant_mcp.server as server_module
+from home_assistant_mcp.server import get_client, get_scheduler, get_tool_cache, list_tools, call_tool
+from home_assistant_mcp.tools import TOOLS_CACHE_TTL, TOOLS_LIST, TOOLS_MAP, TOOLS_PRIORITY
+from home_assistant_mcp.tools.tool_priority import ToolPriority
+from home_assistant_mcp.tools.utils import BYPASS_CACHE_ARG, BYPASS_CACHE_PROPERTY
 from home_assistant_mcp.client import HomeAssistantClient, HomeAssistantError
+from home_assistant_mcp.client_pool import ClientPool
 from home_assistant_mcp.config import HomeAssistantConfig
+from home_assistant_mcp.metrics_registry import MetricsRegistry
+from home_assistant_mcp.models import ApiStatus
+from home_assistant_mcp.server_config import ServerConfig
+from home_assistant_mcp.tool_profiler import ToolProfiler
+from home_assistant_mcp.tracer import Tracer
 
 
 class TestGetClient:
     """Tests for get_client function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_pool(self):
+        """Start every test without a client pool."""
+        server_module._pool = None
+        yield
+        server_module._pool = None
+
     def test_get_client_creates_instance(self):
         """Test that get_client creates a client instance."""
-        # Reset global state
-        import home_assistant_mcp.server as server_module
-
-        server_module._client = None
-        server_module._config = None
-
-        with patch("home_assistant_mcp.server.load_config") as mock_load_config:
+        with patch("home_assistant_mcp.server.load_instance_configs") as mock_load_configs:
             mock_config = HomeAssistantConfig(
                 url="http://localhost:8123",
                 token="test_token",
                 verify_ssl=False,
                 timeout=10.0,
             )
-            mock_load_config.return_value = mock_config
+            mock_load_configs.return_value = {"default": mock_config}
 
             client = get_client()
 
             assert isinstance(client, HomeAssistantClient)
-            mock_load_config.assert_called_once()
+            mock_load_configs.assert_called_once()
 
     def test_get_client_reuses_instance(self):
         """Test that get_client reuses existing instance."""
-        import home_assistant_mcp.server as server_module
-
-        # Create initial client
         mock_config = HomeAssistantConfig(
             url="http://localhost:8123",
             token="test_token",
             verify_ssl=False,
             timeout=10.0,
         )
-        server_module._config = mock_config
-        server_module._client = HomeAssistantClient(mock_config)
-        first_client = server_module._client
+        server_module._pool = ClientPool({"default": mock_config})
+        first_client = get_client()
 
         # Get client again
         second_client = get_client()
@@ -52,6 +63,21 @@ class TestGetClient:
         # Should be the same instance
         assert second_client is first_client
 
+    def test_get_client_per_instance(self):
+        """Test that every instance gets its own client."""
+        server_module._pool = ClientPool(
+            {
+                "house": HomeAssistantConfig(url="http://house:8123", token="a"),
+                "lab": HomeAssistantConfig(url="http://lab:8123", token="b"),
+            }
+        )
+
+        assert get_client().config.url == "http://house:8123"
+        assert get_client("lab").config.url == "http://lab:8123"
+        assert get_client("lab") is get_client("lab")
+        with pytest.raises(HomeAssistantError, match="Unknown Home Assistant instance 'office'"):
+            get_client("office")
+
 
 class TestListTools:
     """Tests for list_tools handler."""
@@ -99,6 +125,24 @@ class TestListTools:
         assert "ha_delete_dashboard" in tool_names
 
 
+class TestToolPriorities:
+    """Tests for tool priority registration."""
+
+    def test_every_tool_has_priority(self):
+        """Test that every registered tool declares a priority class."""
+        assert set(TOOLS_PRIORITY) == set(TOOLS_MAP)
+        assert all(isinstance(p, ToolPriority) for p in TOOLS_PRIORITY.values())
+
+    def test_priority_classes(self):
+        """Test that control, metadata and bulk tools are classified."""
+        assert TOOLS_PRIORITY["ha_turn_off"] == ToolPriority.CONTROL
+        assert TOOLS_PRIORITY["ha_call_service"] == ToolPriority.CONTROL
+        assert TOOLS_PRIORITY["ha_get_config"] == ToolPriority.METADATA
+        assert TOOLS_PRIORITY["ha_list_entities"] == ToolPriority.BULK
+        assert TOOLS_PRIORITY["ha_get_history"] == ToolPriority.BULK
+        assert TOOLS_PRIORITY["ha_fire_events"] == ToolPriority.BULK
+
+
 class TestCallTool:
     """Tests for call_tool handler."""
 
@@ -204,3 +248,475 @@ class TestCallTool:
                 result = await call_tool("test_tool", {})
 
                 assert "Internal error" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_call_tool_runs_in_priority_slot(self):
+        """Test that a tool executes while holding its priority class slot."""
+        seen_stats = {}
+
+        async def record_stats(client, args):
+            seen_stats.update(get_scheduler().stats())
+            return []
+
+        with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+            with patch.dict(TOOLS_MAP, {"ha_turn_off": record_stats}):
+                await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        assert seen_stats["control"]["running"] == 1
+        assert seen_stats["bulk"]["running"] == 0
+
+
+class TestToolResultCaching:
+    """Tests for tool result caching in call_tool."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        """Use an empty cache for every test."""
+        server_module._tool_cache = None
+        yield
+        server_module._tool_cache = None
+
+    @pytest.fixture
+    def mock_client(self) -> AsyncMock:
+        """Create a mock client that records event subscriptions."""
+        client = AsyncMock(spec=HomeAssistantClient)
+        client.subscribe_events = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_read_tool_result_is_cached(self, mock_client: AsyncMock):
+        """Test that a cacheable tool runs once for repeated calls."""
+        tool = AsyncMock(return_value=["areas"])
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(TOOLS_MAP, {"ha_list_areas": tool}):
+                first = await call_tool("ha_list_areas", {})
+                second = await call_tool("ha_list_areas", {})
+
+        assert first == second == ["areas"]
+        tool.assert_called_once()
+        assert get_tool_cache().stats()["hits"] == 1
+
+    def test_cached_tools_accept_bypass_cache(self):
+        """Test that every cached tool, and only those, advertises bypass_cache."""
+        advertised = {
+            tool.name for tool in TOOLS_LIST if tool.inputSchema["properties"].get(BYPASS_CACHE_ARG) is BYPASS_CACHE_PROPERTY
+        }
+        assert advertised == set(TOOLS_CACHE_TTL)
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache_argument(self, mock_client: AsyncMock):
+        """Test that bypass_cache forces execution and is not passed to the tool."""
+        tool = AsyncMock(return_value=["areas"])
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(TOOLS_MAP, {"ha_list_areas": tool}):
+                await call_tool("ha_list_areas", {})
+                await call_tool("ha_list_areas", {"bypass_cache": True})
+
+        assert tool.call_count == 2
+        assert tool.call_args[0][1] == {}
+
+    @pytest.mark.asyncio
+    async def test_write_tool_invalidates_cache(self, mock_client: AsyncMock):
+        """Test that dashboard writes invalidate cached dashboard listings."""
+        list_tool = AsyncMock(return_value=["dashboards"])
+        create_tool = AsyncMock(return_value=["created"])
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(
+                TOOLS_MAP, {"ha_list_dashboards": list_tool, "ha_create_dashboard": create_tool}
+            ):
+                await call_tool("ha_list_dashboards", {})
+                await call_tool("ha_create_dashboard", {"url_path": "x", "title": "X"})
+                await call_tool("ha_list_dashboards", {})
+
+        assert list_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_racing_write_is_not_cached(self, mock_client: AsyncMock):
+        """Test that a listing overtaken by a write is not cached."""
+        listing = asyncio.Event()
+        created = asyncio.Event()
+
+        async def list_dashboards(client, args):
+            listing.set()
+            await created.wait()
+            return ["before create"]
+
+        async def create_dashboard(client, args):
+            created.set()
+            return ["created"]
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(
+                TOOLS_MAP, {"ha_list_dashboards": list_dashboards, "ha_create_dashboard": create_dashboard}
+            ):
+                read = asyncio.create_task(call_tool("ha_list_dashboards", {}))
+                await listing.wait()
+                await call_tool("ha_create_dashboard", {"url_path": "x", "title": "X"})
+                assert await read == ["before create"]
+
+        assert get_tool_cache().get("ha_list_dashboards", {}) is None
+
+    @pytest.mark.asyncio
+    async def test_subscribes_before_first_execution(self, mock_client: AsyncMock):
+        """Test that invalidation events are subscribed before the first result is fetched."""
+        subscribed_before_run = []
+
+        async def list_areas(client, args):
+            subscribed_before_run.append(mock_client.subscribe_events.await_count > 0)
+            return ["areas"]
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(TOOLS_MAP, {"ha_list_areas": list_areas}):
+                await call_tool("ha_list_areas", {})
+
+        assert subscribed_before_run == [True]
+
+    @pytest.mark.asyncio
+    async def test_control_tool_is_never_cached(self, mock_client: AsyncMock):
+        """Test that tools without CACHE_TTL always execute."""
+        tool = AsyncMock(return_value=["ok"])
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                await call_tool("ha_turn_off", {"entity_id": "light.x"})
+                await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        assert tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_event_invalidates_cache(self, mock_client: AsyncMock):
+        """Test that a subscribed Home Assistant event drops stale results."""
+        tool = AsyncMock(return_value=["areas"])
+
+        with patch("home_assistant_mcp.server.get_client", return_value=mock_client):
+            with patch.dict(TOOLS_MAP, {"ha_list_areas": tool}):
+                await call_tool("ha_list_areas", {})
+
+                callbacks = {
+                    call.args[0]: call.args[1] for call in mock_client.subscribe_events.call_args_list
+                }
+                callbacks["area_registry_updated"]({"event_type": "area_registry_updated"})
+
+                await call_tool("ha_list_areas", {})
+
+        assert tool.call_count == 2
+        mock_client.add_event_reconnect_listener.assert_called_once()
+
+
+class TestToolMetrics:
+    """Tests for tool metrics recorded by call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_successful_call_is_recorded(self):
+        """Test that latency and payload size are recorded per tool."""
+        registry = MetricsRegistry()
+        tool = AsyncMock(return_value=[TextContent(type="text", text="done")])
+
+        with patch("home_assistant_mcp.server.METRICS", registry):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                    await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        snapshot = registry.snapshot()
+        duration = snapshot["histograms"]["ha_mcp_tool_duration_seconds"][0]
+        assert duration["labels"] == {"tool": "ha_turn_off"}
+        assert duration["count"] == 1
+        assert snapshot["histograms"]["ha_mcp_tool_response_bytes"][0]["sum"] == 4
+        assert "ha_mcp_tool_errors_total" not in snapshot["counters"]
+
+    @pytest.mark.asyncio
+    async def test_error_is_counted(self):
+        """Test that tool errors are counted by exception type."""
+        registry = MetricsRegistry()
+        tool = AsyncMock(side_effect=HomeAssistantError("boom"))
+
+        with patch("home_assistant_mcp.server.METRICS", registry):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                    await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        assert registry.snapshot()["counters"]["ha_mcp_tool_errors_total"] == [
+            {"labels": {"tool": "ha_turn_off", "error": "HomeAssistantError"}, "value": 1.0}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_is_not_recorded(self):
+        """Test that arbitrary tool names do not create metric series."""
+        registry = MetricsRegistry()
+
+        with patch("home_assistant_mcp.server.METRICS", registry):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                await call_tool("no_such_tool", {})
+
+        assert registry.snapshot()["histograms"] == {}
+
+
+class TestToolTracing:
+    """Tests for tracing spans created by call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_creates_root_span(self):
+        """Test that each tool call is the root of its own trace."""
+        spans: list[dict] = []
+        tracer = Tracer([AsyncMock(export=spans.append)])
+        tool = AsyncMock(return_value=[TextContent(type="text", text="done")])
+
+        with patch("home_assistant_mcp.server.TRACER", tracer):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                    await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        [span] = spans
+        assert span["name"] == "tool ha_turn_off"
+        assert span["parent_id"] is None
+        assert span["attributes"] == {"tool": "ha_turn_off"}
+        assert span["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_tool_error_is_recorded_on_span(self):
+        """Test that handled tool errors mark the span as failed."""
+        spans: list[dict] = []
+        tracer = Tracer([AsyncMock(export=spans.append)])
+        tool = AsyncMock(side_effect=HomeAssistantError("boom"))
+
+        with patch("home_assistant_mcp.server.TRACER", tracer):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                    await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        assert spans[0]["error"] == "HomeAssistantError: Home Assistant error: boom"
+
+    def test_span_exporters_from_config(self, tmp_path):
+        """Test that exporters are built from the server configuration."""
+        config = ServerConfig(
+            trace_file=str(tmp_path / "spans.jsonl"), trace_otlp_endpoint="http://collector:4318"
+        )
+
+        exporters = server_module._build_span_exporters(config)
+
+        assert [type(exporter).__name__ for exporter in exporters] == [
+            "JsonlSpanExporter",
+            "OtlpSpanExporter",
+        ]
+        assert server_module._build_span_exporters(ServerConfig()) == []
+
+
+class TestToolProfiling:
+    """Tests for the profiling hook in call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_selected_tool_is_profiled(self, tmp_path):
+        """Test that a selected tool call writes a profile dump."""
+        profiler = ToolProfiler(tmp_path, tools=["ha_turn_off"])
+        tool = AsyncMock(return_value=[TextContent(type="text", text="done")])
+
+        with patch("home_assistant_mcp.server.get_profiler", return_value=profiler):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool, "ha_toggle": tool}):
+                    await call_tool("ha_turn_off", {"entity_id": "light.x"})
+                    await call_tool("ha_toggle", {"entity_id": "light.x"})
+
+        assert [path.name.endswith("-ha_turn_off.prof") for path in tmp_path.glob("*.prof")] == [True]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_is_not_profiled(self, tmp_path):
+        """Test that unknown tool names never produce dumps."""
+        profiler = ToolProfiler(tmp_path, sample_rate=1.0)
+
+        with patch("home_assistant_mcp.server.get_profiler", return_value=profiler):
+            with patch("home_assistant_mcp.server.get_client", return_value=AsyncMock()):
+                await call_tool("no_such_tool", {})
+
+        assert list(tmp_path.glob("*.prof")) == []
+
+
+class TestPrewarm:
+    """Tests for the startup pre-warm."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_state(self):
+        """Use a fresh client pool and cache for every test."""
+        server_module._pool = None
+        server_module._tool_cache = None
+        yield
+        server_module._pool = None
+        server_module._tool_cache = None
+
+    @pytest.fixture
+    def client(self):
+        """Install a single-instance pool whose client is a mock."""
+        client = AsyncMock(spec=HomeAssistantClient)
+        server_module._pool = ClientPool({"default": HomeAssistantConfig(url="http://localhost:8123", token="t")})
+        with patch.object(server_module._pool, "get", return_value=client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_prewarm_opens_connections_and_prefetches(self, client: AsyncMock):
+        """Test that pre-warm warms the client and caches prefetched tool results."""
+        tool = AsyncMock(return_value=["areas"])
+
+        with patch.dict(TOOLS_MAP, {"ha_list_areas": tool}):
+            await server_module.prewarm(ServerConfig(prewarm_tools=["ha_list_areas"]))
+            result = await call_tool("ha_list_areas", {})
+
+        client.warm_up.assert_awaited_once()
+        tool.assert_called_once()
+        assert result == ["areas"]
+
+    @pytest.mark.asyncio
+    async def test_prewarm_warms_every_instance(self):
+        """Test that pre-warm opens the connections of all configured instances."""
+        server_module._pool = ClientPool(
+            {
+                "house": HomeAssistantConfig(url="http://house:8123", token="a"),
+                "lab": HomeAssistantConfig(url="http://lab:8123", token="b"),
+            }
+        )
+
+        with patch.object(HomeAssistantClient, "warm_up", AsyncMock()) as warm_up:
+            await server_module.prewarm(ServerConfig())
+
+        assert warm_up.await_count == 2
+        assert set(server_module._pool.active()) == {"house", "lab"}
+
+    @pytest.mark.asyncio
+    async def test_prewarm_skips_tools_with_required_arguments(self, client: AsyncMock):
+        """Test that only cacheable tools without required arguments are prefetched."""
+        tool = AsyncMock(return_value=["ok"])
+
+        with patch.dict(TOOLS_MAP, {"ha_get_area_entities": tool, "ha_turn_off": tool}):
+            await server_module.prewarm(
+                ServerConfig(prewarm_tools=["ha_get_area_entities", "ha_turn_off"])
+            )
+
+        tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_is_not_fatal(self, client: AsyncMock):
+        """Test that connection errors during pre-warm are only logged."""
+        client.warm_up.side_effect = HomeAssistantError("connection refused")
+        await server_module.prewarm(ServerConfig())
+
+        server_module._pool = None
+        with patch(
+            "home_assistant_mcp.server.load_instance_configs", side_effect=ValueError("HA_URL missing")
+        ):
+            await server_module.prewarm(ServerConfig())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_share_one_client(self):
+        """Test that pre-warm and concurrent first tool calls create a single client."""
+        config = HomeAssistantConfig(url="http://localhost:8123", token="test_token")
+        tool = AsyncMock(return_value=["ok"])
+
+        with patch(
+            "home_assistant_mcp.server.load_instance_configs", return_value={"default": config}
+        ) as load:
+            with patch.object(HomeAssistantClient, "warm_up", AsyncMock()):
+                with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+                    await asyncio.gather(
+                        server_module.prewarm(ServerConfig()),
+                        *(call_tool("ha_turn_off", {"entity_id": "light.x"}) for _ in range(5)),
+                    )
+
+        load.assert_called_once()
+        clients = {call.args[0] for call in tool.call_args_list}
+        assert clients == {server_module._pool.get()}
+
+
+class TestMultipleInstances:
+    """Tests for routing tool calls to several Home Assistant instances."""
+
+    @pytest.fixture(autouse=True)
+    def clients(self):
+        """Install a two-instance pool with mock clients."""
+        clients = {"house": AsyncMock(spec=HomeAssistantClient), "lab": AsyncMock(spec=HomeAssistantClient)}
+        server_module._pool = ClientPool(
+            {
+                "house": HomeAssistantConfig(url="http://house:8123", token="a"),
+                "lab": HomeAssistantConfig(url="http://lab:8123", token="b"),
+            }
+        )
+        server_module._tool_cache = None
+        with patch.object(server_module._pool, "get", side_effect=lambda name=None: clients[name or "house"]):
+            yield clients
+        server_module._pool = None
+        server_module._tool_cache = None
+
+    @pytest.mark.asyncio
+    async def test_tools_accept_instance_argument(self):
+        """Test that every tool advertises the optional instance argument."""
+        tools = await list_tools()
+
+        for tool in tools:
+            assert tool.inputSchema["properties"]["instance"]["enum"] == ["house", "lab"]
+            assert "instance" not in tool.inputSchema.get("required", [])
+
+    @pytest.mark.asyncio
+    async def test_instance_argument_routes_call(self, clients: dict[str, AsyncMock]):
+        """Test that a call runs against the named instance without the routing argument."""
+        tool = AsyncMock(return_value=["ok"])
+
+        with patch.dict(TOOLS_MAP, {"ha_turn_off": tool}):
+            await call_tool("ha_turn_off", {"entity_id": "light.x", "instance": "lab"})
+            await call_tool("ha_turn_off", {"entity_id": "light.x"})
+
+        assert [call.args[0] for call in tool.call_args_list] == [clients["lab"], clients["house"]]
+        assert tool.call_args_list[0].args[1] == {"entity_id": "light.x"}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_instance(self):
+        """Test that cached results of one instance are not served for another."""
+        tool = AsyncMock(side_effect=lambda client, args: [client])
+
+        with patch.dict(TOOLS_MAP, {"ha_list_areas": tool}):
+            house = await call_tool("ha_list_areas", {"instance": "house"})
+            lab = await call_tool("ha_list_areas", {"instance": "lab"})
+
+        assert house != lab
+        assert tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fan_out_tool_queries_all_instances(self, clients: dict[str, AsyncMock]):
+        """Test that fan-out tools merge every instance unless one is named."""
+        for client in clients.values():
+            client.check_api = AsyncMock(return_value=ApiStatus(message="API running."))
+        clients["lab"].check_api.side_effect = HomeAssistantError("unreachable")
+
+        merged = await call_tool("ha_health_check", {})
+        single = await call_tool("ha_health_check", {"instance": "house"})
+
+        assert merged[0].text.startswith("1 of 2 Home Assistant instances running")
+        assert "lab: unreachable" in merged[0].text
+        assert single[0].text == "Home Assistant API is running: API running."
+
+
+class TestCommandLine:
+    """Tests for command line overrides of the server configuration."""
+
+    def test_transport_arguments_override_config(self):
+        """Test selecting the HTTP transport from the command line."""
+        server_module._server_config = ServerConfig(http_port=8000, max_sessions=32)
+        try:
+            server_module._apply_cli_arguments(["--transport", "http", "--port", "9000", "--max-sessions", "4"])
+            config = server_module.get_server_config()
+        finally:
+            server_module._server_config = None
+
+        assert config.transport == "http"
+        assert config.http_port == 9000
+        assert config.max_sessions == 4
+        assert config.http_host == "127.0.0.1"
+
+    def test_no_arguments_keep_config(self):
+        """Test that running without arguments keeps the environment configuration."""
+        original = ServerConfig(transport="http")
+        server_module._server_config = original
+        try:
+            server_module._apply_cli_arguments([])
+            assert server_module.get_server_config() is original
+        finally:
+            server_module._server_config = None
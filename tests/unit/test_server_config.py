@@ -0,0 +1,188 @@
+"""Unit tests for server configuration module."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from home_assistant_mcp.server_config import ServerConfig, load_server_config
+
+
+class TestServerConfig:
+    """Tests for ServerConfig model."""
+
+    def test_default_concurrency(self):
+        """Test default concurrency limits per priority class."""
+        config = ServerConfig()
+        assert config.concurrency_control == 8
+        assert config.concurrency_metadata == 4
+        assert config.concurrency_bulk == 2
+
+    def test_tool_cache_enabled_by_default(self):
+        """Test default tool cache settings."""
+        config = ServerConfig()
+        assert config.tool_cache_enabled is True
+        assert config.tool_cache_max_entries == 256
+
+    def test_zero_concurrency_raises_error(self):
+        """Test that a concurrency limit below 1 is rejected."""
+        with pytest.raises(ValueError):
+            ServerConfig(concurrency_bulk=0)
+
+
+class TestLoadServerConfig:
+    """Tests for load_server_config function."""
+
+    def test_load_concurrency_from_env(self):
+        """Test loading concurrency limits from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_CONCURRENCY_CONTROL": "16",
+                "HA_CONCURRENCY_METADATA": "6",
+                "HA_CONCURRENCY_BULK": "1",
+                "HA_CONCURRENCY_WAIT": "32",
+            },
+        ):
+            config = load_server_config()
+            assert config.concurrency_control == 16
+            assert config.concurrency_metadata == 6
+            assert config.concurrency_bulk == 1
+            assert config.concurrency_wait == 32
+
+    def test_load_tool_cache_from_env(self):
+        """Test disabling the tool cache from environment variables."""
+        with patch.dict(
+            os.environ,
+            {"HA_TOOL_CACHE": "false", "HA_TOOL_CACHE_MAX_ENTRIES": "10"},
+        ):
+            config = load_server_config()
+            assert config.tool_cache_enabled is False
+            assert config.tool_cache_max_entries == 10
+
+    def test_load_metrics_endpoint_from_env(self):
+        """Test enabling the Prometheus endpoint from environment variables."""
+        with patch.dict(os.environ, {"HA_METRICS_PORT": "9464"}):
+            config = load_server_config()
+            assert config.metrics_port == 9464
+            assert config.metrics_host == "127.0.0.1"
+
+    def test_metrics_endpoint_disabled_by_default(self):
+        """Test that the metrics endpoint is off unless a port is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert load_server_config().metrics_port is None
+
+    def test_load_tracing_from_env(self):
+        """Test enabling span exporters from environment variables."""
+        with patch.dict(
+            os.environ,
+            {"HA_TRACE_FILE": "/tmp/spans.jsonl", "HA_TRACE_OTLP_ENDPOINT": "http://collector:4318"},
+        ):
+            config = load_server_config()
+            assert config.trace_file == "/tmp/spans.jsonl"
+            assert config.trace_otlp_endpoint == "http://collector:4318"
+
+    def test_tracing_disabled_by_default(self):
+        """Test that no span exporter is configured unless set."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_server_config()
+            assert config.trace_file is None
+            assert config.trace_otlp_endpoint is None
+
+    def test_load_profiling_from_env(self):
+        """Test enabling tool profiling from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_PROFILE_TOOLS": "ha_list_entities, ha_get_history",
+                "HA_PROFILE_SAMPLE_RATE": "0.05",
+                "HA_PROFILE_DIR": "/tmp/profiles",
+                "HA_PROFILE_TOP_N": "10",
+            },
+        ):
+            config = load_server_config()
+            assert config.profile_tools == ["ha_list_entities", "ha_get_history"]
+            assert config.profile_sample_rate == 0.05
+            assert config.profile_dir == "/tmp/profiles"
+            assert config.profile_top_n == 10
+
+    def test_profiling_disabled_by_default(self):
+        """Test that no tool is profiled unless configured."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_server_config()
+            assert config.profile_tools == []
+            assert config.profile_sample_rate == 0.0
+
+    def test_sample_rate_above_one_raises_error(self):
+        """Test that a sample rate above 1 is rejected."""
+        with pytest.raises(ValueError):
+            ServerConfig(profile_sample_rate=1.5)
+
+    def test_load_prewarm_from_env(self):
+        """Test configuring the startup pre-warm from environment variables."""
+        with patch.dict(
+            os.environ, {"HA_PREWARM": "false", "HA_PREWARM_TOOLS": "ha_get_config, ha_list_areas"}
+        ):
+            config = load_server_config()
+            assert config.prewarm is False
+            assert config.prewarm_tools == ["ha_get_config", "ha_list_areas"]
+
+    def test_load_output_budget_from_env(self):
+        """Test configuring output paging from environment variables."""
+        with patch.dict(
+            os.environ,
+            {"HA_OUTPUT_MAX_BYTES": "0", "HA_OUTPUT_MAX_TOKENS": "8000", "HA_OUTPUT_PAGE_TTL": "60"},
+        ):
+            config = load_server_config()
+            assert config.output_max_bytes == 0
+            assert config.output_max_tokens == 8000
+            assert config.output_page_ttl == 60
+
+    def test_output_budget_defaults(self):
+        """Test that outputs are paged above 64 KiB by default."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_server_config()
+            assert config.output_max_bytes == 65536
+            assert config.output_max_tokens is None
+
+    def test_prewarm_enabled_by_default(self):
+        """Test that connections are pre-warmed without prefetching by default."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = load_server_config()
+            assert config.prewarm is True
+            assert config.prewarm_tools == []
+
+    def test_load_http_transport_from_env(self):
+        """Test selecting the Streamable HTTP transport from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "HA_MCP_TRANSPORT": "HTTP",
+                "HA_MCP_HOST": "0.0.0.0",
+                "HA_MCP_PORT": "9000",
+                "HA_MCP_PATH": "/ha",
+                "HA_MCP_MAX_SESSIONS": "8",
+                "HA_MCP_SESSION_IDLE_TIMEOUT": "600",
+                "HA_MCP_ALLOWED_HOSTS": "ha-mcp.lan:*, 192.168.1.5:8000",
+                "HA_MCP_ALLOWED_ORIGINS": "https://ha-mcp.lan",
+            },
+        ):
+            config = load_server_config()
+            assert config.transport == "http"
+            assert config.http_host == "0.0.0.0"
+            assert config.http_port == 9000
+            assert config.http_path == "/ha"
+            assert config.max_sessions == 8
+            assert config.session_idle_timeout == 600
+            assert config.allowed_hosts == ["ha-mcp.lan:*", "192.168.1.5:8000"]
+            assert config.allowed_origins == ["https://ha-mcp.lan"]
+
+    def test_stdio_transport_by_default(self):
+        """Test that the server uses stdio unless configured otherwise."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert load_server_config().transport == "stdio"
+
+    def test_unknown_transport_raises_error(self):
+        """Test that unsupported transports are rejected."""
+        with pytest.raises(ValueError):
+            ServerConfig(transport="sse")
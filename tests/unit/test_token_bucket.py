@@ -0,0 +1,68 @@
+"""Unit tests for the token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from home_assistant_mcp.token_bucket import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_bucket_never_waits(self):
+        """Test that a rate of 0 disables limiting."""
+        bucket = TokenBucket(0)
+
+        waits = [await bucket.acquire() for _ in range(100)]
+
+        assert bucket.enabled is False
+        assert all(w == 0.0 for w in waits)
+        assert bucket.stats()["acquired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_burst_is_served_immediately(self):
+        """Test that requests within the burst size do not wait."""
+        bucket = TokenBucket(rate=10, burst=5)
+
+        waits = [await bucket.acquire() for _ in range(5)]
+
+        assert max(waits) < 0.05
+        assert bucket.stats()["acquired"] == 5
+
+    @pytest.mark.asyncio
+    async def test_waits_when_bucket_is_empty(self):
+        """Test that callers wait instead of failing once tokens run out."""
+        bucket = TokenBucket(rate=50, burst=1)
+
+        await bucket.acquire()
+        waited = await bucket.acquire()
+
+        assert waited >= 0.015
+        stats = bucket.stats()
+        assert stats["acquired"] == 2
+        assert stats["max_wait"] >= 0.015
+        assert stats["total_wait"] >= stats["max_wait"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_all_served(self):
+        """Test that concurrent callers queue and all eventually get a token."""
+        bucket = TokenBucket(rate=100, burst=2)
+
+        waits = await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+
+        assert len(waits) == 6
+        assert bucket.stats()["acquired"] == 6
+        assert bucket.stats()["waiting"] == 0
+        assert max(waits) >= 0.02
+
+    def test_default_burst(self):
+        """Test default burst is one second of rate, with a minimum of 1."""
+        assert TokenBucket(rate=20).burst == 20
+        assert TokenBucket(rate=0.5).burst == 1.0
+
+    def test_fractional_burst_is_rejected(self):
+        """Test that a burst below one token, which could never be acquired, is rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            TokenBucket(rate=10, burst=0.5)
@@ -0,0 +1,69 @@
+"""Unit tests for the tool profiler."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from home_assistant_mcp.tool_profiler import SUMMARY_FILE, ToolProfiler
+
+
+def busy_function() -> int:
+    return sum(i * i for i in range(2000))
+
+
+class TestToolProfiler:
+    """Tests for ToolProfiler."""
+
+    def test_disabled_by_default(self, tmp_path: Path):
+        """Test that nothing is profiled without tools or sampling."""
+        profiler = ToolProfiler(tmp_path)
+        assert profiler.enabled is False
+        assert profiler.should_profile("ha_list_entities") is False
+
+    def test_selected_tools_are_always_profiled(self, tmp_path: Path):
+        """Test that selected tools are profiled on every call."""
+        profiler = ToolProfiler(tmp_path, tools=["ha_list_entities"])
+        assert profiler.enabled is True
+        assert profiler.should_profile("ha_list_entities") is True
+        assert profiler.should_profile("ha_get_config") is False
+
+    def test_sampling(self, tmp_path: Path):
+        """Test that other calls are profiled with the sample rate."""
+        profiler = ToolProfiler(tmp_path, sample_rate=0.1)
+        with patch("home_assistant_mcp.tool_profiler.random.random", return_value=0.05):
+            assert profiler.should_profile("ha_get_config") is True
+        with patch("home_assistant_mcp.tool_profiler.random.random", return_value=0.5):
+            assert profiler.should_profile("ha_get_config") is False
+
+    def test_profile_writes_dump_and_summary(self, tmp_path: Path):
+        """Test that a profiled call produces a dump and a summary."""
+        profiler = ToolProfiler(tmp_path / "profiles", tools=["ha_list_entities"], top_n=5)
+
+        for _ in range(2):
+            with profiler.profile("ha_list_entities"):
+                busy_function()
+
+        dumps = list((tmp_path / "profiles").glob("*-ha_list_entities.prof"))
+        assert len(dumps) == 2
+        summary = (tmp_path / "profiles" / SUMMARY_FILE).read_text()
+        assert "ha_list_entities: 2" in summary
+        assert "busy_function" in summary
+
+    def test_old_dumps_are_removed(self, tmp_path: Path):
+        """Test that only max_dumps dumps are kept."""
+        profiler = ToolProfiler(tmp_path, tools=["ha_get_config"], max_dumps=2)
+
+        for _ in range(3):
+            with profiler.profile("ha_get_config"):
+                busy_function()
+
+        assert len(list(tmp_path.glob("*.prof"))) == 2
+
+    def test_nested_call_is_not_profiled_twice(self, tmp_path: Path):
+        """Test that a call starting during a profile runs unprofiled."""
+        profiler = ToolProfiler(tmp_path, tools=["outer", "inner"])
+
+        with profiler.profile("outer"):
+            with profiler.profile("inner"):
+                busy_function()
+
+        assert [path.name.endswith("-outer.prof") for path in tmp_path.glob("*.prof")] == [True]
@@ -0,0 +1,92 @@
+"""Unit tests for the tool result cache."""
+
+from unittest.mock import patch
+
+from home_assistant_mcp.tool_result_cache import INVALIDATE_ALL, ToolResultCache
+
+
+class TestToolResultCache:
+    """Tests for ToolResultCache."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored result is returned on the next lookup."""
+        cache = ToolResultCache()
+
+        assert cache.get("ha_list_areas", {}) is None
+        cache.set("ha_list_areas", {}, ["result"], ttl=60)
+
+        assert cache.get("ha_list_areas", {}) == ["result"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_result_from_before_invalidation_is_not_stored(self):
+        """Test that a result computed across an invalidation is dropped."""
+        cache = ToolResultCache()
+        generation = cache.generation
+        cache.invalidate(["ha_list_dashboards"])
+        cache.set("ha_list_dashboards", {}, ["stale"], ttl=60, generation=generation)
+
+        assert cache.get("ha_list_dashboards", {}) is None
+
+        cache.set("ha_list_dashboards", {}, ["fresh"], ttl=60, generation=cache.generation)
+        assert cache.get("ha_list_dashboards", {}) == ["fresh"]
+
+    def test_key_normalizes_arguments(self):
+        """Test that argument order and null values do not change the key."""
+        key_a = ToolResultCache.make_key("tool", {"a": 1, "b": 2, "c": None})
+        key_b = ToolResultCache.make_key("tool", {"b": 2, "a": 1})
+
+        assert key_a == key_b
+
+    def test_different_arguments_are_separate_entries(self):
+        """Test that results are cached per argument set."""
+        cache = ToolResultCache()
+        cache.set("ha_get_dashboard", {"url_path": "a"}, "A", ttl=60)
+        cache.set("ha_get_dashboard", {"url_path": "b"}, "B", ttl=60)
+
+        assert cache.get("ha_get_dashboard", {"url_path": "a"}) == "A"
+        assert cache.get("ha_get_dashboard", {"url_path": "b"}) == "B"
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries expire after their TTL."""
+        cache = ToolResultCache()
+        with patch("home_assistant_mcp.tool_result_cache.time.monotonic", return_value=100.0):
+            cache.set("ha_get_config", {}, "config", ttl=10)
+        with patch("home_assistant_mcp.tool_result_cache.time.monotonic", return_value=111.0):
+            assert cache.get("ha_get_config", {}) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ToolResultCache(max_entries=2)
+        cache.set("a", {}, 1, ttl=60)
+        cache.set("b", {}, 2, ttl=60)
+        cache.get("a", {})
+        cache.set("c", {}, 3, ttl=60)
+
+        assert cache.get("a", {}) == 1
+        assert cache.get("b", {}) is None
+        assert cache.get("c", {}) == 3
+
+    def test_invalidate_by_tool_name(self):
+        """Test invalidating the entries of specific tools."""
+        cache = ToolResultCache()
+        cache.set("ha_list_dashboards", {}, 1, ttl=60)
+        cache.set("ha_get_dashboard", {"url_path": "x"}, 2, ttl=60)
+        cache.set("ha_get_config", {}, 3, ttl=60)
+
+        removed = cache.invalidate(["ha_list_dashboards", "ha_get_dashboard"])
+
+        assert removed == 2
+        assert cache.get("ha_get_config", {}) == 3
+
+    def test_invalidate_all(self):
+        """Test that None or '*' clears the whole cache."""
+        cache = ToolResultCache()
+        cache.set("a", {}, 1, ttl=60)
+        cache.set("b", {}, 2, ttl=60)
+
+        assert cache.invalidate([INVALIDATE_ALL]) == 2
+        cache.set("a", {}, 1, ttl=60)
+        assert cache.invalidate() == 1
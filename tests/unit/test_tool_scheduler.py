@@ -0,0 +1,83 @@
+"""Unit tests for the priority-aware tool scheduler."""
+
+import asyncio
+
+import pytest
+
+from home_assistant_mcp.tool_scheduler import ToolScheduler
+from home_assistant_mcp.tools.tool_priority import ToolPriority
+
+
+@pytest.fixture
+def scheduler() -> ToolScheduler:
+    """Create a scheduler with one bulk slot."""
+    return ToolScheduler(
+        {
+            ToolPriority.CONTROL: 2,
+            ToolPriority.METADATA: 2,
+            ToolPriority.BULK: 1,
+        }
+    )
+
+
+class TestToolScheduler:
+    """Tests for ToolScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_slot_tracks_running(self, scheduler: ToolScheduler):
+        """Test that a held slot is reported as running."""
+        async with scheduler.slot(ToolPriority.CONTROL):
+            assert scheduler.stats()["control"]["running"] == 1
+
+        assert scheduler.stats()["control"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_class_limit_queues_excess_calls(self, scheduler: ToolScheduler):
+        """Test that calls beyond a class limit wait for a free slot."""
+        release = asyncio.Event()
+
+        async def bulk_call():
+            async with scheduler.slot(ToolPriority.BULK):
+                await release.wait()
+
+        first = asyncio.create_task(bulk_call())
+        second = asyncio.create_task(bulk_call())
+        await asyncio.sleep(0)
+
+        stats = scheduler.stats()["bulk"]
+        assert stats["running"] == 1
+        assert stats["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert scheduler.stats()["bulk"] == {"limit": 1, "running": 0, "waiting": 0}
+
+    @pytest.mark.asyncio
+    async def test_control_not_blocked_by_bulk(self, scheduler: ToolScheduler):
+        """Test that a saturated bulk class does not delay control calls."""
+        release = asyncio.Event()
+
+        async def bulk_call():
+            async with scheduler.slot(ToolPriority.BULK):
+                await release.wait()
+
+        bulk_tasks = [asyncio.create_task(bulk_call()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        async with scheduler.slot(ToolPriority.CONTROL):
+            assert scheduler.stats()["control"]["running"] == 1
+            assert scheduler.stats()["bulk"]["waiting"] == 2
+
+        release.set()
+        await asyncio.gather(*bulk_tasks)
+
+    @pytest.mark.asyncio
+    async def test_slot_released_on_error(self, scheduler: ToolScheduler):
+        """Test that an exception inside the slot frees it."""
+        with pytest.raises(RuntimeError):
+            async with scheduler.slot(ToolPriority.BULK):
+                raise RuntimeError("boom")
+
+        assert scheduler.stats()["bulk"]["running"] == 0
+        async with scheduler.slot(ToolPriority.BULK):
+            pass
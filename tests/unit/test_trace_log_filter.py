@@ -0,0 +1,39 @@
+"""Unit tests for the trace log filter."""
+
+import logging
+
+from home_assistant_mcp.trace_log_filter import TraceLogFilter
+from home_assistant_mcp.tracer import Tracer
+
+
+class NullExporter:
+    """Exporter discarding every span."""
+
+    def export(self, span: dict) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def make_record() -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+
+
+class TestTraceLogFilter:
+    """Tests for TraceLogFilter."""
+
+    def test_record_outside_span(self):
+        """Test that records outside a span get a placeholder."""
+        record = make_record()
+        assert TraceLogFilter().filter(record) is True
+        assert record.trace_id == "-"
+
+    def test_record_inside_span(self):
+        """Test that records inside a span carry its trace ID."""
+        tracer = Tracer([NullExporter()])
+        with tracer.span("work") as span:
+            record = make_record()
+            TraceLogFilter().filter(record)
+
+        assert record.trace_id == span.trace_id
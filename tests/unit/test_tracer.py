@@ -0,0 +1,117 @@
+"""Unit tests for the tracer and spans."""
+
+import asyncio
+
+import pytest
+
+from home_assistant_mcp.span import current_span
+from home_assistant_mcp.tracer import Tracer, current_trace_id
+
+
+class ListExporter:
+    """Exporter collecting spans in memory."""
+
+    def __init__(self):
+        self.spans: list[dict] = []
+        self.shut_down = False
+
+    def export(self, span: dict) -> None:
+        self.spans.append(span)
+
+    async def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class TestTracer:
+    """Tests for Tracer and Span."""
+
+    def test_disabled_tracer_yields_none(self):
+        """Test that spans are no-ops without exporters."""
+        tracer = Tracer()
+        assert tracer.enabled is False
+        with tracer.span("noop") as span:
+            assert span is None
+            assert current_trace_id() is None
+
+    def test_span_is_exported_with_attributes(self):
+        """Test that a finished span is exported with its attributes."""
+        exporter = ListExporter()
+        tracer = Tracer([exporter])
+
+        with tracer.span("tool ha_get_config", tool="ha_get_config") as span:
+            span.set_attribute("cache_hit", False)
+
+        [exported] = exporter.spans
+        assert exported["name"] == "tool ha_get_config"
+        assert exported["attributes"] == {"tool": "ha_get_config", "cache_hit": False}
+        assert exported["parent_id"] is None
+        assert len(exported["trace_id"]) == 32
+        assert exported["end_time_ns"] >= exported["start_time_ns"]
+        assert exported["error"] is None
+
+    def test_child_spans_share_trace(self):
+        """Test that nested spans inherit the trace and point to their parent."""
+        exporter = ListExporter()
+        tracer = Tracer([exporter])
+
+        with tracer.span("root") as root:
+            assert current_trace_id() == root.trace_id
+            with tracer.span("child"):
+                pass
+
+        child, parent = exporter.spans
+        assert child["trace_id"] == parent["trace_id"]
+        assert child["parent_id"] == parent["span_id"]
+        assert current_span.get() is None
+
+    def test_exception_marks_span_failed(self):
+        """Test that an escaping exception is recorded on the span."""
+        exporter = ListExporter()
+        tracer = Tracer([exporter])
+
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("bad")
+
+        assert exporter.spans[0]["error"] == "ValueError: bad"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_separate_traces(self):
+        """Test that spans in concurrent tasks do not leak into each other."""
+        exporter = ListExporter()
+        tracer = Tracer([exporter])
+
+        async def run(name: str) -> None:
+            with tracer.span(name):
+                await asyncio.sleep(0)
+                with tracer.span(f"{name}.child"):
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(run("a"), run("b"))
+
+        by_name = {span["name"]: span for span in exporter.spans}
+        assert by_name["a.child"]["parent_id"] == by_name["a"]["span_id"]
+        assert by_name["b.child"]["parent_id"] == by_name["b"]["span_id"]
+        assert by_name["a"]["trace_id"] != by_name["b"]["trace_id"]
+
+    def test_failing_exporter_does_not_raise(self):
+        """Test that export errors are contained."""
+
+        class BrokenExporter(ListExporter):
+            def export(self, span: dict) -> None:
+                raise RuntimeError("disk full")
+
+        exporter = ListExporter()
+        tracer = Tracer([BrokenExporter(), exporter])
+
+        with tracer.span("work"):
+            pass
+
+        assert len(exporter.spans) == 1
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_exporters(self):
+        """Test that shutdown reaches every exporter."""
+        exporter = ListExporter()
+        await Tracer([exporter]).shutdown()
+        assert exporter.shut_down is True
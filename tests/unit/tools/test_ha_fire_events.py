@@ -0,0 +1,44 @@
+"""Unit tests for ha_fire_events tool."""
+
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.models import FireEventsResult
+from home_assistant_mcp.tools.ha_fire_events import MAX_EVENTS, TOOL_DEF, execute
+
+
+class TestFireEventsTool:
+    """Tests for ha_fire_events tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_fire_events"
+        assert TOOL_DEF.inputSchema["required"] == ["events"]
+
+    async def test_execute_fires_batch(self):
+        """Test that events are passed to the client in order."""
+        mock_client = AsyncMock()
+        mock_client.fire_events.return_value = FireEventsResult(
+            fired=1,
+            failed=1,
+            elapsed_seconds=0.01,
+            events_per_second=100.0,
+            errors=[{"index": 1, "event_type": "b", "error": "Invalid"}],
+        )
+
+        result = await execute(
+            mock_client,
+            {"events": [{"event_type": "a", "event_data": {"n": 1}}, {"event_type": "b"}], "window": 5},
+        )
+
+        assert "Fired 1 of 2 events (100 events/s)" in result[0].text
+        assert '"error": "Invalid"' in result[0].text
+        mock_client.fire_events.assert_called_once_with([("a", {"n": 1}), ("b", None)], window=5)
+
+    async def test_execute_too_many_events(self):
+        """Test that oversized batches are refused."""
+        mock_client = AsyncMock()
+
+        result = await execute(mock_client, {"events": [{"event_type": "a"}] * (MAX_EVENTS + 1)})
+
+        assert "Too many events" in result[0].text
+        mock_client.fire_events.assert_not_called()
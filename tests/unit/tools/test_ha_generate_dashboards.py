@@ -0,0 +1,98 @@
+"""Unit tests for ha_generate_dashboards tool."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
+from home_assistant_mcp.models import Dashboard, EntityState
+from home_assistant_mcp.tools.ha_generate_dashboards import TOOL_DEF, execute
+
+
+@pytest.fixture
+def mock_client() -> AsyncMock:
+    client = AsyncMock()
+    client.get_area_assignments.return_value = (
+        {"living_room": "Living Room", "kitchen": "Kitchen", "garage": "Garage"},
+        {
+            "light.sofa": "living_room",
+            "light.ceiling": "living_room",
+            "climate.living_room": "living_room",
+            "sensor.kitchen_temp": "kitchen",
+            "switch.kettle": "kitchen",
+        },
+    )
+    client.get_states.return_value = [
+        EntityState(entity_id=entity_id, state="on")
+        for entity_id in ("light.sofa", "light.ceiling", "climate.living_room", "sensor.kitchen_temp",
+                          "switch.kettle", "light.hallway")
+    ]
+    client.list_dashboards.return_value = [Dashboard(id="area_kitchen", url_path="area-kitchen", title="Kitchen")]
+    client.create_dashboards.side_effect = lambda specs: [Dashboard(id=s["url_path"], **s) for s in specs]
+    client.save_dashboard_configs.side_effect = lambda configs: {path: None for path in configs}
+    return client
+
+
+class TestGenerateDashboardsTool:
+    """Tests for ha_generate_dashboards tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_generate_dashboards"
+        assert TOOL_DEF.inputSchema["required"] == []
+
+    async def test_dry_run_builds_cards_per_domain(self, mock_client: AsyncMock):
+        """Test that views group entities by domain in a fixed order."""
+        result = await execute(mock_client, {"url_path": "home-areas", "dry_run": True})
+
+        configs = json.loads(result[0].text.split("\n", 1)[1])
+        views = configs["home-areas"]["views"]
+        assert [view["title"] for view in views] == ["Kitchen", "Living Room"]
+        assert views[1]["cards"] == [
+            {"type": "entities", "title": "Lights", "entities": ["light.ceiling", "light.sofa"]},
+            {"type": "thermostat", "entity": "climate.living_room"},
+        ]
+        assert [card["title"] for card in views[0]["cards"]] == ["Switches", "Sensors"]
+        mock_client.save_dashboard_configs.assert_not_called()
+
+    async def test_dashboard_per_area(self, mock_client: AsyncMock):
+        """Test that missing dashboards are created and all are saved in one batch."""
+        result = await execute(mock_client, {})
+
+        assert "Saved 2 of 2 dashboards (2 area views)" in result[0].text
+        created = mock_client.create_dashboards.call_args.args[0]
+        assert [spec["url_path"] for spec in created] == ["area-living-room"]
+        saved = mock_client.save_dashboard_configs.call_args.args[0]
+        assert set(saved) == {"area-kitchen", "area-living-room"}
+
+    async def test_selected_areas_and_domains(self, mock_client: AsyncMock):
+        """Test filtering by area name and domain."""
+        result = await execute(
+            mock_client, {"areas": ["living room"], "domains": ["light"], "url_path": "lights-only", "dry_run": True}
+        )
+
+        views = json.loads(result[0].text.split("\n", 1)[1])["lights-only"]["views"]
+        assert len(views) == 1
+        assert [card["title"] for card in views[0]["cards"]] == ["Lights"]
+
+    async def test_unknown_area(self, mock_client: AsyncMock):
+        """Test that unknown areas are reported."""
+        result = await execute(mock_client, {"areas": ["attic"]})
+
+        assert result[0].text == "Unknown areas: attic"
+
+    async def test_save_errors_are_reported(self, mock_client: AsyncMock):
+        """Test that a failed save is listed per dashboard."""
+        mock_client.save_dashboard_configs.side_effect = lambda configs: {
+            path: HomeAssistantError("Simulated failure") if path == "area-kitchen" else None for path in configs
+        }
+
+        result = await execute(mock_client, {})
+
+        assert "Saved 1 of 2 dashboards" in result[0].text
+        rows = json.loads(result[0].text.split("\n", 1)[1])
+        assert rows[0] == {
+            "url_path": "area-kitchen", "title": "Kitchen", "views": 1, "cards": 2,
+            "created": False, "error": "Simulated failure",
+        }
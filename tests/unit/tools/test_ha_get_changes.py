@@ -0,0 +1,63 @@
+"""Unit tests for ha_get_changes tool."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.change_log import ChangeLog, encode_cursor
+from home_assistant_mcp.models import EntityState
+from home_assistant_mcp.tools.ha_get_changes import TOOL_DEF, execute
+
+
+def parse(result) -> tuple[str, str, list[dict]]:
+    """Split a tool result into its summary, cursor and rows."""
+    summary, cursor_line, *rest = result[0].text.split("\n", 2)
+    return summary, cursor_line.removeprefix("Cursor: "), json.loads(rest[0]) if rest else []
+
+
+class TestGetChangesTool:
+    """Tests for ha_get_changes tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_get_changes"
+        assert TOOL_DEF.inputSchema["required"] == []
+        assert {"cursor", "domain"} <= set(TOOL_DEF.inputSchema["properties"])
+
+    async def test_changes_from_the_log(self):
+        """Test that later calls return only logged changes."""
+        log = ChangeLog()
+        client = AsyncMock()
+        client.get_change_log.return_value = log
+
+        summary, cursor, _ = parse(await execute(client, {}))
+        log.record("light.desk", {"entity_id": "light.desk", "state": "on", "attributes": {"brightness": 90}})
+        log.record("sensor.gone", None)
+        log.record("switch.fan", {"entity_id": "switch.fan", "state": "off", "attributes": {}})
+        summary, next_cursor, rows = parse(await execute(client, {"cursor": cursor, "domain": "light"}))
+
+        assert summary == "1 entities changed."
+        assert rows == [{"entity_id": "light.desk", "state": "on", "attributes": {"brightness": 90}, "last_updated": None}]
+        assert parse(await execute(client, {"cursor": next_cursor}))[0] == "0 entities changed."
+        client.get_states.assert_not_called()
+
+    async def test_fallback_compares_last_updated(self):
+        """Test answering from a full state read when no log is available."""
+        client = AsyncMock()
+        client.get_change_log.return_value = None
+        client.get_states.return_value = [
+            EntityState(entity_id="light.old", state="on", last_updated="2024-01-15T10:00:00+00:00"),
+            EntityState(entity_id="light.new", state="off", last_updated="2024-01-15T12:00:00+00:00"),
+        ]
+        cursor = encode_cursor(None, 0, datetime(2024, 1, 15, 11, tzinfo=UTC))
+
+        summary, next_cursor, rows = parse(await execute(client, {"cursor": cursor}))
+
+        assert [row["entity_id"] for row in rows] == ["light.new"]
+        assert parse(await execute(client, {"cursor": next_cursor}))[0] == "0 entities changed."
+
+    async def test_invalid_cursor(self):
+        """Test that malformed cursors are reported."""
+        result = await execute(AsyncMock(), {"cursor": "garbage"})
+
+        assert "Invalid cursor" in result[0].text
@@ -3,7 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock
 
-from home_assistant_mcp.tools.ha_health_check import TOOL_DEF, execute
+from home_assistant_mcp.tools.ha_health_check import TOOL_DEF, execute, execute_all
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
 from home_assistant_mcp.models import ApiStatus
 
 
@@ -49,3 +50,18 @@ class TestHealthCheckTool:
         # Verify
         assert len(result) == 1
         assert "System operational" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_execute_all_reports_each_instance(self):
+        """Test checking several instances, one of them unreachable."""
+        house, lab = AsyncMock(), AsyncMock()
+        house.check_api.return_value = ApiStatus(message="API running.")
+        lab.check_api.side_effect = HomeAssistantError("Connection refused")
+
+        result = await execute_all({"house": house, "lab": lab}, {})
+
+        assert result[0].text.splitlines() == [
+            "1 of 2 Home Assistant instances running:",
+            "house: running (API running.)",
+            "lab: unreachable (Connection refused)",
+        ]
@@ -2,10 +2,11 @@
 
 import json
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
-from home_assistant_mcp.tools.ha_list_entities import TOOL_DEF, execute
+from home_assistant_mcp.tools.ha_list_entities import TOOL_DEF, execute, execute_all
 from home_assistant_mcp.models import EntityState
+from home_assistant_mcp.tools.utils import OUTPUT_PAGES
 
 
 class TestListEntitiesTool:
@@ -133,3 +134,55 @@ class TestListEntitiesTool:
         json_data = json.loads(text_lines[1])
         # Should use entity_id as fallback
         assert json_data[0]["friendly_name"] == "sensor.test"
+
+    @pytest.mark.asyncio
+    async def test_execute_all_merges_instances(self):
+        """Test listing the entities of several instances at once."""
+        house, lab = AsyncMock(), AsyncMock()
+        house.get_entities_by_domain.return_value = [
+            EntityState(
+                entity_id="light.kitchen",
+                state="on",
+                attributes={"friendly_name": "Kitchen"},
+                last_changed="2024-01-15T10:30:00+00:00",
+                last_updated="2024-01-15T10:30:00+00:00",
+            ),
+        ]
+        lab.get_entities_by_domain.return_value = [
+            EntityState(
+                entity_id="light.bench",
+                state="off",
+                attributes={},
+                last_changed="2024-01-15T10:30:00+00:00",
+                last_updated="2024-01-15T10:30:00+00:00",
+            ),
+        ]
+
+        result = await execute_all({"house": house, "lab": lab}, {"domain": "light"})
+
+        assert "Found 2 entities in 2 instances" in result[0].text
+        json_data = json.loads(result[0].text.split("\n", 1)[1])
+        assert [(e["instance"], e["entity_id"]) for e in json_data] == [
+            ("house", "light.kitchen"),
+            ("lab", "light.bench"),
+        ]
+        lab.get_entities_by_domain.assert_called_once_with("light")
+
+
+    @pytest.mark.asyncio
+    async def test_continuation_does_not_refetch(self):
+        """Test that later pages are served without querying Home Assistant."""
+        mock_client = AsyncMock()
+        mock_client.get_states.return_value = [
+            EntityState(entity_id=f"sensor.s{n}", state=str(n), attributes={}) for n in range(100)
+        ]
+
+        with patch.object(OUTPUT_PAGES, "max_bytes", 2000):
+            first = (await execute(mock_client, {}))[0].text
+            token = first.rsplit("\n", 1)[1].split('"')[3]
+            second = (await execute(mock_client, {"continuation": token}))[0].text
+
+        assert first.startswith("Found 100 entities:")
+        assert second.startswith("Found 100 entities:")
+        assert json.loads("\n".join(second.split("\n")[1:-1]))[0]["entity_id"].startswith("sensor.s")
+        mock_client.get_states.assert_called_once()
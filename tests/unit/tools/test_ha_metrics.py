@@ -0,0 +1,45 @@
+"""Unit tests for ha_metrics tool."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from home_assistant_mcp.metrics_registry import MetricsRegistry
+from home_assistant_mcp.tools.ha_metrics import TOOL_DEF, execute
+
+
+class TestMetricsTool:
+    """Tests for ha_metrics tool."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        """Create a registry with one recorded tool call."""
+        registry = MetricsRegistry()
+        registry.observe("ha_mcp_tool_duration_seconds", 0.2, {"tool": "ha_list_entities"})
+        return registry
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_metrics"
+        assert TOOL_DEF.inputSchema["required"] == []
+        assert TOOL_DEF.inputSchema["properties"]["format"]["enum"] == ["json", "prometheus"]
+
+    @pytest.mark.asyncio
+    async def test_execute_json(self, registry: MetricsRegistry):
+        """Test the default JSON summary."""
+        with patch("home_assistant_mcp.tools.ha_metrics.METRICS", registry):
+            result = await execute(AsyncMock(), {})
+
+        data = json.loads(result[0].text)
+        series = data["histograms"]["ha_mcp_tool_duration_seconds"][0]
+        assert series["labels"] == {"tool": "ha_list_entities"}
+        assert series["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_prometheus(self, registry: MetricsRegistry):
+        """Test Prometheus text output."""
+        with patch("home_assistant_mcp.tools.ha_metrics.METRICS", registry):
+            result = await execute(AsyncMock(), {"format": "prometheus"})
+
+        assert "# TYPE ha_mcp_tool_duration_seconds histogram" in result[0].text
@@ -0,0 +1,52 @@
+"""Unit tests for ha_patch_dashboard tool."""
+
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.models import DashboardPatchResult
+from home_assistant_mcp.tools.ha_patch_dashboard import TOOL_DEF, execute
+
+
+class TestPatchDashboardTool:
+    """Tests for ha_patch_dashboard tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_patch_dashboard"
+        assert TOOL_DEF.inputSchema["required"] == ["operations"]
+        assert "base_hash" in TOOL_DEF.inputSchema["properties"]
+
+    async def test_execute_saves_change(self):
+        """Test that a changing patch is reported as saved."""
+        mock_client = AsyncMock()
+        mock_client.patch_dashboard_config.return_value = DashboardPatchResult(
+            url_path="energy", changed=True, hash="b" * 16, previous_hash="a" * 16, operations=1
+        )
+        operations = [{"op": "replace", "path": "/title", "value": "Energy"}]
+
+        result = await execute(mock_client, {"url_path": "energy", "operations": operations, "base_hash": "a" * 16})
+
+        assert "Dashboard 'energy' patched with 1 operations and saved." in result[0].text
+        assert "b" * 16 in result[0].text
+        mock_client.patch_dashboard_config.assert_called_once_with(
+            operations, url_path="energy", base_hash="a" * 16
+        )
+
+    async def test_execute_unchanged(self):
+        """Test that a no-op patch is reported as not saved."""
+        mock_client = AsyncMock()
+        mock_client.patch_dashboard_config.return_value = DashboardPatchResult(
+            changed=False, hash="a" * 16, previous_hash="a" * 16, operations=0
+        )
+
+        result = await execute(mock_client, {"operations": []})
+
+        assert "Dashboard 'default' unchanged; nothing saved." in result[0].text
+
+    async def test_execute_invalid_patch(self):
+        """Test that patch errors are returned as text."""
+        mock_client = AsyncMock()
+        mock_client.patch_dashboard_config.side_effect = ValueError("Operation 1 (remove /x): missing 'x'")
+
+        result = await execute(mock_client, {"operations": [{"op": "remove", "path": "/x"}]})
+
+        assert result[0].text == "Patch not applied: Operation 1 (remove /x): missing 'x'"
@@ -0,0 +1,93 @@
+"""Unit tests for ha_query_entities tool."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.entity_index import EntityIndex
+from home_assistant_mcp.tools.ha_query_entities import TOOL_DEF, execute
+
+
+def make_client() -> AsyncMock:
+    """Create a client whose index holds a few batteries and lights."""
+    now = datetime.now(UTC)
+    index = EntityIndex()
+    for entity_id, value, attributes, minutes_ago in (
+        ("sensor.door_battery", "12", {"device_class": "battery", "friendly_name": "Door Battery"}, 5),
+        ("sensor.lock_battery", "64", {"device_class": "battery"}, 300),
+        ("light.desk", "on", {"brightness": 180, "color_temp": 300}, 600),
+        ("light.hall", "on", {"brightness": 20}, 1),
+    ):
+        index.update(
+            {
+                "entity_id": entity_id,
+                "state": value,
+                "attributes": attributes,
+                "last_changed": (now - timedelta(minutes=minutes_ago)).isoformat(),
+            }
+        )
+    client = AsyncMock()
+    client.get_entity_index.return_value = index
+    return client
+
+
+def rows(result) -> list[dict]:
+    """Parse the rows of a tool result."""
+    return json.loads(result[0].text.split("\n", 1)[1])
+
+
+class TestQueryEntitiesTool:
+    """Tests for ha_query_entities tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_query_entities"
+        assert TOOL_DEF.inputSchema["required"] == []
+        assert {"domain", "state", "device_class", "where"} <= set(TOOL_DEF.inputSchema["properties"])
+
+    async def test_low_batteries(self):
+        """Test finding low batteries without loading all states."""
+        client = make_client()
+
+        result = await execute(
+            client, {"device_class": "battery", "where": [{"attribute": "state", "op": "<", "value": 20}]}
+        )
+
+        assert "Found 1 matching entities" in result[0].text
+        assert rows(result)[0]["entity_id"] == "sensor.door_battery"
+        assert rows(result)[0]["friendly_name"] == "Door Battery"
+        client.get_states.assert_not_called()
+
+    async def test_only_queried_attributes_are_returned(self):
+        """Test that rows carry the predicate attributes only."""
+        result = await execute(
+            make_client(),
+            {"domain": "light", "state": "on", "where": [{"attribute": "brightness", "op": ">", "value": 100}]},
+        )
+
+        assert rows(result) == [
+            {
+                "entity_id": "light.desk",
+                "friendly_name": "light.desk",
+                "state": "on",
+                "area": None,
+                "last_changed": rows(result)[0]["last_changed"],
+                "brightness": 180,
+            }
+        ]
+
+    async def test_change_age_and_limit(self):
+        """Test filtering on the last change and limiting the rows."""
+        client = make_client()
+
+        recent = await execute(client, {"changed_within_minutes": 10})
+        stale = await execute(client, {"unchanged_for_minutes": 60, "limit": 1})
+
+        assert [r["entity_id"] for r in rows(recent)] == ["light.hall", "sensor.door_battery"]
+        assert "Found 2 matching entities (showing 1)" in stale[0].text
+
+    async def test_unsupported_operator(self):
+        """Test that unknown operators are reported to the caller."""
+        result = await execute(make_client(), {"where": [{"attribute": "brightness", "op": "=~", "value": 1}]})
+
+        assert "Unsupported operator '=~'" in result[0].text
@@ -0,0 +1,68 @@
+"""Unit tests for ha_read_events tool."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from home_assistant_mcp.event_buffer import EventBuffer
+from home_assistant_mcp.tools.ha_read_events import TOOL_DEF, execute
+
+
+def make_client(buffer: EventBuffer) -> MagicMock:
+    """Create a client holding one event buffer."""
+    client = MagicMock()
+    client.get_event_buffer.return_value = buffer
+    client.close_event_buffer = AsyncMock(return_value=buffer)
+    return client
+
+
+def fill(buffer: EventBuffer, count: int) -> None:
+    """Append motion events to a buffer."""
+    for n in range(count):
+        buffer.append({"event_type": "motion", "data": {"n": n}})
+
+
+class TestReadEventsTool:
+    """Tests for ha_read_events tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_read_events"
+        assert TOOL_DEF.inputSchema["required"] == ["subscription_id"]
+
+    async def test_execute_reads_batch_after_cursor(self):
+        """Test reading a batch and the cursor of the next read."""
+        buffer = EventBuffer(["motion"], max_events=4, buffer_id="motion")
+        fill(buffer, 6)
+
+        result = await execute(make_client(buffer), {"subscription_id": "motion", "limit": 3})
+
+        assert result[0].text.startswith("Read 3 events (2 missed)")
+        summary = json.loads(result[0].text.split("\n", 1)[1])
+        assert summary["cursor"] == 5
+        assert summary["pending"] == 1
+        assert summary["dropped_total"] == 2
+        assert [e["seq"] for e in summary["events"]] == [3, 4, 5]
+
+    async def test_execute_waits_and_unsubscribes(self):
+        """Test waiting for events and ending the subscription."""
+        buffer = EventBuffer(["motion"], buffer_id="motion")
+        client = make_client(buffer)
+
+        result = await execute(client, {"subscription_id": "motion", "wait_seconds": 0.01, "unsubscribe": True})
+
+        assert result[0].text.startswith("Read 0 events")
+        client.close_event_buffer.assert_awaited_once_with("motion")
+
+    async def test_execute_reports_interruption(self):
+        """Test that a read across a stream interruption says events may be missing."""
+        buffer = EventBuffer(["motion"], buffer_id="motion")
+        fill(buffer, 2)
+        buffer.mark_gap()
+        fill(buffer, 1)
+
+        result = await execute(make_client(buffer), {"subscription_id": "motion"})
+
+        assert "stream interrupted" in result[0].text
+        summary = json.loads(result[0].text.split("\n", 1)[1])
+        assert summary["interrupted"] is True
+        assert summary["interruptions_total"] == 1
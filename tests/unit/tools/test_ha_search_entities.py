@@ -0,0 +1,68 @@
+"""Unit tests for ha_search_entities tool."""
+
+import json
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.entity_index import EntityIndex
+from home_assistant_mcp.tools.ha_search_entities import TOOL_DEF, execute, execute_all
+
+
+def make_index(*entities: tuple[str, str, str]) -> EntityIndex:
+    """Build an index of (entity_id, friendly_name, area) entries."""
+    index = EntityIndex()
+    for entity_id, friendly_name, area in entities:
+        index.update(
+            {"entity_id": entity_id, "state": "on", "attributes": {"friendly_name": friendly_name}},
+            area=area,
+        )
+    return index
+
+
+class TestSearchEntitiesTool:
+    """Tests for ha_search_entities tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_search_entities"
+        assert TOOL_DEF.inputSchema["required"] == ["query"]
+        assert {"query", "domain", "limit"} <= set(TOOL_DEF.inputSchema["properties"])
+
+    async def test_execute_returns_ranked_matches(self):
+        """Test that the best matches are returned from the client's index."""
+        mock_client = AsyncMock()
+        mock_client.get_entity_index.return_value = make_index(
+            ("light.kitchen_ceiling", "Kitchen Ceiling", "Kitchen"),
+            ("light.bedroom", "Bedroom Lamp", "Bedroom"),
+            ("switch.kitchen_fan", "Kitchen Fan", "Kitchen"),
+        )
+
+        result = await execute(mock_client, {"query": "kitchen ceiling", "limit": 1})
+
+        assert "Found 1 entities matching 'kitchen ceiling'" in result[0].text
+        json_data = json.loads(result[0].text.split("\n", 1)[1])
+        assert json_data[0]["entity_id"] == "light.kitchen_ceiling"
+        assert json_data[0]["area"] == "Kitchen"
+        mock_client.get_states.assert_not_called()
+
+    async def test_execute_limit_is_capped(self):
+        """Test that oversized limits are capped."""
+        mock_client = AsyncMock()
+        mock_client.get_entity_index.return_value = make_index(
+            *((f"light.lamp_{i}", f"Lamp {i}", "Hall") for i in range(60))
+        )
+
+        result = await execute(mock_client, {"query": "lamp", "limit": 500})
+
+        assert "Found 50 entities" in result[0].text
+
+    async def test_execute_all_merges_by_score(self):
+        """Test searching several instances at once."""
+        house, lab = AsyncMock(), AsyncMock()
+        house.get_entity_index.return_value = make_index(("light.porch", "Porch Light", "Outside"))
+        lab.get_entity_index.return_value = make_index(("light.bench", "Bench Light", "Lab"))
+
+        result = await execute_all({"house": house, "lab": lab}, {"query": "bench light"})
+
+        assert "in 2 instances" in result[0].text
+        json_data = json.loads(result[0].text.split("\n", 1)[1])
+        assert (json_data[0]["instance"], json_data[0]["entity_id"]) == ("lab", "light.bench")
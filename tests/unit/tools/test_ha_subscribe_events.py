@@ -0,0 +1,41 @@
+"""Unit tests for ha_subscribe_events tool."""
+
+import json
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.event_buffer import EventBuffer
+from home_assistant_mcp.tools.ha_subscribe_events import TOOL_DEF, execute
+
+
+class TestSubscribeEventsTool:
+    """Tests for ha_subscribe_events tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_subscribe_events"
+        assert TOOL_DEF.inputSchema["required"] == []
+        assert {"event_types", "max_events", "subscription_id"} <= set(TOOL_DEF.inputSchema["properties"])
+
+    async def test_execute_opens_buffer(self):
+        """Test that a buffer is opened for the requested event types."""
+        mock_client = AsyncMock()
+        mock_client.open_event_buffer.return_value = EventBuffer(["zha_event"], 50, "buttons")
+
+        result = await execute(
+            mock_client, {"event_types": ["zha_event"], "max_events": 50, "subscription_id": "buttons"}
+        )
+
+        subscription = json.loads(result[0].text.split("\n", 1)[1])
+        assert subscription["subscription_id"] == "buttons"
+        assert subscription["cursor"] == 0
+        mock_client.open_event_buffer.assert_called_once_with(["zha_event"], 50, "buttons")
+
+    async def test_execute_caps_buffer_size(self):
+        """Test that the buffer size is capped and all events are the default."""
+        mock_client = AsyncMock()
+        mock_client.open_event_buffer.return_value = EventBuffer([], 10000)
+
+        result = await execute(mock_client, {"max_events": 10**9})
+
+        assert '"*"' in result[0].text
+        mock_client.open_event_buffer.assert_called_once_with([], 10000, None)
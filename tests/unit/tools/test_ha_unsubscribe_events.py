@@ -0,0 +1,36 @@
+"""Unit tests for ha_unsubscribe_events tool."""
+
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.event_buffer import EventBuffer
+from home_assistant_mcp.home_assistant_error import HomeAssistantError
+from home_assistant_mcp.tools.ha_unsubscribe_events import TOOL_DEF, execute
+
+
+class TestUnsubscribeEventsTool:
+    """Tests for ha_unsubscribe_events tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_unsubscribe_events"
+        assert TOOL_DEF.inputSchema["required"] == ["subscription_id"]
+
+    async def test_execute_closes_buffer(self):
+        """Test ending a subscription."""
+        buffer = EventBuffer([], buffer_id="motion")
+        buffer.append({"event_type": "motion"})
+        mock_client = AsyncMock()
+        mock_client.close_event_buffer.return_value = buffer
+
+        result = await execute(mock_client, {"subscription_id": "motion"})
+
+        assert "Unsubscribed motion: 1 events received" in result[0].text
+
+    async def test_execute_unknown_subscription(self):
+        """Test that unknown subscriptions are reported, not raised."""
+        mock_client = AsyncMock()
+        mock_client.close_event_buffer.side_effect = HomeAssistantError("Unknown", status_code=404)
+
+        result = await execute(mock_client, {"subscription_id": "gone"})
+
+        assert "No event subscription 'gone' is open" in result[0].text
@@ -0,0 +1,104 @@
+"""Unit tests for ha_wait_for_state tool."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from home_assistant_mcp.models import EntityState
+from home_assistant_mcp.tools.ha_wait_for_state import TOOL_DEF, execute
+
+
+def make_client(state: str, **attributes) -> tuple[AsyncMock, list]:
+    """Create a client recording its state watch callbacks."""
+    callbacks = []
+    unsubscribe = AsyncMock()
+
+    async def watch_state(entity_id, callback):
+        assert entity_id == "climate.living_room"
+        callbacks.append(callback)
+        return unsubscribe
+
+    client = AsyncMock()
+    client.watch_state.side_effect = watch_state
+    client.get_state.return_value = EntityState(
+        entity_id="climate.living_room", state=state, attributes=attributes
+    )
+    client.unsubscribe = unsubscribe
+    return client, callbacks
+
+
+def changed(state: str, **attributes) -> dict:
+    """Build a state_changed event of the watched entity."""
+    return {
+        "event_type": "state_changed",
+        "data": {
+            "entity_id": "climate.living_room",
+            "new_state": {"entity_id": "climate.living_room", "state": state, "attributes": attributes},
+        },
+    }
+
+
+class TestWaitForStateTool:
+    """Tests for ha_wait_for_state tool."""
+
+    def test_tool_definition(self):
+        """Test tool definition is correctly structured."""
+        assert TOOL_DEF.name == "ha_wait_for_state"
+        assert TOOL_DEF.inputSchema["required"] == ["entity_id"]
+        assert {"state", "attribute", "op", "value", "timeout"} <= set(TOOL_DEF.inputSchema["properties"])
+
+    async def test_condition_already_holds(self):
+        """Test returning at once when the entity is already in the target state."""
+        client, _ = make_client("heat")
+
+        result = await execute(client, {"entity_id": "climate.living_room", "state": "heat"})
+
+        assert "reached state == 'heat'" in result[0].text
+        client.watch_state.assert_called_once()
+        client.unsubscribe.assert_awaited_once()
+
+    async def test_waits_for_numeric_attribute(self):
+        """Test waiting for an attribute to cross a threshold."""
+        client, callbacks = make_client("heat", current_temperature=19.0)
+        arguments = {
+            "entity_id": "climate.living_room",
+            "attribute": "current_temperature",
+            "op": ">=",
+            "value": 21,
+            "timeout": 5,
+        }
+
+        task = asyncio.create_task(execute(client, arguments))
+        await asyncio.sleep(0.01)
+        callbacks[0](changed("heat", current_temperature=20.0))
+        callbacks[0]({"data": {"entity_id": "climate.living_room", "new_state": None}})
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        callbacks[0](changed("heat", current_temperature=21.5))
+        result = await task
+
+        assert "reached current_temperature >= 21" in result[0].text
+        assert json.loads(result[0].text.split("\n", 1)[1])["attributes"]["current_temperature"] == 21.5
+        client.get_state.assert_called_once_with("climate.living_room")
+        client.unsubscribe.assert_awaited_once()
+
+    async def test_timeout_reports_latest_state(self):
+        """Test that a timeout returns the last seen state."""
+        client, callbacks = make_client("off")
+
+        task = asyncio.create_task(
+            execute(client, {"entity_id": "climate.living_room", "state": "heat", "timeout": 0.05})
+        )
+        await asyncio.sleep(0.01)
+        callbacks[0](changed("fan_only"))
+        result = await task
+
+        assert "Timed out after 0.05s" in result[0].text
+        assert '"state": "fan_only"' in result[0].text
+        client.unsubscribe.assert_awaited_once()
+
+    async def test_condition_required(self):
+        """Test that a state or value must be given."""
+        result = await execute(AsyncMock(), {"entity_id": "climate.living_room"})
+
+        assert "Either state or value is required" in result[0].text
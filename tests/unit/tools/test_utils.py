@@ -2,9 +2,10 @@
 
 import json
 import pytest
+from unittest.mock import patch
 from pydantic import BaseModel
 
-from home_assistant_mcp.tools.utils import format_response
+from home_assistant_mcp.tools.utils import OUTPUT_PAGES, continued_response, format_response, paged_response
 
 
 class MockModel(BaseModel):
@@ -91,3 +92,55 @@ class TestFormatResponse:
         result = format_response(None)
         parsed = json.loads(result)
         assert parsed is None
+
+
+class TestPagedResponse:
+    """Tests for paged_response and continued_response."""
+
+    def test_small_output_is_unchanged(self):
+        """Test that outputs within the budget match format_response."""
+        data = [MockModel(name="a", value=1), {"name": "b", "value": 2}]
+
+        result = paged_response("Found 2:", data)
+
+        assert result[0].text == f"Found 2:\n{format_response(data)}"
+        assert paged_response("", {"a": 1})[0].text == format_response({"a": 1})
+
+    def test_large_list_is_paged(self):
+        """Test that every page is a valid slice of the list."""
+        data = [{"name": f"item_{n}", "value": n} for n in range(200)]
+
+        with patch.object(OUTPUT_PAGES, "max_bytes", 2000):
+            text = paged_response("Found 200:", data)[0].text
+            values = []
+            while True:
+                lines = text.split("\n")
+                assert len(text.encode()) <= 2000
+                values.extend(item["value"] for item in json.loads("\n".join(lines[1:-1])))
+                if "continuation" not in lines[-1]:
+                    break
+                text = continued_response(lines[-1].split('"')[3])[0].text
+
+        assert values == list(range(200))
+
+    def test_large_object_is_paged_by_lines(self):
+        """Test that the pages of an object rebuild its JSON."""
+        data = {f"key_{n}": "value" for n in range(200)}
+
+        with patch.object(OUTPUT_PAGES, "max_bytes", 1000):
+            text = paged_response("", data)[0].text
+            parts = []
+            while True:
+                *body, note = text.split("\n")
+                parts.extend(body)
+                if "continuation" not in note:
+                    break
+                text = continued_response(note.split('"')[3])[0].text
+
+        assert json.loads("\n".join(parts)) == data
+
+    def test_unknown_continuation(self):
+        """Test that an unknown token asks for a fresh call."""
+        result = continued_response("missing-10")
+
+        assert "Continuation expired or unknown" in result[0].text